@@ -0,0 +1,208 @@
+from __future__ import annotations
+
+import hashlib
+import json
+import logging
+import os
+import shutil
+import threading
+import time
+from pathlib import Path
+
+from sow_render_worker.frame_renderer import _get_int_env
+
+logger = logging.getLogger(__name__)
+
+INDEX_FILENAME = "index.json"
+_DEFAULT_DISK_SHARE = 0.5
+_HASH_CHUNK_BYTES = 1024 * 1024
+
+
+def resolve_asset_cache_bytes(cache_dir: Path) -> int:
+    """Asset cache budget: ``SOW_ASSET_CACHE_MB``, else half of the filesystem holding it."""
+    budget_mb = _get_int_env("SOW_ASSET_CACHE_MB", 0)
+    if budget_mb > 0:
+        return budget_mb * 1024 * 1024
+    probe = cache_dir
+    while not probe.exists() and probe != probe.parent:
+        probe = probe.parent
+    return int(shutil.disk_usage(probe).total * _DEFAULT_DISK_SHARE)
+
+
+def file_sha256(path: Path) -> str:
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(_HASH_CHUNK_BYTES), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def _stat(path: Path) -> os.stat_result | None:
+    try:
+        return path.stat()
+    except OSError:
+        return None
+
+
+def _matches_stat(entry: dict, stat: os.stat_result) -> bool:
+    """True if the file is unchanged since its checksum was recorded."""
+    return (
+        entry.get("sha256") is not None
+        and entry.get("size") == stat.st_size
+        and entry.get("mtime_ns") == stat.st_mtime_ns
+    )
+
+
+class AssetCache:
+    """Byte-bounded LRU cache of downloaded files, indexed in ``index.json``.
+
+    The index records size, mtime, SHA-256 and last use for every file so the
+    cache, and its eviction order, survive across warm Lambda invocations. A hit
+    whose size and mtime still match the index is trusted; otherwise the file is
+    re-hashed (outside the lock, so concurrent prefetches are not serialized) and
+    a checksum mismatch drops it and counts as a miss. Files an instance has
+    served or stored are never evicted by that instance, so a job cannot evict its
+    own inputs.
+    """
+
+    def __init__(self, cache_dir: Path, max_bytes: int | None = None):
+        self.cache_dir = Path(cache_dir)
+        self.max_bytes = max_bytes if max_bytes is not None else resolve_asset_cache_bytes(
+            self.cache_dir
+        )
+        self._index_path = self.cache_dir / INDEX_FILENAME
+        self._lock = threading.Lock()
+        self._entries: dict[str, dict] | None = None
+        self._in_use: set[str] = set()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.corrupt = 0
+
+    def _load(self) -> dict[str, dict]:
+        if self._entries is not None:
+            return self._entries
+        entries: dict[str, dict] = {}
+        try:
+            entries = json.loads(self._index_path.read_text(encoding="utf-8"))["entries"]
+        except FileNotFoundError:
+            pass
+        except (OSError, ValueError, KeyError, TypeError):
+            logger.warning("Asset cache index unreadable, rebuilding: %s", self._index_path)
+
+        on_disk: dict[str, os.stat_result] = {}
+        if self.cache_dir.is_dir():
+            for path in self.cache_dir.iterdir():
+                if path.name == INDEX_FILENAME or path.suffix == ".tmp" or not path.is_file():
+                    continue
+                on_disk[path.name] = path.stat()
+
+        # Drop entries whose file is gone; adopt files that predate the index with
+        # a checksum taken on first use.
+        entries = {name: entry for name, entry in entries.items() if name in on_disk}
+        for name, stat in on_disk.items():
+            if name not in entries or entries[name].get("size") != stat.st_size:
+                entries[name] = {"size": stat.st_size, "sha256": None, "last_used": stat.st_mtime}
+        self._entries = entries
+        return entries
+
+    def _save(self) -> None:
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        tmp_path = self._index_path.with_suffix(".tmp")
+        tmp_path.write_text(json.dumps({"entries": self._entries}), encoding="utf-8")
+        os.replace(tmp_path, self._index_path)
+
+    def _drop(self, name: str) -> None:
+        self._entries.pop(name, None)
+        try:
+            (self.cache_dir / name).unlink()
+        except OSError:
+            pass
+
+    def get(self, name: str) -> Path | None:
+        path = self.cache_dir / name
+        with self._lock:
+            entry = self._load().get(name)
+            stat = _stat(path)
+            if entry is None or stat is None:
+                self.misses += 1
+                return None
+            if name in self._in_use or _matches_stat(entry, stat):
+                return self._hit(name, entry)
+
+        checksum = file_sha256(path)
+
+        with self._lock:
+            current = self._load().get(name)
+            stat = _stat(path)
+            if current is None or stat is None:
+                self.misses += 1
+                return None
+            if current is entry:
+                if entry.get("sha256") not in (None, checksum):
+                    logger.warning("Asset cache checksum mismatch, discarding %s", name)
+                    self._drop(name)
+                    self._save()
+                    self.corrupt += 1
+                    self.misses += 1
+                    return None
+                entry.update(sha256=checksum, size=stat.st_size, mtime_ns=stat.st_mtime_ns)
+            # else: replaced by add() while hashing; the new entry is already verified
+            return self._hit(name, current)
+
+    def _hit(self, name: str, entry: dict) -> Path:
+        entry["last_used"] = time.time()
+        self._in_use.add(name)
+        self._save()
+        self.hits += 1
+        return self.cache_dir / name
+
+    def add(self, name: str, tmp_path: Path, sha256: str) -> Path:
+        """Move a fully written ``tmp_path`` into the cache and evict down to budget."""
+        path = self.cache_dir / name
+        with self._lock:
+            entries = self._load()
+            os.replace(tmp_path, path)
+            stat = path.stat()
+            entries[name] = {
+                "size": stat.st_size,
+                "mtime_ns": stat.st_mtime_ns,
+                "sha256": sha256,
+                "last_used": time.time(),
+            }
+            self._in_use.add(name)
+            self._evict()
+            self._save()
+        return path
+
+    def _evict(self) -> None:
+        total = sum(entry["size"] for entry in self._entries.values())
+        if total <= self.max_bytes:
+            return
+        for name, entry in sorted(self._entries.items(), key=lambda item: item[1]["last_used"]):
+            if total <= self.max_bytes:
+                break
+            if name in self._in_use:
+                continue
+            total -= entry["size"]
+            self._drop(name)
+            self.evictions += 1
+        if total > self.max_bytes:
+            logger.warning(
+                "Asset cache over budget (%.0f/%.0fMB) with only in-use files left",
+                total / (1024 * 1024),
+                self.max_bytes / (1024 * 1024),
+            )
+
+    def get_stats(self) -> dict[str, int]:
+        with self._lock:
+            entries = self._load()
+            return {
+                "entries": len(entries),
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+                "corrupt": self.corrupt,
+                "bytes": sum(entry["size"] for entry in entries.values()),
+                "max_bytes": self.max_bytes,
+            }
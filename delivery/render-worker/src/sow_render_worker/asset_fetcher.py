@@ -1,10 +1,17 @@
+import hashlib
 import logging
-import os
 import shutil
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import FIRST_EXCEPTION, Future, ThreadPoolExecutor, wait
 from pathlib import Path
+from typing import Callable, Iterable
 
 import urllib3
 
+from sow_render_worker.asset_cache import AssetCache
+from sow_render_worker.frame_renderer import _get_int_env
 from sow_render_worker.r2_client import R2Client, create_r2_client_from_env
 
 logger = logging.getLogger(__name__)
@@ -12,6 +19,46 @@ logger = logging.getLogger(__name__)
 DEFAULT_CACHE_DIR = "/tmp/sow-assets/cache"
 DEFAULT_TEMP_DIR = "/tmp/sow-assets/temp"
 MAX_LRC_SIZE_BYTES = 1024 * 1024
+DEFAULT_PREFETCH_WORKERS = 4
+# LRC files can be re-aligned under the same recording hash, so entries shared
+# across invocations expire; a job keeps the copy it first read.
+LRC_CACHE_TTL_SECONDS = 300
+MAX_LRC_CACHE_ENTRIES = 256
+
+_lrc_cache: OrderedDict[str, tuple[float, str]] = OrderedDict()
+_lrc_cache_lock = threading.Lock()
+
+
+def _get_shared_lrc(hash_prefix: str) -> str | None:
+    with _lrc_cache_lock:
+        cached = _lrc_cache.get(hash_prefix)
+        if cached is None:
+            return None
+        fetched_at, content = cached
+        if time.monotonic() - fetched_at > LRC_CACHE_TTL_SECONDS:
+            del _lrc_cache[hash_prefix]
+            return None
+        _lrc_cache.move_to_end(hash_prefix)
+        return content
+
+
+def _put_shared_lrc(hash_prefix: str, content: str) -> None:
+    with _lrc_cache_lock:
+        _lrc_cache[hash_prefix] = (time.monotonic(), content)
+        _lrc_cache.move_to_end(hash_prefix)
+        while len(_lrc_cache) > MAX_LRC_CACHE_ENTRIES:
+            _lrc_cache.popitem(last=False)
+
+
+def clear_lrc_cache() -> None:
+    with _lrc_cache_lock:
+        _lrc_cache.clear()
+
+
+def resolve_prefetch_workers(requested: int | None = None) -> int:
+    if requested is None:
+        requested = _get_int_env("SOW_ASSET_PREFETCH_WORKERS", DEFAULT_PREFETCH_WORKERS)
+    return max(1, requested)
 
 
 class AssetFetcher:
@@ -20,14 +67,23 @@ class AssetFetcher:
         cache_dir: str | None = None,
         temp_dir: str | None = None,
         r2_client: R2Client | None = None,
+        prefetch_workers: int | None = None,
+        asset_cache_bytes: int | None = None,
     ):
         self._cache_dir = Path(cache_dir or DEFAULT_CACHE_DIR)
         self._temp_dir = Path(temp_dir or DEFAULT_TEMP_DIR)
         self._r2_client = r2_client or create_r2_client_from_env()
+        self._prefetch_workers = resolve_prefetch_workers(prefetch_workers)
+        # One pooled connection per prefetch thread so concurrent downloads reuse
+        # sockets instead of opening and discarding extras.
         self._http = urllib3.PoolManager(
-            timeout=urllib3.Timeout(connect=30, read=300)
+            maxsize=self._prefetch_workers,
+            timeout=urllib3.Timeout(connect=30, read=300),
         )
+        self._audio_cache = AssetCache(self._cache_dir, max_bytes=asset_cache_bytes)
         self._lrc_cache: dict[str, str | None] = {}
+        self._lrc_hits = 0
+        self._lrc_misses = 0
         self._job_temp_dir: Path | None = None
 
     def initialize(self) -> None:
@@ -48,7 +104,7 @@ class AssetFetcher:
 
     def download_audio(self, hash_prefix: str) -> str | None:
         cache_path = self._cache_dir / f"{hash_prefix}.mp3"
-        if cache_path.exists():
+        if self._audio_cache.get(cache_path.name) is not None:
             logger.info("Audio cache hit: %s", hash_prefix)
             return str(cache_path)
 
@@ -68,11 +124,13 @@ class AssetFetcher:
                 tmp_path = cache_path.with_suffix(".tmp")
                 try:
                     total_bytes = 0
+                    digest = hashlib.sha256()
                     with open(tmp_path, "wb") as f:
                         for chunk in response.stream(8192):
                             f.write(chunk)
+                            digest.update(chunk)
                             total_bytes += len(chunk)
-                    os.replace(tmp_path, cache_path)
+                    self._audio_cache.add(cache_path.name, tmp_path, digest.hexdigest())
                 except BaseException:
                     try:
                         tmp_path.unlink()
@@ -98,6 +156,14 @@ class AssetFetcher:
             logger.debug("LRC cache hit: %s", hash_prefix)
             return self._lrc_cache[hash_prefix]
 
+        shared = _get_shared_lrc(hash_prefix)
+        if shared is not None:
+            logger.debug("LRC shared cache hit: %s", hash_prefix)
+            self._lrc_hits += 1
+            self._lrc_cache[hash_prefix] = shared
+            return shared
+        self._lrc_misses += 1
+
         try:
             signed_url = self._r2_client.get_lrc_signed_url(
                 hash_prefix, expires_in_seconds=3600
@@ -124,6 +190,7 @@ class AssetFetcher:
 
             content = b"".join(chunks).decode("utf-8")
             self._lrc_cache[hash_prefix] = content
+            _put_shared_lrc(hash_prefix, content)
             logger.info("LRC downloaded: %s (%d bytes)", hash_prefix, total_size)
             return content
         except Exception as exc:
@@ -132,6 +199,79 @@ class AssetFetcher:
                 f"Failed to download LRC for {hash_prefix}: {exc}"
             ) from exc
 
+    def _prefetch_lrc(self, hash_prefix: str) -> None:
+        try:
+            self.download_lrc(hash_prefix)
+        except Exception:
+            # Songs without lyrics still render; remember the miss so later
+            # lookups do not go back to R2.
+            logger.warning("LRC unavailable for %s, continuing without lyrics", hash_prefix)
+            self._lrc_cache[hash_prefix] = None
+
+    def prefetch(
+        self,
+        hash_prefixes: Iterable[str],
+        include_lrc: bool = True,
+        progress_callback: Callable[[int, int], None] | None = None,
+    ) -> None:
+        """Download audio (and LRC) for every recording concurrently into the local cache.
+
+        Raises on the first audio download that fails and cancels downloads that
+        have not started yet. A missing LRC is cached as ``None``.
+        """
+        unique_prefixes = list(dict.fromkeys(p for p in hash_prefixes if p))
+        tasks: list[tuple[Callable[[str], object], str]] = [
+            (self.download_audio, p) for p in unique_prefixes
+        ]
+        if include_lrc:
+            tasks.extend((self._prefetch_lrc, p) for p in unique_prefixes)
+        if not tasks:
+            return
+
+        total = len(tasks)
+        completed = 0
+        with ThreadPoolExecutor(
+            max_workers=min(self._prefetch_workers, total),
+            thread_name_prefix="asset-prefetch",
+        ) as executor:
+            pending: set[Future] = {executor.submit(fn, p) for fn, p in tasks}
+            while pending:
+                done, pending = wait(pending, return_when=FIRST_EXCEPTION)
+                for future in done:
+                    exc = future.exception()
+                    if exc is not None:
+                        for other in pending:
+                            other.cancel()
+                        raise exc
+                    completed += 1
+                    if progress_callback:
+                        progress_callback(completed, total)
+
+    def get_cache_stats(self) -> dict[str, int]:
+        stats = self._audio_cache.get_stats()
+        stats["lrc_hits"] = self._lrc_hits
+        stats["lrc_misses"] = self._lrc_misses
+        return stats
+
+    def log_cache_stats(self, job_id: str | None = None) -> None:
+        stats = self.get_cache_stats()
+        audio_lookups = stats["hits"] + stats["misses"]
+        logger.info(
+            "[%s] Asset cache: audio %d hits/%d misses (%.0f%% hit rate), %d evictions, "
+            "%d corrupt, %d entries (%.0f/%.0fMB); lrc %d hits/%d misses",
+            job_id or "unknown",
+            stats["hits"],
+            stats["misses"],
+            stats["hits"] / max(1, audio_lookups) * 100,
+            stats["evictions"],
+            stats["corrupt"],
+            stats["entries"],
+            stats["bytes"] / (1024 * 1024),
+            stats["max_bytes"] / (1024 * 1024),
+            stats["lrc_hits"],
+            stats["lrc_misses"],
+        )
+
     def cleanup_temp(self) -> None:
         if self._job_temp_dir is not None:
             try:
@@ -3,6 +3,8 @@ from __future__ import annotations
 import json
 import logging
 import subprocess
+import threading
+import time
 from dataclasses import dataclass, field
 from datetime import datetime
 from pathlib import Path
@@ -48,6 +50,13 @@ class ExportResult:
     channels: int = 2
 
 
+@dataclass(frozen=True)
+class AudioPlan:
+    segments: tuple[AudioSegmentInfo, ...]
+    audio_files: tuple[dict[str, Any], ...]
+    total_duration_seconds: float
+
+
 class AssetFetcherProtocol(Protocol):
     def download_audio(self, hash_prefix: str) -> str | None: ...
 
@@ -169,6 +178,7 @@ def concatenate_audio_files(
     sample_rate: int = 44100,
     channels: int = 2,
     job_id: str | None = None,
+    cancel_event: threading.Event | None = None,
 ) -> None:
     filter_complex = build_ffmpeg_filter_complex(audio_files, normalize, target_lufs)
 
@@ -181,22 +191,47 @@ def concatenate_audio_files(
     cmd.append(output_path)
 
     logger.info("[%s] FFmpeg audio concat: starting (timeout=1800s)", job_id or "unknown")
-    subprocess.run(cmd, check=True, capture_output=True, timeout=1800)
+    _run_ffmpeg(cmd, timeout=1800, cancel_event=cancel_event)
     logger.info("[%s] FFmpeg audio concat: complete", job_id or "unknown")
 
 
-def generate_songset_audio(
+class AudioMixCancelled(RuntimeError):
+    """Raised when a mixdown's ffmpeg process is stopped via its cancel event."""
+
+
+def _run_ffmpeg(
+    cmd: list[str],
+    timeout: float,
+    cancel_event: threading.Event | None = None,
+    poll_seconds: float = 0.5,
+) -> None:
+    """Run ffmpeg to completion, killing it on timeout or when ``cancel_event`` is set."""
+    process = subprocess.Popen(cmd, stdout=subprocess.DEVNULL, stderr=subprocess.PIPE)
+    deadline = time.monotonic() + timeout
+    while True:
+        try:
+            _, stderr = process.communicate(timeout=poll_seconds)
+            break
+        except subprocess.TimeoutExpired:
+            cancelled = cancel_event is not None and cancel_event.is_set()
+            if not cancelled and time.monotonic() < deadline:
+                continue
+            process.kill()
+            process.communicate()
+            if cancelled:
+                raise AudioMixCancelled("Audio mixdown cancelled") from None
+            raise subprocess.TimeoutExpired(cmd, timeout) from None
+    if process.returncode != 0:
+        raise subprocess.CalledProcessError(process.returncode, cmd, stderr=stderr)
+
+
+def plan_songset_audio(
     items: list[SongsetItem],
-    output_path: str,
     asset_fetcher: AssetFetcherProtocol,
     progress_callback: Callable[[int, int], None] | None = None,
-    normalize: bool = True,
-    target_lufs: float = -14.0,
-    output_bitrate: str = "320k",
-    sample_rate: int = 44100,
-    channels: int = 2,
     job_id: str | None = None,
-) -> ExportResult:
+) -> AudioPlan:
+    """Resolve each song's audio file and its place on the songset timeline."""
     if not items:
         raise ValueError("Cannot generate audio for empty songset")
 
@@ -279,16 +314,34 @@ def generate_songset_audio(
             progress_callback(current_step, total_steps)
         current_step += 1
 
+    return AudioPlan(
+        segments=tuple(segments),
+        audio_files=tuple(audio_files),
+        total_duration_seconds=current_time_ms / 1000.0,
+    )
+
+
+def mix_songset_audio(
+    plan: AudioPlan,
+    output_path: str,
+    normalize: bool = True,
+    target_lufs: float = -14.0,
+    output_bitrate: str = "320k",
+    sample_rate: int = 44100,
+    channels: int = 2,
+    job_id: str | None = None,
+    cancel_event: threading.Event | None = None,
+) -> ExportResult:
     output_dir = Path(output_path).parent
     output_dir.mkdir(parents=True, exist_ok=True)
 
     logger.info(
         "[%s] Audio: starting FFmpeg concatenation of %d files -> %s",
-        job_id or "unknown", len(audio_files), output_path,
+        job_id or "unknown", len(plan.audio_files), output_path,
     )
 
     concatenate_audio_files(
-        audio_files,
+        list(plan.audio_files),
         output_path,
         normalize=normalize,
         target_lufs=target_lufs,
@@ -296,24 +349,54 @@ def generate_songset_audio(
         sample_rate=sample_rate,
         channels=channels,
         job_id=job_id,
+        cancel_event=cancel_event,
     )
 
     logger.info(
         "[%s] Audio: concatenation complete, total duration=%.1fs, %d segments",
-        job_id or "unknown", current_time_ms / 1000.0, len(segments),
+        job_id or "unknown", plan.total_duration_seconds, len(plan.segments),
     )
 
-    if progress_callback:
-        progress_callback(total_steps, total_steps)
-
     return ExportResult(
         output_path=output_path,
-        total_duration_seconds=current_time_ms / 1000.0,
-        segments=tuple(segments),
+        total_duration_seconds=plan.total_duration_seconds,
+        segments=plan.segments,
+        sample_rate=sample_rate,
+        channels=channels,
+    )
+
+
+def generate_songset_audio(
+    items: list[SongsetItem],
+    output_path: str,
+    asset_fetcher: AssetFetcherProtocol,
+    progress_callback: Callable[[int, int], None] | None = None,
+    normalize: bool = True,
+    target_lufs: float = -14.0,
+    output_bitrate: str = "320k",
+    sample_rate: int = 44100,
+    channels: int = 2,
+    job_id: str | None = None,
+) -> ExportResult:
+    plan = plan_songset_audio(items, asset_fetcher, progress_callback, job_id=job_id)
+
+    result = mix_songset_audio(
+        plan,
+        output_path,
+        normalize=normalize,
+        target_lufs=target_lufs,
+        output_bitrate=output_bitrate,
         sample_rate=sample_rate,
         channels=channels,
+        job_id=job_id,
     )
 
+    if progress_callback:
+        total_steps = len(items) * 2
+        progress_callback(total_steps, total_steps)
+
+    return result
+
 
 def calculate_total_duration(
     items: list[SongsetItem],
@@ -106,7 +106,7 @@ def generate_chapters_manifest(
     download_lrc: Callable[[str], str | None | object],
     total_duration_seconds: float,
 ) -> ChaptersManifest:
-    from .lrc_parser import parse_lrc
+    from .lrc_parser import parse_lrc_cached
 
     def get_lyrics(
         hash_prefix: str, start_seconds: float
@@ -114,7 +114,7 @@ def generate_chapters_manifest(
         try:
             lrc_content = download_lrc(hash_prefix)
             if lrc_content:
-                local_lyrics = parse_lrc(lrc_content)
+                local_lyrics = parse_lrc_cached(lrc_content)
                 return [
                     ChapterLine(
                         text=line.text,
@@ -0,0 +1,136 @@
+from __future__ import annotations
+
+import mmap
+from collections import OrderedDict
+
+import numpy as np
+
+_MIN_FRAME_CACHE_SLOTS = 2
+
+FrameBuffer = bytes | memoryview
+
+
+def allocate_frame_arena(size: int) -> mmap.mmap:
+    # An anonymous shared mapping needs no /dev/shm (absent on Lambda), and
+    # processes forked after this call see the same pages.
+    return mmap.mmap(-1, max(1, size))
+
+
+class FrameCache:
+    """LRU cache of equally sized frames stored in fixed slots of one arena.
+
+    Every frame at a given resolution has the same size, so a byte budget maps to a
+    slot count and evicting the least recently used entry frees exactly one slot.
+    Lookups return ``memoryview`` slices of the arena rather than copies; a view
+    stays valid until its slot is reused, which never happens to pinned slots.
+    """
+
+    def __init__(
+        self,
+        frame_size: int,
+        max_bytes: int,
+        max_entries: int | None = None,
+        arena: mmap.mmap | None = None,
+        offset: int = 0,
+    ):
+        slots = max_bytes // max(1, frame_size)
+        if max_entries is not None:
+            slots = min(slots, max_entries)
+        self.frame_size = frame_size
+        self.capacity = max(_MIN_FRAME_CACHE_SLOTS, slots)
+        self.offset = offset
+        self._arena = arena
+        self._array: np.ndarray | None = None
+        self._view: memoryview | None = None
+        self._index: OrderedDict[tuple, int] = OrderedDict()
+        self._free_slots = list(range(self.capacity - 1, -1, -1))
+        self.pinned: set[int] = set()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    @property
+    def size_bytes(self) -> int:
+        return self.capacity * self.frame_size
+
+    def __len__(self) -> int:
+        return len(self._index)
+
+    def __contains__(self, key: tuple) -> bool:
+        return key in self._index
+
+    def _ensure_arena(self) -> None:
+        if self._array is not None:
+            return
+        if self._arena is None:
+            self._arena = allocate_frame_arena(self.size_bytes)
+        self._array = np.frombuffer(
+            self._arena, dtype=np.uint8, count=self.size_bytes, offset=self.offset
+        )
+        self._view = memoryview(self._arena)
+
+    def slot_view(self, slot: int) -> memoryview:
+        self._ensure_arena()
+        start = self.offset + slot * self.frame_size
+        return self._view[start : start + self.frame_size]
+
+    def slot_of(self, key: tuple) -> int | None:
+        return self._index.get(key)
+
+    def get(self, key: tuple) -> memoryview | None:
+        slot = self._index.get(key)
+        if slot is None:
+            self.misses += 1
+            return None
+        self.hits += 1
+        self._index.move_to_end(key)
+        return self.slot_view(slot)
+
+    def _take_slot(self) -> int | None:
+        if self._free_slots:
+            return self._free_slots.pop()
+        for key, slot in self._index.items():
+            if slot not in self.pinned:
+                del self._index[key]
+                self.evictions += 1
+                return slot
+        return None
+
+    def put(self, key: tuple, frame: np.ndarray | FrameBuffer) -> memoryview | None:
+        """Copy ``frame`` into a slot; returns ``None`` when every slot is pinned."""
+        data = frame if isinstance(frame, np.ndarray) else np.frombuffer(frame, dtype=np.uint8)
+        if data.size != self.frame_size:
+            raise ValueError(f"Frame is {data.size} bytes, cache slots are {self.frame_size}")
+
+        slot = self._index.get(key)
+        if slot is None:
+            slot = self._take_slot()
+            if slot is None:
+                return None
+            self._index[key] = slot
+        else:
+            self._index.move_to_end(key)
+
+        self._ensure_arena()
+        start = slot * self.frame_size
+        self._array[start : start + self.frame_size] = data.reshape(-1)
+        return self.slot_view(slot)
+
+    def clear(self) -> None:
+        self._index.clear()
+        self._free_slots = list(range(self.capacity - 1, -1, -1))
+        self.pinned.clear()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def get_stats(self) -> dict[str, int]:
+        return {
+            "entries": len(self._index),
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "max_entries": self.capacity,
+            "bytes": len(self._index) * self.frame_size,
+            "max_bytes": self.size_bytes,
+        }
@@ -2,14 +2,17 @@ from __future__ import annotations
 
 import logging
 import math
+import mmap
 import os
 from collections import OrderedDict
 from dataclasses import dataclass
 from functools import lru_cache
-from typing import Literal
+from typing import Any, Literal
 
+import numpy as np
 from PIL import Image, ImageDraw, ImageFont
 
+from sow_render_worker.frame_cache import FrameBuffer, FrameCache
 from sow_render_worker.lrc_parser import (
     GlobalLRCLine,
     estimate_last_lyric_duration,
@@ -27,8 +30,11 @@ FontFamily = Literal[
     "noto_serif_tc",
 ]
 
-_DEFAULT_FADE_ALPHA_STEPS = 16
+_DEFAULT_FADE_ALPHA_STEPS = 256
 _DEFAULT_MAX_CACHE_ENTRIES = 200
+_DEFAULT_MAX_LAYER_ENTRIES = 64
+_DEFAULT_LAMBDA_MEMORY_MB = 3072
+_FRAME_CACHE_MEMORY_FRACTION = 0.25
 _DEFAULT_CACHE_ENABLED = True
 _DEFAULT_TEMPO_BPM = 70.0
 _BLANK_PREVIEW_ALPHA = 128
@@ -56,6 +62,49 @@ def _get_int_env(name: str, default: int) -> int:
     return default
 
 
+def resolve_frame_cache_bytes() -> int:
+    """Frame cache budget: ``SOW_FRAME_CACHE_MB``, else a share of the Lambda memory size."""
+    budget_mb = _get_int_env("SOW_FRAME_CACHE_MB", 0)
+    if budget_mb <= 0:
+        lambda_memory_mb = _get_int_env(
+            "AWS_LAMBDA_FUNCTION_MEMORY_SIZE", _DEFAULT_LAMBDA_MEMORY_MB
+        )
+        budget_mb = int(lambda_memory_mb * _FRAME_CACHE_MEMORY_FRACTION)
+    return budget_mb * 1024 * 1024
+
+
+def create_frame_cache(
+    resolution: tuple[int, int],
+    max_cache_entries: int | None = None,
+    max_cache_bytes: int | None = None,
+    arena: mmap.mmap | None = None,
+    offset: int = 0,
+) -> FrameCache:
+    width, height = resolution
+    return FrameCache(
+        frame_size=width * height * 3,
+        max_bytes=max_cache_bytes if max_cache_bytes is not None else resolve_frame_cache_bytes(),
+        max_entries=max(
+            1,
+            max_cache_entries
+            if max_cache_entries is not None
+            else _get_int_env("SOW_MAX_CACHE_ENTRIES", _DEFAULT_MAX_CACHE_ENTRIES),
+        ),
+        arena=arena,
+        offset=offset,
+    )
+
+
+def _first_frame_at(time_seconds: float, fps: int) -> int:
+    """First frame whose timestamp (frame / fps) is at or after ``time_seconds``."""
+    frame_index = math.ceil(time_seconds * fps)
+    while (frame_index - 1) / fps >= time_seconds:
+        frame_index -= 1
+    while frame_index / fps < time_seconds:
+        frame_index += 1
+    return frame_index
+
+
 @dataclass(frozen=True)
 class VideoTemplate:
     name: VideoTemplateName
@@ -103,6 +152,41 @@ class VisualState:
     current_time: float
 
 
+@dataclass(frozen=True, eq=False)
+class TextLayer:
+    x: int
+    y: int
+    mask: np.ndarray
+
+
+@dataclass(frozen=True)
+class TimelineInterval:
+    start_frame: int
+    end_frame: int
+    cache_key: tuple
+    state: VisualState
+
+    @property
+    def frame_count(self) -> int:
+        return self.end_frame - self.start_frame
+
+
+@dataclass(frozen=True)
+class RenderTimeline:
+    fps: int
+    start_frame: int
+    end_frame: int
+    intervals: tuple[TimelineInterval, ...]
+
+    @property
+    def frame_count(self) -> int:
+        return self.end_frame - self.start_frame
+
+    @property
+    def unique_states(self) -> int:
+        return len({interval.cache_key for interval in self.intervals})
+
+
 FONT_SIZE_PRESETS: dict[FontSizePreset, int] = {
     "S": 32,
     "M": 48,
@@ -169,6 +253,18 @@ FONT_FAMILY_PATHS: dict[str, list[str]] = {
 }
 
 
+class _LayerCanvas:
+    """Stands in for ``ImageDraw`` while composing a frame: measures text the same
+    way, but ``FrameRenderer._draw_text`` records layers here instead of drawing."""
+
+    def __init__(self, measure: ImageDraw.ImageDraw):
+        self._measure = measure
+        self.layers: list[tuple[TextLayer, tuple[int, int, int], int]] = []
+
+    def textbbox(self, *args: Any, **kwargs: Any) -> tuple[float, float, float, float]:
+        return self._measure.textbbox(*args, **kwargs)
+
+
 @lru_cache(maxsize=128)
 def _load_font(
     size: int,
@@ -214,6 +310,9 @@ class FrameRenderer:
         font_size_preset: FontSizePreset = "M",
         resolution: tuple[int, int] | None = None,
         font_family: str = "noto_serif_tc",
+        max_cache_entries: int | None = None,
+        max_cache_bytes: int | None = None,
+        frame_cache: FrameCache | None = None,
     ):
         self.template = template
         self.font_size_preset = font_size_preset
@@ -225,17 +324,27 @@ class FrameRenderer:
         self._fade_alpha_steps = min(
             256, max(2, _get_int_env("SOW_FADE_ALPHA_STEPS", _DEFAULT_FADE_ALPHA_STEPS))
         )
-        self._max_cache_entries = max(
-            1, _get_int_env("SOW_MAX_CACHE_ENTRIES", _DEFAULT_MAX_CACHE_ENTRIES)
+        self._frame_cache = (
+            frame_cache
+            if frame_cache is not None
+            else create_frame_cache(self.resolution, max_cache_entries, max_cache_bytes)
         )
-        self._frame_cache: OrderedDict[tuple, bytes] = OrderedDict()
-        self._cache_hits = 0
-        self._cache_misses = 0
+        self._max_cache_entries = self._frame_cache.capacity
         self._alpha_step_size = 256 // self._fade_alpha_steps
 
+        self._max_layer_entries = max(
+            1, _get_int_env("SOW_MAX_LAYER_ENTRIES", _DEFAULT_MAX_LAYER_ENTRIES)
+        )
+        self._layer_cache: OrderedDict[tuple, TextLayer] = OrderedDict()
+        self._layer_hits = 0
+        self._layer_misses = 0
+        self._measure_draw = ImageDraw.Draw(Image.new("L", (1, 1)))
+        self._background: np.ndarray | None = None
+
         logger.info(
             "FrameRenderer init: template=%s, font_size=%s, resolution=%dx%d, font_family=%s, "
-            "cache_enabled=%s, fade_alpha_steps=%d, max_entries=%d",
+            "cache_enabled=%s, fade_alpha_steps=%d, max_entries=%d (%.0fMB), "
+            "max_layer_entries=%d",
             self.template.name,
             self.font_size_preset,
             self.resolution[0],
@@ -244,6 +353,8 @@ class FrameRenderer:
             self._cache_enabled,
             self._fade_alpha_steps,
             self._max_cache_entries,
+            self._frame_cache.size_bytes / (1024 * 1024),
+            self._max_layer_entries,
         )
 
     def get_base_font_size(self) -> int:
@@ -254,7 +365,7 @@ class FrameRenderer:
 
     def fit_text(
         self,
-        draw: ImageDraw.ImageDraw,
+        draw: ImageDraw.ImageDraw | _LayerCanvas,
         text: str,
         target_font_size: int,
         max_width: int,
@@ -269,7 +380,7 @@ class FrameRenderer:
 
     def get_margin(
         self,
-        draw: ImageDraw.ImageDraw,
+        draw: ImageDraw.ImageDraw | _LayerCanvas,
         font_size: int,
     ) -> float:
         font = self._get_font(font_size)
@@ -278,15 +389,19 @@ class FrameRenderer:
 
     def clear_cache(self) -> None:
         self._frame_cache.clear()
-        self._cache_hits = 0
-        self._cache_misses = 0
+        self._layer_cache.clear()
+        self._layer_hits = 0
+        self._layer_misses = 0
 
     def get_cache_stats(self) -> dict[str, int]:
+        return self._frame_cache.get_stats()
+
+    def get_layer_cache_stats(self) -> dict[str, int]:
         return {
-            "entries": len(self._frame_cache),
-            "hits": self._cache_hits,
-            "misses": self._cache_misses,
-            "max_entries": self._max_cache_entries,
+            "entries": len(self._layer_cache),
+            "hits": self._layer_hits,
+            "misses": self._layer_misses,
+            "max_entries": self._max_layer_entries,
         }
 
     def _quantize_alpha(self, alpha: int) -> int:
@@ -305,6 +420,82 @@ class FrameRenderer:
             for channel, background in zip(foreground, self.template.background_color)
         )
 
+    def _draw_text(
+        self,
+        draw: ImageDraw.ImageDraw | _LayerCanvas,
+        xy: tuple[int, int],
+        text: str,
+        font_size: int,
+        color: tuple[int, int, int],
+        alpha: int,
+        anchor: str,
+    ) -> None:
+        if isinstance(draw, _LayerCanvas):
+            draw.layers.append((self._get_text_layer(text, font_size, xy, anchor), color, alpha))
+            return
+        draw.text(
+            xy,
+            text,
+            fill=self._composite_over_background(color, alpha),
+            font=self._get_font(font_size),
+            anchor=anchor,
+        )
+
+    def _get_text_layer(
+        self,
+        text: str,
+        font_size: int,
+        xy: tuple[int, int],
+        anchor: str,
+    ) -> TextLayer:
+        key = (text, font_size, xy, anchor)
+        layer = self._layer_cache.get(key)
+        if layer is not None:
+            self._layer_hits += 1
+            self._layer_cache.move_to_end(key)
+            return layer
+
+        self._layer_misses += 1
+        width, height = self.resolution
+        font = self._get_font(font_size)
+        left, top, right, bottom = self._measure_draw.textbbox(xy, text, font=font, anchor=anchor)
+        left, top = max(0, math.floor(left)), max(0, math.floor(top))
+        right, bottom = min(width, math.ceil(right)), min(height, math.ceil(bottom))
+
+        mask_img = Image.new("L", (max(0, right - left), max(0, bottom - top)), 0)
+        ImageDraw.Draw(mask_img).text(
+            (xy[0] - left, xy[1] - top), text, fill=255, font=font, anchor=anchor
+        )
+        layer = TextLayer(x=left, y=top, mask=np.asarray(mask_img))
+        mask_img.close()
+
+        self._layer_cache[key] = layer
+        if len(self._layer_cache) > self._max_layer_entries:
+            self._layer_cache.popitem(last=False)
+        return layer
+
+    def _composite_layers(
+        self, layers: list[tuple[TextLayer, tuple[int, int, int], int]]
+    ) -> np.ndarray:
+        if self._background is None:
+            width, height = self.resolution
+            self._background = np.full(
+                (height, width, 3), self.template.background_color, dtype=np.uint8
+            )
+        frame = self._background.copy()
+
+        for layer, color, alpha in layers:
+            alpha = min(255, alpha)
+            if alpha <= 0 or not layer.mask.size:
+                continue
+            layer_height, layer_width = layer.mask.shape
+            region = frame[layer.y : layer.y + layer_height, layer.x : layer.x + layer_width]
+            coverage = layer.mask * np.float32(alpha / (255 * 255))
+            blended = region + (np.asarray(color, dtype=np.float32) - region) * coverage[..., None]
+            region[...] = np.rint(blended)
+
+        return frame
+
     def _compute_intro_alpha(
         self,
         segment: SegmentInfo,
@@ -451,6 +642,7 @@ class FrameRenderer:
         lyrics: list[GlobalLRCLine],
         segments: list[SegmentInfo],
         current_time: float,
+        _lyrics_by_song: dict[str, list[GlobalLRCLine]] | None = None,
     ) -> VisualState:
         current_title = ""
         current_segment: SegmentInfo | None = None
@@ -466,7 +658,9 @@ class FrameRenderer:
                     tempo_bpm = segment.tempo_bpm
                 break
 
-        lyrics_by_song = group_lyrics_by_song(lyrics)
+        lyrics_by_song = (
+            _lyrics_by_song if _lyrics_by_song is not None else group_lyrics_by_song(lyrics)
+        )
         current_song_lyrics = lyrics_by_song.get(current_title, [])
 
         intro_alpha = 0
@@ -540,6 +734,105 @@ class FrameRenderer:
             state.is_last_lyric_faded,
         )
 
+    def _compute_timeline_key(self, state: VisualState) -> tuple:
+        if self._cache_enabled:
+            return self._compute_cache_key(state)
+        return (
+            self.font_family,
+            state.segment_id,
+            state.current_title,
+            state.current_lyric_index,
+            state.intro_alpha,
+            state.fade_alpha,
+            state.preview_alpha,
+            state.is_last_lyric_faded,
+        )
+
+    def build_timeline(
+        self,
+        lyrics: list[GlobalLRCLine],
+        segments: list[SegmentInfo],
+        fps: int,
+        start_frame: int,
+        end_frame: int,
+    ) -> RenderTimeline:
+        """Resolve visual state only where it can change and merge frames with the same key.
+
+        Segment boundaries and lyric timestamps cut the range into pieces. Inside a
+        piece the segment and lyric line are fixed and every alpha only moves one
+        way, so equal keys at a piece's first and last frame mean the whole piece
+        shares that key. Pieces that differ are bisected, so frames are resolved
+        only at change points and inside fades.
+
+        With the frame cache enabled the key uses quantized alphas, so each interval
+        maps to exactly one cache entry; with it disabled the key uses exact alphas
+        and the output is identical to resolving frame by frame.
+        """
+        end_frame = max(start_frame, end_frame)
+        lyrics_by_song = group_lyrics_by_song(lyrics)
+        resolved: dict[int, tuple[tuple, VisualState]] = {}
+
+        def resolve(frame_index: int) -> tuple[tuple, VisualState]:
+            if frame_index not in resolved:
+                state = self._resolve_visual_state(
+                    lyrics, segments, frame_index / fps, _lyrics_by_song=lyrics_by_song
+                )
+                resolved[frame_index] = (self._compute_timeline_key(state), state)
+            return resolved[frame_index]
+
+        change_times = [line.global_time_seconds for line in lyrics]
+        for segment in segments:
+            change_times.append(segment.start_time_seconds)
+            change_times.append(segment.start_time_seconds + segment.duration_seconds)
+        cuts = {start_frame, end_frame}
+        for change_time in change_times:
+            frame_index = _first_frame_at(change_time, fps)
+            if start_frame < frame_index < end_frame:
+                cuts.add(frame_index)
+
+        # [start, end, key, state] runs; adjacent equal keys are merged on append
+        runs: list[list[Any]] = []
+
+        def emit(first: int, last: int) -> None:
+            key, state = resolve(first)
+            if runs and runs[-1][1] == first and runs[-1][2] == key:
+                runs[-1][1] = last
+            else:
+                runs.append([first, last, key, state])
+
+        def fill(first: int, last: int) -> None:
+            if last - first == 1 or resolve(first)[0] == resolve(last - 1)[0]:
+                emit(first, last)
+                return
+            middle = (first + last) // 2
+            fill(first, middle)
+            fill(middle, last)
+
+        ordered_cuts = sorted(cuts)
+        for first, last in zip(ordered_cuts, ordered_cuts[1:]):
+            fill(first, last)
+
+        return RenderTimeline(
+            fps=fps,
+            start_frame=start_frame,
+            end_frame=end_frame,
+            intervals=tuple(TimelineInterval(*run) for run in runs),
+        )
+
+    def render_interval_bytes(self, interval: TimelineInterval) -> FrameBuffer:
+        if self._cache_enabled:
+            return self._render_cached_bytes(interval.cache_key, interval.state)
+        return self._render_frame_array(interval.state).tobytes()
+
+    def _render_cached_bytes(self, cache_key: tuple, state: VisualState) -> FrameBuffer:
+        cached = self._frame_cache.get(cache_key)
+        if cached is not None:
+            return cached
+
+        frame = self._render_frame_array(state)
+        cached = self._frame_cache.put(cache_key, frame)
+        return cached if cached is not None else frame.tobytes()
+
     def render_frame(
         self,
         lyrics: list[GlobalLRCLine],
@@ -559,32 +852,18 @@ class FrameRenderer:
         state = self._resolve_visual_state(lyrics, segments, current_time)
 
         if self._cache_enabled:
-            cache_key = self._compute_cache_key(state)
-            if cache_key in self._frame_cache:
-                self._cache_hits += 1
-                self._frame_cache.move_to_end(cache_key)
-                return self._frame_cache[cache_key]
+            return bytes(self._render_cached_bytes(self._compute_cache_key(state), state))
 
-            self._cache_misses += 1
-            img = self._render_frame_impl(state)
-            frame_bytes = img.tobytes()
-            img.close()
-
-            self._frame_cache[cache_key] = frame_bytes
-            if len(self._frame_cache) > self._max_cache_entries:
-                self._frame_cache.popitem(last=False)
-
-            return frame_bytes
-
-        img = self._render_frame_impl(state)
-        frame_bytes = img.tobytes()
-        img.close()
-        return frame_bytes
+        return self._render_frame_array(state).tobytes()
 
     def _render_frame_impl(self, state: VisualState) -> Image.Image:
+        return Image.fromarray(self._render_frame_array(state), "RGB")
+
+    def _render_frame_array(self, state: VisualState) -> np.ndarray:
+        # Text is rasterized once per layer and alpha-blended with NumPy, so a fade
+        # step costs a few masked blends instead of a full Pillow redraw.
         width, height = self.resolution
-        img = Image.new("RGB", (width, height), self.template.background_color)
-        draw = ImageDraw.Draw(img)
+        draw = _LayerCanvas(self._measure_draw)
 
         current_title = state.current_title
         current_segment = state.current_segment
@@ -604,19 +883,19 @@ class FrameRenderer:
             )
 
         if current_title and intro_info_alpha == 0:
-            text_r, text_g, text_b = self.template.text_color
             title_font_size_target = math.floor(self.base_font_size * 0.8)
             margin = self.get_margin(draw, title_font_size_target)
             title_font_size = self.fit_text(
                 draw, current_title, title_font_size_target, width - margin * 2
             )
-            font = self._get_font(title_font_size)
-            draw.text(
+            self._draw_text(
+                draw,
                 (width // 2, 50),
                 current_title,
-                fill=(text_r, text_g, text_b),
-                font=font,
-                anchor="mt",
+                title_font_size,
+                self.template.text_color,
+                255,
+                "mt",
             )
 
         if current_song_lyrics:
@@ -632,14 +911,14 @@ class FrameRenderer:
                     tempo_bpm=state.tempo_bpm,
                 )
 
-        return img
+        return self._composite_layers(draw.layers)
 
     def render_intro_info(
         self,
         segment: SegmentInfo,
         current_time: float,
         first_lyric_time: float,
-        draw: ImageDraw.ImageDraw,
+        draw: ImageDraw.ImageDraw | _LayerCanvas,
         width: int,
         height: int,
     ) -> int:
@@ -689,15 +968,15 @@ class FrameRenderer:
 
         for i, line in enumerate(info_lines):
             fitted_size = self.fit_text(draw, line, intro_font_size, max_width)
-            font = self._get_font(fitted_size)
-            fill_color = self._composite_over_background(self.template.text_color, alpha)
             y_pos = base_y + i * line_height + line_height / 2
-            draw.text(
+            self._draw_text(
+                draw,
                 (width // 2, int(y_pos)),
                 line,
-                fill=fill_color,
-                font=font,
-                anchor="mm",
+                fitted_size,
+                self.template.text_color,
+                alpha,
+                "mm",
             )
 
         return alpha
@@ -707,7 +986,7 @@ class FrameRenderer:
         song_lyrics: list[GlobalLRCLine],
         current_time: float,
         current_title: str,
-        draw: ImageDraw.ImageDraw,
+        draw: ImageDraw.ImageDraw | _LayerCanvas,
         width: int,
         height: int,
         tempo_bpm: float | None = None,
@@ -742,16 +1021,14 @@ class FrameRenderer:
                 previous_font_size = self.fit_text(
                     draw, previous_line.text, current_font_size_target, width - margin * 2
                 )
-                previous_font = self._get_font(previous_font_size)
-                previous_fill_color = self._composite_over_background(
-                    self.template.highlight_color, previous_alpha
-                )
-                draw.text(
+                self._draw_text(
+                    draw,
                     (width // 2, int(height * 0.33)),
                     previous_line.text,
-                    fill=previous_fill_color,
-                    font=previous_font,
-                    anchor="mt",
+                    previous_font_size,
+                    self.template.highlight_color,
+                    previous_alpha,
+                    "mt",
                 )
 
             preview_alpha = self._compute_blank_preview_alpha(
@@ -777,15 +1054,15 @@ class FrameRenderer:
         current_font_size = self.fit_text(
             draw, current_line.text, current_font_size_target, width - margin * 2
         )
-        font = self._get_font(current_font_size)
-        fill_color = self._composite_over_background(self.template.highlight_color, fade_alpha)
         y = int(height * 0.33)
-        draw.text(
+        self._draw_text(
+            draw,
             (width // 2, y),
             current_line.text,
-            fill=fill_color,
-            font=font,
-            anchor="mt",
+            current_font_size,
+            self.template.highlight_color,
+            fade_alpha,
+            "mt",
         )
 
         if not is_last_lyric_faded:
@@ -804,7 +1081,7 @@ class FrameRenderer:
         self,
         next_line: GlobalLRCLine,
         next_alpha: int,
-        draw: ImageDraw.ImageDraw,
+        draw: ImageDraw.ImageDraw | _LayerCanvas,
         width: int,
         height: int,
     ) -> None:
@@ -819,15 +1096,15 @@ class FrameRenderer:
             next_font_size_target,
             width - next_margin * 2,
         )
-        next_font = self._get_font(next_font_size)
-        next_fill_color = self._composite_over_background(self.template.text_color, next_alpha)
         next_y = int(height * 0.33 + 200)
-        draw.text(
+        self._draw_text(
+            draw,
             (width // 2, next_y),
             next_line.text,
-            fill=next_fill_color,
-            font=next_font,
-            anchor="mt",
+            next_font_size,
+            self.template.text_color,
+            next_alpha,
+            "mt",
         )
 
     def render_title_card(self, config: TitleCardConfig) -> Image.Image:
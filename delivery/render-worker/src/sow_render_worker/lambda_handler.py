@@ -29,13 +29,21 @@ def _process_record(record: dict, config, conn, context) -> None:
         raise ValueError("SQS message body missing required field 'userId'")
     user_id = int(user_id)
 
+    pipeline_kwargs = {}
+    render_workers = record_data.get("renderWorkers")
+    if render_workers is not None:
+        try:
+            pipeline_kwargs["render_workers"] = int(render_workers)
+        except (TypeError, ValueError) as exc:
+            raise ValueError(f"Invalid 'renderWorkers' value: {render_workers!r}") from exc
+
     logger.info(
         "Processing render job",
         extra={"job_id": job_id, "user_id": user_id},
     )
 
     start = time.monotonic()
-    execute_render_pipeline(job_id, user_id, conn, lambda_context=context)
+    execute_render_pipeline(job_id, user_id, conn, lambda_context=context, **pipeline_kwargs)
     duration = time.monotonic() - start
 
     logger.info(
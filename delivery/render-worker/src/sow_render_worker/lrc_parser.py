@@ -2,6 +2,7 @@ from __future__ import annotations
 
 import re
 from dataclasses import dataclass
+from functools import lru_cache
 
 
 @dataclass(frozen=True)
@@ -20,6 +21,7 @@ class GlobalLRCLine:
 
 _LRC_PATTERN = re.compile(r"\[(\d{2}):(\d{2})\.(\d{2,3})\](.*)")
 _VALID_LRC_PATTERN = re.compile(r"\[\d{2}:\d{2}\.\d{2,3}\]")
+_PARSED_LRC_CACHE_SIZE = 128
 
 
 def parse_lrc(lrc_content: str) -> list[LRCLine]:
@@ -39,8 +41,14 @@ def parse_lrc(lrc_content: str) -> list[LRCLine]:
     return lines
 
 
+@lru_cache(maxsize=_PARSED_LRC_CACHE_SIZE)
+def parse_lrc_cached(lrc_content: str) -> tuple[LRCLine, ...]:
+    """``parse_lrc`` memoised by content; video and chapters both parse each song."""
+    return tuple(parse_lrc(lrc_content))
+
+
 def convert_to_global_timeline(
-    local_lines: list[LRCLine],
+    local_lines: list[LRCLine] | tuple[LRCLine, ...],
     segment_start_seconds: float,
     title: str,
 ) -> list[GlobalLRCLine]:
@@ -0,0 +1,300 @@
+from __future__ import annotations
+
+import logging
+import mmap
+import multiprocessing
+import os
+from collections import deque
+from multiprocessing.connection import Connection
+from typing import Any, Iterator
+
+from sow_render_worker.frame_cache import FrameBuffer, FrameCache, allocate_frame_arena
+from sow_render_worker.frame_renderer import (
+    FrameRenderer,
+    SegmentInfo,
+    _get_int_env,
+    create_frame_cache,
+)
+from sow_render_worker.lrc_parser import GlobalLRCLine
+
+logger = logging.getLogger(__name__)
+
+_DEFAULT_RENDER_WORKERS = 1
+_DEFAULT_RENDER_CHUNK_FRAMES = 48
+_MAX_INFLIGHT_CHUNKS_PER_WORKER = 2
+_WORKER_JOIN_TIMEOUT_SECONDS = 5
+
+FrameRun = tuple[FrameBuffer, int]
+# A worker reply run: a slot index in the worker's shared cache partition, or the
+# frame bytes when the frame could not be cached.
+_WorkerRun = tuple[int | bytes, int]
+
+
+def available_cpu_count() -> int:
+    try:
+        return max(1, len(os.sched_getaffinity(0)))
+    except (AttributeError, OSError):
+        return max(1, os.cpu_count() or 1)
+
+
+def resolve_render_workers(requested: int | None = None) -> int:
+    """Number of render processes to use; 0 or less means one per available vCPU."""
+    if requested is None:
+        requested = _get_int_env("SOW_RENDER_WORKERS", _DEFAULT_RENDER_WORKERS)
+    cpu_count = available_cpu_count()
+    if requested <= 0:
+        return cpu_count
+    return min(requested, cpu_count)
+
+
+def render_frame_runs(
+    renderer: FrameRenderer,
+    lyrics: list[GlobalLRCLine],
+    segments: list[SegmentInfo],
+    fps: int,
+    start_frame: int,
+    end_frame: int,
+) -> list[FrameRun]:
+    timeline = renderer.build_timeline(lyrics, segments, fps, start_frame, end_frame)
+    return [
+        (renderer.render_interval_bytes(interval), interval.frame_count)
+        for interval in timeline.intervals
+    ]
+
+
+def _render_worker_runs(
+    renderer: FrameRenderer,
+    lyrics: list[GlobalLRCLine],
+    segments: list[SegmentInfo],
+    fps: int,
+    start_frame: int,
+    end_frame: int,
+    shared: bool,
+) -> list[_WorkerRun]:
+    timeline = renderer.build_timeline(lyrics, segments, fps, start_frame, end_frame)
+    frame_cache = renderer._frame_cache
+    runs: list[_WorkerRun] = []
+    for interval in timeline.intervals:
+        frame = renderer.render_interval_bytes(interval)
+        slot = frame_cache.slot_of(interval.cache_key) if shared else None
+        if slot is None or not isinstance(frame, memoryview):
+            runs.append((bytes(frame), interval.frame_count))
+            continue
+        # Keep this reply's slots until the parent has read them.
+        frame_cache.pinned.add(slot)
+        runs.append((slot, interval.frame_count))
+    return runs
+
+
+def _render_worker_main(
+    conn: Connection,
+    renderer_kwargs: dict[str, Any],
+    lyrics: list[GlobalLRCLine],
+    segments: list[SegmentInfo],
+    fps: int,
+) -> None:
+    renderer = FrameRenderer(**renderer_kwargs)
+    shared = renderer_kwargs.get("frame_cache") is not None and renderer._cache_enabled
+    sent_slots: set[int] = set()
+    try:
+        while True:
+            request = conn.recv()
+            if request is None:
+                break
+            start_frame, end_frame = request
+            # The parent has consumed every earlier reply except the previous one
+            # (see ParallelFrameRenderer.iter_runs), so only its slots stay pinned.
+            renderer._frame_cache.pinned = set(sent_slots)
+            try:
+                runs = _render_worker_runs(
+                    renderer, lyrics, segments, fps, start_frame, end_frame, shared
+                )
+            except Exception as exc:
+                conn.send(("error", f"{type(exc).__name__}: {exc}", None))
+                continue
+            sent_slots = {slot for slot, _ in runs if isinstance(slot, int)}
+            conn.send(("ok", runs, renderer.get_cache_stats()))
+    except (EOFError, KeyboardInterrupt):
+        pass
+    finally:
+        conn.close()
+
+
+class ParallelFrameRenderer:
+    """Renders frame ranges in worker processes and yields them back in timeline order.
+
+    Chunks are dispatched round-robin and each worker answers in FIFO order, so
+    reading chunk ``i`` from worker ``i % workers`` reassembles the timeline without
+    a reorder buffer. At most ``_MAX_INFLIGHT_CHUNKS_PER_WORKER`` chunks per worker are
+    outstanding, which bounds memory when the ffmpeg pipe is the slower side.
+
+    Uses ``Process`` + ``Pipe`` rather than ``multiprocessing.Pool``: Lambda has no
+    ``/dev/shm``, so the semaphore-backed queues a pool relies on are unavailable.
+
+    With the fork start method each worker's frame cache is a partition of one
+    anonymous shared mapping, so replies carry slot indices instead of frame bytes
+    and the parent hands out views of those slots without copying.
+    """
+
+    def __init__(
+        self,
+        renderer_kwargs: dict[str, Any],
+        lyrics: list[GlobalLRCLine],
+        segments: list[SegmentInfo],
+        fps: int,
+        workers: int,
+        chunk_frames: int | None = None,
+    ):
+        self.renderer_kwargs = renderer_kwargs
+        self.lyrics = lyrics
+        self.segments = segments
+        self.fps = fps
+        self.workers = max(1, workers)
+        self.chunk_frames = max(
+            1,
+            chunk_frames
+            if chunk_frames is not None
+            else _get_int_env("SOW_RENDER_CHUNK_FRAMES", _DEFAULT_RENDER_CHUNK_FRAMES),
+        )
+        self._processes: list[multiprocessing.process.BaseProcess] = []
+        self._conns: list[Connection] = []
+        self._worker_stats: list[dict[str, int] | None] = []
+        self._arena: mmap.mmap | None = None
+        self._frame_caches: list[FrameCache] = []
+
+    def __enter__(self) -> ParallelFrameRenderer:
+        self.start()
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        self.close()
+
+    def _create_shared_caches(self) -> None:
+        resolution = (
+            self.renderer_kwargs.get("resolution") or self.renderer_kwargs["template"].resolution
+        )
+        cache_kwargs = {
+            "max_cache_entries": self.renderer_kwargs.get("max_cache_entries"),
+            "max_cache_bytes": self.renderer_kwargs.get("max_cache_bytes"),
+        }
+        partition_bytes = create_frame_cache(resolution, **cache_kwargs).size_bytes
+        self._arena = allocate_frame_arena(partition_bytes * self.workers)
+        self._frame_caches = [
+            create_frame_cache(
+                resolution, **cache_kwargs, arena=self._arena, offset=i * partition_bytes
+            )
+            for i in range(self.workers)
+        ]
+
+    def start(self) -> None:
+        if self._processes:
+            return
+        # Spawned workers would receive a pickled copy of the arena, not the mapping.
+        if multiprocessing.get_start_method() == "fork":
+            self._create_shared_caches()
+        for worker_index in range(self.workers):
+            worker_kwargs = dict(self.renderer_kwargs)
+            if self._frame_caches:
+                worker_kwargs["frame_cache"] = self._frame_caches[worker_index]
+            parent_conn, child_conn = multiprocessing.Pipe(duplex=True)
+            process = multiprocessing.Process(
+                target=_render_worker_main,
+                args=(child_conn, worker_kwargs, self.lyrics, self.segments, self.fps),
+                daemon=True,
+            )
+            process.start()
+            child_conn.close()
+            self._processes.append(process)
+            self._conns.append(parent_conn)
+            self._worker_stats.append(None)
+        logger.info(
+            "ParallelFrameRenderer started: workers=%d, chunk_frames=%d, shared_cache=%.0fMB",
+            self.workers,
+            self.chunk_frames,
+            sum(cache.size_bytes for cache in self._frame_caches) / (1024 * 1024),
+        )
+
+    def close(self) -> None:
+        for conn in self._conns:
+            try:
+                conn.send(None)
+            except (OSError, ValueError):
+                pass
+        for process in self._processes:
+            process.join(timeout=_WORKER_JOIN_TIMEOUT_SECONDS)
+            if process.is_alive():
+                process.terminate()
+                process.join(timeout=_WORKER_JOIN_TIMEOUT_SECONDS)
+        for conn in self._conns:
+            conn.close()
+        self._processes = []
+        self._conns = []
+        self._frame_caches = []
+        if self._arena is not None:
+            try:
+                self._arena.close()
+            except BufferError:
+                # A caller still holds a frame view; the mapping goes with it.
+                pass
+            self._arena = None
+
+    def get_cache_stats(self) -> dict[str, int]:
+        totals = {
+            "entries": 0,
+            "hits": 0,
+            "misses": 0,
+            "evictions": 0,
+            "max_entries": 0,
+            "bytes": 0,
+            "max_bytes": 0,
+        }
+        for stats in self._worker_stats:
+            if stats:
+                for key in totals:
+                    totals[key] += stats.get(key, 0)
+        return totals
+
+    def iter_frames(self, start_frame: int, end_frame: int) -> Iterator[bytes]:
+        for frame_bytes, count in self.iter_runs(start_frame, end_frame):
+            for _ in range(count):
+                yield frame_bytes
+
+    def iter_runs(self, start_frame: int, end_frame: int) -> Iterator[FrameRun]:
+        if not self._processes:
+            raise RuntimeError("ParallelFrameRenderer.start() must be called before rendering")
+
+        chunks = [
+            (chunk_start, min(chunk_start + self.chunk_frames, end_frame))
+            for chunk_start in range(start_frame, end_frame, self.chunk_frames)
+        ]
+        max_inflight = self.workers * _MAX_INFLIGHT_CHUNKS_PER_WORKER
+        inflight: deque[int] = deque()
+        next_dispatch = 0
+
+        for chunk_index in range(len(chunks)):
+            while next_dispatch < len(chunks) and len(inflight) < max_inflight:
+                self._conns[next_dispatch % self.workers].send(chunks[next_dispatch])
+                inflight.append(next_dispatch)
+                next_dispatch += 1
+
+            worker_index = chunk_index % self.workers
+            try:
+                status, payload, stats = self._conns[worker_index].recv()
+            except EOFError as exc:
+                exitcode = self._processes[worker_index].exitcode
+                raise RuntimeError(
+                    f"Render worker {worker_index} exited unexpectedly (exitcode={exitcode})"
+                ) from exc
+            inflight.popleft()
+
+            if status != "ok":
+                start, end = chunks[chunk_index]
+                raise RuntimeError(
+                    f"Render worker {worker_index} failed on frames {start}-{end}: {payload}"
+                )
+            self._worker_stats[worker_index] = stats
+
+            for frame, count in payload:
+                if isinstance(frame, int):
+                    frame = self._frame_caches[worker_index].slot_view(frame)
+                yield frame, count
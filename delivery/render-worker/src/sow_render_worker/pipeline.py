@@ -2,7 +2,10 @@ from __future__ import annotations
 
 import logging
 import signal
+import threading
 import time
+from concurrent.futures import Future, ThreadPoolExecutor, wait
+from functools import partial
 from pathlib import Path
 from typing import Any
 
@@ -10,7 +13,13 @@ import psycopg2
 import psycopg2.extras
 
 from sow_render_worker.asset_fetcher import AssetFetcher
-from sow_render_worker.audio_engine import SongsetItem, generate_songset_audio
+from sow_render_worker.audio_engine import (
+    ExportResult,
+    SongsetItem,
+    generate_songset_audio,
+    mix_songset_audio,
+    plan_songset_audio,
+)
 from sow_render_worker.chapters import generate_chapters_manifest
 from sow_render_worker.db import (
     RenderProgress,
@@ -22,12 +31,19 @@ from sow_render_worker.db import (
     start_render_job,
     update_render_progress,
 )
+from sow_render_worker.frame_renderer import _get_bool_env
+from sow_render_worker.segment_cache import (
+    SegmentCache,
+    mix_songset_audio_cached,
+    resolve_segment_cache_enabled,
+)
 from sow_render_worker.uploader import R2Uploader, RenderArtifacts
 from sow_render_worker.video_engine import ChapterInfo, VideoEngine
 
 logger = logging.getLogger(__name__)
 
 LAMBDA_TIMEOUT_SAFETY_MARGIN_SECONDS = 60
+AUDIO_MIX_POLL_SECONDS = 1.0
 
 MAX_SONGSET_ITEMS = 5
 MAX_SONGSET_DURATION_SECONDS = 1500
@@ -193,6 +209,12 @@ class PipelineCancelledError(Exception):
     pass
 
 
+def resolve_overlap_audio_mix(requested: bool | None = None) -> bool:
+    if requested is None:
+        return _get_bool_env("SOW_OVERLAP_AUDIO_MIX", False)
+    return requested
+
+
 def _segment_to_chapter_info(seg, index: int) -> ChapterInfo:
     item = seg.item
     return ChapterInfo(
@@ -213,6 +235,9 @@ def execute_render_pipeline(
     asset_fetcher: AssetFetcher | None = None,
     uploader: R2Uploader | None = None,
     lambda_context: Any | None = None,
+    render_workers: int | None = None,
+    overlap_audio_mix: bool | None = None,
+    segment_cache: SegmentCache | None = None,
 ) -> None:
     job = get_render_job(conn, job_id, user_id)
     if not job:
@@ -225,10 +250,15 @@ def execute_render_pipeline(
         asset_fetcher = AssetFetcher()
     if uploader is None:
         uploader = R2Uploader()
+    if segment_cache is None and resolve_segment_cache_enabled():
+        segment_cache = SegmentCache()
 
     asset_fetcher.initialize()
     temp_dir = asset_fetcher.get_job_temp_dir(job_id)
     pipeline_start = time.monotonic()
+    audio_executor: ThreadPoolExecutor | None = None
+    # Set on the way out so an overlapped mixdown kills its ffmpeg process
+    audio_cancel = threading.Event()
 
     def check_cancelled() -> None:
         current = get_render_job(conn, job_id, user_id)
@@ -324,6 +354,21 @@ def execute_render_pipeline(
 
         check_lambda_timeout()
 
+        def prefetch_progress_callback(completed: int, total: int) -> None:
+            logger.info("[%s] Asset prefetch: %d/%d", job_id, completed, total)
+
+        # Audio mixing, lyric rendering and the chapters manifest all read from
+        # the fetcher's cache after this.
+        asset_fetcher.prefetch(
+            [item.recording_hash_prefix for item in items if item.recording_hash_prefix],
+            progress_callback=prefetch_progress_callback,
+        )
+        logger.info("[%s] Assets prefetched (elapsed=%.1fs)", job_id, elapsed_seconds())
+
+        check_cancelled()
+
+        check_lambda_timeout()
+
         update_render_progress(
             conn,
             job_id,
@@ -352,22 +397,73 @@ def execute_render_pipeline(
                 job_id, step, total_steps, int(step / total_steps * 100) if total_steps > 0 else 0,
             )
 
-        audio_result = generate_songset_audio(
-            items,
-            audio_output_path,
-            asset_fetcher,
-            progress_callback=audio_progress_callback,
-            job_id=job_id,
-        )
+        def check_audio_output() -> None:
+            if not Path(audio_output_path).exists():
+                raise FileNotFoundError(
+                    f"Audio output file not found after generation: {audio_output_path}"
+                )
 
-        if not Path(audio_output_path).exists():
-            raise FileNotFoundError(
-                f"Audio output file not found after generation: {audio_output_path}"
+        # Video only needs the segment timing, so with overlap enabled the mixdown
+        # runs in the background and is muxed in once the video stream is encoded.
+        overlap_audio = job.video_enabled and resolve_overlap_audio_mix(overlap_audio_mix)
+        audio_future: Future[ExportResult] | None = None
+        if overlap_audio or segment_cache is not None:
+            audio_plan = plan_songset_audio(
+                items,
+                asset_fetcher,
+                progress_callback=audio_progress_callback,
+                job_id=job_id,
             )
+            mix_kwargs: dict[str, Any] = {"job_id": job_id}
+            if overlap_audio:
+                mix_kwargs["cancel_event"] = audio_cancel
+            if segment_cache is not None:
+                mix_audio = partial(
+                    mix_songset_audio_cached,
+                    audio_plan,
+                    audio_output_path,
+                    segment_cache,
+                    **mix_kwargs,
+                )
+            else:
+                mix_audio = partial(
+                    mix_songset_audio, audio_plan, audio_output_path, **mix_kwargs
+                )
+            accurate_total_duration = audio_plan.total_duration_seconds
+            audio_segments = audio_plan.segments
+            if overlap_audio:
+                audio_executor = ThreadPoolExecutor(
+                    max_workers=1, thread_name_prefix="audio-mix"
+                )
+                audio_future = audio_executor.submit(mix_audio)
+                logger.info("[%s] Audio mixdown running alongside video", job_id)
+            else:
+                audio_result = mix_audio()
+                check_audio_output()
+        else:
+            audio_result = generate_songset_audio(
+                items,
+                audio_output_path,
+                asset_fetcher,
+                progress_callback=audio_progress_callback,
+                job_id=job_id,
+            )
+            check_audio_output()
+            accurate_total_duration = audio_result.total_duration_seconds
+            audio_segments = audio_result.segments
+
+        def wait_for_audio_mix() -> ExportResult:
+            while not wait([audio_future], timeout=AUDIO_MIX_POLL_SECONDS).done:
+                check_lambda_timeout()
+            result = audio_future.result()
+            check_audio_output()
+            logger.info(
+                "[%s] Audio mixdown joined (elapsed=%.1fs)", job_id, elapsed_seconds()
+            )
+            return result
 
         check_cancelled()
 
-        accurate_total_duration = audio_result.total_duration_seconds
         accurate_render_ratio = get_render_ratio(conn, job.resolution, job.video_enabled)
         accurate_estimated_total = accurate_total_duration * accurate_render_ratio
 
@@ -406,6 +502,8 @@ def execute_render_pipeline(
                 title_card_lines=title_card_lines,
                 songset_name=songset_name,
                 font_family=job.font_family,
+                render_workers=render_workers,
+                segment_cache=segment_cache,
             )
 
             video_output_path = str(Path(temp_dir) / "output.mp4")
@@ -479,14 +577,30 @@ def execute_render_pipeline(
                         return
                     _last_video_db_update_time = now
 
-            video_engine.generate_video(
-                audio_output_path,
-                list(audio_result.segments),
-                video_output_path,
-                progress_callback=video_progress_callback,
-                timeout_check_callback=check_lambda_timeout,
-                job_id=job_id,
-            )
+            if audio_future is not None:
+                video_only_path = str(Path(temp_dir) / "output-video.mp4")
+                video_engine.generate_video(
+                    None,
+                    list(audio_segments),
+                    video_only_path,
+                    progress_callback=video_progress_callback,
+                    timeout_check_callback=check_lambda_timeout,
+                    job_id=job_id,
+                    total_duration_seconds=accurate_total_duration,
+                )
+                audio_result = wait_for_audio_mix()
+                video_engine.mux_audio(
+                    video_only_path, audio_output_path, video_output_path, job_id=job_id
+                )
+            else:
+                video_engine.generate_video(
+                    audio_output_path,
+                    list(audio_result.segments),
+                    video_output_path,
+                    progress_callback=video_progress_callback,
+                    timeout_check_callback=check_lambda_timeout,
+                    job_id=job_id,
+                )
 
             video_engine.frame_renderer.clear_cache()
 
@@ -575,6 +689,21 @@ def execute_render_pipeline(
         raise
 
     finally:
+        if audio_executor is not None:
+            # On failure, kill a still-running mixdown's ffmpeg and wait for the
+            # thread so nothing writes into the work dir during cleanup.
+            audio_cancel.set()
+            audio_executor.shutdown(wait=True, cancel_futures=True)
+        if segment_cache is not None:
+            stats = segment_cache.get_stats()
+            logger.info(
+                "[%s] Segment cache: %d hits, %d misses, %d stored",
+                job_id, stats["hits"], stats["misses"], stats["stores"],
+            )
+        try:
+            asset_fetcher.log_cache_stats(job_id)
+        except Exception as stats_err:
+            logger.warning("[%s] Asset cache stats failed: %s", job_id, stats_err)
         try:
             asset_fetcher.cleanup_temp()
         except Exception as cleanup_err:
@@ -0,0 +1,141 @@
+from __future__ import annotations
+
+import hashlib
+import json
+import logging
+import threading
+from pathlib import Path
+from typing import Any
+
+from sow_render_worker.audio_engine import AudioPlan, ExportResult, mix_songset_audio
+from sow_render_worker.frame_renderer import _get_bool_env
+from sow_render_worker.r2_client import R2Client, create_r2_client_from_env
+
+logger = logging.getLogger(__name__)
+
+SEGMENT_CACHE_PREFIX = "render-cache"
+# Bump when rendering or encoding changes so stale segments are never reused.
+SEGMENT_CACHE_VERSION = 1
+
+_NOT_FOUND_CODES = {"404", "NoSuchKey", "NotFound"}
+
+
+def resolve_segment_cache_enabled(requested: bool | None = None) -> bool:
+    if requested is None:
+        return _get_bool_env("SOW_SEGMENT_CACHE", False)
+    return requested
+
+
+def segment_cache_key(material: Any) -> str:
+    """Stable content key for JSON-serialisable ``material``."""
+    payload = json.dumps(
+        [SEGMENT_CACHE_VERSION, material],
+        sort_keys=True,
+        ensure_ascii=False,
+        separators=(",", ":"),
+        default=str,
+    )
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+class SegmentCache:
+    """Encoded render pieces in R2, addressed by a hash of everything that shaped them.
+
+    Entries are immutable, so a key is written once and read by any later job that
+    produces the same content. Errors are logged and treated as misses: the cache
+    only ever saves work.
+    """
+
+    def __init__(self, r2_client: R2Client | None = None, prefix: str = SEGMENT_CACHE_PREFIX):
+        client = r2_client or create_r2_client_from_env()
+        self._client = client.client
+        self._bucket_name = client.bucket_name
+        self._prefix = prefix.rstrip("/")
+        self.hits = 0
+        self.misses = 0
+        self.stores = 0
+
+    def object_key(self, kind: str, key: str, suffix: str) -> str:
+        return f"{self._prefix}/{kind}/{key}{suffix}"
+
+    def fetch(self, kind: str, key: str, dest: Path) -> bool:
+        object_key = self.object_key(kind, key, dest.suffix)
+        try:
+            self._client.download_file(self._bucket_name, object_key, str(dest))
+        except Exception as exc:
+            code = str(getattr(exc, "response", {}).get("Error", {}).get("Code", ""))
+            if code not in _NOT_FOUND_CODES:
+                logger.warning("Segment cache fetch failed for %s: %s", object_key, exc)
+            try:
+                dest.unlink()
+            except OSError:
+                pass
+            self.misses += 1
+            return False
+        self.hits += 1
+        return True
+
+    def store(self, kind: str, key: str, src: Path) -> None:
+        object_key = self.object_key(kind, key, src.suffix)
+        try:
+            self._client.upload_file(str(src), self._bucket_name, object_key)
+        except Exception as exc:
+            logger.warning("Segment cache store failed for %s: %s", object_key, exc)
+            return
+        self.stores += 1
+
+    def get_stats(self) -> dict[str, int]:
+        return {"hits": self.hits, "misses": self.misses, "stores": self.stores}
+
+
+def audio_plan_cache_key(
+    plan: AudioPlan,
+    normalize: bool = True,
+    target_lufs: float = -14.0,
+    output_bitrate: str = "320k",
+    sample_rate: int = 44100,
+    channels: int = 2,
+) -> str:
+    return segment_cache_key(
+        {
+            "files": [
+                [
+                    audio_file["item"].recording_hash_prefix,
+                    audio_file["item"].recording_content_hash,
+                    audio_file["start_ms"],
+                    audio_file["duration_ms"],
+                    audio_file["crossfade_ms"],
+                ]
+                for audio_file in plan.audio_files
+            ],
+            "normalize": normalize,
+            "target_lufs": target_lufs,
+            "bitrate": output_bitrate,
+            "sample_rate": sample_rate,
+            "channels": channels,
+        }
+    )
+
+
+def mix_songset_audio_cached(
+    plan: AudioPlan,
+    output_path: str,
+    segment_cache: SegmentCache,
+    job_id: str | None = None,
+    cancel_event: threading.Event | None = None,
+) -> ExportResult:
+    """``mix_songset_audio`` that reuses a previous mixdown of the same plan."""
+    key = audio_plan_cache_key(plan)
+    output = Path(output_path)
+    output.parent.mkdir(parents=True, exist_ok=True)
+    if segment_cache.fetch("audio", key, output):
+        logger.info("[%s] Audio: reused cached mixdown %s", job_id or "unknown", key[:12])
+        return ExportResult(
+            output_path=output_path,
+            total_duration_seconds=plan.total_duration_seconds,
+            segments=plan.segments,
+        )
+
+    result = mix_songset_audio(plan, output_path, job_id=job_id, cancel_event=cancel_event)
+    segment_cache.store("audio", key, output)
+    return result
@@ -8,21 +8,35 @@ import shutil
 import subprocess
 import threading
 import time
-from dataclasses import dataclass, field
+from dataclasses import asdict, dataclass, field, replace
 from pathlib import Path
-from typing import Any, Callable, Protocol
+from typing import Any, Callable, Iterator, Literal, Protocol
+
+from PIL import Image
 
 from sow_render_worker.audio_engine import AudioSegmentInfo, get_audio_info
 from sow_render_worker.chapters import Chapter, ChaptersManifest, chapters_to_ffmpeg_metadata
+from sow_render_worker.frame_cache import FrameBuffer
 from sow_render_worker.frame_renderer import (
     VIDEO_TEMPLATES,
     FontSizePreset,
     FrameRenderer,
+    RenderTimeline,
     SegmentInfo,
     TitleCardConfig,
     VideoTemplateName,
 )
-from sow_render_worker.lrc_parser import GlobalLRCLine, convert_to_global_timeline, parse_lrc
+from sow_render_worker.lrc_parser import (
+    GlobalLRCLine,
+    convert_to_global_timeline,
+    parse_lrc_cached,
+)
+from sow_render_worker.parallel_renderer import (
+    FrameRun,
+    ParallelFrameRenderer,
+    resolve_render_workers,
+)
+from sow_render_worker.segment_cache import SegmentCache, segment_cache_key
 
 logger = logging.getLogger(__name__)
 
@@ -34,6 +48,24 @@ RESOLUTION_MAP: dict[str, tuple[int, int]] = {
 
 _MEMORY_WARNING_FRACTION = 0.90
 
+FrameEmitMode = Literal["pipe", "concat"]
+_FRAME_EMIT_MODES: tuple[FrameEmitMode, ...] = ("pipe", "concat")
+_DEFAULT_FRAME_EMIT_MODE: FrameEmitMode = "pipe"
+_CONCAT_PNG_COMPRESS_LEVEL = 1
+_FFMPEG_POLL_INTERVAL_SECONDS = 1.0
+
+
+def resolve_frame_emit_mode(requested: str | None = None) -> FrameEmitMode:
+    mode = (requested or os.environ.get("SOW_FRAME_EMIT_MODE", "")).strip().lower()
+    if not mode:
+        return _DEFAULT_FRAME_EMIT_MODE
+    if mode not in _FRAME_EMIT_MODES:
+        logger.warning(
+            "Unknown frame emit mode %r; falling back to %s", mode, _DEFAULT_FRAME_EMIT_MODE
+        )
+        return _DEFAULT_FRAME_EMIT_MODE
+    return mode  # type: ignore[return-value]
+
 
 def _check_memory_pressure() -> None:
     try:
@@ -66,6 +98,20 @@ class VideoExportResult:
     fps: int
 
 
+@dataclass(frozen=True)
+class VideoChunk:
+    """A frame range encoded on its own so it can be reused by later renders."""
+
+    start_frame: int
+    end_frame: int
+    key: str
+    timeline: RenderTimeline | None = None
+
+    @property
+    def frame_count(self) -> int:
+        return self.end_frame - self.start_frame
+
+
 @dataclass(frozen=True)
 class ChapterInfo:
     position: int
@@ -100,6 +146,9 @@ class VideoEngine:
         font_family: str = "noto_serif_tc",
         ffmpeg_path: str | None = None,
         ffprobe_path: str | None = None,
+        render_workers: int | None = None,
+        frame_emit_mode: str | None = None,
+        segment_cache: SegmentCache | None = None,
     ):
         self.asset_fetcher = asset_fetcher
         self.template = VIDEO_TEMPLATES.get(template, VIDEO_TEMPLATES["dark"])
@@ -113,6 +162,9 @@ class VideoEngine:
         self.font_family = font_family
         self.ffmpeg_path = ffmpeg_path or self._find_ffmpeg()
         self.ffprobe_path = ffprobe_path or "ffprobe"
+        self.render_workers = resolve_render_workers(render_workers)
+        self.frame_emit_mode = resolve_frame_emit_mode(frame_emit_mode)
+        self.segment_cache = segment_cache
 
         self.frame_renderer = FrameRenderer(
             template=self.template,
@@ -121,6 +173,30 @@ class VideoEngine:
             font_family=self.font_family,
         )
 
+    def _create_parallel_renderer(
+        self,
+        lyrics: list[GlobalLRCLine],
+        segments: list[SegmentInfo],
+    ) -> ParallelFrameRenderer:
+        # Each worker keeps its own frame cache; split the budget so total memory
+        # stays at what a single renderer would use.
+        per_worker_cache_entries = max(
+            1, self.frame_renderer._max_cache_entries // self.render_workers
+        )
+        return ParallelFrameRenderer(
+            renderer_kwargs={
+                "template": self.template,
+                "font_size_preset": self.font_size_preset,
+                "resolution": self.resolution,
+                "font_family": self.font_family,
+                "max_cache_entries": per_worker_cache_entries,
+            },
+            lyrics=lyrics,
+            segments=segments,
+            fps=self.fps,
+            workers=self.render_workers,
+        )
+
     @staticmethod
     def _find_ffmpeg() -> str:
         found = shutil.which("ffmpeg")
@@ -144,23 +220,40 @@ class VideoEngine:
             "+faststart",
         ]
 
+    @staticmethod
+    def _audio_input_args(audio_path: str | None) -> list[str]:
+        return ["-i", audio_path] if audio_path else []
+
+    @staticmethod
+    def _audio_output_args(audio_path: str | None) -> list[str]:
+        if not audio_path:
+            return ["-an"]
+        return ["-c:a", "aac", "-b:a", "192k", "-shortest"]
+
     def generate_video(
         self,
-        audio_path: str,
+        audio_path: str | None,
         segments: list[AudioSegmentInfo],
         output_path: str,
         progress_callback: ProgressCallback | None = None,
         timeout_check_callback: TimeoutCheckCallback | None = None,
         job_id: str | None = None,
+        total_duration_seconds: float | None = None,
     ) -> VideoExportResult:
+        """Render the lyric video over ``audio_path``.
+
+        With ``audio_path=None`` a video-only stream of ``total_duration_seconds`` is
+        encoded, to be joined with the mixed audio later by :meth:`mux_audio`.
+        """
         output_dir = Path(output_path).parent
         output_dir.mkdir(parents=True, exist_ok=True)
 
-        audio_info = get_audio_info(audio_path)
-        if not audio_info:
-            raise ValueError("Could not get audio info")
+        if total_duration_seconds is None:
+            audio_info = get_audio_info(audio_path) if audio_path else None
+            if not audio_info:
+                raise ValueError("Could not get audio info")
+            total_duration_seconds = audio_info["duration_seconds"]
 
-        total_duration_seconds = audio_info["duration_seconds"]
         total_frames = math.ceil(total_duration_seconds * self.fps)
 
         logger.info(
@@ -172,6 +265,17 @@ class VideoEngine:
             self.fps,
         )
 
+        if self.segment_cache is not None:
+            # Start every song on a frame boundary so its frames, and therefore its
+            # cached encode, do not depend on where it sits in the set. The shift
+            # is at most half a frame.
+            segments = [
+                replace(
+                    seg, start_time_seconds=round(seg.start_time_seconds * self.fps) / self.fps
+                )
+                for seg in segments
+            ]
+
         all_lyrics: list[GlobalLRCLine] = []
         chapters: list[ChapterInfo] = []
 
@@ -187,7 +291,7 @@ class VideoEngine:
             if not lrc_content:
                 continue
 
-            local_lyrics = parse_lrc(lrc_content)
+            local_lyrics = parse_lrc_cached(lrc_content)
             title = segment.item.song_title or (
                 str(segment.item.song_id) if segment.item.song_id else f"song-{i}"
             )
@@ -289,7 +393,7 @@ class VideoEngine:
 
     def encode_video_with_ffmpeg(
         self,
-        audio_path: str,
+        audio_path: str | None,
         output_path: str,
         total_frames: int,
         total_duration_seconds: float,
@@ -300,6 +404,36 @@ class VideoEngine:
         timeout_check_callback: TimeoutCheckCallback | None = None,
         job_id: str | None = None,
     ) -> None:
+        if self.segment_cache is not None:
+            self._encode_video_segmented(
+                audio_path,
+                output_path,
+                total_frames,
+                total_duration_seconds,
+                lyrics,
+                segments,
+                progress_callback,
+                title_card_config,
+                timeout_check_callback,
+                job_id=job_id,
+            )
+            return
+
+        if self.frame_emit_mode == "concat":
+            self._encode_video_concat(
+                audio_path,
+                output_path,
+                total_frames,
+                total_duration_seconds,
+                lyrics,
+                segments,
+                progress_callback,
+                title_card_config,
+                timeout_check_callback,
+                job_id=job_id,
+            )
+            return
+
         width, height = self.resolution
 
         if self.frame_renderer:
@@ -307,11 +441,30 @@ class VideoEngine:
 
         ffmpeg_start_ns = time.monotonic_ns()
         logger.info(
-            "[%s] encode_video_with_ffmpeg: starting FFmpeg pipe, %d frames (%.1fs at %dfps)",
+            "[%s] encode_video_with_ffmpeg: starting FFmpeg pipe, %d frames (%.1fs at %dfps), "
+            "render_workers=%d",
             job_id or "unknown",
             total_frames,
             total_duration_seconds,
             self.fps,
+            self.render_workers,
+        )
+
+        title_card_frame_count = (
+            math.ceil(self.title_card_duration_seconds * self.fps)
+            if title_card_config and title_card_config.enabled
+            else 0
+        )
+
+        # Start workers before ffmpeg exists: a forked child that inherited ffmpeg's
+        # stdin would keep the pipe open and ffmpeg would never see EOF.
+        parallel_renderer = self._start_parallel_renderer(
+            lyrics, segments, title_card_frame_count, total_frames
+        )
+        frame_iter = self._expand_runs(
+            self._iter_frame_runs(
+                lyrics, segments, title_card_frame_count, total_frames, parallel_renderer, job_id
+            )
         )
 
         args = [
@@ -329,54 +482,29 @@ class VideoEngine:
             str(self.fps),
             "-i",
             "-",
-            "-i",
-            audio_path,
+            *self._audio_input_args(audio_path),
             *self.get_video_codec_args(),
-            "-c:a",
-            "aac",
-            "-b:a",
-            "192k",
-            "-shortest",
+            *self._audio_output_args(audio_path),
             output_path,
         ]
 
-        process = subprocess.Popen(
-            args,
-            stdin=subprocess.PIPE,
-            stdout=subprocess.DEVNULL,
-            stderr=subprocess.PIPE,
-        )
-
-        stderr_chunks: list[bytes] = []
-        stderr_thread: threading.Thread | None = None
-        if process.stderr:
-
-            def _drain_stderr(pipe, chunks):
-                try:
-                    while True:
-                        chunk = pipe.read(4096)
-                        if not chunk:
-                            break
-                        chunks.append(chunk)
-                except Exception:
-                    pass
-
-            stderr_thread = threading.Thread(
-                target=_drain_stderr, args=(process.stderr, stderr_chunks), daemon=True
+        try:
+            process = subprocess.Popen(
+                args,
+                stdin=subprocess.PIPE,
+                stdout=subprocess.DEVNULL,
+                stderr=subprocess.PIPE,
             )
-            stderr_thread.start()
+        except BaseException:
+            if parallel_renderer:
+                parallel_renderer.close()
+            raise
 
-        title_card_frame_count = (
-            math.ceil(self.title_card_duration_seconds * self.fps)
-            if title_card_config and title_card_config.enabled
-            else 0
-        )
+        stderr_chunks, stderr_thread = self._start_stderr_drain(process)
 
         title_card_bytes: bytes | None = None
         if title_card_config and title_card_frame_count > 0:
-            title_card_img = self.frame_renderer.render_title_card(title_card_config)
-            title_card_bytes = title_card_img.tobytes()
-            title_card_img.close()
+            title_card_bytes = self._render_title_card_bytes(title_card_config)
 
         frame_count = 0
         render_total_ns = 0
@@ -392,11 +520,8 @@ class VideoEngine:
                 if title_card_config and frame_count < title_card_frame_count:
                     frame_bytes = title_card_bytes
                 else:
-                    current_time = frame_count / self.fps
                     t0 = time.monotonic_ns()
-                    frame_bytes = self.frame_renderer.render_frame_bytes(
-                        lyrics, segments, current_time
-                    )
+                    frame_bytes = next(frame_iter)
                     render_total_ns += time.monotonic_ns() - t0
 
                 try:
@@ -447,14 +572,7 @@ class VideoEngine:
 
                 if frame_count > 0 and frame_count % (self.fps * 5) == 0:
                     elapsed_so_far = time.monotonic_ns() - ffmpeg_start_ns
-                    cache_info = ""
-                    if self.frame_renderer and self.frame_renderer._cache_enabled:
-                        stats = self.frame_renderer.get_cache_stats()
-                        hit_rate = stats["hits"] / max(1, stats["hits"] + stats["misses"]) * 100
-                        cache_info = (
-                            f", cache={stats['entries']}entries/"
-                            f"{stats['hits']}hits/{stats['misses']}misses ({hit_rate:.0f}%)"
-                        )
+                    cache_info = self._format_cache_info(parallel_renderer)
                     logger.info(
                         "[%s] Encoding breakdown at frame %d/%d: "
                         "render=%.1fs (%.1f%%), pipe_write=%.1fs (%.1f%%)%s",
@@ -480,24 +598,15 @@ class VideoEngine:
             process.wait()
             raise
         finally:
+            if parallel_renderer:
+                parallel_renderer.close()
             total_elapsed_ns = time.monotonic_ns() - ffmpeg_start_ns
-            if self.frame_renderer and self.frame_renderer._cache_enabled:
-                stats = self.frame_renderer.get_cache_stats()
-                hit_rate = stats["hits"] / max(1, stats["hits"] + stats["misses"]) * 100
-                logger.info(
-                    "[%s] Frame cache final: %d entries, %d hits, %d misses (%.1f%% hit rate), max=%d",
-                    job_id or "unknown",
-                    stats["entries"],
-                    stats["hits"],
-                    stats["misses"],
-                    hit_rate,
-                    stats["max_entries"],
-                )
+            self._log_cache_stats(parallel_renderer, job_id)
             if total_elapsed_ns > 0:
                 logger.info(
                     "[%s] Encoding breakdown: total=%.1fs, render=%.1fs (%.1f%%), "
                     "pipe_write=%.1fs (%.1f%%), "
-                    "other=%.1fs (%.1f%%)",
+                    "other=%.1fs (%.1f%%)%s",
                     job_id or "unknown",
                     total_elapsed_ns / 1e9,
                     render_total_ns / 1e9,
@@ -506,6 +615,7 @@ class VideoEngine:
                     write_total_ns / total_elapsed_ns * 100,
                     (total_elapsed_ns - render_total_ns - write_total_ns) / 1e9,
                     (total_elapsed_ns - render_total_ns - write_total_ns) / total_elapsed_ns * 100,
+                    self._format_cache_info(parallel_renderer),
                 )
             else:
                 logger.info(
@@ -535,9 +645,621 @@ class VideoEngine:
         if progress_callback:
             progress_callback(total_frames, total_frames)
 
+    def _start_parallel_renderer(
+        self,
+        lyrics: list[GlobalLRCLine],
+        segments: list[SegmentInfo],
+        start_frame: int,
+        end_frame: int,
+    ) -> ParallelFrameRenderer | None:
+        if self.render_workers <= 1 or end_frame <= start_frame:
+            return None
+        parallel_renderer = self._create_parallel_renderer(lyrics, segments)
+        parallel_renderer.start()
+        return parallel_renderer
+
+    def _iter_frame_runs(
+        self,
+        lyrics: list[GlobalLRCLine],
+        segments: list[SegmentInfo],
+        start_frame: int,
+        end_frame: int,
+        parallel_renderer: ParallelFrameRenderer | None = None,
+        job_id: str | None = None,
+    ) -> Iterator[FrameRun]:
+        if parallel_renderer:
+            yield from parallel_renderer.iter_runs(start_frame, end_frame)
+            return
+
+        timeline_start_ns = time.monotonic_ns()
+        timeline = self.frame_renderer.build_timeline(
+            lyrics, segments, self.fps, start_frame, end_frame
+        )
+        logger.info(
+            "[%s] Render timeline: %d intervals (%d unique states) for %d frames in %.2fs",
+            job_id or "unknown",
+            len(timeline.intervals),
+            timeline.unique_states,
+            timeline.frame_count,
+            (time.monotonic_ns() - timeline_start_ns) / 1e9,
+        )
+        yield from self._render_timeline_runs(timeline)
+
+    def _render_timeline_runs(self, timeline: RenderTimeline) -> Iterator[FrameRun]:
+        for interval in timeline.intervals:
+            yield self.frame_renderer.render_interval_bytes(interval), interval.frame_count
+
+    @staticmethod
+    def _expand_runs(runs: Iterator[FrameRun]) -> Iterator[FrameBuffer]:
+        for frame_bytes, count in runs:
+            for _ in range(count):
+                yield frame_bytes
+
+    def _render_title_card_bytes(self, title_card_config: TitleCardConfig) -> bytes:
+        title_card_img = self.frame_renderer.render_title_card(title_card_config)
+        title_card_bytes = title_card_img.tobytes()
+        title_card_img.close()
+        return title_card_bytes
+
+    @staticmethod
+    def _start_stderr_drain(
+        process: subprocess.Popen,
+    ) -> tuple[list[bytes], threading.Thread | None]:
+        stderr_chunks: list[bytes] = []
+        if not process.stderr:
+            return stderr_chunks, None
+
+        def _drain_stderr(pipe, chunks):
+            try:
+                while True:
+                    chunk = pipe.read(4096)
+                    if not chunk:
+                        break
+                    chunks.append(chunk)
+            except Exception:
+                pass
+
+        stderr_thread = threading.Thread(
+            target=_drain_stderr, args=(process.stderr, stderr_chunks), daemon=True
+        )
+        stderr_thread.start()
+        return stderr_chunks, stderr_thread
+
+    def _write_concat_frame(self, frame_bytes: FrameBuffer, path: Path) -> None:
+        img = Image.frombuffer("RGB", self.resolution, frame_bytes, "raw", "RGB", 0, 1)
+        img.save(path, format="PNG", compress_level=_CONCAT_PNG_COMPRESS_LEVEL)
+        img.close()
+
+    def _encode_video_concat(
+        self,
+        audio_path: str | None,
+        output_path: str,
+        total_frames: int,
+        total_duration_seconds: float,
+        lyrics: list[GlobalLRCLine],
+        segments: list[SegmentInfo],
+        progress_callback: ProgressCallback | None = None,
+        title_card_config: TitleCardConfig | None = None,
+        timeout_check_callback: TimeoutCheckCallback | None = None,
+        job_id: str | None = None,
+    ) -> None:
+        """Write each unique frame once and let ffmpeg's concat demuxer hold it.
+
+        The ffconcat script gives every run of identical frames a single PNG and a
+        duration; the ``fps`` filter turns that back into constant-frame-rate output.
+        """
+        if self.frame_renderer:
+            self.frame_renderer.clear_cache()
+
+        start_ns = time.monotonic_ns()
+        logger.info(
+            "[%s] encode_video_with_ffmpeg: concat mode, %d frames (%.1fs at %dfps), "
+            "render_workers=%d",
+            job_id or "unknown",
+            total_frames,
+            total_duration_seconds,
+            self.fps,
+            self.render_workers,
+        )
+
+        title_card_frame_count = (
+            min(math.ceil(self.title_card_duration_seconds * self.fps), total_frames)
+            if title_card_config and title_card_config.enabled
+            else 0
+        )
+
+        frames_dir = Path(self.asset_fetcher.get_temp_dir()) / (
+            f"frames-{int(time.time() * 1000)}"
+        )
+        frames_dir.mkdir(parents=True, exist_ok=True)
+
+        parallel_renderer: ParallelFrameRenderer | None = None
+        render_total_ns = 0
+        write_total_ns = 0
+        entries: list[list[Any]] = []
+        last_frame_bytes: bytes | None = None
+        frame_count = 0
+
+        def add_run(frame_bytes: FrameBuffer, count: int) -> None:
+            nonlocal last_frame_bytes, write_total_ns
+            if entries and frame_bytes == last_frame_bytes:
+                entries[-1][1] += count
+                return
+            t0 = time.monotonic_ns()
+            frame_path = frames_dir / f"frame-{len(entries):06d}.png"
+            self._write_concat_frame(frame_bytes, frame_path)
+            write_total_ns += time.monotonic_ns() - t0
+            entries.append([frame_path.name, count])
+            # Cached frames are views into slots the renderer may reuse; keep a copy.
+            last_frame_bytes = bytes(frame_bytes)
+
+        try:
+            if title_card_frame_count > 0:
+                add_run(self._render_title_card_bytes(title_card_config), title_card_frame_count)
+                frame_count = title_card_frame_count
+
+            parallel_renderer = self._start_parallel_renderer(
+                lyrics, segments, title_card_frame_count, total_frames
+            )
+            runs = self._iter_frame_runs(
+                lyrics, segments, title_card_frame_count, total_frames, parallel_renderer, job_id
+            )
+            while True:
+                if timeout_check_callback:
+                    timeout_check_callback()
+                _check_memory_pressure()
+
+                t0 = time.monotonic_ns()
+                run = next(runs, None)
+                render_total_ns += time.monotonic_ns() - t0
+                if run is None:
+                    break
+
+                frame_bytes, count = run
+                add_run(frame_bytes, count)
+                previous_seconds = frame_count // self.fps
+                frame_count += count
+                if progress_callback and frame_count // self.fps > previous_seconds:
+                    progress_callback(frame_count, total_frames)
+
+            if parallel_renderer:
+                parallel_renderer.close()
+
+            concat_path = frames_dir / "frames.ffconcat"
+            lines = ["ffconcat version 1.0"]
+            # image2 defaults to a 1/25 timebase, which rounds durations that are
+            # not multiples of 40ms onto the wrong output frame.
+            for name, count in entries:
+                lines.append(f"file '{name}'")
+                lines.append(f"option framerate {self.fps}")
+                lines.append(f"duration {count / self.fps:.6f}")
+            if entries:
+                # The concat demuxer drops the last entry's duration unless the
+                # file is listed once more.
+                lines.append(f"file '{entries[-1][0]}'")
+                lines.append(f"option framerate {self.fps}")
+            concat_path.write_text("\n".join(lines) + "\n", encoding="utf-8")
+
+            logger.info(
+                "[%s] Concat frames: %d unique PNGs for %d frames "
+                "(render=%.1fs, png_write=%.1fs)",
+                job_id or "unknown",
+                len(entries),
+                frame_count,
+                render_total_ns / 1e9,
+                write_total_ns / 1e9,
+            )
+
+            self._run_concat_ffmpeg(
+                concat_path, audio_path, output_path, frame_count, timeout_check_callback, job_id
+            )
+        finally:
+            if parallel_renderer:
+                parallel_renderer.close()
+            self._log_cache_stats(parallel_renderer, job_id)
+            total_elapsed_ns = time.monotonic_ns() - start_ns
+            logger.info(
+                "[%s] Encoding breakdown: total=%.1fs, render=%.1fs, png_write=%.1fs, "
+                "ffmpeg=%.1fs%s",
+                job_id or "unknown",
+                total_elapsed_ns / 1e9,
+                render_total_ns / 1e9,
+                write_total_ns / 1e9,
+                (total_elapsed_ns - render_total_ns - write_total_ns) / 1e9,
+                self._format_cache_info(parallel_renderer),
+            )
+            shutil.rmtree(frames_dir, ignore_errors=True)
+
+        if progress_callback:
+            progress_callback(total_frames, total_frames)
+
+    def _run_concat_ffmpeg(
+        self,
+        concat_path: Path,
+        audio_path: str | None,
+        output_path: str,
+        total_frames: int,
+        timeout_check_callback: TimeoutCheckCallback | None = None,
+        job_id: str | None = None,
+    ) -> None:
+        args = [
+            self.ffmpeg_path,
+            "-y",
+            "-f",
+            "concat",
+            # Per-file options (framerate) are only honoured in unsafe mode; every
+            # path in the script is a bare file name we generated.
+            "-safe",
+            "0",
+            "-i",
+            str(concat_path),
+            *self._audio_input_args(audio_path),
+            "-vf",
+            f"fps={self.fps}",
+            "-frames:v",
+            str(total_frames),
+            *self.get_video_codec_args(),
+            *self._audio_output_args(audio_path),
+            output_path,
+        ]
+
+        ffmpeg_start_ns = time.monotonic_ns()
+        process = subprocess.Popen(
+            args,
+            stdin=subprocess.DEVNULL,
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.PIPE,
+        )
+        stderr_chunks, stderr_thread = self._start_stderr_drain(process)
+
+        try:
+            while True:
+                try:
+                    return_code = process.wait(timeout=_FFMPEG_POLL_INTERVAL_SECONDS)
+                    break
+                except subprocess.TimeoutExpired:
+                    if timeout_check_callback:
+                        timeout_check_callback()
+        except BaseException:
+            process.kill()
+            process.wait()
+            raise
+        finally:
+            if stderr_thread:
+                stderr_thread.join(timeout=5)
+
+        logger.info(
+            "[%s] FFmpeg process exited with code %d in %.1fs",
+            job_id or "unknown",
+            return_code,
+            (time.monotonic_ns() - ffmpeg_start_ns) / 1e9,
+        )
+        if return_code != 0:
+            stderr_output = b"".join(stderr_chunks).decode("utf-8", errors="replace")
+            stderr_info = (
+                f"\nFFmpeg stderr (last 2000 chars): {stderr_output[-2000:]}"
+                if stderr_output
+                else ""
+            )
+            raise RuntimeError(f"FFmpeg exited with code {return_code}.{stderr_info}")
+
+    def _render_config_material(self) -> dict[str, Any]:
+        return {
+            "template": asdict(self.template),
+            "font_size_preset": self.font_size_preset,
+            "font_family": self.font_family,
+            "resolution": list(self.resolution),
+            "fps": self.fps,
+            "cache_enabled": self.frame_renderer._cache_enabled,
+            "fade_alpha_steps": self.frame_renderer._fade_alpha_steps,
+            "codec": self.get_video_codec_args(),
+        }
+
+    @staticmethod
+    def _song_material(segment: SegmentInfo | None, song_lyrics: list[GlobalLRCLine]) -> Any:
+        if segment is None:
+            return None
+        return [
+            segment.song_title,
+            segment.song_album_name,
+            segment.song_composer,
+            segment.song_lyricist,
+            segment.tempo_bpm,
+            [[line.text, round(line.local_time_seconds, 3)] for line in song_lyrics],
+        ]
+
+    def _timeline_chunk_key(self, timeline: RenderTimeline, config: dict[str, Any]) -> str:
+        song_materials: dict[str, Any] = {}
+        runs = []
+        for interval in timeline.intervals:
+            state = interval.state
+            if state.segment_id not in song_materials:
+                song_materials[state.segment_id] = self._song_material(
+                    state.current_segment, state.current_song_lyrics
+                )
+            # cache_key is (font_family, segment_id, *visual fields); the font is in
+            # the config and the segment id is replaced by what the song contains.
+            runs.append(
+                [song_materials[state.segment_id], list(interval.cache_key[2:]), interval.frame_count]
+            )
+        return segment_cache_key({"config": config, "runs": runs})
+
+    def _plan_video_chunks(
+        self,
+        lyrics: list[GlobalLRCLine],
+        segments: list[SegmentInfo],
+        total_frames: int,
+        title_card_config: TitleCardConfig | None,
+        title_card_frame_count: int,
+    ) -> list[VideoChunk]:
+        """Split the video at song starts, keying each piece by the frames it contains."""
+        config = self._render_config_material()
+        chunks: list[VideoChunk] = []
+        if title_card_config and title_card_frame_count > 0:
+            chunks.append(
+                VideoChunk(
+                    0,
+                    title_card_frame_count,
+                    segment_cache_key(
+                        {
+                            "config": config,
+                            "title_card": list(title_card_config.lines),
+                            "frames": title_card_frame_count,
+                        }
+                    ),
+                )
+            )
+
+        boundaries = {title_card_frame_count, total_frames}
+        for seg in segments[1:]:
+            frame = round(seg.start_time_seconds * self.fps)
+            if title_card_frame_count < frame < total_frames:
+                boundaries.add(frame)
+        edges = sorted(boundaries)
+        for start_frame, end_frame in zip(edges, edges[1:]):
+            timeline = self.frame_renderer.build_timeline(
+                lyrics, segments, self.fps, start_frame, end_frame
+            )
+            chunks.append(
+                VideoChunk(
+                    start_frame, end_frame, self._timeline_chunk_key(timeline, config), timeline
+                )
+            )
+        return chunks
+
+    def _encode_frames_to_file(
+        self,
+        frames: Iterator[FrameBuffer],
+        output_path: Path,
+        timeout_check_callback: TimeoutCheckCallback | None = None,
+    ) -> None:
+        width, height = self.resolution
+        args = [
+            self.ffmpeg_path,
+            "-y",
+            "-f",
+            "rawvideo",
+            "-vcodec",
+            "rawvideo",
+            "-s",
+            f"{width}x{height}",
+            "-pix_fmt",
+            "rgb24",
+            "-r",
+            str(self.fps),
+            "-i",
+            "-",
+            *self.get_video_codec_args(),
+            "-an",
+            str(output_path),
+        ]
+        process = subprocess.Popen(
+            args,
+            stdin=subprocess.PIPE,
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.PIPE,
+        )
+        stderr_chunks, stderr_thread = self._start_stderr_drain(process)
+        try:
+            for frame_index, frame_bytes in enumerate(frames):
+                if timeout_check_callback and frame_index % self.fps == 0:
+                    timeout_check_callback()
+                process.stdin.write(frame_bytes)
+            process.stdin.close()
+        except BaseException:
+            process.kill()
+            process.wait()
+            raise
+        finally:
+            if stderr_thread:
+                stderr_thread.join(timeout=5)
+
+        return_code = process.wait()
+        if return_code != 0:
+            stderr_output = b"".join(stderr_chunks).decode("utf-8", errors="replace")
+            stderr_info = (
+                f"\nFFmpeg stderr (last 2000 chars): {stderr_output[-2000:]}"
+                if stderr_output
+                else ""
+            )
+            raise RuntimeError(f"FFmpeg exited with code {return_code}.{stderr_info}")
+
+    def _concat_video_files(self, paths: list[Path], list_path: Path, output_path: str) -> None:
+        list_path.write_text(
+            "ffconcat version 1.0\n" + "".join(f"file '{path.name}'\n" for path in paths),
+            encoding="utf-8",
+        )
+        args = [
+            self.ffmpeg_path,
+            "-y",
+            "-f",
+            "concat",
+            "-safe",
+            "0",
+            "-i",
+            str(list_path),
+            "-c",
+            "copy",
+            "-movflags",
+            "+faststart",
+            output_path,
+        ]
+        result = subprocess.run(args, stdout=subprocess.DEVNULL, stderr=subprocess.PIPE)
+        if result.returncode != 0:
+            stderr_output = result.stderr.decode("utf-8", errors="replace")
+            stderr_info = (
+                f"\nFFmpeg stderr (last 2000 chars): {stderr_output[-2000:]}"
+                if stderr_output
+                else ""
+            )
+            raise RuntimeError(
+                f"FFmpeg concat exited with code {result.returncode}.{stderr_info}"
+            )
+
+    def _encode_video_segmented(
+        self,
+        audio_path: str | None,
+        output_path: str,
+        total_frames: int,
+        total_duration_seconds: float,
+        lyrics: list[GlobalLRCLine],
+        segments: list[SegmentInfo],
+        progress_callback: ProgressCallback | None = None,
+        title_card_config: TitleCardConfig | None = None,
+        timeout_check_callback: TimeoutCheckCallback | None = None,
+        job_id: str | None = None,
+    ) -> None:
+        """Encode the video per song, reusing pieces a previous render already encoded.
+
+        Pieces are encoded independently (each starts on a keyframe) and joined with
+        a stream-copy concat, so only songs whose frames changed are rendered.
+        """
+        start_ns = time.monotonic_ns()
+        title_card_frame_count = (
+            min(math.ceil(self.title_card_duration_seconds * self.fps), total_frames)
+            if title_card_config and title_card_config.enabled
+            else 0
+        )
+        chunks = self._plan_video_chunks(
+            lyrics, segments, total_frames, title_card_config, title_card_frame_count
+        )
+
+        work_dir = Path(self.asset_fetcher.get_temp_dir()) / (
+            f"segments-{int(time.time() * 1000)}"
+        )
+        work_dir.mkdir(parents=True, exist_ok=True)
+
+        if self.frame_renderer:
+            self.frame_renderer.clear_cache()
+
+        parallel_renderer: ParallelFrameRenderer | None = None
+        chunk_paths: dict[str, Path] = {}
+        reused = 0
+        frame_count = 0
+        try:
+            for chunk in chunks:
+                if chunk.key in chunk_paths:
+                    continue
+                path = work_dir / f"{chunk.key}.mp4"
+                if self.segment_cache.fetch("video", chunk.key, path):
+                    chunk_paths[chunk.key] = path
+                    reused += 1
+
+            for chunk in chunks:
+                if timeout_check_callback:
+                    timeout_check_callback()
+                if chunk.key not in chunk_paths:
+                    path = work_dir / f"{chunk.key}.mp4"
+                    if chunk.timeline is None:
+                        title_card_bytes = self._render_title_card_bytes(title_card_config)
+                        frames = (title_card_bytes for _ in range(chunk.frame_count))
+                    else:
+                        if parallel_renderer is None:
+                            parallel_renderer = self._start_parallel_renderer(
+                                lyrics, segments, title_card_frame_count, total_frames
+                            )
+                        runs = (
+                            parallel_renderer.iter_runs(chunk.start_frame, chunk.end_frame)
+                            if parallel_renderer
+                            else self._render_timeline_runs(chunk.timeline)
+                        )
+                        frames = self._expand_runs(runs)
+                    self._encode_frames_to_file(frames, path, timeout_check_callback)
+                    self.segment_cache.store("video", chunk.key, path)
+                    chunk_paths[chunk.key] = path
+
+                frame_count += chunk.frame_count
+                if progress_callback:
+                    progress_callback(frame_count, total_frames)
+
+            if parallel_renderer:
+                parallel_renderer.close()
+
+            logger.info(
+                "[%s] Segmented encode: %d pieces, %d reused from cache, %d encoded in %.1fs",
+                job_id or "unknown",
+                len(chunks),
+                reused,
+                len(chunk_paths) - reused,
+                (time.monotonic_ns() - start_ns) / 1e9,
+            )
+
+            video_path = output_path if not audio_path else str(work_dir / "video.mp4")
+            self._concat_video_files(
+                [chunk_paths[chunk.key] for chunk in chunks],
+                work_dir / "segments.ffconcat",
+                video_path,
+            )
+            if audio_path:
+                self.mux_audio(video_path, audio_path, output_path, job_id=job_id)
+        finally:
+            if parallel_renderer:
+                parallel_renderer.close()
+            self._log_cache_stats(parallel_renderer, job_id)
+            shutil.rmtree(work_dir, ignore_errors=True)
+
+    def _format_cache_info(self, parallel_renderer: ParallelFrameRenderer | None = None) -> str:
+        if not (self.frame_renderer and self.frame_renderer._cache_enabled):
+            return ""
+        stats = self._get_cache_stats(parallel_renderer)
+        hit_rate = stats["hits"] / max(1, stats["hits"] + stats["misses"]) * 100
+        return (
+            f", cache={stats['entries']}entries/"
+            f"{stats['hits']}hits/{stats['misses']}misses/{stats['evictions']}evictions "
+            f"({hit_rate:.0f}%)"
+        )
+
+    def _log_cache_stats(
+        self, parallel_renderer: ParallelFrameRenderer | None = None, job_id: str | None = None
+    ) -> None:
+        if not (self.frame_renderer and self.frame_renderer._cache_enabled):
+            return
+        stats = self._get_cache_stats(parallel_renderer)
+        hit_rate = stats["hits"] / max(1, stats["hits"] + stats["misses"]) * 100
+        logger.info(
+            "[%s] Frame cache final: %d entries (%.0f/%.0fMB), %d hits, %d misses, "
+            "%d evictions (%.1f%% hit rate), max=%d",
+            job_id or "unknown",
+            stats["entries"],
+            stats["bytes"] / (1024 * 1024),
+            stats["max_bytes"] / (1024 * 1024),
+            stats["hits"],
+            stats["misses"],
+            stats["evictions"],
+            hit_rate,
+            stats["max_entries"],
+        )
+
+    def _get_cache_stats(
+        self, parallel_renderer: ParallelFrameRenderer | None = None
+    ) -> dict[str, int]:
+        if parallel_renderer:
+            return parallel_renderer.get_cache_stats()
+        return self.frame_renderer.get_cache_stats()
+
     def generate_blank_video(
         self,
-        audio_path: str,
+        audio_path: str | None,
         output_path: str,
         duration_seconds: float,
         job_id: str | None = None,
@@ -560,14 +1282,9 @@ class VideoEngine:
             "lavfi",
             "-i",
             f"color=c={hex_color}:s={width}x{height}:d={duration_seconds}",
-            "-i",
-            audio_path,
+            *self._audio_input_args(audio_path),
             *self.get_video_codec_args("5000k"),
-            "-c:a",
-            "aac",
-            "-b:a",
-            "192k",
-            "-shortest",
+            *self._audio_output_args(audio_path),
             output_path,
         ]
 
@@ -594,6 +1311,53 @@ class VideoEngine:
             fps=self.fps,
         )
 
+    def mux_audio(
+        self,
+        video_path: str,
+        audio_path: str,
+        output_path: str,
+        job_id: str | None = None,
+    ) -> None:
+        """Join a video-only encode with the mixed audio, copying the video stream."""
+        args = [
+            self.ffmpeg_path,
+            "-y",
+            "-i",
+            video_path,
+            "-i",
+            audio_path,
+            "-map",
+            "0:v:0",
+            "-map",
+            "1:a:0",
+            "-c:v",
+            "copy",
+            *self._audio_output_args(audio_path),
+            "-movflags",
+            "+faststart",
+            output_path,
+        ]
+
+        mux_start_ns = time.monotonic_ns()
+        result = subprocess.run(
+            args,
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.PIPE,
+        )
+        if result.returncode != 0:
+            stderr_output = result.stderr.decode("utf-8", errors="replace")
+            stderr_info = (
+                f"\nFFmpeg stderr (last 2000 chars): {stderr_output[-2000:]}"
+                if stderr_output
+                else ""
+            )
+            raise RuntimeError(f"FFmpeg mux exited with code {result.returncode}.{stderr_info}")
+        logger.info(
+            "[%s] mux_audio: complete in %.1fs",
+            job_id or "unknown",
+            (time.monotonic_ns() - mux_start_ns) / 1e9,
+        )
+
     def inject_chapters(
         self,
         video_path: str,
@@ -27,3 +27,12 @@ def mock_env(env_vars):
 def temp_dir():
     with tempfile.TemporaryDirectory() as tmpdir:
         yield tmpdir
+
+
+@pytest.fixture(autouse=True)
+def _clear_lrc_cache():
+    from sow_render_worker.asset_fetcher import clear_lrc_cache
+
+    clear_lrc_cache()
+    yield
+    clear_lrc_cache()
@@ -0,0 +1,127 @@
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+from pathlib import Path
+from unittest.mock import patch
+
+from sow_render_worker.asset_cache import (
+    INDEX_FILENAME,
+    AssetCache,
+    file_sha256,
+    resolve_asset_cache_bytes,
+)
+
+
+def _add(cache: AssetCache, name: str, data: bytes) -> Path:
+    tmp_path = cache.cache_dir / f"{name}.tmp"
+    cache.cache_dir.mkdir(parents=True, exist_ok=True)
+    tmp_path.write_bytes(data)
+    return cache.add(name, tmp_path, hashlib.sha256(data).hexdigest())
+
+
+class TestResolveAssetCacheBytes:
+    def test_env_override(self, tmp_path, monkeypatch):
+        monkeypatch.setenv("SOW_ASSET_CACHE_MB", "64")
+        assert resolve_asset_cache_bytes(tmp_path) == 64 * 1024 * 1024
+
+    def test_defaults_to_share_of_filesystem(self, tmp_path, monkeypatch):
+        monkeypatch.delenv("SOW_ASSET_CACHE_MB", raising=False)
+        budget = resolve_asset_cache_bytes(tmp_path / "missing" / "cache")
+        assert 0 < budget
+
+
+class TestGetAdd:
+    def test_miss_then_hit(self, tmp_path):
+        cache = AssetCache(tmp_path, max_bytes=100)
+        assert cache.get("a.mp3") is None
+        path = _add(cache, "a.mp3", b"audio")
+        assert path.read_bytes() == b"audio"
+        assert AssetCache(tmp_path, max_bytes=100).get("a.mp3") == path
+        assert cache.get_stats()["misses"] == 1
+
+    def test_index_survives_new_instance(self, tmp_path):
+        cache = AssetCache(tmp_path, max_bytes=100)
+        _add(cache, "a.mp3", b"audio")
+
+        index = json.loads((tmp_path / INDEX_FILENAME).read_text())
+        assert index["entries"]["a.mp3"]["sha256"] == hashlib.sha256(b"audio").hexdigest()
+        assert AssetCache(tmp_path, max_bytes=100).get_stats()["entries"] == 1
+
+    def test_adopts_files_without_index(self, tmp_path):
+        (tmp_path / "legacy.mp3").write_bytes(b"legacy")
+        cache = AssetCache(tmp_path, max_bytes=100)
+
+        assert cache.get("legacy.mp3") == tmp_path / "legacy.mp3"
+        index = json.loads((tmp_path / INDEX_FILENAME).read_text())
+        assert index["entries"]["legacy.mp3"]["sha256"] == hashlib.sha256(b"legacy").hexdigest()
+
+    def test_checksum_mismatch_discards_file(self, tmp_path):
+        _add(AssetCache(tmp_path, max_bytes=100), "a.mp3", b"audio")
+        (tmp_path / "a.mp3").write_bytes(b"AUDIO")
+        os.utime(tmp_path / "a.mp3", ns=(0, 0))
+
+        cache = AssetCache(tmp_path, max_bytes=100)
+        assert cache.get("a.mp3") is None
+        assert not (tmp_path / "a.mp3").exists()
+        assert cache.get_stats()["corrupt"] == 1
+
+    def test_unchanged_file_is_not_rehashed(self, tmp_path):
+        _add(AssetCache(tmp_path, max_bytes=100), "a.mp3", b"audio")
+
+        with patch("sow_render_worker.asset_cache.file_sha256") as sha:
+            assert AssetCache(tmp_path, max_bytes=100).get("a.mp3") == tmp_path / "a.mp3"
+        sha.assert_not_called()
+
+    def test_touched_file_with_same_content_is_kept(self, tmp_path):
+        _add(AssetCache(tmp_path, max_bytes=100), "a.mp3", b"audio")
+        os.utime(tmp_path / "a.mp3", ns=(0, 0))
+
+        cache = AssetCache(tmp_path, max_bytes=100)
+        assert cache.get("a.mp3") == tmp_path / "a.mp3"
+        index = json.loads((tmp_path / INDEX_FILENAME).read_text())
+        assert index["entries"]["a.mp3"]["mtime_ns"] == 0
+
+    def test_hash_runs_outside_the_lock(self, tmp_path):
+        (tmp_path / "legacy.mp3").write_bytes(b"legacy")
+        cache = AssetCache(tmp_path, max_bytes=100)
+
+        def sha256(path):
+            assert not cache._lock.locked()
+            return file_sha256(path)
+
+        with patch("sow_render_worker.asset_cache.file_sha256", side_effect=sha256):
+            assert cache.get("legacy.mp3") == tmp_path / "legacy.mp3"
+
+    def test_unreadable_index_is_rebuilt(self, tmp_path):
+        (tmp_path / "a.mp3").write_bytes(b"audio")
+        (tmp_path / INDEX_FILENAME).write_text("{not json")
+
+        assert AssetCache(tmp_path, max_bytes=100).get("a.mp3") is not None
+
+
+class TestEviction:
+    def test_least_recently_used_evicted_across_instances(self, tmp_path):
+        first = AssetCache(tmp_path, max_bytes=10)
+        _add(first, "a.mp3", b"aaaa")
+        _add(first, "b.mp3", b"bbbb")
+
+        second = AssetCache(tmp_path, max_bytes=10)
+        second.get("a.mp3")
+        _add(second, "c.mp3", b"cccc")
+
+        assert (tmp_path / "a.mp3").exists()
+        assert not (tmp_path / "b.mp3").exists()
+        stats = second.get_stats()
+        assert stats["evictions"] == 1
+        assert stats["bytes"] == 8
+
+    def test_files_in_use_by_job_are_kept(self, tmp_path):
+        cache = AssetCache(tmp_path, max_bytes=6)
+        _add(cache, "a.mp3", b"aaaa")
+        _add(cache, "b.mp3", b"bbbb")
+
+        assert (tmp_path / "a.mp3").exists()
+        assert (tmp_path / "b.mp3").exists()
+        assert cache.get_stats()["evictions"] == 0
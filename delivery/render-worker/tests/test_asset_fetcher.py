@@ -3,7 +3,13 @@ from unittest.mock import MagicMock
 
 import pytest
 
-from sow_render_worker.asset_fetcher import AssetFetcher, DEFAULT_CACHE_DIR, DEFAULT_TEMP_DIR
+from sow_render_worker.asset_fetcher import (
+    DEFAULT_CACHE_DIR,
+    DEFAULT_PREFETCH_WORKERS,
+    DEFAULT_TEMP_DIR,
+    AssetFetcher,
+    resolve_prefetch_workers,
+)
 from sow_render_worker.r2_client import R2Client
 
 
@@ -18,6 +24,7 @@ def _make_fetcher(
     cache_dir: str | None = None,
     temp_dir: str | None = None,
     r2_client: MagicMock | None = None,
+    asset_cache_bytes: int | None = None,
 ) -> AssetFetcher:
     if r2_client is None:
         r2_client = _make_mock_r2_client()
@@ -25,6 +32,7 @@ def _make_fetcher(
         cache_dir=cache_dir,
         temp_dir=temp_dir,
         r2_client=r2_client,
+        asset_cache_bytes=asset_cache_bytes,
     )
 
 
@@ -347,3 +355,117 @@ class TestCachingWorkflow:
         assert Path(result1).read_bytes() == b"audio1"
         assert Path(result2).read_bytes() == b"audio2"
         assert mock_r2.get_audio_signed_url.call_count == 2
+
+
+class TestPrefetch:
+    def _fetcher_with_responses(self, tmp_path, status_by_url):
+        mock_r2 = _make_mock_r2_client()
+        mock_r2.get_audio_signed_url.side_effect = lambda h, **_: f"https://r2/{h}.mp3"
+        mock_r2.get_lrc_signed_url.side_effect = lambda h, **_: f"https://r2/{h}.lrc"
+        fetcher = _make_fetcher(cache_dir=str(tmp_path / "cache"), r2_client=mock_r2)
+
+        def request(method, url, preload_content=True):
+            response = MagicMock()
+            response.status = status_by_url.get(url, 200)
+            response.stream.return_value = [url.encode("utf-8")]
+            return response
+
+        fetcher._http = MagicMock()
+        fetcher._http.request.side_effect = request
+        return fetcher
+
+    def test_downloads_audio_and_lrc_for_each_unique_prefix(self, tmp_path):
+        fetcher = self._fetcher_with_responses(tmp_path, {})
+        progress = []
+
+        fetcher.prefetch(
+            ["aaa", "bbb", "aaa", ""],
+            progress_callback=lambda done, total: progress.append((done, total)),
+        )
+
+        assert (tmp_path / "cache" / "aaa.mp3").read_bytes() == b"https://r2/aaa.mp3"
+        assert (tmp_path / "cache" / "bbb.mp3").exists()
+        assert fetcher._http.request.call_count == 4
+        assert progress[-1] == (4, 4)
+        assert fetcher.download_lrc("bbb") == "https://r2/bbb.lrc"
+        assert fetcher._http.request.call_count == 4
+
+    def test_missing_lrc_is_cached_as_none(self, tmp_path):
+        fetcher = self._fetcher_with_responses(tmp_path, {"https://r2/aaa.lrc": 404})
+
+        fetcher.prefetch(["aaa"])
+
+        assert fetcher.download_lrc("aaa") is None
+        assert (tmp_path / "cache" / "aaa.mp3").exists()
+
+    def test_missing_audio_raises(self, tmp_path):
+        fetcher = self._fetcher_with_responses(tmp_path, {"https://r2/bbb.mp3": 404})
+
+        with pytest.raises(RuntimeError, match="Failed to download audio for bbb"):
+            fetcher.prefetch(["aaa", "bbb"], include_lrc=False)
+
+    def test_audio_only(self, tmp_path):
+        fetcher = self._fetcher_with_responses(tmp_path, {})
+
+        fetcher.prefetch(["aaa"], include_lrc=False)
+
+        fetcher._r2_client.get_lrc_signed_url.assert_not_called()
+
+    def test_prefetch_workers_from_env(self, monkeypatch):
+        monkeypatch.setenv("SOW_ASSET_PREFETCH_WORKERS", "7")
+        assert resolve_prefetch_workers() == 7
+        assert resolve_prefetch_workers(0) == 1
+        monkeypatch.delenv("SOW_ASSET_PREFETCH_WORKERS")
+        assert resolve_prefetch_workers() == DEFAULT_PREFETCH_WORKERS
+
+
+class TestPersistentCaches:
+    def _fetcher(self, tmp_path, mock_r2=None):
+        fetcher = _make_fetcher(cache_dir=str(tmp_path / "cache"), r2_client=mock_r2)
+        mock_response = MagicMock()
+        mock_response.status = 200
+        mock_response.stream.return_value = [b"[00:01.00]line"]
+        fetcher._http = MagicMock()
+        fetcher._http.request.return_value = mock_response
+        return fetcher
+
+    def test_lrc_shared_across_instances(self, tmp_path):
+        mock_r2 = _make_mock_r2_client()
+        self._fetcher(tmp_path, mock_r2).download_lrc("abc123")
+
+        second = self._fetcher(tmp_path, mock_r2)
+        assert second.download_lrc("abc123") == "[00:01.00]line"
+        mock_r2.get_lrc_signed_url.assert_called_once()
+        assert second.get_cache_stats()["lrc_hits"] == 1
+
+    def test_lrc_shared_entry_expires(self, tmp_path, monkeypatch):
+        mock_r2 = _make_mock_r2_client()
+        self._fetcher(tmp_path, mock_r2).download_lrc("abc123")
+        monkeypatch.setattr("sow_render_worker.asset_fetcher.LRC_CACHE_TTL_SECONDS", -1)
+
+        self._fetcher(tmp_path, mock_r2).download_lrc("abc123")
+        assert mock_r2.get_lrc_signed_url.call_count == 2
+
+    def test_audio_reused_by_new_instance(self, tmp_path):
+        mock_r2 = _make_mock_r2_client()
+        self._fetcher(tmp_path, mock_r2).download_audio("abc123")
+
+        second = self._fetcher(tmp_path, mock_r2)
+        assert second.download_audio("abc123") == str(tmp_path / "cache" / "abc123.mp3")
+        mock_r2.get_audio_signed_url.assert_called_once()
+        stats = second.get_cache_stats()
+        assert (stats["hits"], stats["misses"], stats["entries"]) == (1, 0, 1)
+
+    def test_audio_budget_evicts_older_songs(self, tmp_path):
+        mock_r2 = _make_mock_r2_client()
+        first = self._fetcher(tmp_path, mock_r2)
+        first.download_audio("old")
+
+        second = _make_fetcher(
+            cache_dir=str(tmp_path / "cache"), r2_client=mock_r2, asset_cache_bytes=20
+        )
+        second._http = first._http
+        second.download_audio("new")
+
+        assert not (tmp_path / "cache" / "old.mp3").exists()
+        assert second.get_cache_stats()["evictions"] == 1
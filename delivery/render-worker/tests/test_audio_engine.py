@@ -2,12 +2,15 @@ from __future__ import annotations
 
 import json
 import subprocess
+import threading
+import time
 from dataclasses import dataclass
 from unittest.mock import MagicMock, patch
 
 import pytest
 
 from sow_render_worker.audio_engine import (
+    AudioMixCancelled,
     AudioSegmentInfo,
     ExportResult,
     SongsetItem,
@@ -18,7 +21,10 @@ from sow_render_worker.audio_engine import (
     generate_songset_audio,
     get_audio_info,
     get_crossfade_ms,
+    mix_songset_audio,
+    plan_songset_audio,
 )
+from sow_render_worker.audio_engine import _run_ffmpeg
 
 
 def _make_item(**overrides) -> SongsetItem:
@@ -355,8 +361,9 @@ class TestConcatenateAudioFiles:
              "crossfade_ms": 0, "duration_ms": 180000, "start_ms": 0},
         ]
 
-        with patch("sow_render_worker.audio_engine.subprocess.run") as mock_run:
-            mock_run.return_value = MagicMock(returncode=0)
+        with patch("sow_render_worker.audio_engine.subprocess.Popen") as mock_run:
+            mock_run.return_value.communicate.return_value = (b"", b"")
+            mock_run.return_value.returncode = 0
             concatenate_audio_files(audio_files, "/tmp/out.mp3", job_id="test-job")
 
         cmd = mock_run.call_args[0][0]
@@ -376,8 +383,9 @@ class TestConcatenateAudioFiles:
              "crossfade_ms": 0, "duration_ms": 180000, "start_ms": 0},
         ]
 
-        with patch("sow_render_worker.audio_engine.subprocess.run") as mock_run:
-            mock_run.return_value = MagicMock(returncode=0)
+        with patch("sow_render_worker.audio_engine.subprocess.Popen") as mock_run:
+            mock_run.return_value.communicate.return_value = (b"", b"")
+            mock_run.return_value.returncode = 0
             concatenate_audio_files(
                 audio_files, "/tmp/out.mp3",
                 normalize=False,
@@ -400,11 +408,25 @@ class TestConcatenateAudioFiles:
              "crossfade_ms": 0, "duration_ms": 180000, "start_ms": 0},
         ]
 
-        with patch("sow_render_worker.audio_engine.subprocess.run") as mock_run:
-            mock_run.side_effect = subprocess.CalledProcessError(1, "ffmpeg")
+        with patch("sow_render_worker.audio_engine.subprocess.Popen") as mock_run:
+            mock_run.return_value.communicate.return_value = (b"", b"bad filter")
+            mock_run.return_value.returncode = 1
             with pytest.raises(subprocess.CalledProcessError):
                 concatenate_audio_files(audio_files, "/tmp/out.mp3", job_id="test-job")
 
+    def test_cancel_event_kills_running_process(self):
+        cancel = threading.Event()
+        cancel.set()
+
+        start = time.monotonic()
+        with pytest.raises(AudioMixCancelled):
+            _run_ffmpeg(["sleep", "30"], timeout=60, cancel_event=cancel, poll_seconds=0.05)
+        assert time.monotonic() - start < 5
+
+    def test_timeout_kills_process(self):
+        with pytest.raises(subprocess.TimeoutExpired):
+            _run_ffmpeg(["sleep", "30"], timeout=0.1, poll_seconds=0.05)
+
 
 class TestGenerateSongsetAudio:
     def test_empty_items_raises(self):
@@ -534,6 +556,37 @@ class TestGenerateSongsetAudio:
         assert result.segments[1].start_time_seconds == 178.0
 
 
+class TestPlanAndMixSongsetAudio:
+    def test_plan_does_not_run_ffmpeg(self):
+        items = [
+            _make_item(id="1", duration_seconds=100.0),
+            _make_item(id="2", position=1, gap_beats=2.0, tempo_bpm=120.0, duration_seconds=50.0),
+        ]
+        fetcher = MagicMock()
+        fetcher.download_audio.return_value = "/tmp/audio.mp3"
+
+        with patch("sow_render_worker.audio_engine.concatenate_audio_files") as mock_concat:
+            plan = plan_songset_audio(items, fetcher)
+
+        mock_concat.assert_not_called()
+        assert plan.total_duration_seconds == 151.0
+        assert [seg.start_time_seconds for seg in plan.segments] == [0.0, 101.0]
+        assert plan.audio_files[1]["start_ms"] == 101000
+
+    def test_mix_uses_plan_timing(self, tmp_path):
+        fetcher = MagicMock()
+        fetcher.download_audio.return_value = "/tmp/audio.mp3"
+        plan = plan_songset_audio([_make_item(duration_seconds=60.0)], fetcher)
+        output_path = str(tmp_path / "out.mp3")
+
+        with patch("sow_render_worker.audio_engine.concatenate_audio_files") as mock_concat:
+            result = mix_songset_audio(plan, output_path, job_id="test-job")
+
+        assert mock_concat.call_args[0] == (list(plan.audio_files), output_path)
+        assert result.segments == plan.segments
+        assert result.total_duration_seconds == 60.0
+
+
 class TestCalculateTotalDuration:
     def test_single_item_with_duration(self):
         item = _make_item(duration_seconds=180.0)
@@ -0,0 +1,126 @@
+from __future__ import annotations
+
+import numpy as np
+import pytest
+
+from sow_render_worker.frame_cache import FrameCache, allocate_frame_arena
+
+_FRAME_SIZE = 12
+
+
+def _frame(value: int) -> bytes:
+    return bytes([value]) * _FRAME_SIZE
+
+
+class TestCapacity:
+    def test_slots_from_byte_budget(self):
+        cache = FrameCache(frame_size=_FRAME_SIZE, max_bytes=_FRAME_SIZE * 5)
+        assert cache.capacity == 5
+        assert cache.size_bytes == _FRAME_SIZE * 5
+
+    def test_entry_cap_applies(self):
+        cache = FrameCache(frame_size=_FRAME_SIZE, max_bytes=_FRAME_SIZE * 50, max_entries=3)
+        assert cache.capacity == 3
+
+    def test_minimum_two_slots(self):
+        cache = FrameCache(frame_size=_FRAME_SIZE, max_bytes=1)
+        assert cache.capacity == 2
+
+
+class TestGetPut:
+    def test_put_returns_view_of_frame(self):
+        cache = FrameCache(frame_size=_FRAME_SIZE, max_bytes=_FRAME_SIZE * 4)
+        view = cache.put(("a",), _frame(1))
+        assert isinstance(view, memoryview)
+        assert view == _frame(1)
+
+    def test_put_accepts_arrays(self):
+        cache = FrameCache(frame_size=_FRAME_SIZE, max_bytes=_FRAME_SIZE * 4)
+        array = np.full((2, 2, 3), 7, dtype=np.uint8)
+        assert cache.put(("a",), array) == array.tobytes()
+
+    def test_hits_and_misses(self):
+        cache = FrameCache(frame_size=_FRAME_SIZE, max_bytes=_FRAME_SIZE * 4)
+        assert cache.get(("a",)) is None
+        cache.put(("a",), _frame(1))
+        assert cache.get(("a",)) == _frame(1)
+        stats = cache.get_stats()
+        assert stats["hits"] == 1
+        assert stats["misses"] == 1
+        assert stats["bytes"] == _FRAME_SIZE
+
+    def test_wrong_frame_size_raises(self):
+        cache = FrameCache(frame_size=_FRAME_SIZE, max_bytes=_FRAME_SIZE * 4)
+        with pytest.raises(ValueError, match="cache slots are 12"):
+            cache.put(("a",), b"short")
+
+    def test_clear_resets(self):
+        cache = FrameCache(frame_size=_FRAME_SIZE, max_bytes=_FRAME_SIZE * 2)
+        for i in range(3):
+            cache.put((i,), _frame(i))
+        cache.clear()
+        assert cache.get_stats() == {
+            "entries": 0,
+            "hits": 0,
+            "misses": 0,
+            "evictions": 0,
+            "max_entries": 2,
+            "bytes": 0,
+            "max_bytes": _FRAME_SIZE * 2,
+        }
+
+
+class TestEviction:
+    def test_least_recently_used_slot_reused(self):
+        cache = FrameCache(frame_size=_FRAME_SIZE, max_bytes=_FRAME_SIZE * 2)
+        cache.put(("a",), _frame(1))
+        cache.put(("b",), _frame(2))
+        cache.get(("a",))
+        cache.put(("c",), _frame(3))
+
+        assert ("a",) in cache
+        assert ("b",) not in cache
+        assert cache.get(("c",)) == _frame(3)
+        assert cache.get_stats()["evictions"] == 1
+
+    def test_pinned_slots_survive(self):
+        cache = FrameCache(frame_size=_FRAME_SIZE, max_bytes=_FRAME_SIZE * 2)
+        view_a = cache.put(("a",), _frame(1))
+        cache.put(("b",), _frame(2))
+        cache.pinned.add(cache.slot_of(("a",)))
+
+        cache.put(("c",), _frame(3))
+
+        assert ("a",) in cache
+        assert view_a == _frame(1)
+
+    def test_put_returns_none_when_all_slots_pinned(self):
+        cache = FrameCache(frame_size=_FRAME_SIZE, max_bytes=_FRAME_SIZE * 2)
+        cache.put(("a",), _frame(1))
+        cache.put(("b",), _frame(2))
+        cache.pinned.update({cache.slot_of(("a",)), cache.slot_of(("b",))})
+
+        assert cache.put(("c",), _frame(3)) is None
+        assert ("c",) not in cache
+        assert len(cache) == 2
+
+
+class TestSharedArena:
+    def test_partitions_do_not_overlap(self):
+        arena = allocate_frame_arena(_FRAME_SIZE * 4)
+        first = FrameCache(_FRAME_SIZE, _FRAME_SIZE * 2, arena=arena)
+        second = FrameCache(_FRAME_SIZE, _FRAME_SIZE * 2, arena=arena, offset=_FRAME_SIZE * 2)
+        for i in range(2):
+            first.put(("first", i), _frame(10 + i))
+            second.put(("second", i), _frame(20 + i))
+
+        assert arena[: _FRAME_SIZE * 4] == b"".join(
+            _frame(v) for v in (10, 11, 20, 21)
+        )
+
+    def test_slot_view_reads_arena(self):
+        arena = allocate_frame_arena(_FRAME_SIZE * 2)
+        writer = FrameCache(_FRAME_SIZE, _FRAME_SIZE * 2, arena=arena)
+        reader = FrameCache(_FRAME_SIZE, _FRAME_SIZE * 2, arena=arena)
+        writer.put(("a",), _frame(5))
+        assert reader.slot_view(writer.slot_of(("a",))) == _frame(5)
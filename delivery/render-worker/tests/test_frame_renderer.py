@@ -1,7 +1,9 @@
 from __future__ import annotations
 
+import math
 from unittest.mock import MagicMock, patch
 
+import numpy as np
 import pytest
 from PIL import Image, ImageDraw
 
@@ -21,6 +23,7 @@ from sow_render_worker.frame_renderer import (
     _get_bool_env,
     _get_int_env,
     _load_font,
+    resolve_frame_cache_bytes,
 )
 from sow_render_worker.lrc_parser import GlobalLRCLine
 
@@ -854,7 +857,8 @@ class TestQuantizeAlpha:
         assert renderer._quantize_alpha(0) == 0
 
     def test_quantizes_to_step_boundary(self):
-        renderer = FrameRenderer(template=VIDEO_TEMPLATES["dark"])
+        with patch.dict("os.environ", {"SOW_FADE_ALPHA_STEPS": "16"}):
+            renderer = FrameRenderer(template=VIDEO_TEMPLATES["dark"])
         step = renderer._alpha_step_size
         assert renderer._quantize_alpha(step - 1) == 0
         assert renderer._quantize_alpha(step) == step
@@ -1218,3 +1222,242 @@ class TestRGBMode:
 class TestDefaultMaxCacheEntries:
     def test_default_max_cache_entries_200(self):
         assert _DEFAULT_MAX_CACHE_ENTRIES == 200
+
+
+class TestFrameCacheBudget:
+    def test_budget_from_env(self):
+        with patch.dict("os.environ", {"SOW_FRAME_CACHE_MB": "100"}):
+            assert resolve_frame_cache_bytes() == 100 * 1024 * 1024
+
+    def test_budget_from_lambda_memory(self):
+        with patch.dict("os.environ", {"AWS_LAMBDA_FUNCTION_MEMORY_SIZE": "4096"}, clear=True):
+            assert resolve_frame_cache_bytes() == 1024 * 1024 * 1024
+
+    def test_budget_bounds_entries_by_resolution(self):
+        with patch.dict("os.environ", {"SOW_FRAME_CACHE_MB": "64"}):
+            renderer_1080p = FrameRenderer(template=VIDEO_TEMPLATES["dark"])
+            renderer_small = FrameRenderer(template=VIDEO_TEMPLATES["dark"], resolution=(160, 90))
+        assert renderer_1080p.get_cache_stats()["max_entries"] == 64 * 1024 * 1024 // (
+            1920 * 1080 * 3
+        )
+        assert renderer_small.get_cache_stats()["max_entries"] == _DEFAULT_MAX_CACHE_ENTRIES
+
+    def test_explicit_budget_overrides_env(self):
+        with patch.dict("os.environ", {"SOW_FRAME_CACHE_MB": "1"}):
+            renderer = FrameRenderer(
+                template=VIDEO_TEMPLATES["dark"],
+                resolution=(160, 90),
+                max_cache_bytes=160 * 90 * 3 * 7,
+            )
+        assert renderer.get_cache_stats()["max_bytes"] == 160 * 90 * 3 * 7
+
+    def test_evictions_reported(self):
+        renderer = FrameRenderer(
+            template=VIDEO_TEMPLATES["dark"], resolution=(160, 90), max_cache_entries=2
+        )
+        lyrics = _make_lyrics([(5.0, "A"), (10.0, "B"), (15.0, "C")], title="Test Song")
+        segment = _make_segment(start=0.0, duration=60.0)
+        for t in (6.0, 11.0, 16.0):
+            renderer.render_frame_bytes(lyrics, [segment], t)
+        stats = renderer.get_cache_stats()
+        assert stats["entries"] == 2
+        assert stats["evictions"] == 1
+        assert stats["bytes"] == 2 * 160 * 90 * 3
+
+
+class TestRenderTimeline:
+    def _fixture(self):
+        lyrics = _make_lyrics([(5.0, "Hello"), (8.0, ""), (12.0, "World")], title="Test Song")
+        segment = _make_segment(start=0.0, duration=20.0, composer="Composer")
+        return lyrics, [segment]
+
+    def test_intervals_cover_range_contiguously(self):
+        renderer = FrameRenderer(template=VIDEO_TEMPLATES["dark"], resolution=(160, 90))
+        lyrics, segments = self._fixture()
+        timeline = renderer.build_timeline(lyrics, segments, 24, 10, 24 * 20)
+        assert timeline.intervals[0].start_frame == 10
+        assert timeline.intervals[-1].end_frame == 24 * 20
+        for prev, nxt in zip(timeline.intervals, timeline.intervals[1:]):
+            assert prev.end_frame == nxt.start_frame
+            assert prev.cache_key != nxt.cache_key
+        assert sum(i.frame_count for i in timeline.intervals) == timeline.frame_count
+
+    def test_intervals_match_per_frame_cache_keys(self):
+        renderer = FrameRenderer(template=VIDEO_TEMPLATES["dark"], resolution=(160, 90))
+        lyrics, segments = self._fixture()
+        timeline = renderer.build_timeline(lyrics, segments, 24, 0, 24 * 20)
+        for interval in timeline.intervals:
+            for frame_index in range(interval.start_frame, interval.end_frame):
+                state = renderer._resolve_visual_state(lyrics, segments, frame_index / 24)
+                assert renderer._compute_cache_key(state) == interval.cache_key
+
+    def test_far_fewer_intervals_than_frames(self):
+        with patch.dict("os.environ", {"SOW_FADE_ALPHA_STEPS": "16"}):
+            renderer = FrameRenderer(template=VIDEO_TEMPLATES["dark"], resolution=(160, 90))
+        lyrics, segments = self._fixture()
+        timeline = renderer.build_timeline(lyrics, segments, 24, 0, 24 * 20)
+        assert len(timeline.intervals) < timeline.frame_count // 4
+        assert timeline.unique_states <= len(timeline.intervals)
+
+    def test_interval_bytes_match_first_frame_render(self):
+        renderer = FrameRenderer(template=VIDEO_TEMPLATES["dark"], resolution=(160, 90))
+        lyrics, segments = self._fixture()
+        timeline = renderer.build_timeline(lyrics, segments, 24, 0, 24 * 20)
+        reference = FrameRenderer(template=VIDEO_TEMPLATES["dark"], resolution=(160, 90))
+        for interval in timeline.intervals:
+            expected = reference.render_frame_bytes(lyrics, segments, interval.start_frame / 24)
+            assert renderer.render_interval_bytes(interval) == expected
+
+    def test_exact_alphas_when_cache_disabled(self):
+        with patch.dict("os.environ", {"SOW_FRAME_CACHE_ENABLED": "false"}):
+            renderer = FrameRenderer(template=VIDEO_TEMPLATES["dark"], resolution=(160, 90))
+        lyrics, segments = self._fixture()
+        timeline = renderer.build_timeline(lyrics, segments, 24, 0, 24 * 20)
+        for interval in timeline.intervals:
+            for frame_index in range(interval.start_frame, interval.end_frame):
+                state = renderer._resolve_visual_state(lyrics, segments, frame_index / 24)
+                assert state.fade_alpha == interval.state.fade_alpha
+                assert state.intro_alpha == interval.state.intro_alpha
+                assert state.preview_alpha == interval.state.preview_alpha
+        assert renderer.get_cache_stats()["entries"] == 0
+
+    def test_empty_range(self):
+        renderer = FrameRenderer(template=VIDEO_TEMPLATES["dark"])
+        lyrics, segments = self._fixture()
+        timeline = renderer.build_timeline(lyrics, segments, 24, 50, 50)
+        assert timeline.intervals == ()
+        assert timeline.frame_count == 0
+
+    @staticmethod
+    def _per_frame_runs(renderer, lyrics, segments, fps, start, end):
+        runs = []
+        for frame_index in range(start, end):
+            state = renderer._resolve_visual_state(lyrics, segments, frame_index / fps)
+            key = renderer._compute_timeline_key(state)
+            if runs and runs[-1][2] == key:
+                runs[-1][1] = frame_index + 1
+            else:
+                runs.append([frame_index, frame_index + 1, key, state])
+        return [tuple(run) for run in runs]
+
+    @pytest.mark.parametrize("cache_enabled", ["true", "false"])
+    @pytest.mark.parametrize("fps", [24, 30])
+    def test_matches_per_frame_resolution_across_songs(self, cache_enabled, fps):
+        with patch.dict("os.environ", {"SOW_FRAME_CACHE_ENABLED": cache_enabled}):
+            renderer = FrameRenderer(template=VIDEO_TEMPLATES["dark"], resolution=(160, 90))
+        lyrics = _make_lyrics(
+            [(8.0, "A"), (11.0, ""), (15.0, "B"), (18.3, "C")], title="Song 1"
+        ) + _make_lyrics([(4.0, "D"), (6.1, ""), (9.0, "E")], title="Song 2", offset=40.0)
+        segments = [
+            _make_segment(song_title="Song 1", start=0.0, duration=40.0),
+            _make_segment(song_title="Song 2", start=40.0, duration=25.0),
+        ]
+
+        timeline = renderer.build_timeline(lyrics, segments, fps, 3, fps * 70)
+
+        expected = self._per_frame_runs(renderer, lyrics, segments, fps, 3, fps * 70)
+        actual = [(i.start_frame, i.end_frame, i.cache_key, i.state) for i in timeline.intervals]
+        assert actual == expected
+
+    def test_resolves_only_change_points_and_fades(self):
+        renderer = FrameRenderer(template=VIDEO_TEMPLATES["dark"], resolution=(160, 90))
+        lyrics = _make_lyrics([(5.0, "Hello"), (60.0, "World"), (120.0, "End")], title="Test Song")
+        segments = [_make_segment(start=0.0, duration=300.0)]
+
+        with patch.object(
+            renderer, "_resolve_visual_state", wraps=renderer._resolve_visual_state
+        ) as resolve:
+            timeline = renderer.build_timeline(lyrics, segments, 24, 0, 24 * 300)
+
+        assert resolve.call_count < timeline.frame_count // 10
+
+
+class TestTextLayers:
+    def _fading_lyrics(self):
+        return _make_lyrics([(0.0, "Hello"), (10.0, ""), (20.0, "World")], title="Test Song")
+
+    def test_layered_frame_matches_pillow_draw(self):
+        renderer = FrameRenderer(template=VIDEO_TEMPLATES["gradient_warm"], resolution=(640, 360))
+        lyrics = self._fading_lyrics()
+        segment = _make_segment(start=0.0, duration=60.0)
+
+        layered = np.asarray(renderer.render_frame(lyrics, [segment], 14.0), dtype=np.int16)
+
+        img = Image.new("RGB", (640, 360), VIDEO_TEMPLATES["gradient_warm"].background_color)
+        draw = ImageDraw.Draw(img)
+        title_size_target = math.floor(renderer.base_font_size * 0.8)
+        title_size = renderer.fit_text(
+            draw,
+            "Test Song",
+            title_size_target,
+            640 - renderer.get_margin(draw, title_size_target) * 2,
+        )
+        renderer._draw_text(
+            draw,
+            (320, 50),
+            "Test Song",
+            title_size,
+            VIDEO_TEMPLATES["gradient_warm"].text_color,
+            255,
+            "mt",
+        )
+        renderer.render_lyrics(lyrics, 14.0, "Test Song", draw, 640, 360)
+        expected = np.asarray(img, dtype=np.int16)
+
+        assert layered.shape == expected.shape
+        assert np.abs(layered - expected).max() <= 1
+
+    def test_fade_steps_reuse_layers(self):
+        renderer = FrameRenderer(template=VIDEO_TEMPLATES["dark"], resolution=(320, 180))
+        lyrics = self._fading_lyrics()
+        segment = _make_segment(start=0.0, duration=60.0)
+
+        renderer.render_frame_bytes(lyrics, [segment], 13.0)
+        misses = renderer.get_layer_cache_stats()["misses"]
+        for t in (13.5, 14.0, 14.5):
+            renderer.render_frame_bytes(lyrics, [segment], t)
+
+        stats = renderer.get_layer_cache_stats()
+        assert stats["misses"] == misses
+        assert stats["hits"] >= 3
+
+    def test_default_fades_are_not_quantized(self):
+        renderer = FrameRenderer(template=VIDEO_TEMPLATES["dark"], resolution=(320, 180))
+        lyrics = self._fading_lyrics()
+        segment = _make_segment(start=0.0, duration=60.0)
+        state_a = renderer._resolve_visual_state(lyrics, [segment], 14.0)
+        state_b = renderer._resolve_visual_state(lyrics, [segment], 14.04)
+        assert state_a.fade_alpha != state_b.fade_alpha
+        assert renderer._compute_cache_key(state_a) != renderer._compute_cache_key(state_b)
+
+    def test_layer_cache_eviction(self):
+        with patch.dict("os.environ", {"SOW_MAX_LAYER_ENTRIES": "2"}):
+            renderer = FrameRenderer(template=VIDEO_TEMPLATES["dark"], resolution=(320, 180))
+        lyrics = _make_lyrics(
+            [(5.0, "A"), (10.0, "B"), (15.0, "C"), (20.0, "D")], title="Test Song"
+        )
+        segment = _make_segment(start=0.0, duration=60.0)
+        for t in (6.0, 11.0, 16.0):
+            renderer.render_frame_bytes(lyrics, [segment], t)
+        stats = renderer.get_layer_cache_stats()
+        assert stats["entries"] == 2
+        assert stats["max_entries"] == 2
+
+    def test_clear_cache_drops_layers(self):
+        renderer = FrameRenderer(template=VIDEO_TEMPLATES["dark"], resolution=(320, 180))
+        renderer.render_frame_bytes(_make_lyrics([(5.0, "Hello")]), [_make_segment()], 7.0)
+        assert renderer.get_layer_cache_stats()["entries"] > 0
+        renderer.clear_cache()
+        assert renderer.get_layer_cache_stats() == {
+            "entries": 0,
+            "hits": 0,
+            "misses": 0,
+            "max_entries": 64,
+        }
+
+    def test_offscreen_text_clipped(self):
+        renderer = FrameRenderer(template=VIDEO_TEMPLATES["dark"], resolution=(160, 90))
+        layer = renderer._get_text_layer("Hello", 48, (80, 200), "mt")
+        assert layer.mask.size == 0
+        frame = renderer._composite_layers([(layer, (255, 255, 255), 255)])
+        assert (frame == VIDEO_TEMPLATES["dark"].background_color).all()
@@ -59,6 +59,32 @@ class TestProcessRecord:
 
         mock_pipeline.assert_called_once_with("job_abc123", 42, mock_conn, lambda_context=mock_context)
 
+    @patch("sow_render_worker.lambda_handler.execute_render_pipeline")
+    def test_render_workers_passed_through(self, mock_pipeline):
+        mock_conn = MagicMock()
+        mock_context = MagicMock()
+        record = _make_sqs_record()
+        body = json.loads(record["body"])
+        body["renderWorkers"] = 4
+        record["body"] = json.dumps(body)
+
+        _process_record(record, MagicMock(), mock_conn, mock_context)
+
+        mock_pipeline.assert_called_once_with(
+            "job_abc123", 42, mock_conn, lambda_context=mock_context, render_workers=4
+        )
+
+    @patch("sow_render_worker.lambda_handler.execute_render_pipeline")
+    def test_invalid_render_workers_raises(self, mock_pipeline):
+        record = _make_sqs_record()
+        body = json.loads(record["body"])
+        body["renderWorkers"] = "lots"
+        record["body"] = json.dumps(body)
+
+        with pytest.raises(ValueError, match="renderWorkers"):
+            _process_record(record, MagicMock(), MagicMock(), MagicMock())
+        mock_pipeline.assert_not_called()
+
 
 class TestHandler:
     @patch("sow_render_worker.lambda_handler.get_connection")
@@ -0,0 +1,246 @@
+from __future__ import annotations
+
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from sow_render_worker.frame_renderer import VIDEO_TEMPLATES, FrameRenderer, SegmentInfo
+from sow_render_worker.lrc_parser import GlobalLRCLine
+from sow_render_worker.parallel_renderer import (
+    ParallelFrameRenderer,
+    render_frame_runs,
+    resolve_render_workers,
+)
+from sow_render_worker.video_engine import VideoEngine
+
+_SMALL_RESOLUTION = (160, 90)
+
+
+def _make_lyrics():
+    return [
+        GlobalLRCLine(text="Hello", local_time_seconds=0.5, global_time_seconds=0.5, title="Song"),
+        GlobalLRCLine(text="World", local_time_seconds=1.5, global_time_seconds=1.5, title="Song"),
+    ]
+
+
+def _make_segments():
+    return [
+        SegmentInfo(
+            id="seg1",
+            song_id="song1",
+            position=0,
+            song_title="Song",
+            start_time_seconds=0.0,
+            duration_seconds=10.0,
+        )
+    ]
+
+
+def _renderer_kwargs(**overrides):
+    kwargs = {"template": VIDEO_TEMPLATES["dark"], "resolution": _SMALL_RESOLUTION}
+    kwargs.update(overrides)
+    return kwargs
+
+
+class TestResolveRenderWorkers:
+    def test_defaults_to_serial(self):
+        with patch.dict("os.environ", {}, clear=True):
+            assert resolve_render_workers() == 1
+
+    def test_reads_env(self):
+        with (
+            patch.dict("os.environ", {"SOW_RENDER_WORKERS": "3"}),
+            patch("sow_render_worker.parallel_renderer.available_cpu_count", return_value=8),
+        ):
+            assert resolve_render_workers() == 3
+
+    def test_explicit_value_overrides_env(self):
+        with (
+            patch.dict("os.environ", {"SOW_RENDER_WORKERS": "3"}),
+            patch("sow_render_worker.parallel_renderer.available_cpu_count", return_value=8),
+        ):
+            assert resolve_render_workers(2) == 2
+
+    def test_zero_means_all_cpus(self):
+        with patch("sow_render_worker.parallel_renderer.available_cpu_count", return_value=6):
+            assert resolve_render_workers(0) == 6
+
+    def test_clamped_to_cpu_count(self):
+        with patch("sow_render_worker.parallel_renderer.available_cpu_count", return_value=2):
+            assert resolve_render_workers(16) == 2
+
+    def test_invalid_env_falls_back_to_serial(self):
+        with patch.dict("os.environ", {"SOW_RENDER_WORKERS": "many"}):
+            assert resolve_render_workers() == 1
+
+
+class TestRenderFrameRuns:
+    def test_collapses_cached_frames_into_runs(self):
+        renderer = FrameRenderer(**_renderer_kwargs())
+        runs = render_frame_runs(renderer, _make_lyrics(), _make_segments(), 4, 4, 12)
+        assert sum(count for _, count in runs) == 8
+        assert len(runs) < 8
+
+    def test_runs_match_serial_frames(self):
+        lyrics, segments = _make_lyrics(), _make_segments()
+        serial = FrameRenderer(**_renderer_kwargs())
+        expected = [serial.render_frame_bytes(lyrics, segments, i / 4) for i in range(0, 12)]
+
+        renderer = FrameRenderer(**_renderer_kwargs())
+        runs = render_frame_runs(renderer, lyrics, segments, 4, 0, 12)
+        expanded = [frame for frame, count in runs for _ in range(count)]
+        assert expanded == expected
+
+    def test_cache_disabled_collapses_only_identical_states(self):
+        with patch.dict("os.environ", {"SOW_FRAME_CACHE_ENABLED": "false"}):
+            renderer = FrameRenderer(**_renderer_kwargs())
+        runs = render_frame_runs(renderer, _make_lyrics(), _make_segments(), 4, 4, 8)
+        assert [count for _, count in runs] == [2, 2]
+        assert renderer.get_cache_stats()["entries"] == 0
+
+
+class TestParallelFrameRenderer:
+    def test_frames_reassembled_in_order(self):
+        lyrics, segments = _make_lyrics(), _make_segments()
+        serial = FrameRenderer(**_renderer_kwargs())
+        expected = [serial.render_frame_bytes(lyrics, segments, i / 4) for i in range(2, 30)]
+
+        with ParallelFrameRenderer(
+            _renderer_kwargs(), lyrics, segments, fps=4, workers=3, chunk_frames=5
+        ) as parallel:
+            frames = list(parallel.iter_frames(2, 30))
+
+        assert frames == expected
+
+    def test_small_shared_cache_frames_stay_correct(self):
+        lyrics = [
+            GlobalLRCLine(
+                text=f"Line {i}",
+                local_time_seconds=i * 0.5,
+                global_time_seconds=i * 0.5,
+                title="Song",
+            )
+            for i in range(16)
+        ]
+        segments = _make_segments()
+        serial = FrameRenderer(**_renderer_kwargs())
+        expected = [serial.render_frame_bytes(lyrics, segments, i / 4) for i in range(40)]
+
+        with ParallelFrameRenderer(
+            _renderer_kwargs(max_cache_entries=2),
+            lyrics,
+            segments,
+            fps=4,
+            workers=2,
+            chunk_frames=6,
+        ) as parallel:
+            frames = [bytes(frame) for frame in parallel.iter_frames(0, 40)]
+            stats = parallel.get_cache_stats()
+
+        assert frames == expected
+        assert stats["evictions"] > 0
+
+    def test_workers_reply_with_shared_slots(self):
+        with ParallelFrameRenderer(
+            _renderer_kwargs(), _make_lyrics(), _make_segments(), fps=4, workers=2, chunk_frames=4
+        ) as parallel:
+            runs = list(parallel.iter_runs(0, 8))
+            assert parallel._arena is not None
+            assert all(isinstance(frame, memoryview) for frame, _ in runs)
+        assert parallel._arena is None
+
+    def test_cache_stats_aggregated_across_workers(self):
+        with ParallelFrameRenderer(
+            _renderer_kwargs(), _make_lyrics(), _make_segments(), fps=4, workers=2, chunk_frames=4
+        ) as parallel:
+            list(parallel.iter_frames(0, 16))
+            stats = parallel.get_cache_stats()
+
+        assert stats["misses"] > 0
+        assert stats["hits"] + stats["misses"] < 16
+        assert stats["max_entries"] > 0
+
+    def test_worker_error_raises(self):
+        with ParallelFrameRenderer(
+            _renderer_kwargs(),
+            [GlobalLRCLine(text=None, local_time_seconds=0.0, global_time_seconds=0.0, title="Song")],
+            _make_segments(),
+            fps=4,
+            workers=2,
+            chunk_frames=4,
+        ) as parallel:
+            with pytest.raises(RuntimeError, match="Render worker 0 failed on frames 0-4"):
+                list(parallel.iter_frames(0, 8))
+
+    def test_iter_frames_requires_start(self):
+        parallel = ParallelFrameRenderer(
+            _renderer_kwargs(), _make_lyrics(), _make_segments(), fps=4, workers=2
+        )
+        with pytest.raises(RuntimeError, match="start"):
+            list(parallel.iter_frames(0, 4))
+
+    def test_chunk_frames_from_env(self):
+        with patch.dict("os.environ", {"SOW_RENDER_CHUNK_FRAMES": "7"}):
+            parallel = ParallelFrameRenderer(
+                _renderer_kwargs(), _make_lyrics(), _make_segments(), fps=4, workers=2
+            )
+        assert parallel.chunk_frames == 7
+
+
+class TestVideoEngineParallelRendering:
+    def _mock_process(self):
+        mock_process = MagicMock()
+        mock_process.wait.return_value = 0
+        mock_process.stderr.read.return_value = b""
+        return mock_process
+
+    def test_parallel_mode_writes_every_frame(self, tmp_path):
+        with patch("sow_render_worker.parallel_renderer.available_cpu_count", return_value=4):
+            engine = VideoEngine(MagicMock(), resolution="720p", fps=4, render_workers=2)
+        engine.resolution = _SMALL_RESOLUTION
+        engine.frame_renderer = FrameRenderer(**_renderer_kwargs())
+
+        mock_process = self._mock_process()
+        with patch("sow_render_worker.video_engine.subprocess.Popen", return_value=mock_process):
+            engine.encode_video_with_ffmpeg(
+                "/tmp/audio.mp3",
+                str(tmp_path / "video.mp4"),
+                total_frames=20,
+                total_duration_seconds=5.0,
+                lyrics=_make_lyrics(),
+                segments=_make_segments(),
+            )
+
+        serial = FrameRenderer(**_renderer_kwargs())
+        expected = [
+            serial.render_frame_bytes(_make_lyrics(), _make_segments(), i / 4) for i in range(20)
+        ]
+        written = [call.args[0] for call in mock_process.stdin.write.call_args_list]
+        assert written == expected
+
+    def test_serial_mode_does_not_start_workers(self, tmp_path):
+        engine = VideoEngine(MagicMock(), fps=4, render_workers=1)
+        mock_process = self._mock_process()
+        with (
+            patch("sow_render_worker.video_engine.subprocess.Popen", return_value=mock_process),
+            patch("sow_render_worker.video_engine.ParallelFrameRenderer") as mock_parallel,
+        ):
+            engine.encode_video_with_ffmpeg(
+                "/tmp/audio.mp3",
+                str(tmp_path / "video.mp4"),
+                total_frames=4,
+                total_duration_seconds=1.0,
+                lyrics=[],
+                segments=[],
+            )
+        mock_parallel.assert_not_called()
+
+    def test_per_worker_cache_budget_split(self):
+        with (
+            patch.dict("os.environ", {"SOW_MAX_CACHE_ENTRIES": "100"}),
+            patch("sow_render_worker.parallel_renderer.available_cpu_count", return_value=4),
+        ):
+            engine = VideoEngine(MagicMock(), render_workers=4)
+        parallel = engine._create_parallel_renderer([], [])
+        assert parallel.renderer_kwargs["max_cache_entries"] == 25
+        assert parallel.workers == 4
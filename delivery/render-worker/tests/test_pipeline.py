@@ -1,10 +1,10 @@
 from datetime import datetime, timezone
 from pathlib import Path
-from unittest.mock import MagicMock, patch
+from unittest.mock import ANY, MagicMock, patch
 
 import pytest
 
-from sow_render_worker.audio_engine import AudioSegmentInfo, ExportResult, SongsetItem
+from sow_render_worker.audio_engine import AudioPlan, AudioSegmentInfo, ExportResult, SongsetItem
 from sow_render_worker.chapters import ChaptersManifest, Chapter
 from sow_render_worker.db import RenderJob, RenderProgress
 from sow_render_worker.pipeline import (
@@ -393,6 +393,232 @@ class TestExecuteRenderPipeline:
 
             mock_fail.assert_not_called()
 
+    def test_pipeline_prefetches_assets_before_audio(self):
+        job = _make_render_job()
+        mock_conn = MagicMock()
+        items = [
+            _make_songset_item(recording_hash_prefix="aaa"),
+            _make_songset_item(id="item_2", recording_hash_prefix="bbb", position=1),
+        ]
+        mock_fetcher = _make_mock_fetcher()
+        calls = []
+        mock_fetcher.prefetch.side_effect = lambda *a, **kw: calls.append("prefetch")
+
+        def fake_audio(*args, **kwargs):
+            calls.append("audio")
+            return _make_audio_result(items)
+
+        with patch("sow_render_worker.pipeline.get_render_job", return_value=job), \
+             patch("sow_render_worker.pipeline.start_render_job", return_value=job), \
+             patch("sow_render_worker.pipeline.update_render_progress"), \
+             patch("sow_render_worker.pipeline.complete_render_job"), \
+             patch("sow_render_worker.pipeline.fail_render_job"), \
+             patch("sow_render_worker.pipeline.fetch_songset_items", return_value=("Worship Set", items)), \
+             patch("sow_render_worker.pipeline.get_render_ratio", return_value=0.8), \
+             patch("sow_render_worker.pipeline.generate_songset_audio", side_effect=fake_audio), \
+             patch("sow_render_worker.pipeline.generate_chapters_manifest", return_value=_make_chapters_manifest()), \
+             patch("sow_render_worker.pipeline.VideoEngine"), \
+             patch("sow_render_worker.pipeline.Path") as mock_path_cls:
+
+            mock_path_cls.return_value.exists.return_value = True
+
+            execute_render_pipeline(
+                "job_abc123", 42, mock_conn,
+                asset_fetcher=mock_fetcher,
+                uploader=_make_mock_uploader(),
+            )
+
+        assert calls == ["prefetch", "audio"]
+        assert mock_fetcher.prefetch.call_args.args[0] == ["aaa", "bbb"]
+
+    def test_pipeline_prefetch_failure_marks_job_failed(self):
+        job = _make_render_job()
+        mock_conn = MagicMock()
+        items = [_make_songset_item()]
+        mock_fetcher = _make_mock_fetcher()
+        mock_fetcher.prefetch.side_effect = RuntimeError("Failed to download audio for abc123")
+
+        with patch("sow_render_worker.pipeline.get_render_job", return_value=job), \
+             patch("sow_render_worker.pipeline.start_render_job", return_value=job), \
+             patch("sow_render_worker.pipeline.update_render_progress"), \
+             patch("sow_render_worker.pipeline.fail_render_job") as mock_fail, \
+             patch("sow_render_worker.pipeline.fetch_songset_items", return_value=("Worship Set", items)), \
+             patch("sow_render_worker.pipeline.get_render_ratio", return_value=0.8), \
+             patch("sow_render_worker.pipeline.generate_songset_audio") as mock_audio:
+
+            with pytest.raises(RuntimeError, match="Failed to download audio"):
+                execute_render_pipeline(
+                    "job_abc123", 42, mock_conn,
+                    asset_fetcher=mock_fetcher,
+                    uploader=_make_mock_uploader(),
+                )
+
+            mock_audio.assert_not_called()
+            mock_fail.assert_called_once_with(
+                mock_conn, "job_abc123", 42, "Failed to download audio for abc123"
+            )
+
+    def test_pipeline_overlaps_audio_mix_with_video(self):
+        job = _make_render_job()
+        mock_conn = MagicMock()
+        items = [_make_songset_item()]
+        audio_result = _make_audio_result(items)
+        audio_plan = AudioPlan(
+            segments=audio_result.segments,
+            audio_files=(),
+            total_duration_seconds=180.0,
+        )
+
+        with patch("sow_render_worker.pipeline.get_render_job", return_value=job), \
+             patch("sow_render_worker.pipeline.start_render_job", return_value=job), \
+             patch("sow_render_worker.pipeline.update_render_progress"), \
+             patch("sow_render_worker.pipeline.complete_render_job"), \
+             patch("sow_render_worker.pipeline.fail_render_job") as mock_fail, \
+             patch("sow_render_worker.pipeline.fetch_songset_items", return_value=("Worship Set", items)), \
+             patch("sow_render_worker.pipeline.get_render_ratio", return_value=0.8), \
+             patch("sow_render_worker.pipeline.generate_songset_audio") as mock_generate_audio, \
+             patch("sow_render_worker.pipeline.plan_songset_audio", return_value=audio_plan), \
+             patch("sow_render_worker.pipeline.mix_songset_audio", return_value=audio_result) as mock_mix, \
+             patch("sow_render_worker.pipeline.generate_chapters_manifest", return_value=_make_chapters_manifest()), \
+             patch("sow_render_worker.pipeline.VideoEngine") as mock_ve_class, \
+             patch("sow_render_worker.pipeline.Path") as mock_path_cls:
+
+            mock_path_cls.return_value.exists.return_value = True
+            mock_path_cls.return_value.__truediv__.side_effect = lambda name: f"/tmp/sow-test/{name}"
+            mock_ve = MagicMock()
+            mock_ve_class.return_value = mock_ve
+
+            execute_render_pipeline(
+                "job_abc123", 42, mock_conn,
+                asset_fetcher=_make_mock_fetcher(),
+                uploader=_make_mock_uploader(),
+                overlap_audio_mix=True,
+            )
+
+            mock_fail.assert_not_called()
+            mock_generate_audio.assert_not_called()
+            mock_mix.assert_called_once_with(
+                audio_plan, "/tmp/sow-test/output.mp3", job_id="job_abc123", cancel_event=ANY
+            )
+            video_call = mock_ve.generate_video.call_args
+            assert video_call.args[0] is None
+            assert video_call.args[2] == "/tmp/sow-test/output-video.mp4"
+            assert video_call.kwargs["total_duration_seconds"] == 180.0
+            mock_ve.mux_audio.assert_called_once_with(
+                "/tmp/sow-test/output-video.mp4",
+                "/tmp/sow-test/output.mp3",
+                "/tmp/sow-test/output.mp4",
+                job_id="job_abc123",
+            )
+
+    def test_pipeline_overlap_audio_mix_failure_marks_job_failed(self):
+        job = _make_render_job()
+        mock_conn = MagicMock()
+        items = [_make_songset_item()]
+        audio_plan = AudioPlan(
+            segments=_make_audio_result(items).segments,
+            audio_files=(),
+            total_duration_seconds=180.0,
+        )
+
+        with patch("sow_render_worker.pipeline.get_render_job", return_value=job), \
+             patch("sow_render_worker.pipeline.start_render_job", return_value=job), \
+             patch("sow_render_worker.pipeline.update_render_progress"), \
+             patch("sow_render_worker.pipeline.fail_render_job") as mock_fail, \
+             patch("sow_render_worker.pipeline.fetch_songset_items", return_value=("Worship Set", items)), \
+             patch("sow_render_worker.pipeline.get_render_ratio", return_value=0.8), \
+             patch("sow_render_worker.pipeline.plan_songset_audio", return_value=audio_plan), \
+             patch("sow_render_worker.pipeline.mix_songset_audio", side_effect=RuntimeError("amix failed")), \
+             patch("sow_render_worker.pipeline.VideoEngine") as mock_ve_class:
+
+            mock_ve = MagicMock()
+            mock_ve_class.return_value = mock_ve
+
+            with pytest.raises(RuntimeError, match="amix failed"):
+                execute_render_pipeline(
+                    "job_abc123", 42, mock_conn,
+                    asset_fetcher=_make_mock_fetcher(),
+                    uploader=_make_mock_uploader(),
+                    overlap_audio_mix=True,
+                )
+
+            mock_ve.mux_audio.assert_not_called()
+            mock_fail.assert_called_once_with(mock_conn, "job_abc123", 42, "amix failed")
+
+    def test_pipeline_segment_cache_reuses_mixdown(self):
+        job = _make_render_job()
+        mock_conn = MagicMock()
+        items = [_make_songset_item()]
+        audio_result = _make_audio_result(items)
+        audio_plan = AudioPlan(
+            segments=audio_result.segments,
+            audio_files=(),
+            total_duration_seconds=180.0,
+        )
+        segment_cache = MagicMock()
+        segment_cache.get_stats.return_value = {"hits": 1, "misses": 0, "stores": 0}
+
+        with patch("sow_render_worker.pipeline.get_render_job", return_value=job), \
+             patch("sow_render_worker.pipeline.start_render_job", return_value=job), \
+             patch("sow_render_worker.pipeline.update_render_progress"), \
+             patch("sow_render_worker.pipeline.complete_render_job"), \
+             patch("sow_render_worker.pipeline.fail_render_job") as mock_fail, \
+             patch("sow_render_worker.pipeline.fetch_songset_items", return_value=("Worship Set", items)), \
+             patch("sow_render_worker.pipeline.get_render_ratio", return_value=0.8), \
+             patch("sow_render_worker.pipeline.plan_songset_audio", return_value=audio_plan), \
+             patch("sow_render_worker.pipeline.mix_songset_audio") as mock_mix, \
+             patch("sow_render_worker.pipeline.mix_songset_audio_cached", return_value=audio_result) as mock_mix_cached, \
+             patch("sow_render_worker.pipeline.generate_chapters_manifest", return_value=_make_chapters_manifest()), \
+             patch("sow_render_worker.pipeline.VideoEngine") as mock_ve_class, \
+             patch("sow_render_worker.pipeline.Path") as mock_path_cls:
+
+            mock_path_cls.return_value.exists.return_value = True
+            mock_path_cls.return_value.__truediv__.side_effect = lambda name: f"/tmp/sow-test/{name}"
+
+            execute_render_pipeline(
+                "job_abc123", 42, mock_conn,
+                asset_fetcher=_make_mock_fetcher(),
+                uploader=_make_mock_uploader(),
+                overlap_audio_mix=False,
+                segment_cache=segment_cache,
+            )
+
+            mock_fail.assert_not_called()
+            mock_mix.assert_not_called()
+            mock_mix_cached.assert_called_once_with(
+                audio_plan, "/tmp/sow-test/output.mp3", segment_cache, job_id="job_abc123"
+            )
+            assert mock_ve_class.call_args.kwargs["segment_cache"] is segment_cache
+
+    def test_pipeline_overlap_ignored_without_video(self):
+        job = _make_render_job(video_enabled=False)
+        mock_conn = MagicMock()
+        items = [_make_songset_item()]
+
+        with patch("sow_render_worker.pipeline.get_render_job", return_value=job), \
+             patch("sow_render_worker.pipeline.start_render_job", return_value=job), \
+             patch("sow_render_worker.pipeline.update_render_progress"), \
+             patch("sow_render_worker.pipeline.complete_render_job"), \
+             patch("sow_render_worker.pipeline.fail_render_job"), \
+             patch("sow_render_worker.pipeline.fetch_songset_items", return_value=("Worship Set", items)), \
+             patch("sow_render_worker.pipeline.get_render_ratio", return_value=0.8), \
+             patch("sow_render_worker.pipeline.generate_songset_audio", return_value=_make_audio_result(items)) as mock_generate_audio, \
+             patch("sow_render_worker.pipeline.plan_songset_audio") as mock_plan, \
+             patch("sow_render_worker.pipeline.generate_chapters_manifest", return_value=_make_chapters_manifest()), \
+             patch("sow_render_worker.pipeline.Path") as mock_path_cls:
+
+            mock_path_cls.return_value.exists.return_value = True
+
+            execute_render_pipeline(
+                "job_abc123", 42, mock_conn,
+                asset_fetcher=_make_mock_fetcher(),
+                uploader=_make_mock_uploader(),
+                overlap_audio_mix=True,
+            )
+
+            mock_generate_audio.assert_called_once()
+            mock_plan.assert_not_called()
+
     def test_pipeline_memory_error_handler(self):
         job = _make_render_job()
         mock_conn = MagicMock()
@@ -0,0 +1,134 @@
+from __future__ import annotations
+
+from pathlib import Path
+from unittest.mock import MagicMock, patch
+
+from botocore.exceptions import ClientError
+
+from sow_render_worker.audio_engine import AudioPlan, SongsetItem
+from sow_render_worker.r2_client import R2Client
+from sow_render_worker.segment_cache import (
+    SegmentCache,
+    audio_plan_cache_key,
+    mix_songset_audio_cached,
+    resolve_segment_cache_enabled,
+    segment_cache_key,
+)
+
+
+def _make_cache() -> tuple[SegmentCache, MagicMock]:
+    r2_client = MagicMock(spec=R2Client)
+    r2_client.bucket_name = "test-bucket"
+    cache = SegmentCache(r2_client)
+    return cache, r2_client.client
+
+
+def _make_plan(start_ms: int = 0) -> AudioPlan:
+    item = SongsetItem(
+        id="item-1",
+        songset_id="ss-1",
+        song_id="song-1",
+        recording_hash_prefix="abc123",
+        recording_content_hash="abc123def456",
+    )
+    return AudioPlan(
+        segments=(),
+        audio_files=(
+            {"item": item, "start_ms": start_ms, "duration_ms": 1000, "crossfade_ms": 0},
+        ),
+        total_duration_seconds=1.0,
+    )
+
+
+class TestResolveSegmentCacheEnabled:
+    def test_defaults_off(self, monkeypatch):
+        monkeypatch.delenv("SOW_SEGMENT_CACHE", raising=False)
+        assert resolve_segment_cache_enabled() is False
+
+    def test_env_and_explicit(self, monkeypatch):
+        monkeypatch.setenv("SOW_SEGMENT_CACHE", "true")
+        assert resolve_segment_cache_enabled() is True
+        assert resolve_segment_cache_enabled(False) is False
+
+
+class TestSegmentCacheKey:
+    def test_stable_and_order_independent(self):
+        assert segment_cache_key({"a": 1, "b": [2]}) == segment_cache_key({"b": [2], "a": 1})
+
+    def test_version_changes_key(self):
+        key = segment_cache_key({"a": 1})
+        with patch("sow_render_worker.segment_cache.SEGMENT_CACHE_VERSION", 999):
+            assert segment_cache_key({"a": 1}) != key
+
+    def test_audio_key_tracks_timing(self):
+        assert audio_plan_cache_key(_make_plan()) == audio_plan_cache_key(_make_plan())
+        assert audio_plan_cache_key(_make_plan()) != audio_plan_cache_key(_make_plan(start_ms=10))
+
+
+class TestFetchStore:
+    def test_fetch_hit(self, tmp_path):
+        cache, client = _make_cache()
+        assert cache.fetch("video", "k1", tmp_path / "k1.mp4") is True
+        client.download_file.assert_called_once_with(
+            "test-bucket", "render-cache/video/k1.mp4", str(tmp_path / "k1.mp4")
+        )
+        assert cache.get_stats() == {"hits": 1, "misses": 0, "stores": 0}
+
+    def test_fetch_missing_object_is_miss(self, tmp_path, caplog):
+        cache, client = _make_cache()
+        client.download_file.side_effect = ClientError(
+            {"Error": {"Code": "404", "Message": "Not Found"}}, "HeadObject"
+        )
+        assert cache.fetch("video", "k1", tmp_path / "k1.mp4") is False
+        assert cache.get_stats()["misses"] == 1
+        assert "fetch failed" not in caplog.text
+
+    def test_fetch_error_is_miss_and_removes_partial_file(self, tmp_path, caplog):
+        cache, client = _make_cache()
+        dest = tmp_path / "k1.mp4"
+
+        def fail(bucket, key, filename):
+            Path(filename).write_bytes(b"partial")
+            raise OSError("connection reset")
+
+        client.download_file.side_effect = fail
+        assert cache.fetch("video", "k1", dest) is False
+        assert not dest.exists()
+        assert "fetch failed" in caplog.text
+
+    def test_store_swallows_errors(self, tmp_path):
+        cache, client = _make_cache()
+        src = tmp_path / "k1.mp3"
+        src.write_bytes(b"audio")
+        cache.store("audio", "k1", src)
+        client.upload_file.side_effect = OSError("boom")
+        cache.store("audio", "k2", src)
+
+        client.upload_file.assert_any_call(str(src), "test-bucket", "render-cache/audio/k1.mp3")
+        assert cache.get_stats()["stores"] == 1
+
+
+class TestMixSongsetAudioCached:
+    def test_hit_skips_mixdown(self, tmp_path):
+        cache = MagicMock()
+        cache.fetch.return_value = True
+        plan = _make_plan()
+
+        with patch("sow_render_worker.segment_cache.mix_songset_audio") as mock_mix:
+            result = mix_songset_audio_cached(plan, str(tmp_path / "out.mp3"), cache)
+
+        mock_mix.assert_not_called()
+        cache.store.assert_not_called()
+        assert result.total_duration_seconds == 1.0
+
+    def test_miss_mixes_and_stores(self, tmp_path):
+        cache = MagicMock()
+        cache.fetch.return_value = False
+        plan = _make_plan()
+        output_path = str(tmp_path / "out.mp3")
+
+        with patch("sow_render_worker.segment_cache.mix_songset_audio") as mock_mix:
+            mix_songset_audio_cached(plan, output_path, cache, job_id="job-1")
+
+        mock_mix.assert_called_once_with(plan, output_path, job_id="job-1", cancel_event=None)
+        cache.store.assert_called_once_with("audio", audio_plan_cache_key(plan), Path(output_path))
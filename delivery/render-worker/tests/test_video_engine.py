@@ -15,6 +15,7 @@ from sow_render_worker.audio_engine import AudioSegmentInfo, SongsetItem
 from sow_render_worker.chapters import Chapter, ChaptersManifest
 from sow_render_worker.frame_renderer import (
     FONT_SIZE_PRESETS,
+    FrameRenderer,
     VIDEO_TEMPLATES,
     SegmentInfo,
     TitleCardConfig,
@@ -28,6 +29,7 @@ from sow_render_worker.video_engine import (
     RESOLUTION_MAP,
     _check_memory_pressure,
     _MEMORY_WARNING_FRACTION,
+    resolve_frame_emit_mode,
 )
 
 
@@ -625,16 +627,16 @@ class TestEncodeVideoWithFFmpeg:
         mock_process.stderr.read.return_value = b""
 
         render_times: list[float] = []
-        original_render_frame_bytes = engine.frame_renderer.render_frame_bytes
+        original_render_interval_bytes = engine.frame_renderer.render_interval_bytes
 
-        def capture_render_time(lyrics_arg, segments_arg, current_time):
-            render_times.append(current_time)
-            return original_render_frame_bytes(lyrics_arg, segments_arg, current_time)
+        def capture_render_time(interval):
+            render_times.append(interval.state.current_time)
+            return original_render_interval_bytes(interval)
 
         with (
             patch("sow_render_worker.video_engine.subprocess.Popen") as mock_popen,
             patch.object(
-                engine.frame_renderer, "render_frame_bytes", side_effect=capture_render_time
+                engine.frame_renderer, "render_interval_bytes", side_effect=capture_render_time
             ),
         ):
             mock_popen.return_value = mock_process
@@ -649,8 +651,278 @@ class TestEncodeVideoWithFFmpeg:
             )
 
         title_card_frame_count = math.ceil(5.0 * 24)
-        if render_times:
-            assert render_times[0] >= 5.0
+        assert render_times
+        assert render_times[0] == title_card_frame_count / 24
+        assert mock_process.stdin.write.call_count == 240
+
+
+    def test_video_only_encode_has_no_audio_input(self, tmp_path):
+        output_path = str(tmp_path / "video.mp4")
+        engine = VideoEngine(MockAssetFetcher(), ffmpeg_path="/usr/bin/ffmpeg", fps=24)
+
+        mock_process = MagicMock()
+        mock_process.wait.return_value = 0
+        mock_process.stderr.read.return_value = b""
+
+        with patch("sow_render_worker.video_engine.subprocess.Popen") as mock_popen:
+            mock_popen.return_value = mock_process
+            engine.encode_video_with_ffmpeg(
+                None,
+                output_path,
+                total_frames=10,
+                total_duration_seconds=0.5,
+                lyrics=[],
+                segments=[],
+            )
+
+        cmd = mock_popen.call_args[0][0]
+        assert cmd.count("-i") == 1
+        assert "-an" in cmd
+        assert "-shortest" not in cmd
+        assert "aac" not in cmd
+
+
+class TestResolveFrameEmitMode:
+    def test_defaults_to_pipe(self):
+        with patch.dict("os.environ", {}, clear=True):
+            assert resolve_frame_emit_mode() == "pipe"
+
+    def test_reads_env(self):
+        with patch.dict("os.environ", {"SOW_FRAME_EMIT_MODE": "concat"}):
+            assert resolve_frame_emit_mode() == "concat"
+
+    def test_explicit_value_overrides_env(self):
+        with patch.dict("os.environ", {"SOW_FRAME_EMIT_MODE": "concat"}):
+            assert resolve_frame_emit_mode("pipe") == "pipe"
+
+    def test_unknown_value_falls_back_to_pipe(self):
+        assert resolve_frame_emit_mode("Concat ") == "concat"
+        assert resolve_frame_emit_mode("jpeg") == "pipe"
+
+
+class TestEncodeVideoConcat:
+    def _encode(
+        self, tmp_path, total_frames=8, lyrics=None, segments=None, return_code=0, **kwargs
+    ):
+        engine = VideoEngine(
+            MockAssetFetcher(temp_dir=str(tmp_path)), fps=4, frame_emit_mode="concat"
+        )
+        engine.resolution = (160, 90)
+        engine.frame_renderer = FrameRenderer(
+            template=VIDEO_TEMPLATES["dark"], resolution=engine.resolution
+        )
+        captured = {}
+
+        def fake_popen(args, **popen_kwargs):
+            concat_path = Path(args[args.index("-i") + 1])
+            captured["args"] = args
+            captured["script"] = concat_path.read_text(encoding="utf-8")
+            captured["pngs"] = sorted(p.name for p in concat_path.parent.glob("*.png"))
+            process = MagicMock()
+            process.wait.return_value = return_code
+            process.stderr.read.side_effect = [b"concat error", b""]
+            return process
+
+        with patch("sow_render_worker.video_engine.subprocess.Popen", side_effect=fake_popen):
+            engine.encode_video_with_ffmpeg(
+                "/tmp/audio.mp3",
+                str(tmp_path / "video.mp4"),
+                total_frames=total_frames,
+                total_duration_seconds=total_frames / 4,
+                lyrics=lyrics or [],
+                segments=segments or [],
+                **kwargs,
+            )
+        return captured
+
+    @staticmethod
+    def _durations(script: str) -> list[float]:
+        return [float(line.split()[1]) for line in script.splitlines() if line.startswith("duration")]
+
+    def test_identical_frames_written_once(self, tmp_path):
+        captured = self._encode(tmp_path, total_frames=8)
+        assert captured["pngs"] == ["frame-000000.png"]
+        assert self._durations(captured["script"]) == [2.0]
+
+    def test_durations_cover_every_frame(self, tmp_path):
+        lyrics = [
+            GlobalLRCLine(text="One", local_time_seconds=0.5, global_time_seconds=0.5, title="S"),
+            GlobalLRCLine(text="Two", local_time_seconds=1.25, global_time_seconds=1.25, title="S"),
+        ]
+        segments = [
+            SegmentInfo(
+                id="1",
+                song_id="s1",
+                position=0,
+                song_title="S",
+                start_time_seconds=0.0,
+                duration_seconds=10.0,
+            )
+        ]
+        captured = self._encode(tmp_path, total_frames=10, lyrics=lyrics, segments=segments)
+        durations = self._durations(captured["script"])
+        assert len(durations) == len(captured["pngs"]) > 1
+        assert sum(durations) == pytest.approx(10 / 4)
+
+    def test_script_pins_input_framerate(self, tmp_path):
+        captured = self._encode(tmp_path)
+        lines = captured["script"].splitlines()
+        assert lines[0] == "ffconcat version 1.0"
+        file_lines = [i for i, line in enumerate(lines) if line.startswith("file ")]
+        assert len(file_lines) == 2
+        for i in file_lines:
+            assert lines[i + 1] == "option framerate 4"
+
+    def test_ffmpeg_args(self, tmp_path):
+        args = self._encode(tmp_path, total_frames=8)["args"]
+        assert args[args.index("-f") + 1] == "concat"
+        assert args[args.index("-safe") + 1] == "0"
+        assert args[args.index("-vf") + 1] == "fps=4"
+        assert args[args.index("-frames:v") + 1] == "8"
+        assert "-shortest" in args
+
+    def test_title_card_gets_own_entry(self, tmp_path):
+        captured = self._encode(
+            tmp_path,
+            total_frames=30,
+            title_card_config=TitleCardConfig(
+                enabled=True,
+                duration_seconds=5.0,
+                lines=("Set",),
+                total_duration_seconds=7.5,
+            ),
+        )
+        assert self._durations(captured["script"]) == [5.0, 2.5]
+
+    def test_frames_dir_removed(self, tmp_path):
+        self._encode(tmp_path)
+        assert not list(tmp_path.glob("frames-*"))
+
+    def test_nonzero_exit_raises_and_cleans_up(self, tmp_path):
+        with pytest.raises(RuntimeError, match="(?s)FFmpeg exited with code 1.*concat error"):
+            self._encode(tmp_path, return_code=1)
+        assert not list(tmp_path.glob("frames-*"))
+
+
+def _song(song_id: str, start: float, duration: float = 2.0) -> SegmentInfo:
+    return SegmentInfo(
+        id=f"seg-{song_id}",
+        song_id=song_id,
+        position=0,
+        song_title=f"Song {song_id}",
+        start_time_seconds=start,
+        duration_seconds=duration,
+    )
+
+
+def _line(song_id: str, text: str, song_start: float, local: float) -> GlobalLRCLine:
+    return GlobalLRCLine(
+        text=text,
+        local_time_seconds=local,
+        global_time_seconds=song_start + local,
+        title=f"Song {song_id}",
+    )
+
+
+class TestEncodeVideoSegmented:
+    def _engine(self, tmp_path, segment_cache=None) -> VideoEngine:
+        engine = VideoEngine(
+            MockAssetFetcher(temp_dir=str(tmp_path)),
+            fps=4,
+            segment_cache=segment_cache or MagicMock(),
+        )
+        engine.resolution = (160, 90)
+        engine.frame_renderer = FrameRenderer(
+            template=VIDEO_TEMPLATES["dark"], resolution=engine.resolution
+        )
+        return engine
+
+    def _keys(self, engine, segments, lyrics, total_frames):
+        chunks = engine._plan_video_chunks(lyrics, segments, total_frames, None, 0)
+        return [(chunk.start_frame, chunk.end_frame, chunk.key) for chunk in chunks]
+
+    def test_song_key_independent_of_position(self, tmp_path):
+        engine = self._engine(tmp_path)
+        first = self._keys(
+            engine,
+            [_song("a", 0.0), _song("b", 2.0)],
+            [_line("a", "A1", 0.0, 0.5), _line("b", "B1", 2.0, 0.5)],
+            16,
+        )
+        second = self._keys(
+            engine,
+            [_song("c", 0.0, 1.0), _song("a", 1.0), _song("b", 3.0)],
+            [
+                _line("c", "C1", 0.0, 0.25),
+                _line("a", "A1", 1.0, 0.5),
+                _line("b", "B1", 3.0, 0.5),
+            ],
+            20,
+        )
+
+        assert [(s, e) for s, e, _ in first] == [(0, 8), (8, 16)]
+        assert [(s, e) for s, e, _ in second] == [(0, 4), (4, 12), (12, 20)]
+        assert [key for _, _, key in first] == [key for _, _, key in second[1:]]
+
+    def test_changed_lyric_changes_only_that_song(self, tmp_path):
+        engine = self._engine(tmp_path)
+        segments = [_song("a", 0.0), _song("b", 2.0)]
+        before = self._keys(
+            engine, segments, [_line("a", "A1", 0.0, 0.5), _line("b", "B1", 2.0, 0.5)], 16
+        )
+        after = self._keys(
+            engine, segments, [_line("a", "A1", 0.0, 0.5), _line("b", "B2", 2.0, 0.5)], 16
+        )
+
+        assert before[0] == after[0]
+        assert before[1][2] != after[1][2]
+
+    def test_title_card_is_its_own_chunk(self, tmp_path):
+        engine = self._engine(tmp_path)
+        title_card = TitleCardConfig(
+            enabled=True, duration_seconds=1.0, lines=("Sunday",), total_duration_seconds=3.0
+        )
+        chunks = engine._plan_video_chunks([], [_song("a", 1.0)], 12, title_card, 4)
+
+        assert chunks[0].timeline is None
+        assert (chunks[0].start_frame, chunks[0].end_frame) == (0, 4)
+        assert (chunks[1].start_frame, chunks[1].end_frame) == (4, 12)
+
+    def test_encodes_only_missing_chunks(self, tmp_path):
+        cached_keys = set()
+        segment_cache = MagicMock()
+        segment_cache.fetch.side_effect = lambda kind, key, dest: key in cached_keys
+        engine = self._engine(tmp_path, segment_cache)
+        segments = [_song("a", 0.0), _song("b", 2.0)]
+        lyrics = [_line("a", "A1", 0.0, 0.5), _line("b", "B1", 2.0, 0.5)]
+        chunks = engine._plan_video_chunks(lyrics, segments, 16, None, 0)
+        cached_keys.add(chunks[0].key)
+        encoded = []
+
+        def fake_encode(frames, path, timeout_check_callback=None):
+            encoded.append((path.stem, sum(1 for _ in frames)))
+
+        with (
+            patch.object(engine, "_encode_frames_to_file", side_effect=fake_encode),
+            patch.object(engine, "_concat_video_files") as mock_concat,
+            patch.object(engine, "mux_audio") as mock_mux,
+            patch.object(engine, "_start_parallel_renderer", return_value=None),
+        ):
+            engine.encode_video_with_ffmpeg(
+                "/tmp/audio.mp3",
+                str(tmp_path / "video.mp4"),
+                total_frames=16,
+                total_duration_seconds=4.0,
+                lyrics=lyrics,
+                segments=segments,
+            )
+
+        assert encoded == [(chunks[1].key, 8)]
+        segment_cache.store.assert_called_once()
+        assert [p.stem for p in mock_concat.call_args.args[0]] == [c.key for c in chunks]
+        mock_mux.assert_called_once()
+        assert mock_mux.call_args.args[1:] == ("/tmp/audio.mp3", str(tmp_path / "video.mp4"))
+        assert not list(tmp_path.glob("segments-*"))
 
 
 class TestGenerateVideo:
@@ -889,6 +1161,47 @@ class TestGenerateVideo:
         assert call_kwargs[0][2] == math.ceil(180.0 * 24)
 
 
+    def test_explicit_duration_skips_probe(self, tmp_path):
+        output_path = str(tmp_path / "video.mp4")
+        engine = VideoEngine(MockAssetFetcher(lrc_content="[00:00.00]Hello"), include_title_card=False)
+
+        with (
+            patch("sow_render_worker.video_engine.get_audio_info") as mock_info,
+            patch.object(engine, "encode_video_with_ffmpeg") as mock_encode,
+        ):
+            result = engine.generate_video(
+                None, [_make_segment()], output_path, total_duration_seconds=10.0
+            )
+
+        mock_info.assert_not_called()
+        assert mock_encode.call_args[0][0] is None
+        assert result.total_frames == 240
+
+
+class TestMuxAudio:
+    def test_copies_video_and_encodes_audio(self, tmp_path):
+        engine = VideoEngine(MockAssetFetcher(), ffmpeg_path="/usr/bin/ffmpeg")
+        mock_result = MagicMock(returncode=0, stderr=b"")
+
+        with patch("sow_render_worker.video_engine.subprocess.run", return_value=mock_result) as mock_run:
+            engine.mux_audio("/tmp/video.mp4", "/tmp/audio.mp3", "/tmp/out.mp4", job_id="test-job")
+
+        cmd = mock_run.call_args[0][0]
+        assert cmd[:6] == ["/usr/bin/ffmpeg", "-y", "-i", "/tmp/video.mp4", "-i", "/tmp/audio.mp3"]
+        assert cmd[cmd.index("-c:v") + 1] == "copy"
+        assert cmd[cmd.index("-c:a") + 1] == "aac"
+        assert "-shortest" in cmd
+        assert cmd[-1] == "/tmp/out.mp4"
+
+    def test_failure_raises(self):
+        engine = VideoEngine(MockAssetFetcher())
+        mock_result = MagicMock(returncode=1, stderr=b"bad input")
+
+        with patch("sow_render_worker.video_engine.subprocess.run", return_value=mock_result):
+            with pytest.raises(RuntimeError, match="(?s)mux exited with code 1.*bad input"):
+                engine.mux_audio("/tmp/video.mp4", "/tmp/audio.mp3", "/tmp/out.mp4")
+
+
 class TestInjectChapters:
     def test_inject_chapters_success(self, tmp_path):
         video_path = str(tmp_path / "video.mp4")
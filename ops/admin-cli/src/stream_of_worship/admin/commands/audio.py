@@ -71,6 +71,9 @@ KEY_REVIEW_CAVEAT = (
     "v3 will introduce an overrides table preserving manual decisions."
 )
 
+# Completed embedding jobs written per bulk upsert by `audio embed --wait`
+EMBED_WRITE_BATCH_SIZE = 100
+
 
 # Helper functions for download flow
 
@@ -2296,12 +2299,88 @@ def _write_embedding_result(
         return False
 
 
+def _write_embedding_results_bulk(
+    job_infos: list["JobInfo"],
+    db_client: "DatabaseClient",
+    console: "Console",
+    defer_vector_indexes: bool = False,
+) -> int:
+    """Write completed embedding results with one bulk COPY upsert.
+
+    If the bulk write fails, each song is written on its own instead so one
+    bad row does not discard the rest of the batch.
+
+    Returns:
+        Number of songs written
+    """
+    from stream_of_worship.admin.db.models import SongEmbedding, SongLineEmbedding
+
+    embeddings: list[SongEmbedding] = []
+    line_embeddings: list[SongLineEmbedding] = []
+    for job_info in job_infos:
+        result = job_info.result
+        if not result or not hasattr(result, "embedding"):
+            console.print(f"  [red]No embedding result[/red] for job {job_info.job_id}")
+            continue
+        embeddings.append(
+            SongEmbedding(
+                song_id=result.song_id,
+                embedding=result.embedding,
+                model_version=result.model_version,
+                content_hash=result.content_hash,
+            )
+        )
+        line_embeddings.extend(
+            SongLineEmbedding(
+                id=None,
+                song_id=result.song_id,
+                line_index=le.line_index,
+                line_text=le.line_text,
+                embedding=le.embedding,
+                model_version=result.model_version,
+            )
+            for le in result.line_embeddings
+        )
+
+    if not embeddings:
+        return 0
+
+    try:
+        db_client.bulk_upsert_embeddings(
+            embeddings, line_embeddings, defer_vector_indexes=defer_vector_indexes
+        )
+    except Exception as e:
+        console.print(
+            f"  [yellow]Bulk write of {len(embeddings)} embeddings failed, "
+            f"writing one by one:[/yellow] {e}"
+        )
+        return sum(
+            _write_embedding_result(job_info, db_client, console)
+            for job_info in job_infos
+            if job_info.result and hasattr(job_info.result, "embedding")
+        )
+
+    console.print(
+        f"  [green]Wrote[/green] {len(embeddings)} embeddings "
+        f"({len(line_embeddings)} lines)"
+    )
+    return len(embeddings)
+
+
 @app.command("embed")
 def embed_songs(
     song_id: Optional[str] = typer.Argument(None, help="Song ID to embed"),
     all_songs: bool = typer.Option(False, "--all", help="Embed all songs without embeddings"),
     force: bool = typer.Option(False, "--force", help="Re-embed even if content hash matches"),
     wait: bool = typer.Option(False, "--wait", help="Wait for all jobs to complete"),
+    defer_index: bool = typer.Option(
+        False,
+        "--defer-index",
+        help=(
+            "With --wait, drop and rebuild the vector indexes around each bulk write "
+            f"of {EMBED_WRITE_BATCH_SIZE} songs (vector search blocks until it commits)"
+        ),
+    ),
     config_path: Optional[Path] = typer.Option(None, "--config", "-c", help="Path to config file"),
 ) -> None:
     """Generate text embeddings for songs using OpenAI text-embedding-3-small.
@@ -2314,6 +2393,7 @@ def embed_songs(
         sow-admin audio embed --all
         sow-admin audio embed --all --force
         sow-admin audio embed --all --wait
+        sow-admin audio embed --all --force --wait --defer-index
     """
     from rich.console import Console
 
@@ -2380,18 +2460,32 @@ def embed_songs(
         return
 
     console.print("Waiting for jobs to complete...")
+    completed: list[JobInfo] = []
     failed = 0
+
+    def flush() -> None:
+        nonlocal failed
+        written = _write_embedding_results_bulk(
+            completed, db_client, console, defer_vector_indexes=defer_index
+        )
+        failed += len(completed) - written
+        completed.clear()
+
+    # Write results in bounded batches so an interrupted run keeps what it has.
     for jid in job_ids:
         try:
             result = analysis_client.wait_for_completion(jid, poll_interval=2.0, timeout=120.0)
             if result.status == "completed":
-                _write_embedding_result(result, db_client, console)
+                completed.append(result)
+                if len(completed) >= EMBED_WRITE_BATCH_SIZE:
+                    flush()
             else:
                 console.print(f"  [red]Job {jid} failed:[/red] {result.error_message}")
                 failed += 1
         except AnalysisServiceError as e:
             console.print(f"  [red]Job {jid} error:[/red] {e}")
             failed += 1
+    flush()
 
     console.print(f"\nDone: {len(job_ids) - failed} succeeded, {failed} failed")
     db_client.close()
@@ -3510,7 +3604,7 @@ def cache_assets(
                 if path:
                     size_mb = path.stat().st_size / (1024 * 1024)
                     downloaded.append(f"Stem '{stem_name}': {path.name} ({size_mb:.2f} MB)")
-                    console.print(f"[green]  ✓ {stem_name}.wav ({size_mb:.2f} MB)[/green]")
+                    console.print(f"[green]  ✓ {path.name} ({size_mb:.2f} MB)[/green]")
                 else:
                     # Stems might not exist for all recordings
                     console.print(f"[dim]  - {stem_name}.wav (not available)[/dim]")
@@ -6057,6 +6151,26 @@ def _print_unified_progress(
     )
 
 
+def _fetch_job_states(
+    analysis_client: AnalysisClient, job_ids: List[str], console: Console
+) -> Dict[str, JobInfo]:
+    """Fetch all active job states in one request.
+
+    Returns an empty dict when the lookup fails or the service predates bulk
+    status, so the caller falls back to polling each job.
+    """
+    if not job_ids:
+        return {}
+    try:
+        return analysis_client.get_jobs(job_ids)
+    except AnalysisServiceError as e:
+        if e.status_code != 405:
+            console.print(
+                f"  [yellow]→ Bulk job status failed, polling jobs individually: {e}[/yellow]"
+            )
+        return {}
+
+
 def _poll_one_cycle(
     pending_futures: Set[Future],
     active_jobs: Dict[Tuple[str, str], str],
@@ -6111,16 +6225,20 @@ def _poll_one_cycle(
             elif result["status"] == "failed":
                 results[sid]["_pipeline"] = "completed"
             last_completion_time = time.time()
+    elif active_jobs:
+        # No pending downloads; wait out the adaptive interval, waking early
+        # when the service streams a state change for one of the active jobs
+        analysis_client.wait_for_job_changes(list(active_jobs.values()), timeout=interval)
     else:
-        # No pending downloads; just sleep for the adaptive interval
         time.sleep(interval)
 
-    # B. Poll active service jobs
+    # B. Poll active service jobs (one bulk status request, per-job fallback)
+    job_states = _fetch_job_states(analysis_client, list(active_jobs.values()), console)
     for key in list(active_jobs.keys()):
         song_id, step = key
         job_id = active_jobs[key]
         try:
-            job = analysis_client.get_job(job_id)
+            job = job_states.get(job_id) or analysis_client.get_job(job_id)
 
             if step == "lrc":
                 is_terminal, new_job_id = _handle_lrc_completion(
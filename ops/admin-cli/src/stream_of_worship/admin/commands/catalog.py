@@ -18,6 +18,7 @@ from rich.text import Text
 from stream_of_worship.admin.config import AdminConfig
 from stream_of_worship.admin.db.client import DatabaseClient
 from stream_of_worship.admin.db.models import Song
+from stream_of_worship.admin.services.analysis import AnalysisClient
 from stream_of_worship.admin.services.catalog_edit import (
     build_song_diff,
     build_song_from_review,
@@ -892,6 +893,21 @@ def search_songs(
         "-l",
         help="Maximum number of results",
     ),
+    offset: int = typer.Option(
+        0,
+        "--offset",
+        help="Number of results to skip (for paging through results)",
+    ),
+    hybrid: bool = typer.Option(
+        False,
+        "--hybrid",
+        help="Also match by meaning via lyric embeddings (needs the analysis service)",
+    ),
+    ef_search: int = typer.Option(
+        100,
+        "--ef-search",
+        help="HNSW candidate list size for --hybrid (higher: better recall, slower)",
+    ),
     config_path: Path = typer.Option(
         None,
         "--config",
@@ -901,8 +917,10 @@ def search_songs(
 ) -> None:
     """Search songs in catalog.
 
-    Search for songs by title, lyrics, composer, or all fields.
-    Results are ordered by song ID.
+    Search for songs by title, lyrics, composer, album, or all fields.
+    Results are ranked by relevance, title matches first. With --hybrid, the
+    query is also embedded and matched against song and lyric-line
+    embeddings, so a half-remembered lyric finds its song.
     """
     try:
         config = AdminConfig.load(config_path)
@@ -912,8 +930,27 @@ def search_songs(
 
     db_client = get_db_client(config)
 
+    matched_lines: dict[str, Optional[str]] = {}
     try:
-        songs = db_client.search_songs(query, field=field, limit=limit)
+        if hybrid:
+            try:
+                analysis_client = AnalysisClient(config.analysis_url)
+            except ValueError as e:
+                console.print(f"[red]Analysis service not configured: {e}[/red]")
+                raise typer.Exit(1)
+            hits = db_client.hybrid_search_songs(
+                query,
+                analysis_client.embed_query,
+                limit=limit,
+                offset=offset,
+                ef_search=ef_search,
+            )
+            songs = [hit.song for hit in hits]
+            matched_lines = {hit.song.id: hit.matched_line for hit in hits}
+        else:
+            songs = db_client.search_songs(query, field=field, limit=limit, offset=offset)
+    except typer.Exit:
+        raise
     except Exception as e:
         console.print(f"[red]Error searching songs: {e}[/red]")
         raise typer.Exit(1)
@@ -929,15 +966,20 @@ def search_songs(
     table.add_column("Composer", style="green")
     table.add_column("Album", style="yellow")
     table.add_column("Key", style="magenta", justify="center")
+    if hybrid:
+        table.add_column("Matched Line", style="dim")
 
     for song in songs:
-        table.add_row(
+        row = [
             song.id,
             song.title,
             song.composer or "-",
             song.album_name or "-",
             song.musical_key or "-",
-        )
+        ]
+        if hybrid:
+            row.append(matched_lines.get(song.id) or "-")
+        table.add_row(*row)
 
     console.print(table)
 
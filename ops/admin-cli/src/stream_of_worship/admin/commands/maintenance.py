@@ -28,6 +28,7 @@ from stream_of_worship.admin.config import AdminConfig
 from stream_of_worship.admin.db.client import DatabaseClient
 from stream_of_worship.admin.services.r2 import R2Client, R2PrefixSummary
 from stream_of_worship.admin.services.r2_backup import (
+    MAX_CONCURRENCY,
     MIN_CHUNK_SIZE_BYTES,
     BackupError,
     BackupProgress,
@@ -60,9 +61,14 @@ def _load_clients(config_path: Optional[Path]) -> tuple[AdminConfig, DatabaseCli
     return config, get_db_client(config)
 
 
-def _load_r2(config: AdminConfig) -> R2Client:
+def _load_r2(config: AdminConfig, max_pool_connections: int = 5) -> R2Client:
     try:
-        return R2Client(config.r2_bucket, config.r2_endpoint_url, config.r2_region)
+        return R2Client(
+            config.r2_bucket,
+            config.r2_endpoint_url,
+            config.r2_region,
+            max_pool_connections=max_pool_connections,
+        )
     except ValueError as e:
         console.print(f"[red]R2 configuration error: {e}[/red]")
         raise typer.Exit(1)
@@ -599,18 +605,22 @@ def _orphan_r2_prefixes(
     r2_client: R2Client,
     blacklist: list[str],
 ) -> list[dict]:
+    summaries = r2_client.scan_recording_prefixes(blacklist=blacklist)
+    references = db_client.get_recording_prefix_references(
+        [summary.prefix for summary in summaries]
+    )
     rows = []
-    for summary in r2_client.scan_recording_prefixes(blacklist=blacklist):
-        if db_client.recording_row_exists(summary.prefix):
+    for summary in summaries:
+        row_exists, reference_count = references.get(summary.prefix, (False, 0))
+        if row_exists:
             continue
-        references = db_client.count_recording_songset_references(summary.prefix)
         rows.append(
             {
                 "prefix": summary.prefix,
                 "object_count": summary.object_count,
                 "total_bytes": summary.total_bytes,
                 "last_modified": summary.last_modified,
-                "songset_reference_count": references,
+                "songset_reference_count": reference_count,
             }
         )
     return rows
@@ -676,15 +686,23 @@ def purge_r2_waste(
                     "object_count": summary.object_count,
                     "total_bytes": summary.total_bytes,
                     "last_modified": summary.last_modified,
-                    "songset_reference_count": db_client.count_recording_songset_references(
-                        validated
-                    ),
                 }
             )
     rows = _sort_by_last_modified_asc(rows)
+    # A dry run checks every prefix in one query. A real purge re-checks each
+    # prefix right before its delete, so a recording imported while a long
+    # purge runs never loses its objects.
+    references = (
+        {}
+        if confirm
+        else db_client.get_recording_prefix_references([row["prefix"] for row in rows])
+    )
     for row in rows:
+        if confirm:
+            references = db_client.get_recording_prefix_references([row["prefix"]])
+        row_exists, row["songset_reference_count"] = references.get(row["prefix"], (False, 0))
         blocked = []
-        if db_client.recording_row_exists(row["prefix"]):
+        if row_exists:
             blocked.append("recording-row-exists")
         if row["songset_reference_count"]:
             blocked.append("referenced-by-songset")
@@ -722,6 +740,9 @@ def _print_backup_summary_table(result, output_dir: Path) -> None:
     table.add_row("Object count", str(result.object_count))
     table.add_row("Total MB", str(_bytes_to_mb(result.total_bytes)))
     table.add_row("Chunk count", str(result.chunk_count))
+    if result.manifest.get("incremental"):
+        table.add_row("Reused objects", str(result.reused_object_count))
+        table.add_row("Downloaded MB", str(_bytes_to_mb(result.downloaded_bytes)))
     console.print(table)
 
 
@@ -758,13 +779,21 @@ def backup_r2(
         "10GiB", "--chunk-size", help="Chunk size (e.g. 10GiB, 500MiB, raw bytes)"
     ),
     concurrency: int = typer.Option(
-        1, "--concurrency", min=1, max=5,
+        1, "--concurrency", min=1, max=MAX_CONCURRENCY,
         help=(
-            "Number of concurrent download workers (default 1). "
+            "Max concurrent download workers (default 1). "
             "R2 exhibits an account-level throughput cap (~7 MiB/s from this client); "
             "a single connection already saturates it. The v1 rclone benchmark showed "
             "boto3 single-conn 7.85 MiB/s vs 4-range parallel 6.54 MiB/s (ratio=0.83, "
-            "parallel HURTS). Use --diag-range-key to investigate before raising."
+            "parallel HURTS). Use --diag-range-key to investigate before raising. "
+            "Above 1, workers back off adaptively when R2 throttles."
+        ),
+    ),
+    incremental_from: Optional[Path] = typer.Option(
+        None, "--incremental-from",
+        help=(
+            "Previous backup directory; only objects whose ETag, size or last-modified "
+            "changed are downloaded, the rest are referenced from that backup's chain"
         ),
     ),
     debug_traces: bool = typer.Option(
@@ -798,8 +827,12 @@ def backup_r2(
         )
         raise typer.Exit(1)
 
+    if incremental_from is not None and not incremental_from.is_dir():
+        console.print(f"[red]Incremental base not found: {incremental_from}[/red]")
+        raise typer.Exit(1)
+
     config, _ = _load_clients(config_path)
-    r2_client = _load_r2(config)
+    r2_client = _load_r2(config, max_pool_connections=max(5, concurrency))
 
     # Short-circuit: diagnostic mode
     if diag_range_key is not None:
@@ -859,6 +892,8 @@ def backup_r2(
             def _on_progress(prog: BackupProgress) -> None:
                 progress.update(
                     task,
+                    total=prog.total_bytes,
+                    object_count=prog.total_objects,
                     completed=prog.bytes_downloaded,
                     workers=prog.active_workers,
                     objects_done=prog.objects_downloaded,
@@ -878,6 +913,7 @@ def backup_r2(
                 concurrency=concurrency,
                 on_progress=base_callback,
                 tracer=tracer,
+                base_dir=incremental_from,
             )
     except BackupError as e:
         console.print(f"[red]Backup failed: {e}[/red]")
@@ -890,6 +926,8 @@ def backup_r2(
                 "object_count": result.object_count,
                 "total_mb": _bytes_to_mb(result.total_bytes),
                 "chunk_count": result.chunk_count,
+                "reused_object_count": result.reused_object_count,
+                "downloaded_mb": _bytes_to_mb(result.downloaded_bytes),
             }
         )
     else:
@@ -5,17 +5,29 @@ metadata via ``psycopg``.
 """
 
 import logging
+import struct
 import time
 from contextlib import contextmanager
 from datetime import datetime
-from typing import Generator, Optional
+from typing import TYPE_CHECKING, Callable, Generator, Optional
 
+import numpy as np
 import psycopg
 import psycopg.errors
-
-from stream_of_worship.admin.db.models import DatabaseStats, Recording, Song
+from psycopg.adapt import Dumper
+from psycopg.pq import Format
+from psycopg.types import TypeInfo
+
+from stream_of_worship.admin.db.models import (
+    DatabaseStats,
+    Recording,
+    Song,
+    SongEmbedding,
+    SongLineEmbedding,
+)
 from stream_of_worship.admin.db.schema import (
     ACTIVE_ROW_COUNT_QUERY,
+    CREATE_EMBEDDING_INDEXES,
     RECORDING_COLUMNS_FOR_JOIN,
     RECORDING_COLUMNS_SELECT,
     RECORDING_COLUMN_COUNT,
@@ -27,10 +39,31 @@ from stream_of_worship.admin.db.schema import (
 from stream_of_worship.db.connection import ConnectionProvider
 from stream_of_worship.db.helpers import to_str
 
+if TYPE_CHECKING:
+    from stream_of_worship.db.search import SongSearchHit
+
 logger = logging.getLogger("sow_admin.db")
 
 _VALID_VISIBILITY_STATUSES = {"published", "review", "hold"}
 
+# HNSW indexes dropped and rebuilt by bulk_upsert_embeddings(defer_vector_indexes=True).
+_VECTOR_INDEXES = ("idx_song_embedding_cosine", "idx_song_line_embedding_cosine")
+
+
+class _VectorBinaryDumper(Dumper):
+    """Dump a sequence of floats in pgvector's binary format for COPY.
+
+    Layout (see pgvector ``vector_recv``): int16 dimensions, int16 unused,
+    then big-endian float4 values. Subclassed with the database's ``vector``
+    OID, which differs per database.
+    """
+
+    format = Format.BINARY
+
+    def dump(self, obj) -> bytes:
+        values = np.asarray(obj, dtype=">f4")
+        return struct.pack(">hh", len(values), 0) + values.tobytes()
+
 
 class DatabaseClient:
     """Client for PostgreSQL database operations.
@@ -312,6 +345,83 @@ class DatabaseClient:
             )
             return len(songs)
 
+    def get_song_row_digests(self) -> dict[str, Optional[str]]:
+        """Get the stored source-row digest of every active song.
+
+        Returns:
+            Mapping of song ID to its row digest, or ``None`` for songs saved
+            before digests were recorded.
+        """
+        cursor = self.connection.cursor()
+        cursor.execute(
+            """
+            SELECT s.id, d.row_digest
+            FROM songs s
+            LEFT JOIN song_source_digest d ON d.song_id = s.id
+            WHERE s.deleted_at IS NULL
+            """
+        )
+        return {row[0]: row[1] for row in cursor.fetchall()}
+
+    def get_catalog_source_state(self, source_url: str) -> tuple[Optional[str], Optional[str]]:
+        """Get the HTTP validators recorded by the last full scrape of a source.
+
+        Args:
+            source_url: Catalog page URL.
+
+        Returns:
+            Tuple of (ETag, Last-Modified); both ``None`` if never recorded.
+        """
+        cursor = self.connection.cursor()
+        cursor.execute(
+            "SELECT etag, last_modified FROM catalog_source_state WHERE source_url = %s",
+            (source_url,),
+        )
+        row = cursor.fetchone()
+        return (row[0], row[1]) if row else (None, None)
+
+    def save_catalog_sync_state(
+        self,
+        row_digests: dict[str, str],
+        source_url: Optional[str] = None,
+        etag: Optional[str] = None,
+        last_modified: Optional[str] = None,
+    ) -> None:
+        """Record song row digests and, optionally, a source's HTTP validators.
+
+        Both are written in one transaction so a scrape is either fully
+        recorded or retried in full next time.
+
+        Args:
+            row_digests: Mapping of song ID to source-row digest.
+            source_url: Catalog page URL whose validators to record, if any.
+            etag: ``ETag`` response header.
+            last_modified: ``Last-Modified`` response header.
+        """
+        with self.transaction() as conn:
+            cursor = conn.cursor()
+            if row_digests:
+                cursor.execute(
+                    """
+                    INSERT INTO song_source_digest (song_id, row_digest)
+                    SELECT * FROM unnest(%s::text[], %s::text[])
+                    ON CONFLICT (song_id) DO UPDATE SET row_digest = EXCLUDED.row_digest
+                    """,
+                    (list(row_digests), list(row_digests.values())),
+                )
+            if source_url:
+                cursor.execute(
+                    """
+                    INSERT INTO catalog_source_state (source_url, etag, last_modified, checked_at)
+                    VALUES (%s, %s, %s, NOW())
+                    ON CONFLICT (source_url) DO UPDATE SET
+                        etag = EXCLUDED.etag,
+                        last_modified = EXCLUDED.last_modified,
+                        checked_at = EXCLUDED.checked_at
+                    """,
+                    (source_url, etag, last_modified),
+                )
+
     def get_song(self, song_id: str, include_deleted: bool = False) -> Optional[Song]:
         """Get a song by ID.
 
@@ -482,56 +592,79 @@ class DatabaseClient:
         return results
 
     def search_songs(
-        self, query: str, field: str = "all", limit: int = 20, include_deleted: bool = False
+        self,
+        query: str,
+        field: str = "all",
+        limit: int = 20,
+        include_deleted: bool = False,
+        offset: int = 0,
     ) -> list[Song]:
-        """Search songs by query.
+        """Search songs by query, best match first.
+
+        Uses the ranked full-text index on ``songs.search_document`` (see
+        ``stream_of_worship.db.search``).
 
         Args:
             query: Search query string.
             field: Field to search (``title``, ``lyrics``, ``composer``, ``album``, ``all``).
             limit: Maximum number of results.
             include_deleted: Whether to include soft-deleted songs.
+            offset: Number of results to skip, for pagination.
 
         Returns:
             List of matching songs.
         """
-        cursor = self.connection.cursor()
-
-        search_pattern = f"%{query}%"
-
-        deleted_clause = "" if include_deleted else "deleted_at IS NULL AND "
+        # Lazy import to break the admin.db.__init__ ↔ db.search cycle.
+        from stream_of_worship.db.search import search_song_rows
+
+        rows = search_song_rows(
+            self.connection,
+            query,
+            field=field,
+            limit=limit,
+            offset=offset,
+            include_deleted=include_deleted,
+        )
+        return [Song.from_row(row) for row in rows]
 
-        if field == "title":
-            sql = f"SELECT {SONG_COLUMNS_SELECT} FROM songs WHERE {deleted_clause}(title ILIKE %s OR title_pinyin ILIKE %s)"
-            params = [search_pattern, search_pattern]
-        elif field == "lyrics":
-            sql = (
-                f"SELECT {SONG_COLUMNS_SELECT} FROM songs WHERE {deleted_clause}lyrics_raw ILIKE %s"
-            )
-            params = [search_pattern]
-        elif field == "composer":
-            sql = f"SELECT {SONG_COLUMNS_SELECT} FROM songs WHERE {deleted_clause}(composer ILIKE %s OR lyricist ILIKE %s)"
-            params = [search_pattern, search_pattern]
-        elif field == "album":
-            sql = f"SELECT {SONG_COLUMNS_SELECT} FROM songs WHERE {deleted_clause}(album_name ILIKE %s OR album_series ILIKE %s)"
-            params = [search_pattern, search_pattern]
-        else:  # all
-            sql = f"""
-                SELECT {SONG_COLUMNS_SELECT} FROM songs WHERE {deleted_clause}(
-                title ILIKE %s OR title_pinyin ILIKE %s OR
-                lyrics_raw ILIKE %s OR composer ILIKE %s OR lyricist ILIKE %s OR
-                album_name ILIKE %s OR album_series ILIKE %s)
-            """
-            params = [search_pattern] * 7
+    def hybrid_search_songs(
+        self,
+        query: str,
+        embed_query: Callable[[str], list[float]],
+        limit: int = 20,
+        offset: int = 0,
+        ef_search: int = 100,
+        include_deleted: bool = False,
+    ) -> list["SongSearchHit"]:
+        """Search songs by keywords and lyric meaning, best match first.
 
-        sql += f" ORDER BY id LIMIT {limit}"
+        Fuses the full-text ranking with nearest neighbours from
+        ``song_embedding`` and ``song_line_embedding`` (see
+        ``stream_of_worship.db.search.hybrid_search_songs``).
 
-        cursor.execute(sql, params)
+        Args:
+            query: Search query, e.g. a half-remembered lyric.
+            embed_query: Returns the query embedding (wrap in
+                ``QueryEmbeddingCache`` to reuse embeddings).
+            limit: Maximum number of results.
+            offset: Number of results to skip, for pagination.
+            ef_search: HNSW candidate list size (recall vs. latency).
+            include_deleted: Whether to include soft-deleted songs.
 
-        results = []
-        for row in cursor.fetchall():
-            results.append(Song.from_row(tuple(row)))
-        return results
+        Returns:
+            Search hits with fusion score and closest lyric line.
+        """
+        from stream_of_worship.db.search import hybrid_search_songs
+
+        return hybrid_search_songs(
+            self.connection,
+            query,
+            embed_query,
+            limit=limit,
+            offset=offset,
+            ef_search=ef_search,
+            include_deleted=include_deleted,
+        )
 
     # ------------------------------------------------------------------
     # Recording operations
@@ -1302,6 +1435,27 @@ class DatabaseClient:
             cursor.execute("UPDATE songs SET deleted_at = NOW() WHERE id = %s", (song_id,))
             return cursor.rowcount > 0
 
+    def soft_delete_songs_missing_from(self, source_url: str, seen_ids: set[str]) -> int:
+        """Soft-delete every active song from a source that is not in ``seen_ids``.
+
+        Args:
+            source_url: Only songs scraped from this URL are considered.
+            seen_ids: Song IDs present in the latest full scrape.
+
+        Returns:
+            Number of songs marked as deleted.
+        """
+        with self.transaction() as conn:
+            cursor = conn.cursor()
+            cursor.execute(
+                """
+                UPDATE songs SET deleted_at = NOW()
+                WHERE deleted_at IS NULL AND source_url = %s AND NOT (id = ANY(%s))
+                """,
+                (source_url, list(seen_ids)),
+            )
+            return cursor.rowcount
+
     def hold_recordings_for_song(self, song_id: str) -> int:
         """Set active recordings for a song to hold visibility."""
         with self.transaction() as conn:
@@ -1481,6 +1635,48 @@ class DatabaseClient:
         cursor.execute("SELECT 1 FROM recordings WHERE hash_prefix = %s", (hash_prefix,))
         return cursor.fetchone() is not None
 
+    def get_recording_prefix_references(
+        self, hash_prefixes: list[str]
+    ) -> dict[str, tuple[bool, int]]:
+        """Batch form of ``recording_row_exists`` + ``count_recording_songset_references``.
+
+        Resolves every prefix in one set-based query, so scanning a large
+        bucket costs one round trip instead of two per prefix.
+
+        Args:
+            hash_prefixes: Recording hash prefixes to look up.
+
+        Returns:
+            Mapping of each prefix to ``(recording_row_exists, songset_reference_count)``.
+        """
+        if not hash_prefixes:
+            return {}
+        cursor = self.connection.cursor()
+        cursor.execute(
+            """
+            WITH scanned AS (
+                SELECT DISTINCT unnest(%s::text[]) AS prefix
+            ),
+            recorded AS (
+                SELECT DISTINCT r.hash_prefix AS prefix
+                FROM recordings r
+                JOIN scanned s ON s.prefix = r.hash_prefix
+            ),
+            referenced AS (
+                SELECT si.recording_hash_prefix AS prefix, COUNT(*) AS reference_count
+                FROM songset_items si
+                JOIN scanned s ON s.prefix = si.recording_hash_prefix
+                GROUP BY si.recording_hash_prefix
+            )
+            SELECT s.prefix, rec.prefix IS NOT NULL, COALESCE(ref.reference_count, 0)
+            FROM scanned s
+            LEFT JOIN recorded rec ON rec.prefix = s.prefix
+            LEFT JOIN referenced ref ON ref.prefix = s.prefix
+            """,
+            (list(hash_prefixes),),
+        )
+        return {row[0]: (bool(row[1]), int(row[2])) for row in cursor.fetchall()}
+
     def replace_recording_after_import(self, old_hash_prefix: str, recording: Recording) -> int:
         """Persist replacement, update songsets, and soft-delete old recording atomically."""
         with self.transaction() as conn:
@@ -1894,6 +2090,113 @@ class DatabaseClient:
                 values,
             )
 
+    def bulk_upsert_embeddings(
+        self,
+        embeddings: list[SongEmbedding],
+        line_embeddings: list[SongLineEmbedding],
+        defer_vector_indexes: bool = False,
+    ) -> None:
+        """Upsert many song embeddings and replace their line embeddings at once.
+
+        Vectors are streamed with binary ``COPY`` into temporary staging
+        tables, then merged with one ``INSERT ... ON CONFLICT`` and one
+        ``DELETE`` + ``INSERT`` for the lines. Everything runs in a single
+        transaction. Songs in ``embeddings`` lose any line embeddings that are
+        not in ``line_embeddings``, matching ``upsert_song_line_embeddings``.
+
+        Args:
+            embeddings: Song-level embeddings (last one wins per song).
+            line_embeddings: Line embeddings for those songs.
+            defer_vector_indexes: Drop the HNSW indexes before loading and
+                rebuild them afterwards. Much faster for large re-embeds, but
+                the drop holds an ACCESS EXCLUSIVE lock on both embedding
+                tables, so vector search blocks until the rebuild commits.
+        """
+        if not embeddings:
+            return
+        latest = {emb.song_id: emb for emb in embeddings}
+
+        with self.transaction() as conn:
+            vector_type = TypeInfo.fetch(conn, "vector")
+            if vector_type is None:
+                raise psycopg.errors.UndefinedObject('type "vector" does not exist')
+            cursor = conn.cursor()
+            cursor.adapters.register_dumper(
+                None,
+                type("VectorBinaryDumper", (_VectorBinaryDumper,), {"oid": vector_type.oid}),
+            )
+
+            if defer_vector_indexes:
+                cursor.execute(f"DROP INDEX IF EXISTS {', '.join(_VECTOR_INDEXES)}")
+
+            cursor.execute(
+                """
+                CREATE TEMP TABLE _song_embedding_stage (
+                    song_id TEXT, embedding vector, model_version TEXT, content_hash TEXT
+                ) ON COMMIT DROP;
+                CREATE TEMP TABLE _song_line_embedding_stage (
+                    song_id TEXT, line_index INTEGER, line_text TEXT,
+                    embedding vector, model_version TEXT
+                ) ON COMMIT DROP;
+                """
+            )
+            with cursor.copy(
+                "COPY _song_embedding_stage (song_id, embedding, model_version, content_hash) "
+                "FROM STDIN (FORMAT BINARY)"
+            ) as copy:
+                copy.set_types(["text", vector_type.oid, "text", "text"])
+                for emb in latest.values():
+                    copy.write_row(
+                        (emb.song_id, emb.embedding, emb.model_version, emb.content_hash)
+                    )
+            with cursor.copy(
+                "COPY _song_line_embedding_stage "
+                "(song_id, line_index, line_text, embedding, model_version) "
+                "FROM STDIN (FORMAT BINARY)"
+            ) as copy:
+                copy.set_types(["text", "int4", "text", vector_type.oid, "text"])
+                for le in line_embeddings:
+                    copy.write_row(
+                        (le.song_id, le.line_index, le.line_text, le.embedding, le.model_version)
+                    )
+
+            cursor.execute(
+                """
+                INSERT INTO song_embedding (song_id, embedding, model_version, content_hash)
+                SELECT song_id, embedding, model_version, content_hash
+                FROM _song_embedding_stage
+                ON CONFLICT (song_id) DO UPDATE
+                SET embedding = EXCLUDED.embedding,
+                    model_version = EXCLUDED.model_version,
+                    content_hash = EXCLUDED.content_hash
+                """
+            )
+            cursor.execute(
+                """
+                DELETE FROM song_line_embedding sle
+                USING _song_embedding_stage staged
+                WHERE sle.song_id = staged.song_id
+                """
+            )
+            cursor.execute(
+                """
+                INSERT INTO song_line_embedding
+                    (song_id, line_index, line_text, embedding, model_version)
+                SELECT song_id, line_index, line_text, embedding, model_version
+                FROM _song_line_embedding_stage
+                WHERE song_id IN (SELECT song_id FROM _song_embedding_stage)
+                """
+            )
+
+            if defer_vector_indexes:
+                for statement in CREATE_EMBEDDING_INDEXES:
+                    cursor.execute(statement)
+
+        logger.info(
+            f"Bulk upserted {len(latest)} song embeddings, "
+            f"{len(line_embeddings)} line embeddings"
+        )
+
     def get_songs_without_embeddings(self) -> list[Song]:
         """Get songs that have no embedding, have non-empty lyrics, and have
         at least one published recording (i.e. visible in webapp Browse Song).
@@ -125,6 +125,81 @@ CREATE_INDEXES = [
     """,
 ]
 
+# Search tokenizer for songs.search_document (see stream_of_worship.db.search).
+# CJK runs become overlapping bigrams so substring queries hit the GIN index;
+# ASCII words (pinyin, English titles) are lowercased. IMMUTABLE so it can back
+# a generated column.
+CREATE_SEARCH_TOKENS_FUNCTION = r"""
+CREATE OR REPLACE FUNCTION sow_search_tokens(input text)
+RETURNS text
+LANGUAGE sql
+IMMUTABLE
+PARALLEL SAFE
+AS $$
+    SELECT coalesce((
+        SELECT string_agg(
+            CASE WHEN char_length(m.run[1]) = 1 THEN m.run[1]
+            ELSE (
+                SELECT string_agg(substr(m.run[1], i, 2), ' ' ORDER BY i)
+                FROM generate_series(1, char_length(m.run[1]) - 1) AS i
+            ) END,
+            ' ' ORDER BY m.ord)
+        FROM regexp_matches(coalesce(input, ''), '[\u3400-\u9fff\uf900-\ufaff]+', 'g')
+            WITH ORDINALITY AS m(run, ord)
+    ), '') || ' ' || lower(regexp_replace(coalesce(input, ''), '[^0-9A-Za-z]+', ' ', 'g'))
+$$;
+"""
+
+# Weighted search document: title/pinyin A, composer/lyricist B, album C, lyrics D.
+# Pinyin is also indexed with its separators removed so "qiyi" prefix-matches.
+ADD_SONGS_SEARCH_DOCUMENT = """
+ALTER TABLE songs ADD COLUMN IF NOT EXISTS search_document tsvector
+GENERATED ALWAYS AS (
+    setweight(to_tsvector('simple',
+        sow_search_tokens(title) || ' ' || sow_search_tokens(title_pinyin) || ' '
+        || lower(regexp_replace(coalesce(title_pinyin, ''), '[^0-9A-Za-z]+', '', 'g'))), 'A') ||
+    setweight(to_tsvector('simple',
+        sow_search_tokens(composer) || ' ' || sow_search_tokens(lyricist)), 'B') ||
+    setweight(to_tsvector('simple',
+        sow_search_tokens(album_name) || ' ' || sow_search_tokens(album_series)), 'C') ||
+    setweight(to_tsvector('simple', sow_search_tokens(lyrics_raw)), 'D')
+) STORED;
+"""
+
+CREATE_SONGS_SEARCH_INDEX = """
+CREATE INDEX IF NOT EXISTS idx_songs_search_document
+ON songs USING gin (search_document);
+"""
+
+CREATE_SONG_SEARCH_STATEMENTS = [
+    CREATE_SEARCH_TOKENS_FUNCTION,
+    ADD_SONGS_SEARCH_DOCUMENT,
+    CREATE_SONGS_SEARCH_INDEX,
+]
+
+# Incremental catalog scrape bookkeeping: HTTP validators of the last full
+# scrape, and a digest of each song's source row so unchanged rows are skipped.
+CREATE_CATALOG_SOURCE_STATE_TABLE = """
+CREATE TABLE IF NOT EXISTS catalog_source_state (
+    source_url    TEXT PRIMARY KEY,
+    etag          TEXT,
+    last_modified TEXT,
+    checked_at    TIMESTAMPTZ DEFAULT NOW()
+);
+"""
+
+CREATE_SONG_SOURCE_DIGEST_TABLE = """
+CREATE TABLE IF NOT EXISTS song_source_digest (
+    song_id    TEXT PRIMARY KEY REFERENCES songs(id) ON DELETE CASCADE,
+    row_digest TEXT NOT NULL
+);
+"""
+
+CREATE_CATALOG_SYNC_STATEMENTS = [
+    CREATE_CATALOG_SOURCE_STATE_TABLE,
+    CREATE_SONG_SOURCE_DIGEST_TABLE,
+]
+
 # Song embedding table (pgvector for semantic search)
 CREATE_SONG_EMBEDDING_TABLE = """
 CREATE TABLE IF NOT EXISTS song_embedding (
@@ -198,6 +273,8 @@ ALL_SCHEMA_STATEMENTS = [
     CREATE_SONGS_TABLE,
     CREATE_RECORDINGS_TABLE,
     *CREATE_INDEXES,
+    *CREATE_SONG_SEARCH_STATEMENTS,
+    *CREATE_CATALOG_SYNC_STATEMENTS,
     CREATE_SONG_EMBEDDING_TABLE,
     CREATE_SONG_LINE_EMBEDDING_TABLE,
     *CREATE_EMBEDDING_INDEXES,
@@ -4,6 +4,7 @@ Provides AnalysisClient for communicating with the FastAPI analysis service
 over HTTP. Handles authentication, job submission, polling, and result parsing.
 """
 
+import json
 import os
 import time
 from dataclasses import dataclass, field
@@ -11,6 +12,9 @@ from typing import Any, Callable, Dict, List, Optional, Union
 
 import requests
 
+# Matches the analysis service's per-request limit for job status lookups
+_STATUS_BATCH_SIZE = 1000
+
 
 class AnalysisServiceError(Exception):
     """Error communicating with the analysis service."""
@@ -155,6 +159,15 @@ class AnalysisClient:
 
         self._admin_api_key = os.environ.get("SOW_ADMIN_API_KEY")
 
+        # One pooled session so batch polling reuses keep-alive connections
+        self._session = requests.Session()
+        adapter = requests.adapters.HTTPAdapter(pool_connections=4, pool_maxsize=16)
+        self._session.mount("http://", adapter)
+        self._session.mount("https://", adapter)
+        # Learned on first use; older services lack the bulk status endpoints
+        self._bulk_status_supported: Optional[bool] = None
+        self._status_stream_supported: Optional[bool] = None
+
     def _auth_headers(self) -> Dict[str, str]:
         """Get authentication headers.
 
@@ -189,7 +202,7 @@ class AnalysisClient:
             AnalysisServiceError: If the service is unreachable
         """
         try:
-            response = requests.get(
+            response = self._session.get(
                 f"{self.base_url}/api/v1/health",
                 timeout=self.timeout,
             )
@@ -233,7 +246,7 @@ class AnalysisClient:
         }
 
         try:
-            response = requests.post(
+            response = self._session.post(
                 f"{self.base_url}/api/v1/jobs/analyze",
                 json=payload,
                 headers=self._auth_headers(),
@@ -295,20 +308,12 @@ class AnalysisClient:
         Raises:
             AnalysisServiceError: If submission fails
         """
-        payload = {
-            "audio_url": audio_url,
-            "content_hash": content_hash,
-            "options": {
-                "force": force,
-                "sample_rate": sample_rate,
-                "hop_length": hop_length,
-                "start_bpm": start_bpm,
-                **({"lrc_content": lrc_content} if lrc_content is not None else {}),
-            },
-        }
+        payload = self._fast_analysis_payload(
+            audio_url, content_hash, force, sample_rate, hop_length, start_bpm, lrc_content
+        )
 
         try:
-            response = requests.post(
+            response = self._session.post(
                 f"{self.base_url}/api/v1/jobs/fast-analyze",
                 json=payload,
                 headers=self._auth_headers(),
@@ -337,6 +342,100 @@ class AnalysisClient:
                 )
             raise AnalysisServiceError(f"Fast analysis submission failed: {e}")
 
+    def submit_fast_analysis_batch(
+        self,
+        songs: List[Dict[str, Any]],
+        force: bool = False,
+        sample_rate: int = 22050,
+        hop_length: int = 512,
+        start_bpm: float = 80.0,
+    ) -> List[JobInfo]:
+        """Submit many audio files for fast analysis in one request.
+
+        The service creates one fast analysis job per song and runs them in
+        parallel worker processes; poll each returned job as usual.
+
+        Args:
+            songs: Dicts with ``audio_url``, ``content_hash`` and optionally
+                ``lrc_content`` (see submit_fast_analysis)
+            force: Whether to force re-analysis (bypass cache)
+            sample_rate: Target sample rate for librosa
+            hop_length: Hop length for tempo estimation
+            start_bpm: Initial tempo guess for the log-normal prior (default 80)
+
+        Returns:
+            JobInfo per song, in the order given
+
+        Raises:
+            AnalysisServiceError: If submission fails
+        """
+        payload = {
+            "songs": [
+                self._fast_analysis_payload(
+                    song["audio_url"],
+                    song["content_hash"],
+                    force,
+                    sample_rate,
+                    hop_length,
+                    start_bpm,
+                    song.get("lrc_content"),
+                )
+                for song in songs
+            ]
+        }
+
+        try:
+            response = self._session.post(
+                f"{self.base_url}/api/v1/jobs/fast-analyze/batch",
+                json=payload,
+                headers=self._auth_headers(),
+                timeout=self.timeout,
+            )
+
+            if response.status_code == 401:
+                raise AnalysisServiceError(
+                    "Authentication failed: Invalid API key", status_code=401
+                )
+
+            response.raise_for_status()
+            data = response.json()
+            return [self._parse_job_response(job) for job in data["jobs"]]
+
+        except requests.exceptions.ConnectionError as e:
+            raise AnalysisServiceError(
+                f"Cannot connect to analysis service at {self.base_url}: {e}"
+            )
+        except requests.exceptions.RequestException as e:
+            if hasattr(e.response, "status_code"):
+                status = e.response.status_code
+                raise AnalysisServiceError(
+                    f"Fast analysis batch submission failed (HTTP {status}): {e}",
+                    status_code=status,
+                )
+            raise AnalysisServiceError(f"Fast analysis batch submission failed: {e}")
+
+    @staticmethod
+    def _fast_analysis_payload(
+        audio_url: str,
+        content_hash: str,
+        force: bool,
+        sample_rate: int,
+        hop_length: int,
+        start_bpm: float,
+        lrc_content: Optional[str],
+    ) -> Dict[str, Any]:
+        return {
+            "audio_url": audio_url,
+            "content_hash": content_hash,
+            "options": {
+                "force": force,
+                "sample_rate": sample_rate,
+                "hop_length": hop_length,
+                "start_bpm": start_bpm,
+                **({"lrc_content": lrc_content} if lrc_content is not None else {}),
+            },
+        }
+
     def submit_lrc(
         self,
         audio_url: str,
@@ -392,7 +491,7 @@ class AnalysisClient:
         }
 
         try:
-            response = requests.post(
+            response = self._session.post(
                 f"{self.base_url}/api/v1/jobs/lrc",
                 json=payload,
                 headers=self._auth_headers(),
@@ -459,7 +558,7 @@ class AnalysisClient:
         }
 
         try:
-            response = requests.post(
+            response = self._session.post(
                 f"{self.base_url}/api/v1/jobs/embedding",
                 json=payload,
                 headers=self._auth_headers(),
@@ -488,6 +587,48 @@ class AnalysisClient:
                 )
             raise AnalysisServiceError(f"Embedding submission failed: {e}")
 
+    def embed_query(self, text: str) -> List[float]:
+        """Embed a search query with the service's embedding model.
+
+        Args:
+            text: Query text
+
+        Returns:
+            Query embedding vector
+
+        Raises:
+            AnalysisServiceError: If the request fails or embeddings are not
+                configured on the service (HTTP 503)
+        """
+        try:
+            response = self._session.post(
+                f"{self.base_url}/api/v1/embeddings/query",
+                json={"text": text},
+                headers=self._auth_headers(),
+                timeout=self.timeout,
+            )
+
+            if response.status_code == 401:
+                raise AnalysisServiceError(
+                    "Authentication failed: Invalid API key", status_code=401
+                )
+
+            response.raise_for_status()
+            return response.json()["embedding"]
+
+        except requests.exceptions.ConnectionError as e:
+            raise AnalysisServiceError(
+                f"Cannot connect to analysis service at {self.base_url}: {e}"
+            )
+        except requests.exceptions.RequestException as e:
+            if hasattr(e.response, "status_code"):
+                status = e.response.status_code
+                raise AnalysisServiceError(
+                    f"Query embedding failed (HTTP {status}): {e}",
+                    status_code=status,
+                )
+            raise AnalysisServiceError(f"Query embedding failed: {e}")
+
     def submit_forced_alignment(
         self,
         audio_url: str,
@@ -528,7 +669,7 @@ class AnalysisClient:
         }
 
         try:
-            response = requests.post(
+            response = self._session.post(
                 f"{self.base_url}/api/v1/jobs/forced-alignment",
                 json=payload,
                 headers=self._auth_headers(),
@@ -570,7 +711,7 @@ class AnalysisClient:
             AnalysisServiceError: If job not found or request fails
         """
         try:
-            response = requests.get(
+            response = self._session.get(
                 f"{self.base_url}/api/v1/jobs/{job_id}",
                 headers=self._auth_headers(),
                 timeout=self.timeout,
@@ -601,6 +742,125 @@ class AnalysisClient:
                 )
             raise AnalysisServiceError(f"Failed to get job status: {e}")
 
+    def get_jobs(self, job_ids: List[str]) -> Dict[str, JobInfo]:
+        """Get information about many jobs in one request per 1000 IDs.
+
+        Args:
+            job_ids: Unique job identifiers
+
+        Returns:
+            Mapping of job ID to JobInfo; jobs the service does not know are absent
+
+        Raises:
+            AnalysisServiceError: If the request fails. status_code is 405 when
+                the service predates POST /jobs/status; poll with get_job() instead.
+        """
+        if self._bulk_status_supported is False:
+            raise AnalysisServiceError(
+                "Bulk job status not supported by the analysis service", status_code=405
+            )
+
+        jobs: Dict[str, JobInfo] = {}
+        for start in range(0, len(job_ids), _STATUS_BATCH_SIZE):
+            chunk = job_ids[start : start + _STATUS_BATCH_SIZE]
+            try:
+                response = self._session.post(
+                    f"{self.base_url}/api/v1/jobs/status",
+                    json={"job_ids": chunk},
+                    headers=self._auth_headers(),
+                    timeout=self.timeout,
+                )
+
+                if response.status_code in (404, 405):
+                    self._bulk_status_supported = False
+                    raise AnalysisServiceError(
+                        "Bulk job status not supported by the analysis service",
+                        status_code=405,
+                    )
+
+                if response.status_code == 401:
+                    raise AnalysisServiceError(
+                        "Authentication failed: Invalid API key", status_code=401
+                    )
+
+                response.raise_for_status()
+                self._bulk_status_supported = True
+                for data in response.json()["jobs"]:
+                    job = self._parse_job_response(data)
+                    jobs[job.job_id] = job
+
+            except requests.exceptions.ConnectionError as e:
+                raise AnalysisServiceError(
+                    f"Cannot connect to analysis service at {self.base_url}: {e}"
+                )
+            except requests.exceptions.RequestException as e:
+                if hasattr(e.response, "status_code"):
+                    status = e.response.status_code
+                    raise AnalysisServiceError(
+                        f"Failed to get job statuses (HTTP {status}): {e}",
+                        status_code=status,
+                    )
+                raise AnalysisServiceError(f"Failed to get job statuses: {e}")
+
+        return jobs
+
+    def wait_for_job_changes(self, job_ids: List[str], timeout: float) -> Dict[str, JobInfo]:
+        """Block until one of the jobs changes state, or until timeout elapses.
+
+        Listens on the service's job status stream so callers wake as soon as a
+        job moves on instead of sleeping a fixed interval. Against services
+        without the stream, or when it fails, this simply sleeps out the
+        timeout. Never raises.
+
+        Args:
+            job_ids: Job identifiers to watch (the first 1000 are watched)
+            timeout: Maximum seconds to wait
+
+        Returns:
+            The job(s) reported by the first change; empty on timeout
+        """
+        deadline = time.time() + timeout
+        if not job_ids or self._status_stream_supported is False:
+            time.sleep(timeout)
+            return {}
+
+        try:
+            with self._session.post(
+                f"{self.base_url}/api/v1/jobs/status/stream",
+                json={"job_ids": job_ids[:_STATUS_BATCH_SIZE], "include_initial": False},
+                headers=self._auth_headers(),
+                timeout=(self.timeout, max(timeout, 0.1)),
+                stream=True,
+            ) as response:
+                if response.status_code in (404, 405):
+                    self._status_stream_supported = False
+                else:
+                    response.raise_for_status()
+                    self._status_stream_supported = True
+                    for job in self._iter_stream_jobs(response, deadline):
+                        return {job.job_id: job}
+        except (requests.exceptions.RequestException, ValueError):
+            # Read timeouts and malformed events land here; fall back to sleeping
+            pass
+
+        time.sleep(max(0.0, deadline - time.time()))
+        return {}
+
+    def _iter_stream_jobs(self, response: requests.Response, deadline: float):
+        """Yield JobInfo for each ``job`` event of a server-sent event stream."""
+        event = None
+        for line in response.iter_lines(decode_unicode=True):
+            if time.time() >= deadline:
+                return
+            if not line:
+                event = None
+            elif line.startswith("event:"):
+                event = line[6:].strip()
+                if event == "end":
+                    return
+            elif line.startswith("data:") and event == "job":
+                yield self._parse_job_response(json.loads(line[5:]))
+
     def wait_for_completion(
         self,
         job_id: str,
@@ -663,7 +923,7 @@ class AnalysisClient:
             params["job_type"] = job_type
 
         try:
-            response = requests.get(
+            response = self._session.get(
                 f"{self.base_url}/api/v1/jobs",
                 params=params,
                 headers=self._auth_headers(),
@@ -706,7 +966,7 @@ class AnalysisClient:
             ValueError: If SOW_ADMIN_API_KEY is not set
         """
         try:
-            response = requests.post(
+            response = self._session.post(
                 f"{self.base_url}/api/v1/jobs/{job_id}/cancel",
                 headers=self._admin_auth_headers(),
                 timeout=self.timeout,
@@ -753,7 +1013,7 @@ class AnalysisClient:
             ValueError: If SOW_ADMIN_API_KEY is not set
         """
         try:
-            response = requests.post(
+            response = self._session.post(
                 f"{self.base_url}/api/v1/jobs/clear-queue",
                 headers=self._admin_auth_headers(),
                 timeout=self.timeout,
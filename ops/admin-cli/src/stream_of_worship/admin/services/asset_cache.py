@@ -97,6 +97,10 @@ class AssetCache:
     def get_stem_path(self, hash_prefix: str, stem_name: str) -> Path:
         """Get the local cache path for a stem file.
 
+        Returns the cached .flac copy when only that exists (the analysis
+        service uploads FLAC stems under ``stems/full/`` when
+        SOW_R2_STEMS_FORMAT=flac), otherwise the .wav path.
+
         Args:
             hash_prefix: Recording hash prefix
             stem_name: Stem name (e.g., 'vocals', 'drums', 'bass', 'other')
@@ -104,7 +108,11 @@ class AssetCache:
         Returns:
             Local cache path
         """
-        return self._get_cache_path(hash_prefix, "stems", f"{stem_name}.wav")
+        wav_path = self._get_cache_path(hash_prefix, "stems", f"{stem_name}.wav")
+        flac_path = self._get_cache_path(hash_prefix, "stems", f"{stem_name}.flac")
+        if not wav_path.exists() and flac_path.exists():
+            return flac_path
+        return wav_path
 
     def get_lrc_path(self, hash_prefix: str) -> Path:
         """Get the local cache path for an LRC file.
@@ -178,18 +186,26 @@ class AssetCache:
         if not force and cache_path.exists():
             return cache_path
 
-        s3_key = self._get_s3_key(hash_prefix, "stems", f"{stem_name}.wav")
+        # WAV stems live at stems/{stem}.wav; FLAC-mode uploads use stems/full/
+        candidates = [
+            (f"{stem_name}.wav", self._get_s3_key(hash_prefix, "stems", f"{stem_name}.wav")),
+            (f"{stem_name}.flac", self._get_s3_key(hash_prefix, "stems/full", f"{stem_name}.flac")),
+        ]
 
-        try:
-            if not self.r2_client.file_exists(s3_key):
+        for filename, s3_key in candidates:
+            cache_path = self._get_cache_path(hash_prefix, "stems", filename)
+            try:
+                if not self.r2_client.file_exists(s3_key):
+                    continue
+
+                self.r2_client.download_file(s3_key, cache_path)
+                return cache_path if cache_path.exists() else None
+            except Exception:
+                if cache_path.exists():
+                    cache_path.unlink()
                 return None
 
-            self.r2_client.download_file(s3_key, cache_path)
-            return cache_path if cache_path.exists() else None
-        except Exception:
-            if cache_path.exists():
-                cache_path.unlink()
-            return None
+        return None
 
     def download_lrc(self, hash_prefix: str, force: bool = False) -> Optional[Path]:
         """Download and cache the LRC lyrics file.
@@ -11,8 +11,8 @@ from pathlib import Path
 def compute_file_hash(file_path: Path) -> str:
     """Compute the SHA-256 hash of a file.
 
-    Reads in 8 KiB chunks so arbitrarily large files are handled without
-    loading the entire file into memory.
+    Uses ``hashlib.file_digest``, which streams the file through a fixed
+    buffer without loading it into memory and without holding the GIL.
 
     Args:
         file_path: Path to the file to hash
@@ -23,11 +23,8 @@ def compute_file_hash(file_path: Path) -> str:
     Raises:
         FileNotFoundError: If the file does not exist
     """
-    sha256 = hashlib.sha256()
     with open(file_path, "rb") as f:
-        for chunk in iter(lambda: f.read(8192), b""):
-            sha256.update(chunk)
-    return sha256.hexdigest()
+        return hashlib.file_digest(f, "sha256").hexdigest()
 
 
 def get_hash_prefix(content_hash: str) -> str:
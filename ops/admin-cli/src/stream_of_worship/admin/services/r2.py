@@ -9,6 +9,7 @@ import json
 import os
 import re
 import time
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
 from datetime import datetime
 from pathlib import Path
@@ -21,6 +22,12 @@ from botocore.exceptions import ClientError
 MAX_BACKUPS_PER_PREFIX = 5
 RECORDING_HASH_PREFIX_RE = re.compile(r"^[0-9a-f]{12}$")
 
+# Recording prefixes are lowercase hex, so listing each of these key prefixes
+# covers every recording while letting the shards paginate independently.
+RECORDING_SCAN_SHARDS = "0123456789abcdef"
+# Stays under the client's max_pool_connections
+RECORDING_SCAN_CONCURRENCY = 4
+
 
 class StaleObjectError(Exception):
     """Raised when the official LRC object was modified after the operation started."""
@@ -68,13 +75,20 @@ class R2Client:
         region: R2 region (typically "auto")
     """
 
-    def __init__(self, bucket: str, endpoint_url: str, region: str = "auto"):
+    def __init__(
+        self,
+        bucket: str,
+        endpoint_url: str,
+        region: str = "auto",
+        max_pool_connections: int = 5,
+    ):
         """Initialize the R2 client.
 
         Args:
             bucket: R2 bucket name
             endpoint_url: R2 endpoint URL
             region: R2 region
+            max_pool_connections: HTTP connection pool size
 
         Raises:
             ValueError: If either credential environment variable is unset
@@ -106,8 +120,9 @@ class R2Client:
                 retries={"max_attempts": 2},
                 # Align with DEFAULT_CONCURRENCY=1 plus headroom for the
                 # --diag-range-key diagnostic's 4 parallel Range-GET workers.
-                # Higher parallelism is counterproductive under R2's account-level cap.
-                max_pool_connections=5,
+                # Higher parallelism is counterproductive under R2's account-level cap;
+                # backup-r2 raises this to match an explicit --concurrency.
+                max_pool_connections=max_pool_connections,
             ),
         )
 
@@ -297,13 +312,38 @@ class R2Client:
         blacklist: Optional[list[str]] = None,
         limit: Optional[int] = None,
     ) -> list[R2PrefixSummary]:
-        """Scan bucket objects and summarize top-level hash-like recording prefixes."""
+        """Scan bucket objects and summarize top-level hash-like recording prefixes.
+
+        The listing is split by the first hex character of the key and the
+        shards are paginated concurrently.
+        """
         blacklist = blacklist or []
+        summaries: dict[str, R2PrefixSummary] = {}
+
+        with ThreadPoolExecutor(max_workers=RECORDING_SCAN_CONCURRENCY) as executor:
+            for shard in executor.map(
+                lambda shard: self._scan_recording_shard(shard, blacklist),
+                RECORDING_SCAN_SHARDS,
+            ):
+                summaries.update(shard)
+
+        result = sorted(summaries.values(), key=lambda summary: summary.prefix)
+        if limit is not None:
+            result = result[:limit]
+        return result
+
+    def _scan_recording_shard(
+        self, key_prefix: str, blacklist: list[str]
+    ) -> dict[str, R2PrefixSummary]:
         paginator = self._client.get_paginator("list_objects_v2")
         summaries: dict[str, R2PrefixSummary] = {}
         latest_values: dict[str, object] = {}
 
-        for page in paginator.paginate(Bucket=self.bucket, PaginationConfig={"PageSize": 1000}):
+        for page in paginator.paginate(
+            Bucket=self.bucket,
+            Prefix=key_prefix,
+            PaginationConfig={"PageSize": 1000},
+        ):
             for obj in page.get("Contents", []):
                 key = obj.get("Key", "")
                 if any(key.startswith(blocked) for blocked in blacklist):
@@ -324,10 +364,7 @@ class R2Client:
                     latest_values[prefix] = modified
                     current.last_modified = self._last_modified_to_str(modified)
 
-        result = sorted(summaries.values(), key=lambda summary: summary.prefix)
-        if limit is not None:
-            result = result[:limit]
-        return result
+        return summaries
 
     def upload_lrc(self, file_path: Path, hash_prefix: str) -> str:
         """Upload an LRC file to R2 under the hash-prefix directory.
@@ -3,9 +3,14 @@
 Implements full-bucket backup, verification, and restore for Cloudflare R2
 disaster recovery.  Backups are chunked tar archives with a JSON manifest
 that maps safe internal member names back to R2 keys and metadata.
+
+Incremental backups only download objects whose ETag, size, or last-modified
+changed since a base backup; unchanged objects are recorded in the manifest
+with an ``archive`` path pointing at the backup directory that holds them.
 """
 
 import hashlib
+import io
 import json
 import logging
 import os
@@ -26,6 +31,7 @@ from stream_of_worship.admin.services.r2 import R2Client
 logger = logging.getLogger(__name__)
 
 MANIFEST_VERSION = 4
+INCREMENTAL_MANIFEST_VERSION = 5
 DEFAULT_CHUNK_SIZE_BYTES = 10 * 1024 * 1024 * 1024  # 10 GiB
 MIN_CHUNK_SIZE_BYTES = 64 * 1024 * 1024  # 64 MiB
 PARTIAL_MARKER = ".sow-r2-backup-partial"
@@ -39,10 +45,22 @@ PARTIAL_MARKER = ".sow-r2-backup-partial"
 # See reports/admin-r2-backup-rclone-download-v1-results.md and
 # specs/admin-r2-backup-throughput-remediation-v2.md.
 # --concurrency N>1 remains available for experimentation but is not expected
-# to help; run --diag-range-key first.
+# to help; run --diag-range-key first. Above 1, workers share an
+# AdaptiveThrottle that backs off when R2 answers with SlowDown/429/503.
 DEFAULT_CONCURRENCY = 1
+MAX_CONCURRENCY = 32
+THROTTLE_ERROR_CODES = {
+    "SlowDown",
+    "TooManyRequests",
+    "RequestLimitExceeded",
+    "ServiceUnavailable",
+    "429",
+    "503",
+}
 COPY_BUFFER_SIZE = 1024 * 1024  # 1 MB
 SPOT_CHECK_HEAD_RATIO = 0.05  # 5% random sample
+# Bytes of completed concurrent downloads held in memory for the tar writer
+REORDER_BUFFER_BYTES = 256 * 1024 * 1024
 
 _BINARY_SUFFIXES = {
     "KiB": 1024,
@@ -229,21 +247,97 @@ class BackupProgress:
             return self._bytes_written
 
 
+class AdaptiveThrottle:
+    """Additive-increase/multiplicative-decrease limit on in-flight downloads.
+
+    The executor may run up to ``max_limit`` workers, but each download first
+    acquires a slot here. A throttling response halves the limit; every
+    ``increase_after`` successes raise it by one again.
+    """
+
+    def __init__(self, max_limit: int, min_limit: int = 1, increase_after: int = 8):
+        self._cond = threading.Condition()
+        self.max_limit = max_limit
+        self.min_limit = min_limit
+        self.limit = max_limit
+        self._increase_after = increase_after
+        self._in_flight = 0
+        self._successes = 0
+
+    def acquire(self) -> None:
+        with self._cond:
+            while self._in_flight >= self.limit:
+                self._cond.wait()
+            self._in_flight += 1
+
+    def release(self, throttled: bool = False) -> None:
+        with self._cond:
+            self._in_flight -= 1
+            if throttled:
+                self.limit = max(self.min_limit, self.limit // 2)
+                self._successes = 0
+            else:
+                self._successes += 1
+                if self._successes >= self._increase_after and self.limit < self.max_limit:
+                    self.limit += 1
+                    self._successes = 0
+            self._cond.notify_all()
+
+
+class ReorderBuffer:
+    """Byte budget for concurrent downloads waiting on the single tar writer.
+
+    Workers complete out of order; each reserves its object's size before
+    downloading into memory and the writer releases it once the object is in
+    the tar, so buffered bytes stay under ``capacity``.
+    """
+
+    def __init__(self, capacity: int):
+        self._cond = threading.Condition()
+        self.capacity = capacity
+        self.used = 0
+        self._closed = False
+
+    def reserve(self, n: int) -> None:
+        with self._cond:
+            while not self._closed and self.used and self.used + n > self.capacity:
+                self._cond.wait()
+            if self._closed:
+                raise BackupError("Backup aborted")
+            self.used += n
+
+    def release(self, n: int) -> None:
+        with self._cond:
+            self.used -= n
+            self._cond.notify_all()
+
+    def close(self) -> None:
+        """Wake and fail any worker still waiting for space."""
+        with self._cond:
+            self._closed = True
+            self._cond.notify_all()
+
+
 @dataclass
 class DownloadResult:
-    """Result of downloading a single object to a temp file."""
+    """Result of downloading a single object.
 
-    temp_path: Path
+    ``temp_path`` or ``buffer`` holds the body unless it was streamed
+    straight into a chunk tar, in which case both are None.
+    """
+
+    temp_path: Optional[Path]
     sha256: str
     bytes_read: int
     metadata: dict
+    buffer: Optional[io.BytesIO] = None
 
 
 class BackupTracer:
     """Collects and emits performance traces for backup operations.
 
     Thread-safe. Designed to be passed (as `tracer=`) into `write_backup`
-    and `_download_object_to_tempfile` to emit per-object and per-phase
+    and `_download_object` to emit per-object and per-phase
     timing logs at DEBUG level. All methods are no-ops if the tracer is
     disabled (logger level above DEBUG).
 
@@ -359,7 +453,7 @@ class BackupTracer:
 
         `wait_ms` = wall time spent on `future.result(idx)` (head-of-line wait).
         `tar_write_ms` = wall time spent in `current_tar.addfile(...)` end-to-end
-        (includes opening temp file, reading from disk, and writing to tar).
+        (includes reading the body from its stream, buffer, or temp file).
         """
         if not self._enabled:
             return
@@ -387,7 +481,7 @@ class BackupTracer:
     ) -> None:
         """Emit a retry trace event when a download retry fires.
 
-        Called from `_download_object_to_tempfile` on each retry attempt
+        Called from `_download_object` on each retry attempt
         (before the next attempt begins). `error_code` is the botocore
         ClientError error code string (e.g., "RequestTimeout", "ReadTimeout",
         "SlowDown", "SocketError").
@@ -638,41 +732,71 @@ def _build_manifest_object(
     return obj_entry
 
 
-def _download_object_to_tempfile(
+def _tar_info(member_name: str, size: int) -> tarfile.TarInfo:
+    tar_info = tarfile.TarInfo(name=member_name)
+    tar_info.size = size
+    tar_info.mtime = 0
+    tar_info.mode = 0o644
+    tar_info.type = tarfile.REGTYPE
+    return tar_info
+
+
+def _truncate_tar(tar: tarfile.TarFile, offset: int, member_count: int) -> None:
+    """Drop members appended to an open chunk tar after ``offset``."""
+    tar.fileobj.seek(offset)
+    tar.fileobj.truncate()
+    tar.offset = offset
+    del tar.members[member_count:]
+
+
+def _download_object(
     r2_client: R2Client,
     inv_obj: InventoryObject,
-    temp_dir: Path,
+    write_body: Callable[[HashingReader], None],
+    discard: Callable[[], None],
     progress: Optional[BackupProgress] = None,
     tracer: Optional[BackupTracer] = None,
     max_retries: int = 2,
-) -> DownloadResult:
-    """Download a single object to a temp file with consistency checking.
+    throttle: Optional[AdaptiveThrottle] = None,
+) -> tuple[HashingReader, dict]:
+    """Download a single object into a destination with consistency checking.
 
-    Downloads to a temporary file under temp_dir, validates ETag from GET
-    response against inventory, performs MD5 body check for single-part
-    objects, and returns the temp path + hash + metadata.
+    Validates the GET response's length against the inventory before
+    ``write_body`` consumes the body, then checks for short reads, ETag
+    changes, and performs an MD5 body check for single-part objects. ``discard`` undoes whatever
+    ``write_body`` wrote before a retry or final failure.
 
     Args:
         r2_client: R2Client instance
         inv_obj: Inventory object to download
-        temp_dir: Directory for temporary files
+        write_body: Consumes the hashing reader into the destination
+        discard: Removes a failed attempt's output
         progress: Optional BackupProgress tracker for reporting
         tracer: Optional BackupTracer for performance tracing
         max_retries: Number of retry attempts for transient failures
+        throttle: Optional AdaptiveThrottle shared by concurrent workers
+
+    Returns:
+        Tuple of (exhausted HashingReader, GET response metadata).
 
     Raises:
         BackupError: If the object cannot be captured consistently.
     """
-    import tempfile
-
     last_error: Optional[str] = None
     worker_name = threading.current_thread().name
     retries_taken = 0
     conn_ms = 0.0
     stream_ms = 0.0
+    backoff_seconds = 0.0
 
     for attempt in range(max_retries + 1):
-        temp_path: Optional[Path] = None
+        written = False
+        throttled = False
+        if backoff_seconds:
+            time.sleep(backoff_seconds)
+            backoff_seconds = 0.0
+        if throttle is not None:
+            throttle.acquire()
         try:
             if progress is not None:
                 progress.worker_started()
@@ -685,15 +809,19 @@ def _download_object_to_tempfile(
             get_etag = resp["etag"]
 
             try:
-                temp_dir.mkdir(parents=True, exist_ok=True)
-                with tempfile.NamedTemporaryFile(dir=temp_dir, delete=False) as temp_file:
-                    temp_path = Path(temp_file.name)
+                # The tar writer puts the inventory size in the member header
+                if content_length != inv_obj.size:
+                    raise BackupError(
+                        f"Size mismatch for {inv_obj.key}: inventory says {inv_obj.size}, "
+                        f"GET reports {content_length}"
+                    )
 
-                    on_read = progress.add_bytes if progress is not None else None
-                    hashing_reader = HashingReader(body, on_read=on_read)
-                    t_stream_start = time.monotonic() if tracer is not None else 0.0
-                    shutil.copyfileobj(hashing_reader, temp_file, length=COPY_BUFFER_SIZE)
-                    stream_ms = (time.monotonic() - t_stream_start) * 1000.0 if tracer is not None else 0.0
+                on_read = progress.add_bytes if progress is not None else None
+                hashing_reader = HashingReader(body, on_read=on_read)
+                t_stream_start = time.monotonic() if tracer is not None else 0.0
+                written = True
+                write_body(hashing_reader)
+                stream_ms = (time.monotonic() - t_stream_start) * 1000.0 if tracer is not None else 0.0
 
                 if hashing_reader.bytes_read != content_length:
                     raise BackupError(
@@ -701,12 +829,6 @@ def _download_object_to_tempfile(
                         f"got {hashing_reader.bytes_read}"
                     )
 
-                if hashing_reader.bytes_read != inv_obj.size:
-                    raise BackupError(
-                        f"Size mismatch for {inv_obj.key}: inventory says {inv_obj.size}, "
-                        f"downloaded {hashing_reader.bytes_read}"
-                    )
-
                 if get_etag != inv_obj.etag:
                     raise BackupError(
                         f"Object {inv_obj.key} ETag changed: inventory {inv_obj.etag}, "
@@ -721,8 +843,6 @@ def _download_object_to_tempfile(
                             f"computed {hashing_reader.md5_hex}"
                         )
 
-                sha256 = hashing_reader.sha256_hex
-
                 metadata = {
                     "content_type": resp.get("content_type"),
                     "cache_control": resp.get("cache_control"),
@@ -743,20 +863,21 @@ def _download_object_to_tempfile(
                         retries=retries_taken,
                     )
 
-                return DownloadResult(
-                    temp_path=temp_path,
-                    sha256=sha256,
-                    bytes_read=hashing_reader.bytes_read,
-                    metadata=metadata,
-                )
+                return hashing_reader, metadata
             finally:
                 body.close()
 
         except Exception as e:
+            if written:
+                discard()
             last_error = str(e)
             error_code = ""
             if isinstance(e, ClientError):
                 error_code = e.response.get("Error", {}).get("Code", "")
+                status = e.response.get("ResponseMetadata", {}).get("HTTPStatusCode")
+                throttled = (
+                    error_code in THROTTLE_ERROR_CODES or str(status) in THROTTLE_ERROR_CODES
+                )
             if attempt < max_retries:
                 retries_taken += 1
                 if tracer is not None:
@@ -767,11 +888,8 @@ def _download_object_to_tempfile(
                         error_code=error_code,
                         elapsed_ms=(conn_ms + stream_ms),
                     )
-                if temp_path is not None:
-                    try:
-                        temp_path.unlink()
-                    except OSError:
-                        pass
+                if throttled:
+                    backoff_seconds = min(0.5 * 2**attempt, 8.0)
                 continue
             if tracer is not None:
                 tracer.object_download_trace(
@@ -789,6 +907,127 @@ def _download_object_to_tempfile(
         finally:
             if progress is not None:
                 progress.worker_finished()
+            if throttle is not None:
+                throttle.release(throttled=throttled)
+
+
+def _download_object_to_tempfile(
+    r2_client: R2Client,
+    inv_obj: InventoryObject,
+    temp_dir: Path,
+    progress: Optional[BackupProgress] = None,
+    tracer: Optional[BackupTracer] = None,
+    max_retries: int = 2,
+    throttle: Optional[AdaptiveThrottle] = None,
+) -> DownloadResult:
+    """Download a single object to a temp file under temp_dir.
+
+    Used by concurrent workers for objects too large for the reorder buffer.
+    See `_download_object` for the checks and retry behaviour.
+    """
+    import tempfile
+
+    temp_paths: list[Path] = []
+
+    def _write(reader: HashingReader) -> None:
+        temp_dir.mkdir(parents=True, exist_ok=True)
+        with tempfile.NamedTemporaryFile(dir=temp_dir, delete=False) as temp_file:
+            temp_paths.append(Path(temp_file.name))
+            shutil.copyfileobj(reader, temp_file, length=COPY_BUFFER_SIZE)
+
+    def _discard() -> None:
+        while temp_paths:
+            try:
+                temp_paths.pop().unlink()
+            except OSError:
+                pass
+
+    reader, metadata = _download_object(
+        r2_client, inv_obj, _write, _discard, progress, tracer, max_retries, throttle
+    )
+    return DownloadResult(
+        temp_path=temp_paths[-1],
+        sha256=reader.sha256_hex,
+        bytes_read=reader.bytes_read,
+        metadata=metadata,
+    )
+
+
+def _download_object_to_memory(
+    r2_client: R2Client,
+    inv_obj: InventoryObject,
+    progress: Optional[BackupProgress] = None,
+    tracer: Optional[BackupTracer] = None,
+    max_retries: int = 2,
+    throttle: Optional[AdaptiveThrottle] = None,
+) -> DownloadResult:
+    """Download a single object into an in-memory buffer.
+
+    Used by concurrent workers so completed objects wait in the reorder buffer
+    rather than on disk until the tar writer appends them.
+    """
+    buffer = io.BytesIO()
+
+    def _write(reader: HashingReader) -> None:
+        shutil.copyfileobj(reader, buffer, length=COPY_BUFFER_SIZE)
+
+    def _discard() -> None:
+        buffer.seek(0)
+        buffer.truncate()
+
+    reader, metadata = _download_object(
+        r2_client, inv_obj, _write, _discard, progress, tracer, max_retries, throttle
+    )
+    buffer.seek(0)
+    return DownloadResult(
+        temp_path=None,
+        sha256=reader.sha256_hex,
+        bytes_read=reader.bytes_read,
+        metadata=metadata,
+        buffer=buffer,
+    )
+
+
+def _stream_object_into_tar(
+    r2_client: R2Client,
+    inv_obj: InventoryObject,
+    tar: tarfile.TarFile,
+    member_name: str,
+    progress: Optional[BackupProgress] = None,
+    tracer: Optional[BackupTracer] = None,
+    max_retries: int = 2,
+) -> DownloadResult:
+    """Stream a single object from its GET body straight into an open chunk tar.
+
+    The inventory size is written in the member header up front, so nothing is
+    staged on disk. A failed attempt is truncated off the tar before retrying.
+    """
+    start_offset = tar.offset
+    member_count = len(tar.members)
+
+    def _write(reader: HashingReader) -> None:
+        try:
+            tar.addfile(_tar_info(member_name, inv_obj.size), reader)
+        except OSError as e:
+            if reader.bytes_read < inv_obj.size:
+                raise BackupError(
+                    f"Short read for {inv_obj.key}: expected {inv_obj.size} bytes, "
+                    f"got {reader.bytes_read}"
+                ) from e
+            raise
+
+    def _discard() -> None:
+        _truncate_tar(tar, start_offset, member_count)
+
+    reader, metadata = _download_object(
+        r2_client, inv_obj, _write, _discard, progress, tracer, max_retries
+    )
+    return DownloadResult(
+        temp_path=None,
+        sha256=reader.sha256_hex,
+        bytes_read=reader.bytes_read,
+        metadata=metadata,
+    )
 
 
 def range_get_throughput_diag(
@@ -885,6 +1124,36 @@ class BackupResult:
     total_bytes: int
     chunk_count: int
     manifest: dict
+    reused_object_count: int = 0
+    downloaded_bytes: int = 0
+
+
+def _load_base_objects(base_dir: Path, output_dir: Path, bucket: str) -> dict[str, dict]:
+    """Load a base backup's manifest entries keyed by R2 key.
+
+    Each entry's ``archive`` is rewritten relative to ``output_dir`` so the new
+    manifest points straight at the directory holding the member, however many
+    increments the base itself was built on.
+
+    Raises:
+        BackupError: If the base manifest is unreadable or for another bucket.
+    """
+    try:
+        manifest = load_manifest(base_dir)
+    except (VerifyError, json.JSONDecodeError, OSError) as e:
+        raise BackupError(f"Cannot use {base_dir} as incremental base: {e}") from e
+    if manifest.get("bucket") != bucket:
+        raise BackupError(
+            f"Incremental base {base_dir} is a backup of bucket "
+            f"{manifest.get('bucket')!r}, not {bucket!r}"
+        )
+
+    output_abs = os.path.abspath(output_dir)
+    entries: dict[str, dict] = {}
+    for obj in manifest.get("objects", []):
+        holder = os.path.abspath(os.path.join(base_dir, obj.get("archive") or "."))
+        entries[obj["key"]] = {**obj, "archive": os.path.relpath(holder, output_abs)}
+    return entries
 
 
 def write_backup(
@@ -895,21 +1164,26 @@ def write_backup(
     concurrency: int = DEFAULT_CONCURRENCY,
     on_progress: Optional[Callable[[BackupProgress], None]] = None,
     tracer: Optional[BackupTracer] = None,
+    base_dir: Optional[Path] = None,
 ) -> BackupResult:
-    """Write a full backup to the output directory.
+    """Write a full or incremental backup to the output directory.
 
     Creates <output_dir>.part/ first, writes chunks and manifest, then
-    renames to <output_dir>/.
+    renames to <output_dir>/. With ``base_dir``, objects whose ETag, size and
+    last-modified match the base manifest are referenced rather than
+    downloaded, and downloaded objects whose SHA-256 is already archived are
+    stored only once.
 
     Args:
         r2_client: R2Client instance
         output_dir: Final output directory path
         inventory: Pre-built inventory
         chunk_size_bytes: Max bytes per chunk tar
-        concurrency: Number of concurrent download workers (1-64)
+        concurrency: Max concurrent download workers (1-MAX_CONCURRENCY)
         on_progress: Optional callback invoked with BackupProgress updates.
             Called from worker threads (throttled to ~10/sec).
         tracer: Optional BackupTracer for performance tracing.
+        base_dir: Optional previous backup directory to build an increment on.
 
     Returns:
         BackupResult with summary info.
@@ -917,8 +1191,8 @@ def write_backup(
     Raises:
         BackupError: If backup fails. Partial directory is cleaned up.
     """
-    if not (1 <= concurrency <= 5):
-        raise BackupError(f"concurrency must be 1-5, got {concurrency}")
+    if not (1 <= concurrency <= MAX_CONCURRENCY):
+        raise BackupError(f"concurrency must be 1-{MAX_CONCURRENCY}, got {concurrency}")
 
     if output_dir.exists():
         raise BackupError(f"Output directory already exists: {output_dir}")
@@ -932,7 +1206,48 @@ def write_backup(
     if chunk_size_bytes <= 0:
         raise BackupError(f"Chunk size must be positive, got {chunk_size_bytes}")
 
-    required_space = int(inventory.total_bytes * 2.1) + 50 * 1024 * 1024
+    base_objects = (
+        _load_base_objects(base_dir, output_dir, r2_client.bucket) if base_dir is not None else {}
+    )
+    reused_objects: list[dict] = []
+    download_indices: list[int] = []
+    for idx, inv_obj in enumerate(inventory.objects):
+        prev = base_objects.get(inv_obj.key)
+        if prev is not None and (prev["etag"], prev["size"], prev["last_modified"]) == (
+            inv_obj.etag,
+            inv_obj.size,
+            inv_obj.last_modified,
+        ):
+            reused_objects.append(prev)
+        else:
+            download_indices.append(idx)
+    download_bytes = sum(inventory.objects[i].size for i in download_indices)
+
+    # Content-addressed locations of members already archived, by SHA-256
+    locations_by_sha: dict[str, dict] = {}
+    if base_dir is not None:
+        for prev in base_objects.values():
+            locations_by_sha.setdefault(
+                prev["sha256"],
+                {
+                    "archive": prev["archive"],
+                    "chunk_index": prev["chunk_index"],
+                    "member_name": prev["member_name"],
+                },
+            )
+
+    # Bodies stream into the tar; only concurrent downloads too large for the
+    # reorder buffer are staged on disk first. Each member adds up to 1 KiB of
+    # tar header and padding.
+    staged_bytes = 0
+    if concurrency > 1:
+        staged_bytes = sum(
+            inventory.objects[i].size
+            for i in download_indices
+            if inventory.objects[i].size > REORDER_BUFFER_BYTES
+        )
+    required_space = download_bytes + staged_bytes + 1024 * len(download_indices)
+    required_space += 50 * 1024 * 1024
 
     if tracer is not None:
         tracer.phase_start("disk_check")
@@ -975,9 +1290,11 @@ def write_backup(
         from concurrent.futures import ThreadPoolExecutor
         import random
 
-        manifest_objects: list[dict] = []
+        manifest_objects: list[dict] = list(reused_objects)
         chunk_index = 0
         current_chunk_bytes = 0
+        current_chunk_members = 0
+        deduplicated_count = 0
 
         def _ensure_tar():
             nonlocal current_tar
@@ -985,16 +1302,65 @@ def write_backup(
                 current_tar = tarfile.open(_chunk_path(partial_dir, chunk_index), "w")
 
         def _rotate_chunk():
-            nonlocal current_tar, chunk_index, current_chunk_bytes
+            nonlocal current_tar, chunk_index, current_chunk_bytes, current_chunk_members
             if current_tar is not None:
                 current_tar.close()
                 current_tar = None
             chunk_index += 1
             current_chunk_bytes = 0
+            current_chunk_members = 0
+
+        def _prepare_tar(size: int) -> None:
+            # Rotate chunk if needed (based on completion-order size, not submission order)
+            if current_chunk_bytes > 0 and current_chunk_bytes + size > chunk_size_bytes:
+                _rotate_chunk()
+            _ensure_tar()
+
+        def _record(
+            idx: int,
+            download_result: DownloadResult,
+            location: Optional[dict],
+            wait_ms: float,
+            tar_write_ms: float,
+        ) -> None:
+            """Add the manifest entry for a downloaded object."""
+            nonlocal current_chunk_bytes, current_chunk_members, deduplicated_count
+            inv_obj = inventory.objects[idx]
+            if location is not None:
+                obj_entry = _build_manifest_object(
+                    inv_obj, location["member_name"], download_result.sha256,
+                    location["chunk_index"], download_result.metadata,
+                )
+                if location.get("archive"):
+                    obj_entry["archive"] = location["archive"]
+                deduplicated_count += 1
+            else:
+                member_name = _member_name_for_index(idx)
+                if tracer is not None:
+                    tracer.tar_write_trace(
+                        idx=idx,
+                        key=inv_obj.key,
+                        wait_ms=wait_ms,
+                        tar_write_ms=tar_write_ms,
+                        bytes_written=inv_obj.size,
+                    )
+                obj_entry = _build_manifest_object(
+                    inv_obj, member_name, download_result.sha256, chunk_index,
+                    download_result.metadata,
+                )
+                current_chunk_bytes += inv_obj.size
+                current_chunk_members += 1
+                if base_dir is not None:
+                    locations_by_sha[download_result.sha256] = {
+                        "chunk_index": chunk_index,
+                        "member_name": member_name,
+                    }
+            manifest_objects.append(obj_entry)
+            progress.object_written(inv_obj.size)
 
         progress = BackupProgress(
-            total_objects=inventory.object_count,
-            total_bytes=inventory.total_bytes,
+            total_objects=len(download_indices),
+            total_bytes=download_bytes,
             on_progress=on_progress,
         )
 
@@ -1007,106 +1373,116 @@ def write_backup(
         # small lrc/json files), so the end of the run is small fast objects —
         # no slow tail with workers=1.
         submission_order = sorted(
-            range(len(inventory.objects)),
+            download_indices,
             key=lambda i: inventory.objects[i].size,
             reverse=True,
         )
 
-        with ThreadPoolExecutor(max_workers=concurrency) as executor:
-            futures = {
-                idx: executor.submit(
-                    _download_object_to_tempfile,
+        if concurrency == 1:
+            # Single connection: stream each GET body straight into the chunk tar.
+            for idx in submission_order:
+                inv_obj = inventory.objects[idx]
+                _prepare_tar(inv_obj.size)
+                start_offset, member_count = current_tar.offset, len(current_tar.members)
+
+                t_tar_start = time.monotonic() if tracer is not None else 0.0
+                download_result = _stream_object_into_tar(
                     r2_client,
-                    inventory.objects[idx],
-                    temp_dir,
+                    inv_obj,
+                    current_tar,
+                    _member_name_for_index(idx),
                     progress,
                     tracer,
                 )
-                for idx in submission_order
-            }
+                tar_write_ms = (time.monotonic() - t_tar_start) * 1000.0 if tracer is not None else 0.0
+                progress.mark_object_downloaded()
 
-            # Build reverse lookup: future → idx (needed because as_completed yields futures,
-            # not indices).
-            future_to_idx = {f: idx for idx, f in futures.items()}
+                location = locations_by_sha.get(download_result.sha256)
+                if location is not None:
+                    _truncate_tar(current_tar, start_offset, member_count)
+                _record(idx, download_result, location, 0.0, tar_write_ms)
+        else:
+            throttle = AdaptiveThrottle(concurrency)
+            reorder_buffer = ReorderBuffer(REORDER_BUFFER_BYTES)
 
-            try:
-                for future in as_completed(futures.values()):
-                    idx = future_to_idx[future]
-                    inv_obj = inventory.objects[idx]
-                    member_name = _member_name_for_index(idx)
+            def _fetch(inv_obj: InventoryObject) -> DownloadResult:
+                if inv_obj.size > REORDER_BUFFER_BYTES:
+                    return _download_object_to_tempfile(
+                        r2_client, inv_obj, temp_dir, progress, tracer, throttle=throttle
+                    )
+                reorder_buffer.reserve(inv_obj.size)
+                try:
+                    return _download_object_to_memory(
+                        r2_client, inv_obj, progress, tracer, throttle=throttle
+                    )
+                except BaseException:
+                    reorder_buffer.release(inv_obj.size)
+                    raise
+
+            with ThreadPoolExecutor(max_workers=concurrency) as executor:
+                futures = {
+                    idx: executor.submit(_fetch, inventory.objects[idx])
+                    for idx in submission_order
+                }
 
-                    # Rotate chunk if needed (based on completion-order size, not submission order)
-                    if (
-                        current_chunk_bytes > 0
-                        and current_chunk_bytes + inv_obj.size > chunk_size_bytes
-                    ):
-                        _rotate_chunk()
+                # Build reverse lookup: future → idx (needed because as_completed yields
+                # futures, not indices).
+                future_to_idx = {f: idx for idx, f in futures.items()}
 
-                    _ensure_tar()
+                try:
+                    for future in as_completed(futures.values()):
+                        idx = future_to_idx[future]
+                        inv_obj = inventory.objects[idx]
 
-                    t_wait_start = time.monotonic() if tracer is not None else 0.0
-                    try:
+                        t_wait_start = time.monotonic() if tracer is not None else 0.0
                         download_result = future.result()
-                    except BaseException:
-                        for f in futures.values():
-                            f.cancel()
-                        raise
-                    wait_ms = (time.monotonic() - t_wait_start) * 1000.0 if tracer is not None else 0.0
+                        wait_ms = (time.monotonic() - t_wait_start) * 1000.0 if tracer is not None else 0.0
 
-                    if progress is not None:
                         progress.mark_object_downloaded()
 
-                    _track_temp(download_result.temp_path)
-                    try:
-                        tar_info = tarfile.TarInfo(name=member_name)
-                        tar_info.size = download_result.bytes_read
-                        tar_info.mtime = 0
-                        tar_info.mode = 0o644
-                        tar_info.type = tarfile.REGTYPE
-
-                        t_tar_start = time.monotonic() if tracer is not None else 0.0
-                        with open(download_result.temp_path, "rb") as f_in:
-                            current_tar.addfile(tar_info, f_in)
-                        tar_write_ms = (time.monotonic() - t_tar_start) * 1000.0 if tracer is not None else 0.0
-
-                        if tracer is not None:
-                            tracer.tar_write_trace(
-                                idx=idx,
-                                key=inv_obj.key,
-                                wait_ms=wait_ms,
-                                tar_write_ms=tar_write_ms,
-                                bytes_written=inv_obj.size,
-                            )
-
-                        obj_entry = _build_manifest_object(
-                            inv_obj, member_name, download_result.sha256, chunk_index,
-                            download_result.metadata,
-                        )
-                        manifest_objects.append(obj_entry)
-                        current_chunk_bytes += inv_obj.size
-
-                        if progress is not None:
-                            progress.object_written(inv_obj.size)
-                    finally:
-                        _untrack_temp(download_result.temp_path)
+                        if download_result.temp_path is not None:
+                            _track_temp(download_result.temp_path)
                         try:
-                            download_result.temp_path.unlink()
-                        except OSError:
-                            pass
-            except BaseException:
-                for f in futures.values():
-                    f.cancel()
-                raise
+                            location = locations_by_sha.get(download_result.sha256)
+                            tar_write_ms = 0.0
+                            if location is None:
+                                _prepare_tar(inv_obj.size)
+                                tar_info = _tar_info(
+                                    _member_name_for_index(idx), download_result.bytes_read
+                                )
+                                t_tar_start = time.monotonic() if tracer is not None else 0.0
+                                if download_result.buffer is not None:
+                                    current_tar.addfile(tar_info, download_result.buffer)
+                                else:
+                                    with open(download_result.temp_path, "rb") as f_in:
+                                        current_tar.addfile(tar_info, f_in)
+                                tar_write_ms = (time.monotonic() - t_tar_start) * 1000.0 if tracer is not None else 0.0
+                            _record(idx, download_result, location, wait_ms, tar_write_ms)
+                        finally:
+                            if download_result.buffer is not None:
+                                download_result.buffer.close()
+                                reorder_buffer.release(inv_obj.size)
+                            if download_result.temp_path is not None:
+                                _untrack_temp(download_result.temp_path)
+                                try:
+                                    download_result.temp_path.unlink()
+                                except OSError:
+                                    pass
+                except BaseException:
+                    reorder_buffer.close()
+                    for f in futures.values():
+                        f.cancel()
+                    raise
 
         if tracer is not None:
             tracer.phase_end(
                 "download_phase",
-                objects=inventory.object_count,
-                total_bytes=inventory.total_bytes,
+                objects=len(download_indices),
+                total_bytes=download_bytes,
             )
             tracer.finalize(
-                total_objects=inventory.object_count,
-                total_bytes=inventory.total_bytes,
+                total_objects=len(download_indices),
+                total_bytes=download_bytes,
             )
 
         if current_tar is not None:
@@ -1114,6 +1490,9 @@ def write_backup(
                 tracer.phase_start("tar_close")
             current_tar.close()
             current_tar = None
+            if not current_chunk_members:
+                # Every object streamed into this chunk was a duplicate
+                _chunk_path(partial_dir, chunk_index).unlink()
             if tracer is not None:
                 tracer.phase_end("tar_close")
 
@@ -1143,10 +1522,10 @@ def write_backup(
             if tracer is not None:
                 tracer.phase_end("spot_check", samples=sample_size)
 
-        final_chunk_count = chunk_index + 1 if manifest_objects else 0
+        final_chunk_count = chunk_index + 1 if current_chunk_members else chunk_index
 
         manifest = {
-            "version": MANIFEST_VERSION,
+            "version": MANIFEST_VERSION if base_dir is None else INCREMENTAL_MANIFEST_VERSION,
             "created_at": datetime.now(timezone.utc).isoformat(),
             "inventory_started_at": inventory.started_at,
             "inventory_completed_at": inventory.completed_at,
@@ -1163,8 +1542,18 @@ def write_backup(
                 "md5_body_check": True,
                 "spot_check_head_ratio": SPOT_CHECK_HEAD_RATIO,
             },
-            "objects": manifest_objects,
         }
+        if base_dir is not None:
+            manifest["incremental"] = {
+                "base_dir": os.path.relpath(
+                    os.path.abspath(base_dir), os.path.abspath(output_dir)
+                ),
+                "reused_object_count": len(reused_objects),
+                "downloaded_object_count": len(download_indices),
+                "downloaded_bytes": download_bytes,
+                "deduplicated_object_count": deduplicated_count,
+            }
+        manifest["objects"] = manifest_objects
 
         if tracer is not None:
             tracer.phase_start("manifest_write")
@@ -1196,6 +1585,8 @@ def write_backup(
             total_bytes=manifest["total_bytes"],
             chunk_count=final_chunk_count,
             manifest=manifest,
+            reused_object_count=len(reused_objects),
+            downloaded_bytes=download_bytes,
         )
 
     except BaseException:
@@ -1209,16 +1600,16 @@ def write_backup(
         raise
 
 
-SUPPORTED_MANIFEST_VERSIONS = {3, 4}
+SUPPORTED_MANIFEST_VERSIONS = {3, 4, 5}
 
 
 def load_manifest(dir_path: Path) -> dict:
     """Load and return manifest.json from a backup directory.
 
-    Supports manifest versions 3 and 4. Version 3 uses post-download HEAD
+    Supports manifest versions 3, 4 and 5. Version 3 uses post-download HEAD
     consistency checks; version 4 uses GET-ETag checks with MD5 body
-    verification. Both produce identical object/chunk structures for
-    verification and restore.
+    verification. Version 5 is an incremental v4 manifest whose entries may
+    carry an ``archive`` path to the backup directory holding the member.
 
     Raises:
         VerifyError: If manifest is missing or has unsupported version.
@@ -1252,20 +1643,32 @@ def _validate_manifest_invariants(manifest: dict) -> list[str]:
             errors.append(f"Duplicate object key: {key}")
         seen_keys.add(key)
 
-    # Unique member names
-    seen_members: set[str] = set()
-    for name in member_names:
-        if name in seen_members:
-            errors.append(f"Duplicate member name: {name}")
-        seen_members.add(name)
-
-    # Valid chunk indexes
+    # Unique member locations; incremental manifests may point several keys
+    # at one member when their content is identical.
+    shared_members_ok = manifest.get("version") == INCREMENTAL_MANIFEST_VERSION
+    seen_members: dict[tuple, str] = {}
+    for obj in objects:
+        location = (obj.get("archive") or "", obj.get("chunk_index"), obj.get("member_name", ""))
+        if location in seen_members and not (
+            shared_members_ok and seen_members[location] == obj.get("sha256")
+        ):
+            errors.append(f"Duplicate member name: {obj.get('member_name', '')}")
+        seen_members.setdefault(location, obj.get("sha256", ""))
+
+    # Valid chunk indexes; referenced archives are range-checked by verify_archive
     chunk_count = manifest.get("chunk_count", 0)
     for obj in objects:
         ci = obj.get("chunk_index", -1)
-        if not isinstance(ci, int) or ci < 0 or ci >= chunk_count:
+        limit = chunk_count if not obj.get("archive") else float("inf")
+        if not isinstance(ci, int) or ci < 0 or ci >= limit:
             errors.append(f"Invalid chunk_index for {obj.get('key')}: {ci}")
 
+    # Referenced archives are relative paths
+    for obj in objects:
+        archive = obj.get("archive")
+        if archive is not None and (not isinstance(archive, str) or os.path.isabs(archive)):
+            errors.append(f"Invalid archive for {obj.get('key')}: {archive}")
+
     # object_count matches
     if manifest.get("object_count") != len(objects):
         errors.append(
@@ -1280,9 +1683,10 @@ def _validate_manifest_invariants(manifest: dict) -> list[str]:
         )
 
     # chunk_count matches
-    if chunk_count != len({o.get("chunk_index", -1) for o in objects if o}):
-        if objects:
-            max_ci = max(o.get("chunk_index", 0) for o in objects)
+    local_objects = [o for o in objects if not o.get("archive")]
+    if chunk_count != len({o.get("chunk_index", -1) for o in local_objects if o}):
+        if local_objects:
+            max_ci = max(o.get("chunk_index", 0) for o in local_objects)
             if chunk_count != max_ci + 1:
                 errors.append(
                     f"chunk_count {chunk_count} != max chunk_index + 1 ({max_ci + 1})"
@@ -1315,6 +1719,87 @@ class VerifyResult:
     chunk_count: int = 0
 
 
+def _verify_chunk(
+    chunk_file: Path,
+    expected: dict[str, dict],
+    errors: list[str],
+    label: str,
+    allow_unreferenced: bool = False,
+) -> None:
+    """Check one chunk tar's members against their manifest entries.
+
+    Appends problems to ``errors``. Members not in ``expected`` are orphans
+    unless ``allow_unreferenced`` (a chunk of a referenced base archive).
+    """
+    try:
+        with tarfile.open(chunk_file, "r") as tar:
+            seen_names: set[str] = set()
+
+            for member in tar.getmembers():
+                if not member.isreg():
+                    errors.append(
+                        f"Non-regular member in {label}: {member.name}"
+                    )
+                    continue
+                if member.name in seen_names:
+                    errors.append(
+                        f"Duplicate member in {label}: {member.name}"
+                    )
+                    continue
+                seen_names.add(member.name)
+
+                if member.name not in expected:
+                    if not allow_unreferenced:
+                        errors.append(
+                            f"Orphan member in {label}: {member.name}"
+                        )
+                    continue
+
+                obj_entry = expected[member.name]
+
+                # Size check
+                if member.size != obj_entry.get("size", 0):
+                    errors.append(
+                        f"Size mismatch for {member.name} in {label}: "
+                        f"tar {member.size}, manifest {obj_entry.get('size')}"
+                    )
+
+                # SHA-256 check
+                hasher = hashlib.sha256()
+                f = tar.extractfile(member)
+                if f is None:
+                    errors.append(
+                        f"Cannot extract member {member.name} from {label}"
+                    )
+                    continue
+                try:
+                    while True:
+                        chunk = f.read(64 * 1024)
+                        if not chunk:
+                            break
+                        hasher.update(chunk)
+                finally:
+                    f.close()
+
+                actual_hash = hasher.hexdigest()
+                expected_hash = obj_entry.get("sha256", "")
+                if actual_hash != expected_hash:
+                    errors.append(
+                        f"Hash mismatch for {member.name} in {label}: "
+                        f"actual {actual_hash}, expected {expected_hash}"
+                    )
+
+            # Check for missing members
+            for expected_name in expected:
+                if expected_name not in seen_names:
+                    errors.append(
+                        f"Missing member {expected_name} in {label}"
+                    )
+
+    except (tarfile.TarError, OSError) as e:
+        errors.append(f"Cannot read tar {label}: {e}")
+
+
 def verify_archive(dir_path: Path) -> VerifyResult:
     """Verify a backup archive directory.
 
@@ -1342,12 +1827,15 @@ def verify_archive(dir_path: Path) -> VerifyResult:
     objects = manifest.get("objects", [])
     chunk_count = manifest.get("chunk_count", 0)
 
-    # Build expected member map per chunk
+    # Build expected member map per chunk, split by the archive holding it
     chunk_members: dict[int, dict[str, dict]] = {}
+    referenced: dict[str, dict[int, dict[str, dict]]] = {}
     for obj in objects:
         ci = obj.get("chunk_index", 0)
         member_name = obj.get("member_name", "")
-        chunk_members.setdefault(ci, {})[member_name] = obj
+        archive = obj.get("archive")
+        members = referenced.setdefault(archive, {}) if archive else chunk_members
+        members.setdefault(ci, {})[member_name] = obj
 
     # Verify each chunk
     for ci in range(chunk_count):
@@ -1355,74 +1843,23 @@ def verify_archive(dir_path: Path) -> VerifyResult:
         if not chunk_file.exists():
             errors.append(f"Missing chunk file: {chunk_file.name}")
             continue
+        _verify_chunk(chunk_file, chunk_members.get(ci, {}), errors, chunk_file.name)
 
+    # Verify referenced members in earlier archives of an incremental chain
+    for archive, members_by_chunk in sorted(referenced.items()):
+        archive_dir = dir_path / archive
         try:
-            with tarfile.open(chunk_file, "r") as tar:
-                expected = chunk_members.get(ci, {})
-                seen_names: set[str] = set()
-
-                for member in tar.getmembers():
-                    if not member.isreg():
-                        errors.append(
-                            f"Non-regular member in {chunk_file.name}: {member.name}"
-                        )
-                        continue
-                    if member.name in seen_names:
-                        errors.append(
-                            f"Duplicate member in {chunk_file.name}: {member.name}"
-                        )
-                        continue
-                    seen_names.add(member.name)
-
-                    if member.name not in expected:
-                        errors.append(
-                            f"Orphan member in {chunk_file.name}: {member.name}"
-                        )
-                        continue
-
-                    obj_entry = expected[member.name]
-
-                    # Size check
-                    if member.size != obj_entry.get("size", 0):
-                        errors.append(
-                            f"Size mismatch for {member.name} in {chunk_file.name}: "
-                            f"tar {member.size}, manifest {obj_entry.get('size')}"
-                        )
-
-                    # SHA-256 check
-                    hasher = hashlib.sha256()
-                    f = tar.extractfile(member)
-                    if f is None:
-                        errors.append(
-                            f"Cannot extract member {member.name} from {chunk_file.name}"
-                        )
-                        continue
-                    try:
-                        while True:
-                            chunk = f.read(64 * 1024)
-                            if not chunk:
-                                break
-                            hasher.update(chunk)
-                    finally:
-                        f.close()
-
-                    actual_hash = hasher.hexdigest()
-                    expected_hash = obj_entry.get("sha256", "")
-                    if actual_hash != expected_hash:
-                        errors.append(
-                            f"Hash mismatch for {member.name} in {chunk_file.name}: "
-                            f"actual {actual_hash}, expected {expected_hash}"
-                        )
-
-                # Check for missing members
-                for expected_name in expected:
-                    if expected_name not in seen_names:
-                        errors.append(
-                            f"Missing member {expected_name} in {chunk_file.name}"
-                        )
-
-        except (tarfile.TarError, OSError) as e:
-            errors.append(f"Cannot read tar {chunk_file.name}: {e}")
+            archive_chunk_count = load_manifest(archive_dir).get("chunk_count", 0)
+        except (VerifyError, json.JSONDecodeError, OSError) as e:
+            errors.append(f"Cannot read referenced archive {archive}: {e}")
+            continue
+        for ci, expected in sorted(members_by_chunk.items()):
+            chunk_file = _chunk_path(archive_dir, ci)
+            label = f"{archive}/{chunk_file.name}"
+            if ci >= archive_chunk_count or not chunk_file.exists():
+                errors.append(f"Missing chunk file: {label}")
+                continue
+            _verify_chunk(chunk_file, expected, errors, label, allow_unreferenced=True)
 
     # Check for extra chunk files
     for entry in dir_path.iterdir():
@@ -1455,6 +1892,7 @@ class RestorePlanRow:
     sha256: str
     action: str  # create, conflict, skip, overwrite
     target_exists: bool
+    archive: Optional[str] = None  # backup dir holding the member, relative
 
 
 @dataclass
@@ -1525,6 +1963,7 @@ def plan_restore(
                     sha256=obj["sha256"],
                     action=action,
                     target_exists=target_exists,
+                    archive=obj.get("archive"),
                 )
             )
     except ClientError as e:
@@ -1605,18 +2044,19 @@ def restore_from_archive(
     # Build manifest object lookup
     obj_by_key = {o["key"]: o for o in manifest.get("objects", [])}
 
-    # Group by chunk_index
-    by_chunk: dict[int, list[RestorePlanRow]] = {}
+    # Group by the archive and chunk holding each member
+    by_chunk: dict[tuple[str, int], list[RestorePlanRow]] = {}
     for row in upload_rows:
-        by_chunk.setdefault(row.chunk_index, []).append(row)
+        by_chunk.setdefault((row.archive or "", row.chunk_index), []).append(row)
 
-    for chunk_index, rows in sorted(by_chunk.items()):
-        chunk_file = _chunk_path(dir_path, chunk_index)
+    for (archive, chunk_index), rows in sorted(by_chunk.items()):
+        chunk_file = _chunk_path(dir_path / archive if archive else dir_path, chunk_index)
         if not chunk_file.exists():
+            label = f"{archive}/{chunk_file.name}" if archive else chunk_file.name
             for row in rows:
                 result.failed += 1
                 result.failures.append(
-                    {"key": row.key, "error": f"Missing chunk file: {chunk_file.name}"}
+                    {"key": row.key, "error": f"Missing chunk file: {label}"}
                 )
             continue
 
@@ -3,14 +3,16 @@
 Refactored from poc/lyrics_scraper.py to integrate with the admin CLI database.
 """
 
+import hashlib
+import io
 import json
 import logging
 import time
 from datetime import datetime
-from typing import Dict, List, Optional
+from typing import Dict, Iterator, List, Optional
 
 import requests
-from bs4 import BeautifulSoup
+from lxml import etree
 from pypinyin import lazy_pinyin
 
 from stream_of_worship.admin.db.client import DatabaseClient
@@ -20,6 +22,11 @@ from stream_of_worship.music.key import parse_musical_key
 
 logger = logging.getLogger(__name__)
 
+TABLE_ID = "tablepress-3"
+
+# Row fields covered by the change-detection digest, in hashing order.
+ROW_DIGEST_FIELDS = ("title", "composer", "lyricist", "album", "series", "key", "lyrics_raw")
+
 
 class CatalogScraper:
     """Scraper for sop.org/songs catalog.
@@ -46,6 +53,14 @@ class CatalogScraper:
         # Track duplicate count from last run
         self.last_run_duplicate_count: int = 0
 
+        # Row digests and (ETag, Last-Modified) from the last scrape, recorded
+        # once its songs are saved.
+        self._pending_digests: Dict[str, str] = {}
+        self._pending_source_state: Optional[tuple] = None
+
+        # Set when the table stream ended on a parse error.
+        self._table_parse_error = False
+
     def scrape_all_songs(
         self,
         limit: Optional[int] = None,
@@ -55,41 +70,66 @@ class CatalogScraper:
     ) -> List[Song]:
         """Scrape all songs from the sop.org/songs table.
 
+        Incremental runs send the validators recorded by the last full scrape
+        (``If-None-Match`` / ``If-Modified-Since``) and stop on ``304 Not
+        Modified``. Otherwise each row is hashed and only rows that are new or
+        whose digest changed are returned. Digests and validators are recorded
+        by ``save_songs`` once the changed songs are stored.
+
         Args:
             limit: Maximum number of songs to scrape (None for all)
             force: Re-scrape all songs even if already in database
-            incremental: Skip songs already in database (ignored if force=True)
+            incremental: Skip unchanged songs already in database (ignored if force=True)
             soft_delete_missing: Mark songs not seen this run as deleted (full scrape only)
 
         Returns:
-            List of Song objects
+            List of new or changed Song objects
         """
+        use_digests = incremental and not force and self.db_client is not None
+        full_scrape = not limit
+        self._pending_digests = {}
+        self._pending_source_state = None
+
+        request_headers = dict(self.headers)
+        if use_digests and full_scrape:
+            request_headers.update(self._conditional_headers())
+
         logger.info(f"Fetching lyrics table from {self.url}")
 
         try:
-            response = requests.get(self.url, headers=self.headers, timeout=30)
+            response = requests.get(self.url, headers=request_headers, timeout=30)
             response.raise_for_status()
         except requests.exceptions.RequestException as e:
             logger.error(f"Failed to fetch page: {e}")
             raise
 
-        logger.info(f"Parsing HTML ({len(response.text)} bytes)")
-        soup = BeautifulSoup(response.text, "html.parser")
+        self.last_run_duplicate_count = 0
+        if response.status_code == 304:
+            logger.info("Catalog not modified since the last scrape")
+            return []
 
-        # Find the TablePress table
-        table = soup.find("table", id="tablepress-3")
-        if not table:
-            raise ValueError("Table 'tablepress-3' not found - site structure may have changed")
+        if full_scrape and self.db_client:
+            self._pending_source_state = (
+                response.headers.get("ETag"),
+                response.headers.get("Last-Modified"),
+            )
+
+        # Get stored row digests for incremental mode
+        stored_digests: Dict[str, Optional[str]] = {}
+        if use_digests:
+            stored_digests = self._get_stored_digests()
+            logger.info(f"Found {len(stored_digests)} existing songs in database")
 
-        rows = table.find_all("tr")
-        logger.info(f"Found {len(rows)} rows in table")
+        logger.info(f"Parsing HTML ({len(response.text)} bytes)")
+        self._table_parse_error = False
+        rows = self._iter_table_rows(response.text)
 
         # Get headers
-        if not rows:
+        header_cells = next(rows, None)
+        if header_cells is None:
             raise ValueError("No rows found in table")
 
-        header_row = rows[0]
-        headers = [th.get_text(strip=True) for th in header_row.find_all(["th", "td"])]
+        headers = [self._cell_text(cell) for cell in header_cells]
         logger.info(f"Headers: {headers}")
 
         # Find column indices
@@ -108,52 +148,58 @@ class CatalogScraper:
 
         # Parse data rows
         songs = []
-        data_rows = rows[1:]  # Skip header
-
-        if limit:
-            data_rows = data_rows[:limit]
-            soft_delete_missing = False  # Don't soft-delete when using limit
-
-        # Get existing song IDs for incremental mode
-        existing_ids = set()
-        if incremental and not force and self.db_client:
-            existing_ids = self._get_existing_song_ids()
-            logger.info(f"Found {len(existing_ids)} existing songs in database")
-
         seen_ids = set()
         duplicate_count = 0
-        for row_num, row in enumerate(data_rows, 1):
-            cells = row.find_all(["td", "th"])
+        unchanged_count = 0
+        failed_count = 0
+        for row_num, cells in enumerate(rows, 1):
+            if limit and row_num > limit:
+                break
             if not cells:
                 continue
 
             try:
-                song = self._parse_row(cells, col_indices, row_num)
-                if not song:
+                fields = self._extract_row(cells, col_indices)
+                if not fields:
                     continue
 
+                song_id = self._compute_song_id(
+                    fields["title"], fields["composer"], fields["lyricist"]
+                )
+
                 # In-run dedup: first-seen wins.
-                if song.id in seen_ids:
+                if song_id in seen_ids:
                     duplicate_count += 1
                     logger.debug(
-                        f"Skipping duplicate row {row_num}: id={song.id} "
-                        f"title={song.title!r} (first seen earlier in this run)"
+                        f"Skipping duplicate row {row_num}: id={song_id} "
+                        f"title={fields['title']!r} (first seen earlier in this run)"
                     )
                     continue
-                seen_ids.add(song.id)
-
-                # Cross-run incremental skip (existing behavior).
-                if incremental and not force and song.id in existing_ids:
-                    logger.debug(f"Skipping existing song: {song.id}")
-                    continue
-
-                songs.append(song)
+                seen_ids.add(song_id)
+
+                digest = self._row_digest(fields)
+                if use_digests and song_id in stored_digests:
+                    stored = stored_digests[song_id]
+                    if stored == digest:
+                        unchanged_count += 1
+                        continue
+                    if stored is None:
+                        # Saved before digests existed: keep the stored song and
+                        # record a baseline instead of rewriting the whole catalog.
+                        self._pending_digests[song_id] = digest
+                        unchanged_count += 1
+                        continue
+
+                songs.append(self._build_song(song_id, fields, row_num))
+                if self.db_client:
+                    self._pending_digests[song_id] = digest
 
                 if row_num % 100 == 0:
-                    logger.info(f"Processed {row_num}/{len(data_rows)} songs...")
+                    logger.info(f"Processed {row_num} rows...")
 
             except Exception as e:
                 logger.warning(f"Failed to parse row {row_num}: {e}")
+                failed_count += 1
                 continue
 
         if duplicate_count:
@@ -161,32 +207,92 @@ class CatalogScraper:
                 f"Skipped {duplicate_count} duplicate row(s) within this scrape "
                 f"(same title/composer/lyricist as an earlier row)"
             )
-
-        # Soft-delete songs not seen this run (full scrape only)
-        if soft_delete_missing and self.db_client and not limit:
-            missing_ids = existing_ids - seen_ids
-            if missing_ids:
-                logger.info(f"Soft-deleting {len(missing_ids)} songs not seen in this scrape")
-                for song_id in missing_ids:
-                    self.db_client.soft_delete_song(song_id)
-                    logger.debug(f"Soft-deleted song: {song_id}")
+        if unchanged_count:
+            logger.info(f"Skipped {unchanged_count} unchanged song(s)")
+
+        # A partial parse must not look like songs removed from the catalog,
+        # and the validators must not be recorded or the next run gets a 304
+        # and never sees the rest of the table.
+        incomplete = self._table_parse_error or failed_count > 0
+        if incomplete:
+            logger.warning(
+                f"Catalog table parsed incompletely ({failed_count} failed row(s)); "
+                f"skipping soft-delete and not recording source validators"
+            )
+            self._pending_source_state = None
+
+        # Soft-delete songs not seen this run (full incremental scrape only)
+        if soft_delete_missing and use_digests and full_scrape and not incomplete:
+            if seen_ids:
+                deleted = self.db_client.soft_delete_songs_missing_from(self.url, seen_ids)
+                if deleted:
+                    logger.info(f"Soft-deleted {deleted} songs not seen in this scrape")
+            else:
+                logger.warning("No songs parsed from the table; skipping soft-delete")
 
         self.last_run_duplicate_count = duplicate_count
-        logger.info(f"Successfully parsed {len(songs)} songs")
+        logger.info(f"Successfully parsed {len(songs)} new or changed songs")
+
+        # Nothing to save, so record the digests and validators now.
+        if not songs:
+            self._commit_sync_state()
         return songs
 
-    def _get_existing_song_ids(self) -> set:
-        """Get set of existing song IDs from database."""
+    def _conditional_headers(self) -> Dict[str, str]:
+        """Build conditional request headers from the last full scrape."""
+        try:
+            etag, last_modified = self.db_client.get_catalog_source_state(self.url)
+        except Exception as e:
+            logger.warning(f"Failed to read catalog source state: {e}")
+            return {}
+
+        headers = {}
+        if etag:
+            headers["If-None-Match"] = etag
+        if last_modified:
+            headers["If-Modified-Since"] = last_modified
+        return headers
+
+    def _get_stored_digests(self) -> Dict[str, Optional[str]]:
+        """Get stored row digests of existing songs from database."""
+        try:
+            return self.db_client.get_song_row_digests()
+        except Exception as e:
+            logger.warning(f"Failed to get existing song digests: {e}")
+            return {}
+
+    def _commit_sync_state(self, failed_ids: Optional[set] = None) -> None:
+        """Record pending row digests and source validators after a scrape.
+
+        Args:
+            failed_ids: Songs that could not be saved. Their digests are
+                dropped and the validators are not recorded, so the next
+                scrape fetches and retries them.
+        """
         if not self.db_client:
-            return set()
+            return
+
+        digests = self._pending_digests
+        source_state = self._pending_source_state
+        if failed_ids:
+            digests = {k: v for k, v in digests.items() if k not in failed_ids}
+            source_state = None
+        if not digests and not source_state:
+            return
 
+        etag, last_modified = source_state or (None, None)
         try:
-            # List all songs and extract IDs
-            songs = self.db_client.list_songs(limit=100000)  # Large limit to get all
-            return {song.id for song in songs}
+            self.db_client.save_catalog_sync_state(
+                digests,
+                source_url=self.url if source_state else None,
+                etag=etag,
+                last_modified=last_modified,
+            )
         except Exception as e:
-            logger.warning(f"Failed to get existing song IDs: {e}")
-            return set()
+            logger.warning(f"Failed to record catalog sync state: {e}")
+            return
+        self._pending_digests = {}
+        self._pending_source_state = None
 
     def save_songs(self, songs: List[Song]) -> tuple[int, float]:
         """Save songs to the database.
@@ -212,10 +318,12 @@ class CatalogScraper:
             saved_count = self.db_client.insert_songs_bulk(songs)
             elapsed = time.time() - start_time
             logger.info(f"Successfully saved {saved_count}/{len(songs)} songs in {elapsed:.2f}s ({len(songs)/elapsed:.1f} songs/sec)")
+            self._commit_sync_state()
             return saved_count, elapsed
         except Exception as e:
             logger.error(f"Bulk insert failed, falling back to individual inserts: {e}")
             saved_count = 0
+            failed_ids = set()
             with self.db_client.transaction():
                 for i, song in enumerate(songs):
                     try:
@@ -225,11 +333,53 @@ class CatalogScraper:
                             elapsed = time.time() - start_time
                             logger.info(f"Progress: {i + 1}/{len(songs)} songs in {elapsed:.2f}s")
                     except Exception as inner_e:
+                        failed_ids.add(song.id)
                         logger.warning(f"Failed to save song {song.id}: {inner_e}")
             elapsed = time.time() - start_time
             logger.info(f"Saved {saved_count}/{len(songs)} songs in {elapsed:.2f}s ({saved_count/elapsed:.1f} songs/sec)")
+            self._commit_sync_state(failed_ids)
             return saved_count, elapsed
 
+    def _iter_table_rows(self, html: str) -> Iterator[List]:
+        """Stream the cells of each row of the catalog table.
+
+        Rows are parsed incrementally with lxml and released once consumed,
+        so the full document tree is never held in memory.
+
+        A parse error ends the stream early and sets ``_table_parse_error``.
+
+        Raises:
+            ValueError: If the catalog table is not in the page.
+        """
+        found = False
+        events = etree.iterparse(
+            io.BytesIO(html.encode("utf-8")),
+            events=("end",),
+            tag=("tr", "table"),
+            html=True,
+            encoding="utf-8",
+        )
+        try:
+            for _, element in events:
+                if element.tag == "table":
+                    found = found or element.get("id") == TABLE_ID
+                    continue
+
+                table = next(element.iterancestors("table"), None)
+                if table is not None and table.get("id") == TABLE_ID:
+                    found = True
+                    yield [cell for cell in element if cell.tag in ("td", "th")]
+
+                element.clear()
+                while element.getprevious() is not None:
+                    del element.getparent()[0]
+        except etree.XMLSyntaxError as e:
+            logger.warning(f"Catalog table parse stopped early: {e}")
+            self._table_parse_error = True
+
+        if not found:
+            raise ValueError(f"Table '{TABLE_ID}' not found - site structure may have changed")
+
     def _find_header_index(self, headers: List[str], keywords: List[str]) -> Optional[int]:
         """Find column index by matching keywords."""
         for i, header in enumerate(headers):
@@ -237,61 +387,55 @@ class CatalogScraper:
                 return i
         return None
 
-    def _parse_row(self, cells: List, col_indices: Dict, row_num: int) -> Optional[Song]:
-        """Parse a single table row into a Song object."""
-        # Extract basic metadata
-        title = (
-            cells[col_indices["title"]].get_text(strip=True)
-            if col_indices["title"] is not None
-            else ""
-        )
+    @staticmethod
+    def _cell_text(cell) -> str:
+        """Concatenate a cell's text nodes, each stripped of surrounding whitespace."""
+        return "".join(text.strip() for text in cell.itertext())
+
+    def _extract_row(self, cells: List, col_indices: Dict) -> Optional[Dict]:
+        """Extract the text fields of a table row; None if it has no title."""
+
+        def text(column: str) -> str:
+            index = col_indices[column]
+            return self._cell_text(cells[index]) if index is not None else ""
+
+        title = text("title")
         if not title:
             return None
 
-        composer = (
-            cells[col_indices["composer"]].get_text(strip=True)
-            if col_indices["composer"] is not None
-            else ""
-        )
-        lyricist = (
-            cells[col_indices["lyricist"]].get_text(strip=True)
-            if col_indices["lyricist"] is not None
-            else ""
-        )
-        album = (
-            cells[col_indices["album"]].get_text(strip=True)
-            if col_indices["album"] is not None
-            else ""
-        )
-        series = (
-            cells[col_indices["series"]].get_text(strip=True)
-            if col_indices["series"] is not None
-            else ""
-        )
-        key = (
-            cells[col_indices["key"]].get_text(strip=True) if col_indices["key"] is not None else ""
-        )
-
-        # Extract lyrics
-        lyrics_cell = cells[col_indices["lyrics"]]
-        lyrics_data = self._parse_lyrics_cell(lyrics_cell)
+        lyrics_data = self._parse_lyrics_cell(cells[col_indices["lyrics"]])
+        return {
+            "title": title,
+            "composer": text("composer"),
+            "lyricist": text("lyricist"),
+            "album": text("album"),
+            "series": text("series"),
+            "key": text("key"),
+            **lyrics_data,
+        }
 
-        # Generate stable song ID
-        song_id = self._compute_song_id(title, composer, lyricist)
+    @staticmethod
+    def _row_digest(fields: Dict) -> str:
+        """Hash the source fields of a row to detect changes between scrapes."""
+        values = [fields[name] for name in ROW_DIGEST_FIELDS]
+        return hashlib.sha256("\x1f".join(values).encode("utf-8")).hexdigest()
 
+    def _build_song(self, song_id: str, fields: Dict, row_num: int) -> Song:
+        """Build a Song from extracted row fields."""
         # Generate pinyin for title
-        title_pinyin = "_".join(lazy_pinyin(title))
+        title_pinyin = "_".join(lazy_pinyin(fields["title"]))
 
         # Create Song object
+        key = fields["key"]
         parsed_key = parse_musical_key(key)
         song = Song(
             id=song_id,
-            title=title,
+            title=fields["title"],
             title_pinyin=title_pinyin,
-            composer=composer,
-            lyricist=lyricist,
-            album_name=album,
-            album_series=series,
+            composer=fields["composer"],
+            lyricist=fields["lyricist"],
+            album_name=fields["album"],
+            album_series=fields["series"],
             musical_key=key,
             musical_key_root=parsed_key.root,
             musical_key_mode=parsed_key.mode,
@@ -300,10 +444,10 @@ class CatalogScraper:
             musical_key_start_pitch_class=parsed_key.start_pitch_class,
             musical_key_end_pitch_class=parsed_key.end_pitch_class,
             musical_key_parse_status=parsed_key.status,
-            lyrics_raw=lyrics_data["lyrics_raw"],
-            lyrics_lines=json.dumps(lyrics_data["lyrics_lines"], ensure_ascii=False),
+            lyrics_raw=fields["lyrics_raw"],
+            lyrics_lines=json.dumps(fields["lyrics_lines"], ensure_ascii=False),
             sections=json.dumps(
-                self._detect_sections(lyrics_data["lyrics_lines"]), ensure_ascii=False
+                self._detect_sections(fields["lyrics_lines"]), ensure_ascii=False
             ),
             source_url=self.url,
             table_row_number=row_num,
@@ -314,18 +458,13 @@ class CatalogScraper:
 
     def _parse_lyrics_cell(self, cell) -> Dict:
         """Extract lyrics from table cell, preserving line breaks."""
-        # Handle both malformed <br>...</br> pattern and standard <br/> tags.
-        # For malformed <br> with children, unwrap preserves nested content.
-        # For standard <br/>, replace with newline directly.
-        for br in cell.find_all("br"):
-            if br.contents:
-                br.insert_before("\n")
-                br.unwrap()
-            else:
-                br.replace_with("\n")
+        # lxml parses every <br> as a void element, including the malformed
+        # <br>...</br> pattern, so each one becomes a newline before its tail.
+        for br in cell.iter("br"):
+            br.tail = "\n" + (br.tail or "")
 
         # Get text with newlines preserved
-        lyrics_raw = cell.get_text()
+        lyrics_raw = "".join(cell.itertext())
 
         # Split into lines, strip whitespace, filter empty
         lyrics_lines = [line.strip() for line in lyrics_raw.split("\n") if line.strip()]
@@ -13,6 +13,7 @@ import psycopg.rows
 from stream_of_worship.admin.db.models import Recording, Song
 from stream_of_worship.admin.db.schema import RECORDING_COLUMNS_SELECT, SONG_COLUMNS_SELECT
 from stream_of_worship.db.connection import ConnectionProvider
+from stream_of_worship.db.search import SongSearchHit, hybrid_search_songs, search_song_rows
 
 logger = logging.getLogger("sow_app.db")
 
@@ -169,52 +170,74 @@ class ReadOnlyClient:
         return results
 
     def search_songs(
-        self, query: str, field: str = "all", limit: int = 20, include_deleted: bool = False
+        self,
+        query: str,
+        field: str = "all",
+        limit: int = 20,
+        include_deleted: bool = False,
+        offset: int = 0,
     ) -> list[Song]:
-        """Search songs by query.
+        """Search songs by query, best match first.
+
+        Uses the ranked full-text index on ``songs.search_document`` (see
+        ``stream_of_worship.db.search``).
 
         Args:
             query: Search query string.
-            field: Field to search (``title``, ``lyrics``, ``composer``, ``all``).
+            field: Field to search (``title``, ``lyrics``, ``composer``, ``album``, ``all``).
             limit: Maximum number of results.
             include_deleted: Whether to include soft-deleted songs.
+            offset: Number of results to skip, for pagination.
 
         Returns:
             List of matching songs.
         """
-        cursor = self.connection.cursor()
-
-        search_pattern = f"%{query}%"
+        rows = search_song_rows(
+            self.connection,
+            query,
+            field=field,
+            limit=limit,
+            offset=offset,
+            include_deleted=include_deleted,
+        )
+        return [Song.from_row(row) for row in rows]
+
+    def hybrid_search_songs(
+        self,
+        query: str,
+        embed_query: Callable[[str], list[float]],
+        limit: int = 20,
+        offset: int = 0,
+        ef_search: int = 100,
+        include_deleted: bool = False,
+    ) -> list[SongSearchHit]:
+        """Search songs by keywords and lyric meaning, best match first.
 
-        deleted_clause = "" if include_deleted else "deleted_at IS NULL AND "
+        Fuses the full-text ranking with nearest neighbours from
+        ``song_embedding`` and ``song_line_embedding`` (see
+        ``stream_of_worship.db.search.hybrid_search_songs``).
 
-        if field == "title":
-            sql = f"SELECT {SONG_COLUMNS_SELECT} FROM songs WHERE {deleted_clause}(title ILIKE %s OR title_pinyin ILIKE %s)"
-            params = [search_pattern, search_pattern]
-        elif field == "lyrics":
-            sql = (
-                f"SELECT {SONG_COLUMNS_SELECT} FROM songs WHERE {deleted_clause}lyrics_raw ILIKE %s"
-            )
-            params = [search_pattern]
-        elif field == "composer":
-            sql = f"SELECT {SONG_COLUMNS_SELECT} FROM songs WHERE {deleted_clause}(composer ILIKE %s OR lyricist ILIKE %s)"
-            params = [search_pattern, search_pattern]
-        else:  # all
-            sql = f"""
-                SELECT {SONG_COLUMNS_SELECT} FROM songs WHERE {deleted_clause}(
-                title ILIKE %s OR title_pinyin ILIKE %s OR
-                lyrics_raw ILIKE %s OR composer ILIKE %s OR lyricist ILIKE %s)
-            """
-            params = [search_pattern] * 5
-
-        sql += f" ORDER BY title LIMIT {limit}"
-
-        cursor.execute(sql, params)
+        Args:
+            query: Search query, e.g. a half-remembered lyric.
+            embed_query: Returns the query embedding (wrap in
+                ``QueryEmbeddingCache`` to reuse embeddings).
+            limit: Maximum number of results.
+            offset: Number of results to skip, for pagination.
+            ef_search: HNSW candidate list size (recall vs. latency).
+            include_deleted: Whether to include soft-deleted songs.
 
-        results = []
-        for row in cursor.fetchall():
-            results.append(Song.from_row(tuple(row)))
-        return results
+        Returns:
+            Search hits with fusion score and closest lyric line.
+        """
+        return hybrid_search_songs(
+            self.connection,
+            query,
+            embed_query,
+            limit=limit,
+            offset=offset,
+            ef_search=ef_search,
+            include_deleted=include_deleted,
+        )
 
     def list_albums(self) -> list[str]:
         """List all unique album names.
@@ -12,9 +12,11 @@ DDL has exactly one source of truth.
 from stream_of_worship.admin.db.schema import (
     ACTIVE_RECORDINGS_QUERY,
     ACTIVE_SONGS_QUERY,
+    CREATE_CATALOG_SYNC_STATEMENTS,
     CREATE_INDEXES,
     CREATE_RECORDINGS_TABLE,
     CREATE_RECORDINGS_UPDATE_TRIGGER,
+    CREATE_SONG_SEARCH_STATEMENTS,
     CREATE_SONGS_TABLE,
     CREATE_SONGS_UPDATE_TRIGGER,
     CREATE_UPDATE_TIMESTAMP_FUNCTION,
@@ -53,6 +55,8 @@ ALL_SCHEMA_STATEMENTS = [
     CREATE_SONGS_TABLE,
     CREATE_RECORDINGS_TABLE,
     *CREATE_INDEXES,
+    *CREATE_SONG_SEARCH_STATEMENTS,
+    *CREATE_CATALOG_SYNC_STATEMENTS,
     CREATE_UPDATE_TIMESTAMP_FUNCTION,
     CREATE_SONGS_UPDATE_TRIGGER,
     CREATE_RECORDINGS_UPDATE_TRIGGER,
@@ -71,9 +75,11 @@ __all__ = [
     # Re-exports from admin schema
     "ACTIVE_RECORDINGS_QUERY",
     "ACTIVE_SONGS_QUERY",
+    "CREATE_CATALOG_SYNC_STATEMENTS",
     "CREATE_INDEXES",
     "CREATE_RECORDINGS_TABLE",
     "CREATE_RECORDINGS_UPDATE_TRIGGER",
+    "CREATE_SONG_SEARCH_STATEMENTS",
     "CREATE_SONGS_TABLE",
     "CREATE_SONGS_UPDATE_TRIGGER",
     "CREATE_UPDATE_TIMESTAMP_FUNCTION",
@@ -0,0 +1,369 @@
+"""Ranked song search shared by the admin and app database clients.
+
+Songs carry a generated ``search_document`` tsvector (see
+``admin.db.schema.ADD_SONGS_SEARCH_DOCUMENT``) built by ``sow_search_tokens``:
+CJK runs become overlapping bigrams and ASCII words are lowercased. Queries
+are tokenized the same way here, so a CJK substring becomes a phrase query
+over its bigrams and is answered from the GIN index instead of an
+``ILIKE '%q%'`` scan over every column. Fields map to tsvector weights:
+title/pinyin ``A``, composer/lyricist ``B``, album ``C``, lyrics ``D``.
+
+Queries that cannot be expressed over bigrams (a lone CJK character, or only
+punctuation) and databases whose schema predates ``search_document`` fall back
+to the ``ILIKE`` predicates.
+
+``hybrid_search_songs`` adds semantic recall: the query is embedded once,
+nearest neighbours are read from the HNSW indexes on ``song_embedding`` and
+``song_line_embedding``, and the three rankings are merged with reciprocal
+rank fusion.
+"""
+
+import json
+import logging
+import re
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Callable, Optional
+
+import psycopg
+import psycopg.errors
+
+from stream_of_worship.admin.db.models import Song
+from stream_of_worship.admin.db.schema import SONG_COLUMNS_SELECT
+
+logger = logging.getLogger("sow.db.search")
+
+# Must match the character class in admin.db.schema.CREATE_SEARCH_TOKENS_FUNCTION.
+_CJK_CLASS = "[\u3400-\u9fff\uf900-\ufaff]"
+_CJK_RUN = re.compile(f"{_CJK_CLASS}+")
+_ASCII_WORD = re.compile(r"[0-9A-Za-z]+")
+_TOKEN = re.compile(f"{_CJK_CLASS}+|[0-9A-Za-z]+")
+
+SEARCH_FIELD_WEIGHTS = {
+    "title": "A",
+    "composer": "B",
+    "album": "C",
+    "lyrics": "D",
+    "all": "",
+}
+
+_ILIKE_COLUMNS = {
+    "title": ("title", "title_pinyin"),
+    "lyrics": ("lyrics_raw",),
+    "composer": ("composer", "lyricist"),
+    "album": ("album_name", "album_series"),
+}
+_ILIKE_COLUMNS["all"] = tuple(col for cols in _ILIKE_COLUMNS.values() for col in cols)
+
+# Standard RRF damping constant (Cormack et al.); the webapp's rerank uses the same.
+RRF_K = 60
+# pgvector rejects hnsw.ef_search above 1000.
+_MAX_EF_SEARCH = 1000
+
+# ts_rank_cd normalization 1 divides by 1 + log(document length), so a title hit
+# is not outranked by a long lyric sheet that repeats the phrase.
+_RANK_NORMALIZATION = 1
+
+
+def build_search_tsquery(query: str, field: str = "all") -> Optional[str]:
+    """Translate a user query into ``to_tsquery('simple', ...)`` syntax.
+
+    CJK runs become phrase queries over their bigrams (``'奇異' <-> '異恩'``),
+    ASCII words are ANDed, and the final ASCII word matches as a prefix so
+    partially typed pinyin still finds titles.
+
+    Args:
+        query: Raw search string.
+        field: Search field; restricts terms to that field's weight.
+
+    Returns:
+        tsquery text, or ``None`` when the query has nothing the index can
+        answer (empty, punctuation only, or a single-character CJK run).
+    """
+    weight = SEARCH_FIELD_WEIGHTS.get(field, "")
+    tokens = _TOKEN.findall(query)
+    if not tokens:
+        return None
+
+    last_word = max(
+        (i for i, token in enumerate(tokens) if _ASCII_WORD.fullmatch(token)), default=None
+    )
+    weight_label = f":{weight}" if weight else ""
+    parts = []
+    for i, token in enumerate(tokens):
+        if _CJK_RUN.fullmatch(token):
+            if len(token) < 2:
+                return None
+            bigrams = [f"'{token[j:j + 2]}'{weight_label}" for j in range(len(token) - 1)]
+            phrase = " <-> ".join(bigrams)
+            parts.append(f"({phrase})" if len(bigrams) > 1 else phrase)
+        else:
+            suffix = "*" if i == last_word else ""
+            label = f":{suffix}{weight}" if suffix or weight else ""
+            parts.append(f"'{token.lower()}'{label}")
+    return " & ".join(parts)
+
+
+def _ilike_search(
+    conn: psycopg.Connection,
+    query: str,
+    field: str,
+    limit: int,
+    offset: int,
+    deleted_clause: str,
+) -> list[tuple]:
+    columns = _ILIKE_COLUMNS.get(field, _ILIKE_COLUMNS["all"])
+    pattern = "%" + re.sub(r"([\\%_])", r"\\\1", query) + "%"
+    predicate = " OR ".join(f"{col} ILIKE %s" for col in columns)
+    cursor = conn.cursor()
+    cursor.execute(
+        f"SELECT {SONG_COLUMNS_SELECT} FROM songs WHERE {deleted_clause}({predicate}) "
+        "ORDER BY (title ILIKE %s) DESC, title, id LIMIT %s OFFSET %s",
+        [*([pattern] * len(columns)), pattern, limit, offset],
+    )
+    return [tuple(row) for row in cursor.fetchall()]
+
+
+def search_song_rows(
+    conn: psycopg.Connection,
+    query: str,
+    field: str = "all",
+    limit: int = 20,
+    offset: int = 0,
+    include_deleted: bool = False,
+) -> list[tuple]:
+    """Run a ranked song search and return rows in ``SONG_COLUMNS_SELECT`` order.
+
+    Args:
+        conn: Open psycopg connection (autocommit).
+        query: Raw search string.
+        field: ``title``, ``lyrics``, ``composer``, ``album`` or ``all``.
+        limit: Maximum number of rows.
+        offset: Number of rows to skip, for pagination.
+        include_deleted: Whether to include soft-deleted songs.
+
+    Returns:
+        Song rows, best match first.
+    """
+    deleted_clause = "" if include_deleted else "deleted_at IS NULL AND "
+    tsquery = build_search_tsquery(query, field)
+    if tsquery is None:
+        return _ilike_search(conn, query, field, limit, offset, deleted_clause)
+
+    cursor = conn.cursor()
+    try:
+        cursor.execute(
+            f"""
+            SELECT {SONG_COLUMNS_SELECT} FROM songs
+            WHERE {deleted_clause}search_document @@ to_tsquery('simple', %s)
+            ORDER BY ts_rank_cd(search_document, to_tsquery('simple', %s), %s) DESC, id
+            LIMIT %s OFFSET %s
+            """,
+            [tsquery, tsquery, _RANK_NORMALIZATION, limit, offset],
+        )
+    except psycopg.errors.UndefinedColumn:
+        logger.warning(
+            "songs.search_document is missing; run 'sow-admin db init' to enable indexed search"
+        )
+        return _ilike_search(conn, query, field, limit, offset, deleted_clause)
+    return [tuple(row) for row in cursor.fetchall()]
+
+
+@dataclass
+class SongSearchHit:
+    """One fused search result.
+
+    Attributes:
+        song: The matching song.
+        score: Reciprocal rank fusion score (higher is better).
+        matched_line: Closest lyric line by embedding, when one was found.
+    """
+
+    song: Song
+    score: float
+    matched_line: Optional[str] = None
+
+
+class QueryEmbeddingCache:
+    """Thread-safe LRU cache in front of a query embedding function.
+
+    Queries are keyed after trimming and collapsing whitespace, so retyping a
+    search or paging through results never calls the embedding provider twice.
+    """
+
+    def __init__(self, embed: Callable[[str], list[float]], max_entries: int = 256):
+        self._embed = embed
+        self.max_entries = max(1, max_entries)
+        self._entries: OrderedDict[str, list[float]] = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def __call__(self, query: str) -> list[float]:
+        key = " ".join(query.split())
+        with self._lock:
+            if key in self._entries:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return self._entries[key]
+        embedding = self._embed(key)
+        with self._lock:
+            self.misses += 1
+            self._entries[key] = embedding
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+        return embedding
+
+
+def reciprocal_rank_fusion(rankings: list[list[str]], k: int = RRF_K) -> list[tuple[str, float]]:
+    """Merge ranked ID lists: each list contributes ``1 / (k + rank)`` per ID.
+
+    Args:
+        rankings: Ranked lists of IDs, best first. Duplicates within a list
+            count once, at their best rank.
+        k: Damping constant; larger values flatten the weight of top ranks.
+
+    Returns:
+        ``(id, score)`` pairs, best first. Ties keep first-seen order.
+    """
+    scores: dict[str, float] = {}
+    for ranking in rankings:
+        for rank, item_id in enumerate(dict.fromkeys(ranking), start=1):
+            scores[item_id] = scores.get(item_id, 0.0) + 1.0 / (k + rank)
+    return sorted(scores.items(), key=lambda item: item[1], reverse=True)
+
+
+def _nearest_songs(
+    conn: psycopg.Connection,
+    vector: str,
+    k: int,
+    ef_search: int,
+    model_version: Optional[str],
+    include_deleted: bool,
+) -> tuple[list[str], dict[str, str]]:
+    """Top-k songs by song embedding and by best-matching line embedding.
+
+    The ANN scans run in inner queries ordered by distance with a LIMIT, so
+    pgvector answers them from the HNSW indexes; filters apply to the top-k.
+    """
+    model_clause = "WHERE model_version = %s" if model_version else ""
+    model_params = [model_version] if model_version else []
+    deleted_clause = "" if include_deleted else "WHERE s.deleted_at IS NULL"
+
+    with conn.transaction():
+        cursor = conn.cursor()
+        cursor.execute(
+            "SELECT set_config('hnsw.ef_search', %s, true)",
+            [str(min(max(ef_search, k), _MAX_EF_SEARCH))],
+        )
+        cursor.execute(
+            f"""
+            SELECT nn.song_id FROM (
+                SELECT song_id, embedding <=> %s::vector AS distance
+                FROM song_embedding {model_clause}
+                ORDER BY embedding <=> %s::vector
+                LIMIT %s
+            ) nn
+            JOIN songs s ON s.id = nn.song_id
+            {deleted_clause}
+            ORDER BY nn.distance
+            """,
+            [vector, *model_params, vector, k],
+        )
+        song_ranking = [row[0] for row in cursor.fetchall()]
+
+        # Several lines of one song can crowd the top-k, so over-fetch lines.
+        cursor.execute(
+            f"""
+            SELECT nn.song_id, nn.line_text FROM (
+                SELECT song_id, line_text, embedding <=> %s::vector AS distance
+                FROM song_line_embedding {model_clause}
+                ORDER BY embedding <=> %s::vector
+                LIMIT %s
+            ) nn
+            JOIN songs s ON s.id = nn.song_id
+            {deleted_clause}
+            ORDER BY nn.distance
+            """,
+            [vector, *model_params, vector, k * 4],
+        )
+        best_lines: dict[str, str] = {}
+        for song_id, line_text in cursor.fetchall():
+            best_lines.setdefault(song_id, line_text)
+
+    return song_ranking, best_lines
+
+
+def hybrid_search_songs(
+    conn: psycopg.Connection,
+    query: str,
+    embed_query: Callable[[str], list[float]],
+    limit: int = 20,
+    offset: int = 0,
+    ef_search: int = 100,
+    candidates: Optional[int] = None,
+    model_version: Optional[str] = None,
+    include_deleted: bool = False,
+    rrf_k: int = RRF_K,
+) -> list[SongSearchHit]:
+    """Search songs by keywords and meaning, fused with reciprocal rank fusion.
+
+    Args:
+        conn: Open psycopg connection (autocommit).
+        query: Raw search string, e.g. a half-remembered lyric.
+        embed_query: Returns the query embedding; wrap it in
+            ``QueryEmbeddingCache`` to reuse embeddings across calls.
+        limit: Maximum number of hits.
+        offset: Number of fused hits to skip, for pagination.
+        ef_search: HNSW candidate list size; higher trades latency for recall.
+        candidates: Results taken from each ranking before fusion
+            (default ``max(4 * (limit + offset), 40)``).
+        model_version: Only match embeddings from this model, if given.
+        include_deleted: Whether to include soft-deleted songs.
+        rrf_k: Reciprocal rank fusion damping constant.
+
+    Returns:
+        Hits, best first. If embedding or vector lookup fails, the lexical
+        ranking alone is returned.
+    """
+    k = candidates or max(4 * (limit + offset), 40)
+    lexical = [
+        row[0]
+        for row in search_song_rows(conn, query, limit=k, include_deleted=include_deleted)
+    ]
+
+    song_ranking: list[str] = []
+    best_lines: dict[str, str] = {}
+    try:
+        vector = json.dumps(embed_query(query))
+        song_ranking, best_lines = _nearest_songs(
+            conn, vector, k, ef_search, model_version, include_deleted
+        )
+    except (
+        psycopg.errors.UndefinedTable,
+        psycopg.errors.UndefinedObject,
+        psycopg.errors.UndefinedFunction,
+    ) as e:
+        logger.warning(f"Vector search unavailable, using lexical ranking only: {e}")
+    except psycopg.Error:
+        raise
+    except Exception as e:
+        logger.warning(f"Query embedding failed, using lexical ranking only: {e}")
+
+    fused = reciprocal_rank_fusion([lexical, song_ranking, list(best_lines)], k=rrf_k)
+    page = fused[offset : offset + limit]
+    if not page:
+        return []
+
+    cursor = conn.cursor()
+    cursor.execute(
+        f"SELECT {SONG_COLUMNS_SELECT} FROM songs WHERE id = ANY(%s)",
+        [[song_id for song_id, _ in page]],
+    )
+    songs = {song.id: song for song in (Song.from_row(tuple(row)) for row in cursor.fetchall())}
+    return [
+        SongSearchHit(song=songs[song_id], score=score, matched_line=best_lines.get(song_id))
+        for song_id, score in page
+        if song_id in songs
+    ]
@@ -38,6 +38,8 @@ def db_client(make_test_provider):
                 DROP TABLE IF EXISTS songset_items CASCADE;
                 DROP TABLE IF EXISTS songsets CASCADE;
                 DROP TABLE IF EXISTS recordings CASCADE;
+                DROP TABLE IF EXISTS song_source_digest CASCADE;
+                DROP TABLE IF EXISTS catalog_source_state CASCADE;
                 DROP TABLE IF EXISTS songs CASCADE;
                 DROP FUNCTION IF EXISTS update_updated_at_column CASCADE;
             """)
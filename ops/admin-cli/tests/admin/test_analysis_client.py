@@ -50,7 +50,7 @@ class TestAnalysisClientInit:
 class TestHealthCheck:
     """Tests for AnalysisClient.health_check."""
 
-    @patch("stream_of_worship.admin.services.analysis.requests.get")
+    @patch("stream_of_worship.admin.services.analysis.requests.Session.get")
     def test_success(self, mock_get, api_key_env):
         """Returns health data on successful request."""
         mock_response = MagicMock()
@@ -66,7 +66,7 @@ class TestHealthCheck:
             timeout=30,
         )
 
-    @patch("stream_of_worship.admin.services.analysis.requests.get")
+    @patch("stream_of_worship.admin.services.analysis.requests.Session.get")
     def test_connection_error(self, mock_get, api_key_env):
         """Raises AnalysisServiceError on connection failure."""
         mock_get.side_effect = requests.exceptions.ConnectionError("Connection refused")
@@ -79,7 +79,7 @@ class TestHealthCheck:
 class TestSubmitAnalysis:
     """Tests for AnalysisClient.submit_analysis."""
 
-    @patch("stream_of_worship.admin.services.analysis.requests.post")
+    @patch("stream_of_worship.admin.services.analysis.requests.Session.post")
     def test_success(self, mock_post, api_key_env):
         """Returns JobInfo on successful submission."""
         mock_response = MagicMock()
@@ -101,7 +101,7 @@ class TestSubmitAnalysis:
         assert job.status == "queued"
         assert job.job_type == "analysis"
 
-    @patch("stream_of_worship.admin.services.analysis.requests.post")
+    @patch("stream_of_worship.admin.services.analysis.requests.Session.post")
     def test_options_passed_correctly(self, mock_post, api_key_env):
         """Options are passed in request body."""
         mock_response = MagicMock()
@@ -123,7 +123,7 @@ class TestSubmitAnalysis:
         assert payload["options"]["generate_stems"] is False
         assert payload["options"]["force"] is True
 
-    @patch("stream_of_worship.admin.services.analysis.requests.post")
+    @patch("stream_of_worship.admin.services.analysis.requests.Session.post")
     def test_connection_error(self, mock_post, api_key_env):
         """Raises AnalysisServiceError on connection failure."""
         mock_post.side_effect = requests.exceptions.ConnectionError("Connection refused")
@@ -132,7 +132,7 @@ class TestSubmitAnalysis:
         with pytest.raises(AnalysisServiceError, match="Cannot connect"):
             client.submit_analysis("s3://bucket/audio.mp3", "abc123")
 
-    @patch("stream_of_worship.admin.services.analysis.requests.post")
+    @patch("stream_of_worship.admin.services.analysis.requests.Session.post")
     def test_401_unauthorized(self, mock_post, api_key_env):
         """Raises AnalysisServiceError with status_code 401 on auth failure."""
         mock_response = MagicMock()
@@ -146,7 +146,7 @@ class TestSubmitAnalysis:
         assert exc_info.value.status_code == 401
         assert "Authentication failed" in str(exc_info.value)
 
-    @patch("stream_of_worship.admin.services.analysis.requests.post")
+    @patch("stream_of_worship.admin.services.analysis.requests.Session.post")
     def test_500_server_error(self, mock_post, api_key_env):
         """Raises AnalysisServiceError on server error."""
         mock_response = MagicMock()
@@ -164,7 +164,7 @@ class TestSubmitAnalysis:
 class TestSubmitFastAnalysis:
     """Tests for AnalysisClient.submit_fast_analysis."""
 
-    @patch("stream_of_worship.admin.services.analysis.requests.post")
+    @patch("stream_of_worship.admin.services.analysis.requests.Session.post")
     def test_payload_includes_start_bpm(self, mock_post, api_key_env):
         """Verify start_bpm is included in the API payload."""
         mock_response = MagicMock()
@@ -188,7 +188,7 @@ class TestSubmitFastAnalysis:
         assert payload["options"]["start_bpm"] == 80.0
         assert payload["options"]["hop_length"] == 512
 
-    @patch("stream_of_worship.admin.services.analysis.requests.post")
+    @patch("stream_of_worship.admin.services.analysis.requests.Session.post")
     def test_custom_start_bpm_passed_through(self, mock_post, api_key_env):
         """Verify custom start_bpm overrides the default."""
         mock_response = MagicMock()
@@ -211,7 +211,7 @@ class TestSubmitFastAnalysis:
         payload = call_args.kwargs["json"]
         assert payload["options"]["start_bpm"] == 120.0
 
-    @patch("stream_of_worship.admin.services.analysis.requests.post")
+    @patch("stream_of_worship.admin.services.analysis.requests.Session.post")
     def test_connection_error(self, mock_post, api_key_env):
         """Raises AnalysisServiceError on connection failure."""
         mock_post.side_effect = requests.exceptions.ConnectionError("Connection refused")
@@ -220,7 +220,7 @@ class TestSubmitFastAnalysis:
         with pytest.raises(AnalysisServiceError, match="Cannot connect"):
             client.submit_fast_analysis("s3://bucket/audio.mp3", "abc123")
 
-    @patch("stream_of_worship.admin.services.analysis.requests.post")
+    @patch("stream_of_worship.admin.services.analysis.requests.Session.post")
     def test_401_unauthorized(self, mock_post, api_key_env):
         """Raises AnalysisServiceError with status_code 401 on auth failure."""
         mock_response = MagicMock()
@@ -235,10 +235,96 @@ class TestSubmitFastAnalysis:
         assert "Authentication failed" in str(exc_info.value)
 
 
+class TestSubmitFastAnalysisBatch:
+    """Tests for AnalysisClient.submit_fast_analysis_batch."""
+
+    @patch("stream_of_worship.admin.services.analysis.requests.Session.post")
+    def test_one_job_per_song_in_order(self, mock_post, api_key_env):
+        """Each song gets a full fast-analysis payload; jobs come back in order."""
+        mock_response = MagicMock()
+        mock_response.status_code = 200
+        mock_response.json.return_value = {
+            "jobs": [
+                {"job_id": "job-1", "status": "queued", "job_type": "fast_analyze"},
+                {"job_id": "job-2", "status": "completed", "job_type": "fast_analyze"},
+            ]
+        }
+        mock_post.return_value = mock_response
+
+        client = AnalysisClient("http://localhost:8000")
+        jobs = client.submit_fast_analysis_batch(
+            [
+                {"audio_url": "s3://bucket/a.mp3", "content_hash": "aaa"},
+                {
+                    "audio_url": "s3://bucket/b.mp3",
+                    "content_hash": "bbb",
+                    "lrc_content": "[00:00.00]x",
+                },
+            ],
+            force=True,
+        )
+
+        assert [job.job_id for job in jobs] == ["job-1", "job-2"]
+        assert mock_post.call_args.args[0].endswith("/api/v1/jobs/fast-analyze/batch")
+        songs = mock_post.call_args.kwargs["json"]["songs"]
+        assert [song["content_hash"] for song in songs] == ["aaa", "bbb"]
+        assert songs[0]["options"]["force"] is True
+        assert songs[0]["options"]["start_bpm"] == 80.0
+        assert "lrc_content" not in songs[0]["options"]
+        assert songs[1]["options"]["lrc_content"] == "[00:00.00]x"
+
+    @patch("stream_of_worship.admin.services.analysis.requests.Session.post")
+    def test_connection_error(self, mock_post, api_key_env):
+        """Raises AnalysisServiceError on connection failure."""
+        mock_post.side_effect = requests.exceptions.ConnectionError("Connection refused")
+
+        client = AnalysisClient("http://localhost:8000")
+        with pytest.raises(AnalysisServiceError, match="Cannot connect"):
+            client.submit_fast_analysis_batch(
+                [{"audio_url": "s3://bucket/a.mp3", "content_hash": "aaa"}]
+            )
+
+
+class TestEmbedQuery:
+    """Tests for AnalysisClient.embed_query."""
+
+    @patch("stream_of_worship.admin.services.analysis.requests.Session.post")
+    def test_returns_embedding(self, mock_post, api_key_env):
+        """Posts the query text and returns the vector."""
+        mock_response = MagicMock()
+        mock_response.status_code = 200
+        mock_response.json.return_value = {
+            "embedding": [0.1, 0.2],
+            "model_version": "text-embedding-3-small",
+        }
+        mock_post.return_value = mock_response
+
+        client = AnalysisClient("http://localhost:8000")
+
+        assert client.embed_query("奇異恩典") == [0.1, 0.2]
+        assert mock_post.call_args.args[0].endswith("/api/v1/embeddings/query")
+        assert mock_post.call_args.kwargs["json"] == {"text": "奇異恩典"}
+
+    @patch("stream_of_worship.admin.services.analysis.requests.Session.post")
+    def test_unconfigured_service(self, mock_post, api_key_env):
+        """A 503 from the service surfaces as AnalysisServiceError with the status."""
+        mock_response = MagicMock()
+        mock_response.status_code = 503
+        mock_response.raise_for_status.side_effect = requests.exceptions.HTTPError(
+            response=mock_response
+        )
+        mock_post.return_value = mock_response
+
+        client = AnalysisClient("http://localhost:8000")
+        with pytest.raises(AnalysisServiceError) as exc_info:
+            client.embed_query("奇異恩典")
+        assert exc_info.value.status_code == 503
+
+
 class TestGetJob:
     """Tests for AnalysisClient.get_job."""
 
-    @patch("stream_of_worship.admin.services.analysis.requests.get")
+    @patch("stream_of_worship.admin.services.analysis.requests.Session.get")
     def test_queued_job(self, mock_get, api_key_env):
         """Returns JobInfo for queued job."""
         mock_response = MagicMock()
@@ -256,7 +342,7 @@ class TestGetJob:
         assert job.job_id == "job-123"
         assert job.status == "queued"
 
-    @patch("stream_of_worship.admin.services.analysis.requests.get")
+    @patch("stream_of_worship.admin.services.analysis.requests.Session.get")
     def test_completed_job_with_result(self, mock_get, api_key_env):
         """Returns JobInfo with AnalysisResult for completed job."""
         mock_response = MagicMock()
@@ -284,7 +370,7 @@ class TestGetJob:
         assert job.result.musical_key == "G"
         assert job.result.stems_url == "s3://bucket/stems/"
 
-    @patch("stream_of_worship.admin.services.analysis.requests.get")
+    @patch("stream_of_worship.admin.services.analysis.requests.Session.get")
     def test_failed_job(self, mock_get, api_key_env):
         """Returns JobInfo with error_message for failed job."""
         mock_response = MagicMock()
@@ -302,7 +388,7 @@ class TestGetJob:
         assert job.status == "failed"
         assert job.error_message == "Analysis failed: out of memory"
 
-    @patch("stream_of_worship.admin.services.analysis.requests.get")
+    @patch("stream_of_worship.admin.services.analysis.requests.Session.get")
     def test_404_not_found(self, mock_get, api_key_env):
         """Raises AnalysisServiceError with status_code 404."""
         mock_response = MagicMock()
@@ -316,7 +402,7 @@ class TestGetJob:
         assert exc_info.value.status_code == 404
         assert "Job not found" in str(exc_info.value)
 
-    @patch("stream_of_worship.admin.services.analysis.requests.get")
+    @patch("stream_of_worship.admin.services.analysis.requests.Session.get")
     def test_401_unauthorized(self, mock_get, api_key_env):
         """Raises AnalysisServiceError with status_code 401."""
         mock_response = MagicMock()
@@ -330,6 +416,100 @@ class TestGetJob:
         assert exc_info.value.status_code == 401
 
 
+class TestGetJobs:
+    """Tests for AnalysisClient.get_jobs (bulk status)."""
+
+    @patch("stream_of_worship.admin.services.analysis.requests.Session.post")
+    def test_returns_jobs_by_id(self, mock_post, api_key_env):
+        """One POST returns every known job keyed by ID."""
+        mock_response = MagicMock()
+        mock_response.status_code = 200
+        mock_response.json.return_value = {
+            "jobs": [
+                {"job_id": "job-1", "status": "completed", "job_type": "fast_analyze"},
+                {"job_id": "job-2", "status": "processing", "job_type": "lrc"},
+            ],
+            "missing": ["job-3"],
+        }
+        mock_post.return_value = mock_response
+
+        client = AnalysisClient("http://localhost:8000")
+        jobs = client.get_jobs(["job-1", "job-2", "job-3"])
+
+        assert set(jobs) == {"job-1", "job-2"}
+        assert jobs["job-2"].status == "processing"
+        assert mock_post.call_args.args[0].endswith("/api/v1/jobs/status")
+        assert mock_post.call_args.kwargs["json"] == {"job_ids": ["job-1", "job-2", "job-3"]}
+
+    @patch("stream_of_worship.admin.services.analysis.requests.Session.post")
+    def test_old_service_raises_405_once(self, mock_post, api_key_env):
+        """A service without the endpoint is remembered; later calls skip HTTP."""
+        mock_response = MagicMock()
+        mock_response.status_code = 405
+        mock_post.return_value = mock_response
+
+        client = AnalysisClient("http://localhost:8000")
+        for _ in range(2):
+            with pytest.raises(AnalysisServiceError) as exc_info:
+                client.get_jobs(["job-1"])
+            assert exc_info.value.status_code == 405
+
+        assert mock_post.call_count == 1
+
+
+def _stream_response(lines, status_code=200):
+    response = MagicMock()
+    response.status_code = status_code
+    response.iter_lines.return_value = iter(lines)
+    response.__enter__.return_value = response
+    return response
+
+
+class TestWaitForJobChanges:
+    """Tests for AnalysisClient.wait_for_job_changes (SSE stream)."""
+
+    @patch("stream_of_worship.admin.services.analysis.time.sleep")
+    @patch("stream_of_worship.admin.services.analysis.requests.Session.post")
+    def test_returns_first_streamed_change(self, mock_post, mock_sleep, api_key_env):
+        """Wakes on the first job event without sleeping out the timeout."""
+        job = '{"job_id": "job-1", "status": "completed", "job_type": "lrc"}'
+        mock_post.return_value = _stream_response(
+            [": keep-alive", "", "event: job", f"data: {job}", ""]
+        )
+
+        client = AnalysisClient("http://localhost:8000")
+        changed = client.wait_for_job_changes(["job-1", "job-2"], timeout=30.0)
+
+        assert changed["job-1"].status == "completed"
+        mock_sleep.assert_not_called()
+        kwargs = mock_post.call_args.kwargs
+        assert kwargs["stream"] is True
+        assert kwargs["json"] == {"job_ids": ["job-1", "job-2"], "include_initial": False}
+
+    @patch("stream_of_worship.admin.services.analysis.time.sleep")
+    @patch("stream_of_worship.admin.services.analysis.requests.Session.post")
+    def test_old_service_falls_back_to_sleep(self, mock_post, mock_sleep, api_key_env):
+        """Without the stream endpoint the call sleeps, and stops trying the stream."""
+        mock_post.return_value = _stream_response([], status_code=405)
+
+        client = AnalysisClient("http://localhost:8000")
+        assert client.wait_for_job_changes(["job-1"], timeout=5.0) == {}
+        assert client.wait_for_job_changes(["job-1"], timeout=5.0) == {}
+
+        assert mock_post.call_count == 1
+        assert mock_sleep.call_count == 2
+
+    @patch("stream_of_worship.admin.services.analysis.time.sleep")
+    @patch("stream_of_worship.admin.services.analysis.requests.Session.post")
+    def test_connection_error_does_not_raise(self, mock_post, mock_sleep, api_key_env):
+        """Stream failures degrade to sleeping out the timeout."""
+        mock_post.side_effect = requests.exceptions.ConnectionError("refused")
+
+        client = AnalysisClient("http://localhost:8000")
+        assert client.wait_for_job_changes(["job-1"], timeout=5.0) == {}
+        mock_sleep.assert_called_once()
+
+
 class TestWaitForCompletion:
     """Tests for AnalysisClient.wait_for_completion."""
 
@@ -62,6 +62,10 @@ def stubs(tmp_path):
     """Return a bundle of mocks and patches for exercising _process_batch."""
     db_client = MagicMock()
     analysis_client = MagicMock()
+    # Bulk status mirrors the per-job get_job() stub
+    analysis_client.get_jobs.side_effect = lambda ids: {
+        job_id: analysis_client.get_job(job_id) for job_id in ids
+    }
     r2_client = MagicMock()
 
     # R2 never has a preexisting LRC by default; but _confirm_r2_lrc finds one
@@ -144,6 +144,10 @@ class TestAdvanceSong:
         db_client.get_song.return_value = _make_song(song_id)
 
         analysis_client = MagicMock()
+        # Bulk status mirrors the per-job get_job() stub
+        analysis_client.get_jobs.side_effect = lambda ids: {
+            job_id: analysis_client.get_job(job_id) for job_id in ids
+        }
         analysis_client.submit_fast_analysis.return_value = JobInfo(
             job_id="ana-job-1", status="queued", job_type="fast_analyze"
         )
@@ -174,6 +178,10 @@ class TestAdvanceSong:
         db_client.get_embedding_content_hash.return_value = None
 
         analysis_client = MagicMock()
+        # Bulk status mirrors the per-job get_job() stub
+        analysis_client.get_jobs.side_effect = lambda ids: {
+            job_id: analysis_client.get_job(job_id) for job_id in ids
+        }
         analysis_client.submit_embedding.return_value = JobInfo(
             job_id="emb-job-1", status="queued", job_type="embedding"
         )
@@ -412,6 +420,10 @@ class TestSubmitAnalysisForSong:
         db_client = MagicMock()
         db_client.get_recording_by_song_id.return_value = _make_recording(song_id)
         analysis_client = MagicMock()
+        # Bulk status mirrors the per-job get_job() stub
+        analysis_client.get_jobs.side_effect = lambda ids: {
+            job_id: analysis_client.get_job(job_id) for job_id in ids
+        }
         analysis_client.submit_fast_analysis.return_value = JobInfo(
             job_id="ana-1", status="queued", job_type="fast_analyze"
         )
@@ -475,6 +487,10 @@ class TestSubmitEmbeddingForSong:
         db_client.get_recording_by_song_id.return_value = _make_recording(song_id)
         db_client.get_embedding_content_hash.return_value = None
         analysis_client = MagicMock()
+        # Bulk status mirrors the per-job get_job() stub
+        analysis_client.get_jobs.side_effect = lambda ids: {
+            job_id: analysis_client.get_job(job_id) for job_id in ids
+        }
         analysis_client.submit_embedding.return_value = JobInfo(
             job_id="emb-1", status="queued", job_type="embedding"
         )
@@ -542,6 +558,10 @@ class TestPollOneCycle:
         db_client.get_song.return_value = _make_song(song_id)
 
         analysis_client = MagicMock()
+        # Bulk status mirrors the per-job get_job() stub
+        analysis_client.get_jobs.side_effect = lambda ids: {
+            job_id: analysis_client.get_job(job_id) for job_id in ids
+        }
         analysis_client.get_job.return_value = _completed_lrc_job()
         # When advance submits analysis:
         analysis_client.submit_fast_analysis.return_value = JobInfo(
@@ -589,6 +609,10 @@ class TestPollOneCycle:
         db_client.get_embedding_content_hash.return_value = None
 
         analysis_client = MagicMock()
+        # Bulk status mirrors the per-job get_job() stub
+        analysis_client.get_jobs.side_effect = lambda ids: {
+            job_id: analysis_client.get_job(job_id) for job_id in ids
+        }
         # Song A's analysis is completed, Song B's is still processing
         def _get_job(job_id):
             if job_id == "ana-a":
@@ -636,6 +660,46 @@ class TestPollOneCycle:
         assert (song_b, "analyze") in active_jobs
         assert (song_b, "embedding") not in active_jobs
 
+    def test_bulk_status_and_stream_wait(self):
+        """Idle cycles wait on the job stream, then fetch every job in one request."""
+        song_a, song_b = "sA", "sB"
+        db_client = MagicMock()
+        analysis_client = MagicMock()
+        analysis_client.get_jobs.return_value = {
+            "ana-a": JobInfo(job_id="ana-a", status="processing", job_type="fast_analyze"),
+        }
+        # Missing from the bulk response: polled individually (e.g. to surface a 404)
+        analysis_client.get_job.return_value = JobInfo(
+            job_id="ana-b", status="processing", job_type="fast_analyze"
+        )
+        active_jobs = {(song_a, "analyze"): "ana-a", (song_b, "analyze"): "ana-b"}
+
+        _poll_one_cycle(
+            pending_futures=set(),
+            active_jobs=active_jobs,
+            results={song_a: {}, song_b: {}},
+            db_client=db_client,
+            analysis_client=analysis_client,
+            r2_client=MagicMock(),
+            selected_steps=["analyze"],
+            force=False,
+            analysis_tier="fast",
+            stale_after_minutes=120,
+            console=Console(quiet=True),
+            _add_manifest_entry=_noop_manifest_entry,
+            results_lock=__import__("threading").Lock(),
+            lrc_attempted=set(),
+            resubmit_counts={},
+            last_completion_time=time.time(),
+            batch_start_time=time.time(),
+        )
+
+        analysis_client.wait_for_job_changes.assert_called_once()
+        assert analysis_client.wait_for_job_changes.call_args.args[0] == ["ana-a", "ana-b"]
+        analysis_client.get_jobs.assert_called_once_with(["ana-a", "ana-b"])
+        analysis_client.get_job.assert_called_once_with("ana-b")
+        assert set(active_jobs) == {(song_a, "analyze"), (song_b, "analyze")}
+
 
 # ---------------------------------------------------------------------------
 # Unified resume
@@ -687,6 +751,10 @@ class TestUnifiedResume:
         db_client.get_song.return_value = _make_song("s1")
 
         analysis_client = MagicMock()
+        # Bulk status mirrors the per-job get_job() stub
+        analysis_client.get_jobs.side_effect = lambda ids: {
+            job_id: analysis_client.get_job(job_id) for job_id in ids
+        }
         # All jobs return completed so the loop terminates
         analysis_client.get_job.return_value = _completed_lrc_job()
         r2_client = MagicMock()
@@ -713,3 +781,54 @@ class TestUnifiedResume:
         # Results should have entries for s1 and s2
         assert "s1" in results
         assert "s2" in results
+
+
+# ---------------------------------------------------------------------------
+# _write_embedding_results_bulk / embed --wait
+# ---------------------------------------------------------------------------
+
+class TestEmbeddingWrites:
+    def test_bulk_failure_falls_back_to_per_song_writes(self):
+        db_client = MagicMock()
+        db_client.bulk_upsert_embeddings.side_effect = RuntimeError("dimension mismatch")
+        db_client.upsert_song_embedding.side_effect = [None, RuntimeError("bad row")]
+        jobs = [_completed_embedding_job("emb-1"), _completed_embedding_job("emb-2")]
+
+        written = audio._write_embedding_results_bulk(jobs, db_client, Console(quiet=True))
+
+        assert written == 1
+        assert db_client.upsert_song_embedding.call_count == 2
+
+    def test_wait_flushes_in_batches(self, monkeypatch):
+        monkeypatch.setattr(audio, "EMBED_WRITE_BATCH_SIZE", 2)
+        db_client = MagicMock()
+        db_client.get_all_songs_with_lyrics.return_value = [
+            _make_song(f"s{i}") for i in range(5)
+        ]
+        analysis_client = MagicMock()
+        analysis_client.wait_for_completion.side_effect = (
+            lambda job_id, **kwargs: _completed_embedding_job(job_id)
+        )
+
+        with (
+            patch.object(audio.AdminConfig, "load"),
+            patch.object(audio, "get_db_client", return_value=db_client),
+            patch(
+                "stream_of_worship.admin.services.analysis.AnalysisClient",
+                return_value=analysis_client,
+            ),
+            patch.object(
+                audio,
+                "_submit_embedding_single",
+                side_effect=lambda song, *args, **kwargs: f"emb-{song.id}",
+            ),
+        ):
+            audio.embed_songs(
+                song_id=None, all_songs=True, force=True, wait=True,
+                defer_index=False, config_path=None,
+            )
+
+        batch_sizes = [
+            len(call.args[0]) for call in db_client.bulk_upsert_embeddings.call_args_list
+        ]
+        assert batch_sizes == [2, 2, 1]
@@ -45,6 +45,8 @@ def _drop_all_tables(make_test_provider):
                 DROP TABLE IF EXISTS songset_items CASCADE;
                 DROP TABLE IF EXISTS songsets CASCADE;
                 DROP TABLE IF EXISTS recordings CASCADE;
+                DROP TABLE IF EXISTS song_source_digest CASCADE;
+                DROP TABLE IF EXISTS catalog_source_state CASCADE;
                 DROP TABLE IF EXISTS songs CASCADE;
                 DROP TABLE IF EXISTS "session" CASCADE;
                 DROP TABLE IF EXISTS "account" CASCADE;
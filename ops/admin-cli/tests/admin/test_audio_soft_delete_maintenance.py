@@ -193,6 +193,15 @@ class FakeMaintenanceDb:
     def recording_row_exists(self, hash_prefix: str):
         return hash_prefix == "def123abc456"
 
+    def get_recording_prefix_references(self, hash_prefixes: list[str]):
+        return {
+            prefix: (
+                self.recording_row_exists(prefix),
+                self.count_recording_songset_references(prefix),
+            )
+            for prefix in hash_prefixes
+        }
+
     def count_recording_songset_references(self, hash_prefix: str):
         return 0
 
@@ -471,6 +480,40 @@ def test_maintenance_purge_r2_waste_confirm_deletes_oldest_first():
     assert deleted_order == ["old_prefix", "mid_prefix", "new_prefix", "null_prefix"]
 
 
+def test_maintenance_purge_r2_waste_rechecks_each_prefix_before_delete():
+    """A recording imported mid-purge blocks the delete of its prefix."""
+    db = FakeMaintenanceDb()
+    r2 = MagicMock()
+    r2.scan_recording_prefixes.return_value = _make_purge_orphan_prefixes()
+    imported: set[str] = set()
+
+    def _delete_and_import(prefix):
+        # While the oldest prefix is being deleted, mid_prefix gets a DB row
+        imported.add("mid_prefix")
+        return SimpleNamespace(object_count=1)
+
+    r2.delete_prefix.side_effect = _delete_and_import
+    db.recording_row_exists = lambda prefix: prefix in imported
+
+    with (
+        patch(
+            "stream_of_worship.admin.commands.maintenance.AdminConfig.load",
+            return_value=AdminConfig(),
+        ),
+        patch("stream_of_worship.admin.commands.maintenance.get_db_client", return_value=db),
+        patch("stream_of_worship.admin.commands.maintenance.R2Client", return_value=r2),
+    ):
+        result = runner.invoke(
+            app,
+            ["maintenance", "purge-r2-waste", "--all", "--confirm", "--format", "json"],
+        )
+
+    assert result.exit_code == 0
+    deleted = [c.args[0] for c in r2.delete_prefix.call_args_list]
+    assert deleted == ["old_prefix", "new_prefix", "null_prefix"]
+    assert "recording-row-exists" in result.output
+
+
 def test_maintenance_purge_r2_waste_stems_only_prefix_deletes_stems_not_prefix():
     db = FakeMaintenanceDb()
     r2 = MagicMock()
@@ -697,8 +740,11 @@ def test_repair_manifest_no_selector_returns_before_querying_db():
 
 def test_orphan_r2_prefixes_filters_db_rows():
     db = MagicMock()
-    db.recording_row_exists.side_effect = lambda prefix: prefix == "aaaaaaaaaaaa"
-    db.count_recording_songset_references.return_value = 0
+    db.get_recording_prefix_references.return_value = {
+        "aaaaaaaaaaaa": (True, 0),
+        "bbbbbbbbbbbb": (False, 2),
+        "cccccccccccc": (False, 0),
+    }
     r2 = MagicMock()
     r2.scan_recording_prefixes.return_value = [
         SimpleNamespace(prefix="aaaaaaaaaaaa", object_count=1, total_bytes=10, last_modified=None),
@@ -709,7 +755,11 @@ def test_orphan_r2_prefixes_filters_db_rows():
     rows = _orphan_r2_prefixes(db, r2, [])
 
     assert [row["prefix"] for row in rows] == ["bbbbbbbbbbbb", "cccccccccccc"]
+    assert [row["songset_reference_count"] for row in rows] == [2, 0]
     r2.scan_recording_prefixes.assert_called_once_with(blacklist=[])
+    db.get_recording_prefix_references.assert_called_once_with(
+        ["aaaaaaaaaaaa", "bbbbbbbbbbbb", "cccccccccccc"]
+    )
 
 
 class FakeCursor:
@@ -29,6 +29,8 @@ def admin_client(make_test_provider):
                 DROP TABLE IF EXISTS songset_items CASCADE;
                 DROP TABLE IF EXISTS songsets CASCADE;
                 DROP TABLE IF EXISTS recordings CASCADE;
+                DROP TABLE IF EXISTS song_source_digest CASCADE;
+                DROP TABLE IF EXISTS catalog_source_state CASCADE;
                 DROP TABLE IF EXISTS songs CASCADE;
                 DROP FUNCTION IF EXISTS update_updated_at_column CASCADE;
             """)
@@ -433,6 +435,57 @@ class TestDatabaseClientIntegration:
         assert recording is not None
         assert recording.visibility_status == "hold"
 
+    def test_get_recording_prefix_references(self, admin_client):
+        admin_client.insert_song(
+            Song(
+                id="song_1",
+                title="Test Song",
+                source_url="https://example.com/source",
+                scraped_at="2024-01-01T00:00:00",
+            )
+        )
+        admin_client.insert_recording(
+            Recording(
+                content_hash="a" * 64,
+                hash_prefix="aaaaaaaaaaaa",
+                song_id="song_1",
+                original_filename="test.mp3",
+                file_size_bytes=1000,
+                imported_at="2024-01-01T00:00:00",
+            )
+        )
+        with admin_client.connection.cursor() as cur:
+            cur.execute(
+                'INSERT INTO "user" ("name", "email", "emailVerified", "createdAt", "updatedAt") '
+                "VALUES (%s, %s, %s, NOW(), NOW()) RETURNING id",
+                ("Test User", "test@example.com", False),
+            )
+            user_id = cur.fetchone()[0]
+            cur.execute(
+                "INSERT INTO songsets (id, user_id, name, created_at, updated_at) "
+                "VALUES (%s, %s, %s, NOW(), NOW())",
+                ("songset_1", user_id, "Set 1"),
+            )
+            for i, prefix in enumerate(["aaaaaaaaaaaa", "bbbbbbbbbbbb", "bbbbbbbbbbbb"]):
+                cur.execute(
+                    "INSERT INTO songset_items "
+                    "(id, songset_id, song_id, recording_hash_prefix, position, created_at) "
+                    "VALUES (%s, %s, %s, %s, %s, NOW())",
+                    (f"item_{i}", "songset_1", "song_1", prefix, i),
+                )
+            admin_client.connection.commit()
+
+        references = admin_client.get_recording_prefix_references(
+            ["aaaaaaaaaaaa", "bbbbbbbbbbbb", "cccccccccccc", "cccccccccccc"]
+        )
+
+        assert references == {
+            "aaaaaaaaaaaa": (True, 1),
+            "bbbbbbbbbbbb": (False, 2),
+            "cccccccccccc": (False, 0),
+        }
+        assert admin_client.get_recording_prefix_references([]) == {}
+
     def test_delete_and_restore_recording(self, admin_client):
         """Test soft-deleting and restoring a recording."""
         from stream_of_worship.db.app.read_client import ReadOnlyClient
@@ -47,8 +47,8 @@ class TestComputeFileHash:
         assert compute_file_hash(file_a) != compute_file_hash(file_b)
 
     def test_multi_chunk_file(self, tmp_path):
-        """Hash is correct for files larger than the 8 KiB read buffer."""
-        content = b"x" * (8192 * 3 + 100)  # spans multiple chunks
+        """Hash is correct for files larger than the read buffer."""
+        content = b"x" * (2**18 * 3 + 100)  # spans multiple file_digest reads
         file_path = tmp_path / "large.bin"
         file_path.write_bytes(content)
 
@@ -147,31 +147,40 @@ class TestPrefixMaintenance:
     def test_scan_recording_prefixes_filters_non_hash_and_blacklist(self, mock_boto_client, r2_env):
         mock_s3 = MagicMock()
         paginator = MagicMock()
-        paginator.paginate.return_value = [
+        objects = [
             {
-                "Contents": [
-                    {
-                        "Key": "abc123def456/audio.mp3",
-                        "Size": 100,
-                        "LastModified": datetime(2024, 1, 1),
-                    },
-                    {
-                        "Key": "renders/abc123def456/output.mp4",
-                        "Size": 999,
-                        "LastModified": datetime(2024, 1, 2),
-                    },
-                    {
-                        "Key": "not-a-hash/file.txt",
-                        "Size": 50,
-                        "LastModified": datetime(2024, 1, 3),
-                    },
-                    {
-                        "Key": "def123abc456/audio.mp3",
-                        "Size": 200,
-                        "LastModified": datetime(2024, 1, 4),
-                    },
-                ]
-            }
+                "Key": "abc123def456/audio.mp3",
+                "Size": 100,
+                "LastModified": datetime(2024, 1, 1),
+            },
+            {
+                "Key": "abc123def456/stems/bass.wav",
+                "Size": 50,
+                "LastModified": datetime(2024, 1, 5),
+            },
+            {
+                "Key": "renders/abc123def456/output.mp4",
+                "Size": 999,
+                "LastModified": datetime(2024, 1, 2),
+            },
+            {
+                "Key": "not-a-hash/file.txt",
+                "Size": 50,
+                "LastModified": datetime(2024, 1, 3),
+            },
+            {
+                "Key": "def123abc456/audio.mp3",
+                "Size": 200,
+                "LastModified": datetime(2024, 1, 4),
+            },
+            {
+                "Key": "dead00beef00/audio.mp3",
+                "Size": 300,
+                "LastModified": datetime(2024, 1, 6),
+            },
+        ]
+        paginator.paginate.side_effect = lambda Bucket, Prefix, PaginationConfig: [
+            {"Contents": [obj for obj in objects if obj["Key"].startswith(Prefix)]}
         ]
         mock_s3.get_paginator.return_value = paginator
         mock_boto_client.return_value = mock_s3
@@ -179,11 +188,15 @@ class TestPrefixMaintenance:
         client = R2Client(bucket="sow-audio", endpoint_url="https://r2.example.com")
         summaries = client.scan_recording_prefixes(blacklist=["renders/"])
 
-        assert [summary.prefix for summary in summaries] == ["abc123def456", "def123abc456"]
-        assert [summary.total_bytes for summary in summaries] == [100, 200]
-        paginator.paginate.assert_called_once_with(
-            Bucket="sow-audio",
-            PaginationConfig={"PageSize": 1000},
+        assert [summary.prefix for summary in summaries] == [
+            "abc123def456",
+            "dead00beef00",
+            "def123abc456",
+        ]
+        assert [summary.total_bytes for summary in summaries] == [150, 300, 200]
+        assert summaries[0].object_count == 2
+        assert sorted(c.kwargs["Prefix"] for c in paginator.paginate.call_args_list) == list(
+            "0123456789abcdef"
         )
 
     def test_missing_secret_key_raises(self, monkeypatch):
@@ -11,12 +11,15 @@ import pytest
 
 from stream_of_worship.admin.services.r2_backup import (
     DEFAULT_CHUNK_SIZE_BYTES,
+    INCREMENTAL_MANIFEST_VERSION,
     MANIFEST_VERSION,
     MIN_CHUNK_SIZE_BYTES,
+    AdaptiveThrottle,
     BackupError,
     BackupProgress,
     BackupTracer,
     HashingReader,
+    ReorderBuffer,
     RestoreError,
     build_inventory,
     load_manifest,
@@ -910,17 +913,17 @@ class TestConcurrentBackup:
         inventory = build_inventory(r2)
         output = tmp_path / "backup"
 
-        with pytest.raises(BackupError, match="concurrency must be 1-5"):
+        with pytest.raises(BackupError, match="concurrency must be 1-32"):
             write_backup(r2, output, inventory, concurrency=0)
 
-    def test_concurrency_validation_rejects_6(self, tmp_path):
-        """write_backup raises BackupError for concurrency=6."""
+    def test_concurrency_validation_rejects_33(self, tmp_path):
+        """write_backup raises BackupError for concurrency=33."""
         r2 = _make_r2_mock([])
         inventory = build_inventory(r2)
         output = tmp_path / "backup"
 
-        with pytest.raises(BackupError, match="concurrency must be 1-5"):
-            write_backup(r2, output, inventory, concurrency=6)
+        with pytest.raises(BackupError, match="concurrency must be 1-32"):
+            write_backup(r2, output, inventory, concurrency=33)
 
 
 # ---------------------------------------------------------------------------
@@ -1883,3 +1886,242 @@ class TestRangeGetDiagnostic:
         assert len(result["per_range_mbps"]) == 4
         for m in result["per_range_mbps"]:
             assert m == pytest.approx(10.0, rel=0.01)
+
+
+# ---------------------------------------------------------------------------
+# Incremental backup tests
+# ---------------------------------------------------------------------------
+
+
+def _obj(key: str, data: bytes, last_modified: str = "2026-01-01T00:00:00+00:00") -> dict:
+    return {"key": key, "size": len(data), "data": data, "last_modified": last_modified}
+
+
+def _write_increment(tmp_path, name: str, objects: list[dict], base_dir: Path):
+    r2 = _make_r2_mock(objects)
+    result = write_backup(r2, tmp_path / name, build_inventory(r2), base_dir=base_dir)
+    return r2, result
+
+
+class TestIncrementalBackup:
+    def test_only_changed_and_new_objects_are_downloaded(self, tmp_path):
+        base = _create_valid_backup(tmp_path, [_obj("a", b"alpha"), _obj("b", b"beta")])
+
+        r2, result = _write_increment(
+            tmp_path,
+            "inc1",
+            [_obj("a", b"alpha"), _obj("b", b"beta2", "2026-02-01T00:00:00+00:00"),
+             _obj("c", b"gamma")],
+            base,
+        )
+
+        fetched = sorted(c.args[0] for c in r2.get_object_stream.call_args_list)
+        assert fetched == ["b", "c"]
+        assert result.reused_object_count == 1
+        assert result.downloaded_bytes == len(b"beta2") + len(b"gamma")
+        manifest = result.manifest
+        assert manifest["version"] == INCREMENTAL_MANIFEST_VERSION
+        assert manifest["incremental"]["base_dir"] == "../backup"
+        by_key = {o["key"]: o for o in manifest["objects"]}
+        assert by_key["a"]["archive"] == "../backup"
+        assert "archive" not in by_key["b"]
+        assert manifest["object_count"] == 3
+        assert verify_archive(tmp_path / "inc1").ok
+
+    def test_identical_content_is_stored_once(self, tmp_path):
+        base = _create_valid_backup(tmp_path, [_obj("a", b"alpha")])
+
+        _, result = _write_increment(
+            tmp_path, "inc1", [_obj("a", b"alpha"), _obj("copy-of-a", b"alpha"),
+                               _obj("n1", b"new"), _obj("n2", b"new")], base,
+        )
+
+        by_key = {o["key"]: o for o in result.manifest["objects"]}
+        assert by_key["copy-of-a"]["archive"] == "../backup"
+        assert by_key["copy-of-a"]["member_name"] == by_key["a"]["member_name"]
+        assert by_key["n1"]["member_name"] == by_key["n2"]["member_name"]
+        assert result.manifest["incremental"]["deduplicated_object_count"] == 2
+        with tarfile.open(tmp_path / "inc1" / "chunk-000000.tar") as tar:
+            assert len(tar.getmembers()) == 1
+        assert verify_archive(tmp_path / "inc1").ok
+
+    def test_chain_references_the_archive_holding_the_member(self, tmp_path):
+        base = _create_valid_backup(tmp_path, [_obj("a", b"alpha")])
+        _write_increment(tmp_path, "inc1", [_obj("a", b"alpha"), _obj("b", b"beta")], base)
+
+        _, result = _write_increment(
+            tmp_path, "inc2", [_obj("a", b"alpha"), _obj("b", b"beta")], tmp_path / "inc1"
+        )
+
+        by_key = {o["key"]: o for o in result.manifest["objects"]}
+        assert by_key["a"]["archive"] == "../backup"
+        assert by_key["b"]["archive"] == "../inc1"
+        assert result.chunk_count == 0
+        assert verify_archive(tmp_path / "inc2").ok
+
+    def test_verify_reports_missing_referenced_archive(self, tmp_path):
+        base = _create_valid_backup(tmp_path, [_obj("a", b"alpha")])
+        _write_increment(tmp_path, "inc1", [_obj("a", b"alpha"), _obj("b", b"beta")], base)
+        (base / "manifest.json").unlink()
+
+        result = verify_archive(tmp_path / "inc1")
+
+        assert not result.ok
+        assert any("Cannot read referenced archive ../backup" in e for e in result.errors)
+
+    def test_restore_reads_members_across_the_chain(self, tmp_path):
+        base = _create_valid_backup(tmp_path, [_obj("a", b"alpha")])
+        _write_increment(tmp_path, "inc1", [_obj("a", b"alpha"), _obj("b", b"beta")], base)
+
+        r2 = MagicMock()
+        r2.head_object.return_value = None
+        uploaded = {}
+        r2.upload_fileobj.side_effect = lambda f, key, extra_args: uploaded.update(
+            {key: f.read()}
+        )
+        manifest = load_manifest(tmp_path / "inc1")
+        plan = plan_restore(r2, manifest)
+
+        result = restore_from_archive(r2, tmp_path / "inc1", manifest, plan, confirm=True)
+
+        assert result.uploaded == 2
+        assert uploaded == {"a": b"alpha", "b": b"beta"}
+
+    def test_base_from_another_bucket_is_rejected(self, tmp_path):
+        base = _create_valid_backup(tmp_path, [_obj("a", b"alpha")])
+        r2 = _make_r2_mock([_obj("a", b"alpha")])
+        r2.bucket = "other-bucket"
+
+        with pytest.raises(BackupError, match="not 'other-bucket'"):
+            write_backup(r2, tmp_path / "inc1", build_inventory(r2), base_dir=base)
+
+
+class TestAdaptiveThrottle:
+    def test_halves_on_throttle_and_recovers_additively(self):
+        throttle = AdaptiveThrottle(8, increase_after=2)
+
+        throttle.acquire()
+        throttle.release(throttled=True)
+        assert throttle.limit == 4
+
+        for _ in range(4):
+            throttle.acquire()
+            throttle.release()
+        assert throttle.limit == 6
+
+    def test_never_drops_below_min_limit(self):
+        throttle = AdaptiveThrottle(2)
+        for _ in range(3):
+            throttle.acquire()
+            throttle.release(throttled=True)
+        assert throttle.limit == 1
+
+    def test_slow_down_shrinks_the_shared_limit(self, tmp_path, monkeypatch):
+        from botocore.exceptions import ClientError
+
+        from stream_of_worship.admin.services import r2_backup
+
+        monkeypatch.setattr(r2_backup.time, "sleep", lambda seconds: None)
+        r2 = _make_r2_mock([_obj("a", b"alpha")])
+        original_get = r2.get_object_stream.side_effect
+        calls = []
+
+        def _slow_down_once(key):
+            calls.append(key)
+            if len(calls) == 1:
+                raise ClientError({"Error": {"Code": "SlowDown"}}, "GetObject")
+            return original_get(key)
+
+        r2.get_object_stream.side_effect = _slow_down_once
+        throttle = AdaptiveThrottle(4)
+
+        r2_backup._download_object_to_tempfile(
+            r2, build_inventory(r2).objects[0], tmp_path, throttle=throttle
+        )
+
+        assert calls == ["a", "a"]
+        assert throttle.limit == 2
+
+
+# ---------------------------------------------------------------------------
+# Streaming tar writer tests
+# ---------------------------------------------------------------------------
+
+
+class TestStreamingBackup:
+    def _forbid_temp_files(self, monkeypatch):
+        from stream_of_worship.admin.services import r2_backup
+
+        def _fail(*args, **kwargs):
+            raise AssertionError("object was staged in a temp file")
+
+        monkeypatch.setattr(r2_backup, "_download_object_to_tempfile", _fail)
+
+    @pytest.mark.parametrize("concurrency", [1, 4])
+    def test_bodies_are_not_staged_on_disk(self, tmp_path, monkeypatch, concurrency):
+        self._forbid_temp_files(monkeypatch)
+        r2 = _make_r2_mock([_obj(f"k{i}", bytes([i]) * (i + 1)) for i in range(6)])
+
+        result = write_backup(
+            r2, tmp_path / "backup", build_inventory(r2), concurrency=concurrency
+        )
+
+        assert result.object_count == 6
+        assert verify_archive(tmp_path / "backup").ok
+
+    def test_failed_attempt_is_truncated_off_the_tar(self, tmp_path):
+        r2 = _make_r2_mock([_obj("a", b"alpha"), _obj("b", b"bravo!")])
+        original_get = r2.get_object_stream.side_effect
+        calls = []
+
+        def _corrupt_first_b(key):
+            calls.append(key)
+            resp = original_get(key)
+            if key == "b" and calls.count("b") == 1:
+                resp["body"] = io.BytesIO(b"BRAVO!")
+            return resp
+
+        r2.get_object_stream.side_effect = _corrupt_first_b
+
+        write_backup(r2, tmp_path / "backup", build_inventory(r2))
+
+        assert calls.count("b") == 2
+        with tarfile.open(tmp_path / "backup" / "chunk-000000.tar") as tar:
+            assert sorted(m.name for m in tar.getmembers()) == [
+                "objects/000000000000.bin",
+                "objects/000000000001.bin",
+            ]
+        assert verify_archive(tmp_path / "backup").ok
+
+    def test_reorder_buffer_bounds_memory_and_spills_large_objects(
+        self, tmp_path, monkeypatch
+    ):
+        from stream_of_worship.admin.services import r2_backup
+
+        monkeypatch.setattr(r2_backup, "REORDER_BUFFER_BYTES", 250)
+        peak = []
+        original_reserve = ReorderBuffer.reserve
+
+        def _tracking_reserve(self, n):
+            original_reserve(self, n)
+            peak.append(self.used)
+
+        monkeypatch.setattr(ReorderBuffer, "reserve", _tracking_reserve)
+        objects = [_obj(f"small{i}", bytes([i]) * 100) for i in range(8)]
+        objects.append(_obj("large", b"L" * 400))
+        r2 = _make_r2_mock(objects)
+
+        result = write_backup(r2, tmp_path / "backup", build_inventory(r2), concurrency=4)
+
+        assert result.object_count == 9
+        assert max(peak) <= 250
+        assert not (tmp_path / "backup" / "tmp").exists()
+        assert verify_archive(tmp_path / "backup").ok
+
+    def test_closed_reorder_buffer_fails_waiting_workers(self):
+        buffer = ReorderBuffer(10)
+        buffer.reserve(10)
+        buffer.close()
+
+        with pytest.raises(BackupError, match="aborted"):
+            buffer.reserve(5)
@@ -538,6 +538,7 @@ def test_backup_r2_debug_traces_flag_passes_tracer(monkeypatch, tmp_path):
         concurrency,
         on_progress,
         tracer,
+        base_dir,
     ):
         captured["tracer"] = tracer
         captured["concurrency"] = concurrency
@@ -565,7 +566,7 @@ def test_backup_r2_debug_traces_flag_passes_tracer(monkeypatch, tmp_path):
     )
     monkeypatch.setattr(
         "stream_of_worship.admin.commands.maintenance._load_r2",
-        lambda config: _make_fake_r2(),
+        lambda config, **kwargs: _make_fake_r2(),
     )
 
     runner = CliRunner()
@@ -599,6 +600,7 @@ def test_backup_r2_default_no_tracer_passes_none(monkeypatch, tmp_path):
         concurrency,
         on_progress,
         tracer,
+        base_dir,
     ):
         captured["tracer"] = tracer
         return BackupResult(
@@ -623,7 +625,7 @@ def test_backup_r2_default_no_tracer_passes_none(monkeypatch, tmp_path):
     )
     monkeypatch.setattr(
         "stream_of_worship.admin.commands.maintenance._load_r2",
-        lambda config: _make_fake_r2(),
+        lambda config, **kwargs: _make_fake_r2(),
     )
 
     runner = CliRunner()
@@ -666,7 +668,7 @@ def test_backup_r2_diag_range_key_flag(monkeypatch, tmp_path):
     )
     monkeypatch.setattr(
         "stream_of_worship.admin.commands.maintenance._load_r2",
-        lambda config: _make_fake_r2(),
+        lambda config, **kwargs: _make_fake_r2(),
     )
 
     runner = CliRunner()
@@ -2,12 +2,15 @@
 
 import json
 from datetime import datetime
-from unittest.mock import Mock, patch
+from unittest.mock import MagicMock, Mock, patch
 
+import lxml.html
+from lxml import etree
 import pytest
 
 from stream_of_worship.admin.db.client import DatabaseClient
 from stream_of_worship.admin.db.models import Song
+from stream_of_worship.admin.services.catalog_edit import compute_song_id
 from stream_of_worship.admin.services.scraper import CatalogScraper
 
 
@@ -229,7 +232,7 @@ class TestCatalogScraperWithDatabase:
     def test_scrape_with_incremental(self, mock_get, temp_db):
         """Test incremental scraping skips existing songs."""
         existing_song = Song(
-            id="jiang_tian_chang_kai_1", title="將天敞開",
+            id=compute_song_id("將天敞開", "Composer", "Lyricist"), title="將天敞開",
             source_url="https://example.com", scraped_at="2024-01-01T00:00:00",
         )
         temp_db.insert_song(existing_song)
@@ -244,7 +247,7 @@ class TestCatalogScraperWithDatabase:
                 <td>Album</td><td>Series</td><td>C</td><td>Lyrics</td></tr>
         </table>
         """
-        mock_response = Mock()
+        mock_response = Mock(status_code=200, headers={})
         mock_response.text = html_content
         mock_response.raise_for_status = Mock()
         mock_get.return_value = mock_response
@@ -274,7 +277,7 @@ class TestCatalogScraperWithDatabase:
                 <td>Album</td><td>Series</td><td>C</td><td>Lyrics</td></tr>
         </table>
         """
-        mock_response = Mock()
+        mock_response = Mock(status_code=200, headers={})
         mock_response.text = html_content
         mock_response.raise_for_status = Mock()
         mock_get.return_value = mock_response
@@ -344,10 +347,7 @@ class TestCatalogScraperLyricsParsing:
 
     def test_parse_lyrics_cell_with_br(self, scraper_no_db):
         """Test parsing lyrics cell with <br/> tags."""
-        from bs4 import BeautifulSoup
-
-        html = "Line 1<br/>Line 2<br/>Line 3"
-        cell = BeautifulSoup(html, "html.parser")
+        cell = lxml.html.fragment_fromstring("<td>Line 1<br/>Line 2<br/>Line 3</td>")
 
         result = scraper_no_db._parse_lyrics_cell(cell)
 
@@ -356,10 +356,7 @@ class TestCatalogScraperLyricsParsing:
 
     def test_parse_lyrics_cell_empty_lines(self, scraper_no_db):
         """Test parsing lyrics cell with empty lines."""
-        from bs4 import BeautifulSoup
-
-        html = "Line 1<br/><br/>Line 2"
-        cell = BeautifulSoup(html, "html.parser")
+        cell = lxml.html.fragment_fromstring("<td>Line 1<br/><br/>Line 2</td>")
 
         result = scraper_no_db._parse_lyrics_cell(cell)
 
@@ -369,14 +366,10 @@ class TestCatalogScraperLyricsParsing:
         """Test parsing lyrics cell with malformed <br>...</br> pattern.
 
         Some songs on sop.org have <br> (non-self-closing) followed by </br>
-        at the end, which html.parser treats as a nested element. This test
-        ensures the scraper correctly handles this case.
+        at the end. This test ensures the scraper correctly handles this case.
         """
-        from bs4 import BeautifulSoup
-
         html = "<td>Line 1<br>Line 2<br/>Line 3<br/>Line 4</br></td>"
-        soup = BeautifulSoup(html, "html.parser")
-        cell = soup.find("td")
+        cell = lxml.html.fragment_fromstring(html)
 
         result = scraper_no_db._parse_lyrics_cell(cell)
 
@@ -487,6 +480,174 @@ class TestCatalogScraperHelpers:
         assert duplicate_song.musical_key == "G"
 
 
+class TestIncrementalScrape:
+    """Tests for conditional fetch and row-digest diffing against a stub database."""
+
+    HTML = """
+    <table id="tablepress-3">
+        <tr><th>曲名</th><th>作曲</th><th>作詞</th><th>專輯名稱</th>
+            <th>專輯系列</th><th>調性</th><th>歌詞</th></tr>
+        <tr><td>Same</td><td>C</td><td>L</td><td>A</td><td>S</td><td>G</td><td>x</td></tr>
+        <tr><td>Changed</td><td>C</td><td>L</td><td>A</td><td>S</td><td>G</td><td>new</td></tr>
+        <tr><td>Legacy</td><td>C</td><td>L</td><td>A</td><td>S</td><td>G</td><td>x</td></tr>
+        <tr><td>Added</td><td>C</td><td>L</td><td>A</td><td>S</td><td>G</td><td>x</td></tr>
+    </table>
+    """
+
+    @staticmethod
+    def _digest(title, lyrics):
+        return CatalogScraper._row_digest(
+            {"title": title, "composer": "C", "lyricist": "L", "album": "A",
+             "series": "S", "key": "G", "lyrics_raw": lyrics}
+        )
+
+    @pytest.fixture
+    def db(self):
+        db = MagicMock(spec=DatabaseClient)
+        db.get_catalog_source_state.return_value = ('"v1"', "Mon, 01 Jan 2024 00:00:00 GMT")
+        db.get_song_row_digests.return_value = {
+            compute_song_id("Same", "C", "L"): self._digest("Same", "x"),
+            compute_song_id("Changed", "C", "L"): self._digest("Changed", "old"),
+            compute_song_id("Legacy", "C", "L"): None,
+        }
+        db.soft_delete_songs_missing_from.return_value = 2
+        return db
+
+    @patch("stream_of_worship.admin.services.scraper.requests.get")
+    def test_not_modified_returns_nothing(self, mock_get, db):
+        mock_get.return_value = Mock(status_code=304, headers={})
+
+        songs = CatalogScraper(db_client=db).scrape_all_songs()
+
+        assert songs == []
+        sent = mock_get.call_args.kwargs["headers"]
+        assert sent["If-None-Match"] == '"v1"'
+        assert sent["If-Modified-Since"] == "Mon, 01 Jan 2024 00:00:00 GMT"
+        db.get_song_row_digests.assert_not_called()
+        db.soft_delete_songs_missing_from.assert_not_called()
+        db.save_catalog_sync_state.assert_not_called()
+
+    @patch("stream_of_worship.admin.services.scraper.requests.get")
+    def test_only_changed_rows_are_returned(self, mock_get, db):
+        mock_get.return_value = Mock(status_code=200, text=self.HTML, headers={"ETag": '"v2"'})
+        scraper = CatalogScraper(db_client=db)
+
+        songs = scraper.scrape_all_songs()
+
+        assert [song.title for song in songs] == ["Changed", "Added"]
+        source_url, seen_ids = db.soft_delete_songs_missing_from.call_args.args
+        assert source_url == scraper.url
+        assert len(seen_ids) == 4
+        db.soft_delete_song.assert_not_called()
+        db.save_catalog_sync_state.assert_not_called()
+
+        db.insert_songs_bulk.return_value = 2
+        scraper.save_songs(songs)
+
+        digests = db.save_catalog_sync_state.call_args.args[0]
+        assert digests == {
+            compute_song_id("Changed", "C", "L"): self._digest("Changed", "new"),
+            compute_song_id("Legacy", "C", "L"): self._digest("Legacy", "x"),
+            compute_song_id("Added", "C", "L"): self._digest("Added", "x"),
+        }
+        assert db.save_catalog_sync_state.call_args.kwargs == {
+            "source_url": scraper.url, "etag": '"v2"', "last_modified": None,
+        }
+
+    @patch("stream_of_worship.admin.services.scraper.requests.get")
+    def test_failed_inserts_are_retried_next_scrape(self, mock_get, db):
+        mock_get.return_value = Mock(status_code=200, text=self.HTML, headers={"ETag": '"v2"'})
+        db.insert_songs_bulk.side_effect = RuntimeError("bulk failed")
+        db.insert_song.side_effect = [None, RuntimeError("bad row")]
+        scraper = CatalogScraper(db_client=db)
+
+        scraper.save_songs(scraper.scrape_all_songs())
+
+        digests = db.save_catalog_sync_state.call_args.args[0]
+        assert compute_song_id("Added", "C", "L") not in digests
+        assert compute_song_id("Changed", "C", "L") in digests
+        assert db.save_catalog_sync_state.call_args.kwargs["source_url"] is None
+
+    @patch("stream_of_worship.admin.services.scraper.requests.get")
+    def test_force_skips_conditional_fetch_and_soft_delete(self, mock_get, db):
+        mock_get.return_value = Mock(status_code=200, text=self.HTML, headers={})
+
+        songs = CatalogScraper(db_client=db).scrape_all_songs(force=True)
+
+        assert len(songs) == 4
+        assert "If-None-Match" not in mock_get.call_args.kwargs["headers"]
+        db.get_song_row_digests.assert_not_called()
+        db.soft_delete_songs_missing_from.assert_not_called()
+
+    @patch("stream_of_worship.admin.services.scraper.requests.get")
+    def test_failed_row_skips_soft_delete_and_validators(self, mock_get, db):
+        mock_get.return_value = Mock(status_code=200, text=self.HTML, headers={"ETag": '"v2"'})
+        scraper = CatalogScraper(db_client=db)
+        extract_row = scraper._extract_row
+
+        def flaky_extract(cells, col_indices):
+            fields = extract_row(cells, col_indices)
+            if fields["title"] == "Legacy":
+                raise RuntimeError("bad row")
+            return fields
+
+        with patch.object(scraper, "_extract_row", side_effect=flaky_extract):
+            songs = scraper.scrape_all_songs()
+
+        assert [song.title for song in songs] == ["Changed", "Added"]
+        db.soft_delete_songs_missing_from.assert_not_called()
+
+        db.insert_songs_bulk.return_value = 2
+        scraper.save_songs(songs)
+
+        digests = db.save_catalog_sync_state.call_args.args[0]
+        assert compute_song_id("Legacy", "C", "L") not in digests
+        assert db.save_catalog_sync_state.call_args.kwargs == {
+            "source_url": None, "etag": None, "last_modified": None,
+        }
+
+    @patch("stream_of_worship.admin.services.scraper.requests.get")
+    def test_parse_error_skips_soft_delete_and_validators(self, mock_get, db):
+        mock_get.return_value = Mock(status_code=200, text=self.HTML, headers={"ETag": '"v2"'})
+        scraper = CatalogScraper(db_client=db)
+        iter_rows = scraper._iter_table_rows
+
+        def truncated_rows(html):
+            for row_num, cells in enumerate(iter_rows(html)):
+                if row_num == 3:
+                    scraper._table_parse_error = True
+                    return
+                yield cells
+
+        with patch.object(scraper, "_iter_table_rows", side_effect=truncated_rows):
+            songs = scraper.scrape_all_songs()
+
+        assert [song.title for song in songs] == ["Changed"]
+        db.soft_delete_songs_missing_from.assert_not_called()
+
+        db.insert_songs_bulk.return_value = 1
+        scraper.save_songs(songs)
+
+        assert db.save_catalog_sync_state.call_args.kwargs["source_url"] is None
+        assert db.save_catalog_sync_state.call_args.kwargs["etag"] is None
+
+    def test_iter_table_rows_flags_syntax_error(self, db):
+        scraper = CatalogScraper(db_client=db)
+
+        def broken_events(*args, **kwargs):
+            raise etree.XMLSyntaxError("truncated", None, 1, 1)
+            yield
+
+        with patch(
+            "stream_of_worship.admin.services.scraper.etree.iterparse",
+            side_effect=broken_events,
+        ):
+            with pytest.raises(ValueError):
+                list(scraper._iter_table_rows(self.HTML))
+
+        assert scraper._table_parse_error
+
+
 def _drop_all_tables(make_test_provider):
     """Drop all tables for cleanup."""
     try:
@@ -500,6 +661,8 @@ def _drop_all_tables(make_test_provider):
                 DROP TABLE IF EXISTS songset_items CASCADE;
                 DROP TABLE IF EXISTS songsets CASCADE;
                 DROP TABLE IF EXISTS recordings CASCADE;
+                DROP TABLE IF EXISTS song_source_digest CASCADE;
+                DROP TABLE IF EXISTS catalog_source_state CASCADE;
                 DROP TABLE IF EXISTS songs CASCADE;
                 DROP TABLE IF EXISTS "session" CASCADE;
                 DROP TABLE IF EXISTS "account" CASCADE;
@@ -0,0 +1,110 @@
+"""Unit tests for the COPY-based bulk embedding writer.
+
+The statements themselves need Postgres with pgvector; these tests cover the
+binary vector encoding and the order of the staged merge with a stub
+connection.
+"""
+
+import struct
+from types import SimpleNamespace
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from stream_of_worship.admin.db import client as client_module
+from stream_of_worship.admin.db.client import DatabaseClient, _VectorBinaryDumper
+from stream_of_worship.admin.db.models import SongEmbedding, SongLineEmbedding
+
+
+def test_vector_dumper_matches_pgvector_binary_format():
+    dumper = type("D", (_VectorBinaryDumper,), {"oid": 16385})(list)
+
+    data = dumper.dump([1.0, -0.5, 0.25])
+
+    assert data[:4] == struct.pack(">hh", 3, 0)
+    assert struct.unpack(">3f", data[4:]) == (1.0, -0.5, 0.25)
+
+
+@pytest.fixture
+def stub_client():
+    conn = MagicMock()
+    cursor = conn.cursor.return_value
+    provider = MagicMock()
+    provider.get_connection.return_value = conn
+    with patch.object(
+        client_module.TypeInfo, "fetch", return_value=SimpleNamespace(oid=16385)
+    ):
+        yield DatabaseClient(provider), conn, cursor
+
+
+def _executed(cursor) -> list[str]:
+    return [" ".join(c.args[0].split()) for c in cursor.execute.call_args_list]
+
+
+class TestBulkUpsertEmbeddings:
+    """Tests for DatabaseClient.bulk_upsert_embeddings."""
+
+    def test_copies_into_stage_then_merges_in_one_transaction(self, stub_client):
+        client, conn, cursor = stub_client
+        copy = cursor.copy.return_value.__enter__.return_value
+
+        client.bulk_upsert_embeddings(
+            [SongEmbedding(song_id="song_1", embedding=[0.5], content_hash="h1")],
+            [
+                SongLineEmbedding(song_id="song_1", line_index=0, line_text="奇異恩典",
+                                  embedding=[0.25]),
+            ],
+        )
+
+        conn.transaction.assert_called_once()
+        assert [c.args[0].split(" (")[0] for c in cursor.copy.call_args_list] == [
+            "COPY _song_embedding_stage",
+            "COPY _song_line_embedding_stage",
+        ]
+        assert copy.set_types.call_args_list[0].args[0] == ["text", 16385, "text", "text"]
+        assert copy.write_row.call_args_list[1].args[0] == (
+            "song_1", 0, "奇異恩典", [0.25], "text-embedding-3-small"
+        )
+        statements = _executed(cursor)
+        assert statements[0].startswith("CREATE TEMP TABLE _song_embedding_stage")
+        assert "ON CONFLICT (song_id) DO UPDATE" in statements[1]
+        assert statements[2].startswith("DELETE FROM song_line_embedding")
+        assert statements[3].startswith("INSERT INTO song_line_embedding")
+        assert not any("INDEX" in sql for sql in statements)
+
+    def test_last_embedding_wins_per_song(self, stub_client):
+        client, _, cursor = stub_client
+        copy = cursor.copy.return_value.__enter__.return_value
+
+        client.bulk_upsert_embeddings(
+            [
+                SongEmbedding(song_id="song_1", embedding=[0.1], content_hash="old"),
+                SongEmbedding(song_id="song_2", embedding=[0.2], content_hash="h2"),
+                SongEmbedding(song_id="song_1", embedding=[0.3], content_hash="new"),
+            ],
+            [],
+        )
+
+        rows = [c.args[0] for c in copy.write_row.call_args_list]
+        assert [(row[0], row[3]) for row in rows] == [("song_1", "new"), ("song_2", "h2")]
+        assert not any("DISTINCT" in sql for sql in _executed(cursor))
+
+    def test_defer_vector_indexes_drops_and_rebuilds_hnsw(self, stub_client):
+        client, _, cursor = stub_client
+
+        client.bulk_upsert_embeddings(
+            [SongEmbedding(song_id="song_1", embedding=[0.5])], [], defer_vector_indexes=True
+        )
+
+        statements = _executed(cursor)
+        assert statements[0] == (
+            "DROP INDEX IF EXISTS idx_song_embedding_cosine, idx_song_line_embedding_cosine"
+        )
+        rebuilt = [sql for sql in statements if sql.startswith("CREATE INDEX")]
+        assert any("idx_song_embedding_cosine" in sql and "hnsw" in sql for sql in rebuilt)
+        assert any("idx_song_line_embedding_cosine" in sql for sql in rebuilt)
+
+    def test_empty_batch_is_a_no_op(self, stub_client):
+        client, conn, _ = stub_client
+        client.bulk_upsert_embeddings([], [])
+        conn.transaction.assert_not_called()
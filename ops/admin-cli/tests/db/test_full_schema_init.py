@@ -10,6 +10,8 @@ EXPECTED_TABLES = {
     # catalog
     "songs",
     "recordings",
+    "catalog_source_state",
+    "song_source_digest",
     # auth (Better Auth core)
     "user",
     "account",
@@ -55,6 +57,7 @@ class TestFullSchemaInit:
                 DROP TABLE IF EXISTS songset_share, lyric_mark,
                     user_lrc_override, user_settings,
                     songset_items, songsets,
+                    song_source_digest, catalog_source_state,
                     recordings, songs,
                     "session", "account", "verification", "user" CASCADE;
                 DROP FUNCTION IF EXISTS update_updated_at_column CASCADE;
@@ -114,6 +117,7 @@ class TestFullSchemaInit:
                 DROP TABLE IF EXISTS songset_share, lyric_mark,
                     user_lrc_override, user_settings,
                     songset_items, songsets,
+                    song_source_digest, catalog_source_state,
                     recordings, songs,
                     "session", "account", "verification", "user" CASCADE;
                 DROP FUNCTION IF EXISTS update_updated_at_column CASCADE;
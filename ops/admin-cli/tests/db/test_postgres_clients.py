@@ -52,6 +52,8 @@ def db_clients(make_test_provider, seed_user):
                 DROP TABLE IF EXISTS songset_items CASCADE;
                 DROP TABLE IF EXISTS songsets CASCADE;
                 DROP TABLE IF EXISTS recordings CASCADE;
+                DROP TABLE IF EXISTS song_source_digest CASCADE;
+                DROP TABLE IF EXISTS catalog_source_state CASCADE;
                 DROP TABLE IF EXISTS songs CASCADE;
                 DROP TABLE IF EXISTS "session" CASCADE;
                 DROP TABLE IF EXISTS "account" CASCADE;
@@ -278,6 +280,37 @@ class TestReadOnlyClient:
         assert len(results) == 1
         assert results[0].title == "Amazing Grace"
 
+    def test_search_songs_cjk_ranked_and_paginated(self, db_clients):
+        """CJK substrings match via bigrams; title hits rank above lyric hits."""
+        admin_client, read_client, _, _ = db_clients
+
+        for song_id, title, lyrics in [
+            ("song_1", "讚美之泉", "奇異恩典何等甘甜"),
+            ("song_2", "奇異恩典", "我罪已得赦免"),
+            ("song_3", "恩典之路", "主的恩典夠我用"),
+        ]:
+            admin_client.insert_song(
+                Song(
+                    id=song_id,
+                    title=title,
+                    title_pinyin="_".join(["x"] * len(title)),
+                    lyrics_raw=lyrics,
+                    source_url="http://test",
+                    scraped_at="2024-01-01T00:00:00",
+                )
+            )
+
+        results = read_client.search_songs("奇異恩典")
+        assert [s.id for s in results] == ["song_2", "song_1"]
+
+        assert [s.id for s in read_client.search_songs("奇異恩典", field="lyrics")] == ["song_1"]
+        assert read_client.search_songs("異典") == []
+
+        first_page = read_client.search_songs("恩典", limit=2)
+        second_page = read_client.search_songs("恩典", limit=2, offset=2)
+        assert len(first_page) == 2
+        assert {s.id for s in first_page + second_page} == {"song_1", "song_2", "song_3"}
+
     def test_list_albums(self, db_clients):
         """Test listing albums."""
         admin_client, read_client, _, _ = db_clients
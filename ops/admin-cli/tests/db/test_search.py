@@ -0,0 +1,208 @@
+"""Unit tests for the ranked song search query builder.
+
+The SQL itself runs against Postgres in ``test_postgres_clients.py``; these
+tests cover tokenization and the ILIKE fallback with a stub connection.
+"""
+
+from unittest.mock import MagicMock
+
+import psycopg.errors
+
+from stream_of_worship.db.search import (
+    QueryEmbeddingCache,
+    build_search_tsquery,
+    hybrid_search_songs,
+    reciprocal_rank_fusion,
+    search_song_rows,
+)
+
+
+class TestBuildSearchTsquery:
+    """Tests for build_search_tsquery."""
+
+    def test_cjk_run_becomes_bigram_phrase(self):
+        assert build_search_tsquery("奇異恩典") == "('奇異' <-> '異恩' <-> '恩典')"
+
+    def test_two_character_run_is_a_single_term(self):
+        assert build_search_tsquery("恩典") == "'恩典'"
+
+    def test_ascii_words_lowercased_and_last_is_prefix(self):
+        assert build_search_tsquery("Amazing Gra") == "'amazing' & 'gra':*"
+
+    def test_field_restricts_weight(self):
+        assert build_search_tsquery("主耶穌 qi", field="title") == (
+            "('主耶':A <-> '耶穌':A) & 'qi':*A"
+        )
+        assert build_search_tsquery("恩典", field="lyrics") == "'恩典':D"
+
+    def test_punctuation_cannot_inject_operators(self):
+        assert build_search_tsquery("grace' | !x:*") == "'grace' & 'x':*"
+
+    def test_unindexable_queries_return_none(self):
+        assert build_search_tsquery("") is None
+        assert build_search_tsquery("!!") is None
+        assert build_search_tsquery("主") is None
+        assert build_search_tsquery("主 grace") is None
+
+
+class TestSearchSongRows:
+    """Tests for search_song_rows dispatch."""
+
+    def test_indexed_search_is_ranked_and_paginated(self):
+        conn = MagicMock()
+        cursor = conn.cursor.return_value
+        cursor.fetchall.return_value = [("song_1",)]
+
+        rows = search_song_rows(conn, "恩典", limit=10, offset=20)
+
+        sql, params = cursor.execute.call_args.args
+        assert "search_document @@ to_tsquery('simple', %s)" in sql
+        assert "ts_rank_cd" in sql
+        assert "deleted_at IS NULL" in sql
+        assert params == ["'恩典'", "'恩典'", 1, 10, 20]
+        assert rows == [("song_1",)]
+
+    def test_single_character_falls_back_to_ilike(self):
+        conn = MagicMock()
+        cursor = conn.cursor.return_value
+        cursor.fetchall.return_value = []
+
+        search_song_rows(conn, "主", field="title", include_deleted=True)
+
+        sql, params = cursor.execute.call_args.args
+        assert "title ILIKE %s OR title_pinyin ILIKE %s" in sql
+        assert "deleted_at IS NULL" not in sql
+        assert params == ["%主%", "%主%", "%主%", 20, 0]
+
+    def test_ilike_fallback_escapes_wildcards(self):
+        conn = MagicMock()
+        conn.cursor.return_value.fetchall.return_value = []
+
+        search_song_rows(conn, "主_%", field="lyrics")
+
+        _, params = conn.cursor.return_value.execute.call_args.args
+        assert params[0] == "%主\\_\\%%"
+
+    def test_missing_search_document_falls_back_to_ilike(self):
+        conn = MagicMock()
+        indexed, fallback = MagicMock(), MagicMock()
+        indexed.execute.side_effect = psycopg.errors.UndefinedColumn("search_document")
+        fallback.fetchall.return_value = [("song_1",)]
+        conn.cursor.side_effect = [indexed, fallback]
+
+        rows = search_song_rows(conn, "Amazing")
+
+        assert rows == [("song_1",)]
+        sql, _ = fallback.execute.call_args.args
+        assert "album_series ILIKE %s" in sql
+
+
+def _song_row(song_id: str) -> tuple:
+    return (song_id, song_id) + (None,) * 22
+
+
+class FakeCursor:
+    """Routes queries to canned rows by what the SQL reads from."""
+
+    def __init__(self, lexical, songs, lines, fail_vectors=False):
+        self.results = {"lexical": lexical, "songs": songs, "lines": lines}
+        self.fail_vectors = fail_vectors
+        self.executed = []
+        self._rows = []
+
+    def execute(self, sql, params=None):
+        self.executed.append((sql, params))
+        if "set_config" in sql:
+            if self.fail_vectors:
+                raise psycopg.errors.UndefinedTable("song_embedding")
+            self._rows = []
+        elif "FROM song_line_embedding" in sql:
+            self._rows = self.results["lines"]
+        elif "FROM song_embedding" in sql:
+            self._rows = self.results["songs"]
+        elif "id = ANY" in sql:
+            self._rows = [_song_row(song_id) for song_id in params[0]]
+        else:
+            self._rows = [_song_row(song_id) for song_id in self.results["lexical"]]
+
+    def fetchall(self):
+        return self._rows
+
+
+def _conn(cursor):
+    conn = MagicMock()
+    conn.cursor.return_value = cursor
+    return conn
+
+
+class TestReciprocalRankFusion:
+    """Tests for reciprocal_rank_fusion."""
+
+    def test_items_in_several_rankings_rise(self):
+        fused = reciprocal_rank_fusion([["a", "b", "c"], ["c", "d"], ["c", "a"]], k=60)
+        assert [item for item, _ in fused] == ["c", "a", "b", "d"]  # b, d tie: first seen wins
+        assert fused[0][1] == 1 / 63 + 1 / 61 + 1 / 61
+
+    def test_duplicates_within_a_ranking_count_once(self):
+        assert reciprocal_rank_fusion([["a", "a"]]) == [("a", 1 / 61)]
+
+
+class TestQueryEmbeddingCache:
+    """Tests for QueryEmbeddingCache."""
+
+    def test_normalizes_and_evicts_least_recent(self):
+        calls = []
+        cache = QueryEmbeddingCache(lambda q: calls.append(q) or [float(len(calls))], 2)
+
+        assert cache(" 奇異  恩典 ") == cache("奇異 恩典") == [1.0]
+        cache("b")
+        cache("c")
+        cache("奇異 恩典")
+
+        assert calls == ["奇異 恩典", "b", "c", "奇異 恩典"]
+        assert (cache.hits, cache.misses) == (1, 4)
+
+
+class TestHybridSearchSongs:
+    """Tests for hybrid_search_songs fusion and fallbacks."""
+
+    def test_fuses_lexical_song_and_line_rankings(self):
+        cursor = FakeCursor(
+            lexical=["song_a"],
+            songs=[("song_b",), ("song_a",)],
+            lines=[("song_b", "何等甘甜"), ("song_b", "我罪已得赦免"), ("song_c", "前我失喪")],
+        )
+        conn = _conn(cursor)
+
+        hits = hybrid_search_songs(conn, "何等甘甜", lambda q: [0.5, 0.25], limit=2, ef_search=64)
+
+        assert [hit.song.id for hit in hits] == ["song_b", "song_a"]
+        assert hits[0].matched_line == "何等甘甜"
+        assert hits[1].matched_line is None
+        set_config = next(p for sql, p in cursor.executed if "set_config" in sql)
+        assert set_config == ["64"]
+        vector_sql, vector_params = next(
+            (sql, p) for sql, p in cursor.executed if "FROM song_embedding" in sql
+        )
+        assert "deleted_at IS NULL" in vector_sql
+        assert vector_params == ["[0.5, 0.25]", "[0.5, 0.25]", 40]
+
+    def test_ef_search_never_below_candidate_count(self):
+        cursor = FakeCursor(lexical=[], songs=[], lines=[])
+        hybrid_search_songs(_conn(cursor), "grace", lambda q: [0.0], candidates=200, ef_search=40)
+        assert next(p for sql, p in cursor.executed if "set_config" in sql) == ["200"]
+
+    def test_embedding_failure_falls_back_to_lexical(self):
+        def embed(query):
+            raise RuntimeError("service unavailable")
+
+        cursor = FakeCursor(lexical=["song_a", "song_b"], songs=[], lines=[])
+        hits = hybrid_search_songs(_conn(cursor), "grace", embed)
+
+        assert [hit.song.id for hit in hits] == ["song_a", "song_b"]
+        assert not any("set_config" in sql for sql, _ in cursor.executed)
+
+    def test_missing_vector_tables_fall_back_to_lexical(self):
+        cursor = FakeCursor(lexical=["song_a"], songs=[], lines=[], fail_vectors=True)
+        hits = hybrid_search_songs(_conn(cursor), "grace", lambda q: [0.0])
+        assert [hit.song.id for hit in hits] == ["song_a"]
@@ -28,6 +28,7 @@ def user_client(postgres_url):
                 DROP TABLE IF EXISTS songset_share, lyric_mark,
                     user_lrc_override, user_settings,
                     songset_items, songsets,
+                    song_source_digest, catalog_source_state,
                     recordings, songs,
                     "session", "account", "verification", "user" CASCADE;
                 DROP FUNCTION IF EXISTS update_updated_at_column CASCADE;
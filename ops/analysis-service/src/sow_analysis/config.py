@@ -23,6 +23,16 @@ class Settings(BaseSettings):
     SOW_R2_ENDPOINT_URL: str = ""
     SOW_R2_ACCESS_KEY_ID: str = ""
     SOW_R2_SECRET_ACCESS_KEY: str = ""
+    # Transfer tuning. Files larger than the chunk size move as concurrent
+    # multipart uploads / ranged downloads of SOW_R2_MAX_CONCURRENCY parts;
+    # up to SOW_R2_TRANSFER_WORKERS files transfer at once on a dedicated pool.
+    SOW_R2_MULTIPART_CHUNK_MB: int = 16
+    SOW_R2_MAX_CONCURRENCY: int = 8
+    SOW_R2_TRANSFER_WORKERS: int = 4
+    # Stem format for analysis-job uploads: "wav" or "flac". In flac mode,
+    # integer-PCM stems upload as {hash}/stems/full/{stem}.flac (roughly half
+    # the bytes); float stems cannot round-trip through FLAC and stay .wav.
+    SOW_R2_STEMS_FORMAT: str = "wav"
 
     # API Security
     SOW_ANALYSIS_API_KEY: str = ""
@@ -31,6 +41,14 @@ class Settings(BaseSettings):
     # Cache and Processing
     CACHE_DIR: Path = Path("/cache")
     KEY_ALGORITHM_VERSION: str = "ks_segment_vote_v1"
+    # Full analysis decodes audio once, then resamples to this rate for key
+    # detection (0 = the file's native rate, as KEY_ALGORITHM_VERSION assumes).
+    # 22050 matches fast analysis and roughly halves the HPSS/CQT cost, but can
+    # change keys under the same version tag, so it is opt-in.
+    SOW_ANALYSIS_KEY_SAMPLE_RATE: int = 0
+    # Back the decoded key-detection buffer with a temp file (np.memmap) so its
+    # pages can be reclaimed while allin1/demucs run.
+    SOW_ANALYSIS_MMAP_AUDIO: bool = False
     # Tempo detection algorithm version.
     #   "v4_octave_guard" -> start_bpm=80 + double/half-time guard (current default)
     #   "v5_cps_prior"    -> CPS-derived lognormal prior (skips octave guard)
@@ -43,6 +61,14 @@ class Settings(BaseSettings):
     # SOW_MAX_CONCURRENT_LOCAL_MODEL_JOBS. Default is cgroup-aware on Linux.
     # A value <= 0 means auto-detect (cgroup-aware on Linux, 1 elsewhere), capped at 4.
     SOW_FAST_ANALYZE_MAX_CONCURRENT: int = 0
+    # Fast analysis runs its librosa work in a pool of worker processes so songs
+    # are analyzed in parallel instead of serializing on the GIL. 0 = one worker
+    # per SOW_FAST_ANALYZE_MAX_CONCURRENT slot; a negative value disables the
+    # pool and falls back to the thread executor. Concurrent fast jobs are
+    # min(workers, SOW_FAST_ANALYZE_MAX_CONCURRENT) either way.
+    SOW_FAST_ANALYZE_PROCESS_WORKERS: int = 0
+    # Maximum songs accepted by one POST /jobs/fast-analyze/batch request.
+    SOW_FAST_ANALYZE_BATCH_MAX_SIZE: int = 500
 
     @field_validator("SOW_LOG_LEVEL")
     @classmethod
@@ -66,6 +92,15 @@ class Settings(BaseSettings):
         except (AttributeError, OSError):  # macOS / unsupported
             return 1
 
+    @field_validator("SOW_R2_STEMS_FORMAT")
+    @classmethod
+    def _validate_r2_stems_format(cls, v: str) -> str:
+        allowed = {"wav", "flac"}
+        lower = v.lower()
+        if lower not in allowed:
+            raise ValueError(f"SOW_R2_STEMS_FORMAT must be one of {allowed}, got: {v!r}")
+        return lower
+
     @field_validator("SOW_MAX_CONCURRENT_LOCAL_MODEL_JOBS")
     @classmethod
     def _validate_concurrent_jobs(cls, v: int) -> int:
@@ -131,10 +166,26 @@ class Settings(BaseSettings):
     SOW_EMBEDDING_API_KEY: str = ""
     SOW_EMBEDDING_BASE_URL: str = ""
     SOW_EMBEDDING_MODEL: str = "text-embedding-3-small"
+    # Concurrent embedding jobs. Their texts are coalesced into shared API
+    # requests, so this can be well above the provider's request concurrency.
+    SOW_EMBEDDING_MAX_CONCURRENT_JOBS: int = 32
+    # How long the batcher waits to gather texts from other jobs before calling
+    # the API, and the per-request input/token ceilings (OpenAI allows 2048
+    # inputs and 300k tokens per embeddings request).
+    SOW_EMBEDDING_BATCH_WINDOW_MS: int = 50
+    SOW_EMBEDDING_BATCH_MAX_INPUTS: int = 2048
+    SOW_EMBEDDING_BATCH_MAX_TOKENS: int = 250000
+    # Content-addressed text -> vector cache under CACHE_DIR/embeddings, so
+    # chorus lines shared across songs and unchanged songs are not re-embedded.
+    SOW_EMBEDDING_CACHE_ENABLED: bool = True
 
     # Whisper Configuration
     SOW_WHISPER_DEVICE: str = "cpu"  # "cuda" or "cpu"
     SOW_WHISPER_CACHE_DIR: Path = Path("/cache/whisper")
+    SOW_WHISPER_PRELOAD_MODELS: str = ""  # Comma-separated models to load at startup, e.g. "large-v3"
+    SOW_WHISPER_POOL_MAX_MODELS: int = 1  # Resident models kept loaded between LRC jobs
+    SOW_WHISPER_POOL_IDLE_SECONDS: float = 600.0  # Unload a model after this long unused
+    SOW_WHISPER_POOL_MIN_AVAILABLE_MB: int = 1024  # Unload idle models below this free memory; 0 disables
 
     # DashScope Qwen3 ASR Configuration
     SOW_DASHSCOPE_API_KEY: str = ""
@@ -228,6 +279,20 @@ class Settings(BaseSettings):
         30  # Delay before processing starts (window to cancel/clear jobs)
     )
 
+    SOW_JOB_STORE_FLUSH_INTERVAL_MS: int = 250
+    # Progress/stage updates are buffered per job and written in one SQLite
+    # transaction at most this often. Status changes and results are always
+    # committed immediately. 0 commits every update.
+
+    SOW_JOB_COALESCING_ENABLED: bool = True
+    # Attach a submission to an identical queued/processing job (same type,
+    # content_hash and options) instead of running the same work twice.
+    # Requests with options.force=true always get a fresh job.
+
+    SOW_JOB_COALESCE_COMPLETED_MAX_AGE_SECONDS: int = 3600
+    # Return an identical job that completed within this window instead of
+    # re-running it. 0 coalesces with in-flight jobs only.
+
     # Forced Aligner Configuration (Qwen3ForcedAligner-0.6B, runs in-process)
     SOW_FORCED_ALIGNER_MODEL_PATH: str = (
         "Qwen/Qwen3-ForcedAligner-0.6B"  # HF model ID or local path
@@ -21,6 +21,7 @@ logger = logging.getLogger(__name__)
 from .routes import health, jobs
 from .routes.jobs import set_job_queue
 from .workers.queue import JobQueue
+from .workers.whisper_pool import get_whisper_model_pool
 
 # Optional imports for heavy dependencies
 try:
@@ -183,6 +184,25 @@ async def lifespan(app: FastAPI):
     else:
         logger.warning("ForcedAlignerWrapper not available (qwen-asr not installed)")
 
+    # Resident Whisper models: warm configured models in the background so startup
+    # is not blocked, and unload idle ones periodically
+    whisper_pool = get_whisper_model_pool()
+    whisper_tasks = [asyncio.create_task(whisper_pool.run_maintenance())]
+    preload_models = [m.strip() for m in settings.SOW_WHISPER_PRELOAD_MODELS.split(",") if m.strip()]
+    if preload_models:
+
+        async def _warm_whisper_models() -> None:
+            loop = asyncio.get_running_loop()
+            for model_name in preload_models:
+                try:
+                    await loop.run_in_executor(
+                        None, whisper_pool.warm, model_name, settings.SOW_WHISPER_DEVICE or "cuda"
+                    )
+                except Exception as e:
+                    logger.warning(f"Failed to warm Whisper model {model_name}: {e}")
+
+        whisper_tasks.append(asyncio.create_task(_warm_whisper_models()))
+
     # Log startup configuration (non-sensitive values only)
     headers = ("Category", "Setting", "Value")
     config_rows = [
@@ -194,6 +214,11 @@ async def lifespan(app: FastAPI):
         ("Processing", "cache_dir", str(settings.CACHE_DIR)),
         ("Processing", "queue_start_delay", f"{settings.SOW_QUEUE_START_DELAY_SECONDS}s"),
         ("BPM (Fast Analysis)", "algorithm", settings.BPM_ALGORITHM_VERSION),
+        (
+            "Fast Analysis",
+            "process_workers",
+            str(job_queue.fast_analyze_workers or "disabled (thread executor)"),
+        ),
         ("LLM", "model", settings.SOW_LLM_MODEL or "(not set)"),
         ("LLM", "provider", settings.SOW_LLM_BASE_URL or "(not set)"),
         ("Embedding", "model", settings.SOW_EMBEDDING_MODEL),
@@ -207,6 +232,9 @@ async def lifespan(app: FastAPI):
         ("Qwen3 ForcedAligner", "device", settings.SOW_FORCED_ALIGNER_DEVICE),
         ("Whisper", "device", settings.SOW_WHISPER_DEVICE),
         ("Whisper", "cache_dir", str(settings.SOW_WHISPER_CACHE_DIR)),
+        ("Whisper", "preload_models", settings.SOW_WHISPER_PRELOAD_MODELS or "(none)"),
+        ("Whisper", "pool_max_models", str(settings.SOW_WHISPER_POOL_MAX_MODELS)),
+        ("Whisper", "pool_idle_seconds", f"{settings.SOW_WHISPER_POOL_IDLE_SECONDS:.0f}s"),
         ("Demucs", "model", settings.SOW_DEMUCS_MODEL),
         ("Demucs", "device", settings.SOW_DEMUCS_DEVICE),
         ("Audio Separator", "model_dir", str(settings.SOW_AUDIO_SEPARATOR_MODEL_DIR)),
@@ -258,6 +286,12 @@ async def lifespan(app: FastAPI):
         await forced_aligner_wrapper.cleanup()
         logger.info("Forced aligner wrapper cleaned up")
 
+    # Unload resident Whisper models
+    for whisper_task in whisper_tasks:
+        whisper_task.cancel()
+    await asyncio.gather(*whisper_tasks, return_exceptions=True)
+    whisper_pool.clear()
+
     # Cleanup MVSEP client
     if mvsep_client is not None:
         await mvsep_client.aclose()
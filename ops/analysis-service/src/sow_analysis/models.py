@@ -70,6 +70,16 @@ class FastAnalyzeJobRequest(BaseModel):
     options: FastAnalyzeOptions = Field(default_factory=FastAnalyzeOptions)
 
 
+class FastAnalyzeBatchRequest(BaseModel):
+    """Request to submit fast analysis for many songs at once.
+
+    Each entry becomes its own fast analysis job, so results are cached and
+    polled per song exactly as with single submissions.
+    """
+
+    songs: List[FastAnalyzeJobRequest] = Field(min_length=1)
+
+
 class LrcOptions(BaseModel):
     """Options for LRC generation jobs."""
 
@@ -214,6 +224,27 @@ class JobResponse(BaseModel):
     result: Optional[Union[JobResult, "EmbeddingJobResult"]] = None
 
 
+class BatchJobResponse(BaseModel):
+    """Jobs created by a batch submission, in request order."""
+
+    jobs: List[JobResponse]
+
+
+class JobStatusRequest(BaseModel):
+    """Request for the state of many jobs at once."""
+
+    job_ids: List[str] = Field(min_length=1, max_length=1000)
+    # Stream only: send the current state of each job before any changes
+    include_initial: bool = True
+
+
+class JobStatusBatchResponse(BaseModel):
+    """State of the requested jobs; IDs the service does not know are listed in missing."""
+
+    jobs: List[JobResponse]
+    missing: List[str] = []
+
+
 class EmbeddingJobRequest(BaseModel):
     """Request to submit an embedding job."""
 
@@ -243,6 +274,19 @@ class EmbeddingJobResult(BaseModel):
     content_hash: str
 
 
+class QueryEmbeddingRequest(BaseModel):
+    """Request to embed a search query synchronously."""
+
+    text: str = Field(min_length=1, max_length=2000)
+
+
+class QueryEmbeddingResponse(BaseModel):
+    """Embedding for a search query."""
+
+    embedding: List[float]
+    model_version: str
+
+
 @dataclass
 class Job:
     """Represents a job in the queue."""
@@ -8,6 +8,7 @@ from fastapi import APIRouter
 from .. import __version__
 from ..config import settings
 from ..storage.cache import CacheManager
+from ..workers.whisper_pool import get_whisper_model_pool
 
 logger = logging.getLogger(__name__)
 router = APIRouter()
@@ -143,6 +144,14 @@ async def health_check() -> dict:
     except ImportError:
         pass
 
+    queue_stats = None
+    try:
+        from ..main import job_queue as jq
+
+        queue_stats = {"coalescing": jq.get_coalesce_stats()}
+    except ImportError:
+        pass
+
     return {
         "status": "healthy",
         "version": __version__,
@@ -152,5 +161,7 @@ async def health_check() -> dict:
             "llm": check_llm_connection(),
             "embedding": await asyncio.to_thread(check_embedding_connection),
             "separator": {"status": separator_status},
+            "whisper_pool": get_whisper_model_pool().get_stats(),
         },
+        "queue": queue_stats,
     }
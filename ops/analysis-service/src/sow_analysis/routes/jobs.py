@@ -1,23 +1,31 @@
 """Job submission and status endpoints."""
 
-from typing import TYPE_CHECKING, Optional
+from typing import TYPE_CHECKING, AsyncIterator, Optional
 
 from fastapi import APIRouter, Depends, Header, HTTPException
+from fastapi.responses import StreamingResponse
 from pydantic import BaseModel, ValidationError
 
 from ..config import settings
 from ..models import (
     AnalyzeJobRequest,
+    BatchJobResponse,
     EmbeddingJobRequest,
     EmbeddingJobResult,
+    FastAnalyzeBatchRequest,
     FastAnalyzeJobRequest,
     ForcedAlignmentJobRequest,
     JobResponse,
     JobStatus,
+    JobStatusBatchResponse,
+    JobStatusRequest,
     JobType,
     LrcJobRequest,
+    QueryEmbeddingRequest,
+    QueryEmbeddingResponse,
     StemSeparationJobRequest,
 )
+from ..workers.exceptions import LLMConfigError
 
 if TYPE_CHECKING:
     from ..workers.queue import JobQueue
@@ -197,6 +205,38 @@ async def submit_fast_analysis_job(
     return job_to_response(job)
 
 
+@router.post("/jobs/fast-analyze/batch", response_model=BatchJobResponse)
+async def submit_fast_analysis_batch(
+    request: FastAnalyzeBatchRequest,
+    api_key: str = Depends(verify_api_key),
+) -> BatchJobResponse:
+    """Submit many songs for fast analysis in one request.
+
+    Each song becomes its own fast analysis job (duplicates coalesce as with
+    single submissions). Jobs run in parallel on the fast-analysis process
+    pool, and each result lands in that song's fast-tier cache as soon as it
+    finishes, so callers poll the returned job ids as usual.
+
+    Args:
+        request: Songs to analyze
+        api_key: Validated API key
+
+    Returns:
+        One job response per song, in request order
+    """
+    if job_queue is None:
+        raise HTTPException(500, "Job queue not initialized")
+
+    max_size = settings.SOW_FAST_ANALYZE_BATCH_MAX_SIZE
+    if len(request.songs) > max_size:
+        raise HTTPException(
+            422, f"Batch of {len(request.songs)} songs exceeds the limit of {max_size}"
+        )
+
+    jobs = [await job_queue.submit(JobType.FAST_ANALYZE, song) for song in request.songs]
+    return BatchJobResponse(jobs=[job_to_response(job) for job in jobs])
+
+
 @router.post("/jobs/lrc", response_model=JobResponse)
 async def submit_lrc_job(
     request_payload: dict,
@@ -268,6 +308,33 @@ async def submit_embedding_job(
     return job_to_response(job)
 
 
+@router.post("/embeddings/query", response_model=QueryEmbeddingResponse)
+async def embed_query(
+    request: QueryEmbeddingRequest,
+    api_key: str = Depends(verify_api_key),
+) -> QueryEmbeddingResponse:
+    """Embed a search query synchronously.
+
+    Uses the same model, request batching and text cache as embedding jobs,
+    so repeated queries are served from the cache.
+
+    Args:
+        request: Query text
+        api_key: Validated API key
+
+    Returns:
+        Query embedding and the model that produced it
+    """
+    if job_queue is None:
+        raise HTTPException(500, "Job queue not initialized")
+
+    try:
+        embedding = await job_queue.embed_query(request.text)
+    except (LLMConfigError, RuntimeError) as e:
+        raise HTTPException(503, str(e))
+    return QueryEmbeddingResponse(embedding=embedding, model_version=settings.SOW_EMBEDDING_MODEL)
+
+
 @router.post("/jobs/forced-alignment", response_model=JobResponse)
 async def submit_forced_alignment_job(
     request: ForcedAlignmentJobRequest,
@@ -314,6 +381,69 @@ async def list_jobs(
     return [job_to_response(job) for job in jobs]
 
 
+@router.post("/jobs/status", response_model=JobStatusBatchResponse)
+async def get_jobs_status(
+    request: JobStatusRequest,
+    api_key: str = Depends(verify_api_key),
+) -> JobStatusBatchResponse:
+    """Get the status of many jobs in one request.
+
+    Args:
+        request: Job IDs to look up
+        api_key: Validated API key
+
+    Returns:
+        Known jobs in request order, plus the IDs that were not found
+    """
+    if job_queue is None:
+        raise HTTPException(500, "Job queue not initialized")
+
+    found = await job_queue.get_jobs(request.job_ids)
+    return JobStatusBatchResponse(
+        jobs=[job_to_response(found[job_id]) for job_id in request.job_ids if job_id in found],
+        missing=[job_id for job_id in request.job_ids if job_id not in found],
+    )
+
+
+@router.post("/jobs/status/stream")
+async def stream_jobs_status(
+    request: JobStatusRequest,
+    api_key: str = Depends(verify_api_key),
+) -> StreamingResponse:
+    """Stream job state changes as server-sent events.
+
+    Sends a ``job`` event (a JobResponse) whenever a watched job's status or
+    result changes (progress ticks are not streamed), a comment line as a
+    keep-alive, and a final ``end`` event once every watched job has finished.
+    Unknown job IDs are ignored; use POST /jobs/status to detect them.
+
+    Args:
+        request: Job IDs to watch
+        api_key: Validated API key
+
+    Returns:
+        text/event-stream response
+    """
+    if job_queue is None:
+        raise HTTPException(500, "Job queue not initialized")
+
+    async def events() -> AsyncIterator[str]:
+        async for job in job_queue.watch_jobs(
+            request.job_ids, include_initial=request.include_initial
+        ):
+            if job is None:
+                yield ": keep-alive\n\n"
+            else:
+                yield f"event: job\ndata: {job_to_response(job).model_dump_json()}\n\n"
+        yield "event: end\ndata: {}\n\n"
+
+    return StreamingResponse(
+        events(),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
+
+
 @router.get("/jobs/{job_id}", response_model=JobResponse)
 async def get_job_status(
     job_id: str,
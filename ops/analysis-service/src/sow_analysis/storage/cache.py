@@ -8,6 +8,8 @@ from datetime import datetime, timezone
 from pathlib import Path
 from typing import Optional
 
+import numpy as np
+
 from ..config import settings
 
 
@@ -294,6 +296,41 @@ class CacheManager:
         cache_file.write_text(json.dumps(cache_data, indent=2, ensure_ascii=False))
         return cache_file
 
+    def _text_embedding_file(self, key: str) -> Path:
+        return self.cache_dir / "embeddings" / key[:2] / f"{key}.f32"
+
+    def get_text_embeddings(self, keys: list[str]) -> dict[str, list[float]]:
+        """Look up cached text embeddings.
+
+        Args:
+            keys: Content-addressed keys (see embedder.text_embedding_key)
+
+        Returns:
+            Mapping of key to vector for the keys that are cached
+        """
+        found = {}
+        for key in keys:
+            cache_file = self._text_embedding_file(key)
+            try:
+                found[key] = np.fromfile(cache_file, dtype="<f4").tolist()
+            except (FileNotFoundError, ValueError):
+                continue
+        return found
+
+    def save_text_embeddings(self, vectors: dict[str, list[float]]) -> None:
+        """Store text embeddings as little-endian float32, written atomically.
+
+        Args:
+            vectors: Mapping of content-addressed key to vector
+        """
+        for key, vector in vectors.items():
+            cache_file = self._text_embedding_file(key)
+            cache_file.parent.mkdir(parents=True, exist_ok=True)
+            fd, tmp_name = tempfile.mkstemp(dir=cache_file.parent, suffix=".tmp")
+            with os.fdopen(fd, "wb") as f:
+                f.write(np.asarray(vector, dtype="<f4").tobytes())
+            os.replace(tmp_name, cache_file)
+
     def clear(self) -> None:
         """Clear all cached data."""
         if self.cache_dir.exists():
@@ -1,9 +1,10 @@
 """SQLite-backed persistent job store for the analysis service."""
 
+import asyncio
 import logging
 from datetime import datetime, timezone, timedelta
 from pathlib import Path
-from typing import Any, Optional
+from typing import Any, Callable, Optional
 
 import aiosqlite
 
@@ -21,19 +22,35 @@ from .cache import CacheManager
 
 logger = logging.getLogger(__name__)
 
+# Updates touching these columns are written and committed immediately: job
+# status drives restart recovery in JobQueue.initialize and the result must
+# never be lost once a job reports completion. Anything else (progress, stage)
+# may sit in the write-behind buffer.
+DURABLE_FIELDS = frozenset({"status", "result_json"})
+
 
 class JobStore:
     """SQLite-backed persistent job store."""
 
-    def __init__(self, db_path: Path):
+    def __init__(self, db_path: Path, flush_interval_seconds: float = 0.0):
         """Initialize with path to SQLite database file.
 
         Args:
             db_path: Path to the SQLite database file
+            flush_interval_seconds: How long non-status updates (progress,
+                stage) are buffered and coalesced per job before being written
+                in one transaction. 0 writes every update through.
         """
         self.db_path = db_path
+        self.flush_interval_seconds = flush_interval_seconds
         self._db: Optional[aiosqlite.Connection] = None
         self._cache_manager: Optional[CacheManager] = None
+        self._update_listeners: list[Callable[[str], None]] = []
+        # job_id -> column -> value, including updated_at
+        self._pending: dict[str, dict[str, Any]] = {}
+        self._flush_task: Optional[asyncio.Task] = None
+        # Keeps a flush and an immediate write from interleaving
+        self._write_lock = asyncio.Lock()
 
     def set_cache_manager(self, cache_manager: CacheManager) -> None:
         """Set the cache manager for job reconstruction.
@@ -43,6 +60,25 @@ class JobStore:
         """
         self._cache_manager = cache_manager
 
+    def add_update_listener(self, listener: Callable[[str], None]) -> None:
+        """Register a callback invoked with the job ID after an insert, or an
+        update that changes a durable field (status or result).
+
+        Progress and stage ticks do not notify, so listeners wake only when a
+        job's state actually moves on.
+
+        Args:
+            listener: Non-blocking callable; exceptions are logged and ignored
+        """
+        self._update_listeners.append(listener)
+
+    def _notify_update(self, job_id: str) -> None:
+        for listener in self._update_listeners:
+            try:
+                listener(job_id)
+            except Exception as e:
+                logger.warning(f"Job update listener failed for {job_id}: {e}")
+
     async def initialize(self) -> None:
         """Create tables if not exist. Called once at startup."""
         self._db = await aiosqlite.connect(self.db_path)
@@ -500,6 +536,7 @@ class JobStore:
         )
         await self._db.commit()
         logger.debug(f"Inserted job {job.id} into database")
+        self._notify_update(job.id)
 
     async def update_job(self, job_id: str, **fields: Any) -> None:
         """Update specific fields on a job.
@@ -514,26 +551,59 @@ class JobStore:
         if not fields:
             return
 
-        # Build dynamic update query
-        set_clauses = []
-        values = []
-
-        for key, value in fields.items():
-            set_clauses.append(f"{key} = ?")
-            values.append(value)
-
         # Always update updated_at timestamp
-        set_clauses.append("updated_at = ?")
-        values.append(datetime.now(timezone.utc).isoformat())
+        columns = {**fields, "updated_at": datetime.now(timezone.utc).isoformat()}
 
-        values.append(job_id)
+        if self.flush_interval_seconds > 0 and not DURABLE_FIELDS.intersection(fields):
+            self._pending.setdefault(job_id, {}).update(columns)
+            if self._flush_task is None or self._flush_task.done():
+                self._flush_task = asyncio.create_task(self._flush_after_interval())
+        else:
+            # Commit now, together with anything buffered (including this job's
+            # own progress, so the row ends up at its latest state)
+            await self._write({job_id: columns})
 
-        await self._db.execute(
-            f"UPDATE jobs SET {', '.join(set_clauses)} WHERE id = ?",
-            values,
-        )
-        await self._db.commit()
         logger.debug(f"Updated job {job_id}: {fields}")
+        if DURABLE_FIELDS.intersection(fields):
+            self._notify_update(job_id)
+
+    async def flush(self) -> None:
+        """Write all buffered job updates in a single transaction."""
+        if self._pending:
+            await self._write({})
+
+    async def _flush_after_interval(self) -> None:
+        await asyncio.sleep(self.flush_interval_seconds)
+        try:
+            await self.flush()
+        except Exception as e:
+            logger.error(f"Failed to flush buffered job updates: {e}")
+
+    async def _write(self, updates: dict[str, dict[str, Any]]) -> None:
+        """Commit buffered updates plus ``updates`` (which win) in one transaction."""
+        if not self._db:
+            raise RuntimeError("JobStore not initialized")
+
+        async with self._write_lock:
+            pending, self._pending = self._pending, {}
+            for job_id, columns in updates.items():
+                pending[job_id] = {**pending.get(job_id, {}), **columns}
+            try:
+                for job_id, columns in pending.items():
+                    set_clauses = ", ".join(f"{key} = ?" for key in columns)
+                    await self._db.execute(
+                        f"UPDATE jobs SET {set_clauses} WHERE id = ?",
+                        [*columns.values(), job_id],
+                    )
+                await self._db.commit()
+            except BaseException:
+                # Re-buffer so a later flush retries (newer buffered values win)
+                for job_id, columns in pending.items():
+                    if job_id not in updates:
+                        self._pending[job_id] = {**columns, **self._pending.get(job_id, {})}
+                raise
+        if len(pending) > 1:
+            logger.debug(f"Wrote buffered updates for {len(pending)} jobs")
 
     def _row_to_job(self, row: tuple) -> Job:
         """Convert database row to Job instance.
@@ -622,6 +692,7 @@ class JobStore:
         """
         if not self._db:
             raise RuntimeError("JobStore not initialized")
+        await self.flush()
 
         async with self._db.execute("SELECT * FROM jobs WHERE id = ?", (job_id,)) as cursor:
             row = await cursor.fetchone()
@@ -631,6 +702,79 @@ class JobStore:
 
         return self._row_to_job(row)
 
+    async def get_jobs(self, job_ids: list[str]) -> list[Job]:
+        """Retrieve many jobs by ID; unknown IDs are skipped.
+
+        Args:
+            job_ids: Job IDs to look up
+
+        Returns:
+            Jobs found, in no particular order
+        """
+        if not self._db:
+            raise RuntimeError("JobStore not initialized")
+        await self.flush()
+
+        jobs = []
+        # Stay well under SQLite's bound-parameter limit
+        for start in range(0, len(job_ids), 500):
+            chunk = job_ids[start : start + 500]
+            placeholders = ", ".join("?" for _ in chunk)
+            async with self._db.execute(
+                f"SELECT * FROM jobs WHERE id IN ({placeholders})", chunk
+            ) as cursor:
+                rows = await cursor.fetchall()
+            jobs.extend(self._row_to_job(row) for row in rows)
+        return jobs
+
+    async def find_duplicate_job(
+        self,
+        job_type: JobType,
+        content_hash: str,
+        request_json: str,
+        completed_since: Optional[datetime] = None,
+    ) -> Optional[Job]:
+        """Find an identical job that is in flight or recently completed.
+
+        Uses idx_jobs_content_hash to narrow candidates, then matches the full
+        request so differing options never coalesce. In-flight jobs are
+        preferred over completed ones.
+
+        Args:
+            job_type: Job type to match
+            content_hash: Content hash of the request
+            request_json: Serialized request to match exactly
+            completed_since: Also match jobs completed at or after this time
+
+        Returns:
+            Matching job or None
+        """
+        if not self._db:
+            raise RuntimeError("JobStore not initialized")
+        await self.flush()
+
+        query = """
+            SELECT * FROM jobs
+            WHERE content_hash = ? AND type = ? AND request_json = ?
+            AND (
+                status IN ('queued', 'waiting', 'processing')
+                OR (status = 'completed' AND updated_at >= ?)
+            )
+            ORDER BY CASE status WHEN 'completed' THEN 1 ELSE 0 END, created_at DESC
+            LIMIT 1
+        """
+        # "~" sorts after every ISO timestamp, so no completed row matches
+        since = completed_since.isoformat() if completed_since else "~"
+        async with self._db.execute(
+            query, (content_hash, job_type.value, request_json, since)
+        ) as cursor:
+            row = await cursor.fetchone()
+
+        if row is None:
+            return None
+
+        return self._row_to_job(row)
+
     async def get_interrupted_jobs(self) -> list[Job]:
         """Return jobs with status PROCESSING (for restart recovery).
 
@@ -643,6 +787,7 @@ class JobStore:
         """
         if not self._db:
             raise RuntimeError("JobStore not initialized")
+        await self.flush()
 
         async with self._db.execute(
             "SELECT * FROM jobs WHERE status = 'processing'"
@@ -664,6 +809,7 @@ class JobStore:
         """
         if not self._db:
             raise RuntimeError("JobStore not initialized")
+        await self.flush()
 
         async with self._db.execute(
             "SELECT * FROM jobs WHERE status = 'queued'"
@@ -682,6 +828,7 @@ class JobStore:
         """
         if not self._db:
             raise RuntimeError("JobStore not initialized")
+        await self.flush()
 
         async with self._db.execute(
             "SELECT * FROM jobs WHERE status = 'waiting'"
@@ -703,6 +850,7 @@ class JobStore:
         """
         if not self._db:
             raise RuntimeError("JobStore not initialized")
+        await self.flush()
 
         async with self._db.execute(
             "SELECT * FROM jobs WHERE status = 'cancelled'"
@@ -724,6 +872,7 @@ class JobStore:
         """
         if not self._db:
             raise RuntimeError("JobStore not initialized")
+        await self.flush()
 
         cutoff_date = datetime.now(timezone.utc) - timedelta(days=max_age_days)
         cutoff_str = cutoff_date.isoformat()
@@ -762,6 +911,7 @@ class JobStore:
         """
         if not self._db:
             raise RuntimeError("JobStore not initialized")
+        await self.flush()
 
         # Build query with optional filters
         query = "SELECT * FROM jobs"
@@ -788,8 +938,13 @@ class JobStore:
         return [self._row_to_job(row) for row in rows]
 
     async def close(self) -> None:
-        """Close the database connection."""
+        """Flush buffered updates and close the database connection."""
+        if self._flush_task is not None:
+            self._flush_task.cancel()
+            await asyncio.gather(self._flush_task, return_exceptions=True)
+            self._flush_task = None
         if self._db:
+            await self.flush()
             await self._db.close()
             self._db = None
             logger.info("JobStore database connection closed")
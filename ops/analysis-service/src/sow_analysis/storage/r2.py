@@ -5,12 +5,18 @@ import json
 import os
 import re
 import tempfile
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
 from pathlib import Path
 from typing import Optional, Tuple
 
 import boto3
+from boto3.s3.transfer import TransferConfig
+from botocore.config import Config
 from botocore.exceptions import ClientError
 
+from ..config import settings
+
 # Legacy stem name mappings for backward compatibility
 STEM_LEGACY_NAMES = {
     "vocals_dry": "vocals_clean",
@@ -20,6 +26,8 @@ STEM_LEGACY_NAMES = {
 
 MAX_BACKUPS_PER_PREFIX = 5
 
+STEM_NAMES = ("bass", "drums", "other", "vocals")
+
 
 class StaleObjectError(Exception):
     """Raised when the official LRC object was modified after the job started."""
@@ -47,6 +55,43 @@ def parse_s3_url(s3_url: str) -> Tuple[str, str]:
     return match.group(1), match.group(2)
 
 
+def encode_flac(wav_path: Path) -> Optional[Path]:
+    """Re-encode an integer-PCM WAV stem as FLAC next to the source file.
+
+    Only 16- and 24-bit PCM stems round-trip exactly through FLAC. Float
+    stems (the demucs default) can exceed full scale and have no FLAC
+    equivalent, so they are left alone and the caller uploads the WAV.
+
+    Args:
+        wav_path: Path to the WAV file
+
+    Returns:
+        Path to the written .flac file, or None if the stem must stay WAV
+    """
+    import soundfile
+
+    subtype = soundfile.info(str(wav_path)).subtype
+    if subtype not in ("PCM_16", "PCM_24"):
+        return None
+
+    data, sample_rate = soundfile.read(str(wav_path), dtype="int32", always_2d=True)
+    flac_path = wav_path.with_suffix(".flac")
+    soundfile.write(str(flac_path), data, sample_rate, format="FLAC", subtype=subtype)
+    return flac_path
+
+
+def stem_key(hash_prefix: str, stem_path: Path) -> str:
+    """R2 key for an analysis-job stem.
+
+    WAV stems live at ``{hash}/stems/{stem}.wav``. FLAC-encoded ones go
+    under ``{hash}/stems/full/`` so they never collide with the
+    ``stems/{name}.flac`` keys written by the stem-separation stages.
+    """
+    if stem_path.suffix == ".flac":
+        return f"{hash_prefix}/stems/full/{stem_path.name}"
+    return f"{hash_prefix}/stems/{stem_path.name}"
+
+
 class R2Client:
     """R2/S3 storage client for audio and result files.
 
@@ -67,12 +112,43 @@ class R2Client:
         if not access_key or not secret_key:
             raise ValueError("SOW_R2_ACCESS_KEY_ID and SOW_R2_SECRET_ACCESS_KEY must be set")
 
+        workers = max(1, settings.SOW_R2_TRANSFER_WORKERS)
+        concurrency = max(1, settings.SOW_R2_MAX_CONCURRENCY)
+        chunk_size = max(5, settings.SOW_R2_MULTIPART_CHUNK_MB) * 1024 * 1024
+
         self.bucket = bucket
         self.s3 = boto3.client(
             "s3",
             endpoint_url=endpoint_url,
             aws_access_key_id=access_key,
             aws_secret_access_key=secret_key,
+            # Every part of every in-flight transfer needs its own connection
+            config=Config(max_pool_connections=workers * concurrency + 10),
+        )
+        self.transfer_config = TransferConfig(
+            multipart_threshold=chunk_size,
+            multipart_chunksize=chunk_size,
+            max_concurrency=concurrency,
+        )
+        # Dedicated pool so large transfers don't starve the loop's default
+        # executor (shared with CPU-bound analysis helpers).
+        self._executor = ThreadPoolExecutor(max_workers=workers, thread_name_prefix="r2-transfer")
+
+    def close(self) -> None:
+        """Shut down the transfer thread pool."""
+        self._executor.shutdown(wait=False, cancel_futures=True)
+
+    async def _upload_file(self, local_path: Path, key: str) -> None:
+        loop = asyncio.get_running_loop()
+        await loop.run_in_executor(
+            self._executor,
+            partial(
+                self.s3.upload_file,
+                str(local_path),
+                self.bucket,
+                key,
+                Config=self.transfer_config,
+            ),
         )
 
     async def download_audio(self, s3_url: str, local_path: Path) -> None:
@@ -83,17 +159,24 @@ class R2Client:
             local_path: Where to save the file
         """
         bucket, key = parse_s3_url(s3_url)
-        loop = asyncio.get_event_loop()
+        loop = asyncio.get_running_loop()
 
         # Ensure parent directory exists
         local_path.parent.mkdir(parents=True, exist_ok=True)
 
-        await loop.run_in_executor(None, self.s3.download_file, bucket, key, str(local_path))
+        await loop.run_in_executor(
+            self._executor,
+            partial(
+                self.s3.download_file, bucket, key, str(local_path), Config=self.transfer_config
+            ),
+        )
 
     async def upload_stems(self, hash_prefix: str, stems_dir: Path) -> str:
-        """Upload stem files to R2.
+        """Upload stem files to R2 concurrently.
 
-        Uploads: bass.wav, drums.wav, other.wav, vocals.wav
+        Uploads bass, drums, other and vocals as .wav. When
+        SOW_R2_STEMS_FORMAT is "flac", integer-PCM stems are uploaded as
+        ``stems/full/{stem}.flac`` instead (see ``stem_key``).
 
         Args:
             hash_prefix: Content hash prefix for the path
@@ -102,19 +185,19 @@ class R2Client:
         Returns:
             s3://bucket/{hash}/stems/ URL
         """
-        loop = asyncio.get_event_loop()
+        loop = asyncio.get_running_loop()
+        as_flac = settings.SOW_R2_STEMS_FORMAT == "flac"
 
-        for stem in ("bass", "drums", "other", "vocals"):
-            key = f"{hash_prefix}/stems/{stem}.wav"
+        async def upload(stem: str) -> None:
             stem_path = stems_dir / f"{stem}.wav"
-            if stem_path.exists():
-                await loop.run_in_executor(
-                    None,
-                    self.s3.upload_file,
-                    str(stem_path),
-                    self.bucket,
-                    key,
-                )
+            if not stem_path.exists():
+                return
+            if as_flac:
+                flac_path = await loop.run_in_executor(self._executor, encode_flac, stem_path)
+                stem_path = flac_path or stem_path
+            await self._upload_file(stem_path, stem_key(hash_prefix, stem_path))
+
+        await asyncio.gather(*(upload(stem) for stem in STEM_NAMES))
 
         return f"s3://{self.bucket}/{hash_prefix}/stems/"
 
@@ -232,47 +315,19 @@ class R2Client:
             Tuple of (vocals_dry_url, vocals_url or None, instrumental_url or None).
             Order matches separate_stems() return: (vocals_dry, vocals, instrumental).
         """
-        loop = asyncio.get_event_loop()
-
-        # Upload vocals_dry.flac (Stage 2 output)
-        vocals_dry_url: Optional[str] = None
-        if vocals_dry and vocals_dry.exists():
-            dry_key = f"{hash_prefix}/stems/vocals_dry.flac"
-            await loop.run_in_executor(
-                None,
-                self.s3.upload_file,
-                str(vocals_dry),
-                self.bucket,
-                dry_key,
-            )
-            vocals_dry_url = f"s3://{self.bucket}/{dry_key}"
-
-        # Upload vocals.flac (Stage 1 output) if provided
-        vocals_url: Optional[str] = None
-        if vocals and vocals.exists():
-            vocals_key = f"{hash_prefix}/stems/vocals.flac"
-            await loop.run_in_executor(
-                None,
-                self.s3.upload_file,
-                str(vocals),
-                self.bucket,
-                vocals_key,
-            )
-            vocals_url = f"s3://{self.bucket}/{vocals_key}"
-
-        # Upload instrumental.flac if provided
-        instrumental_url: Optional[str] = None
-        if instrumental and instrumental.exists():
-            instrumental_key = f"{hash_prefix}/stems/instrumental.flac"
-            await loop.run_in_executor(
-                None,
-                self.s3.upload_file,
-                str(instrumental),
-                self.bucket,
-                instrumental_key,
-            )
-            instrumental_url = f"s3://{self.bucket}/{instrumental_key}"
 
+        async def upload(path: Optional[Path], stem_name: str) -> Optional[str]:
+            if not path or not path.exists():
+                return None
+            key = f"{hash_prefix}/stems/{stem_name}.flac"
+            await self._upload_file(path, key)
+            return f"s3://{self.bucket}/{key}"
+
+        vocals_dry_url, vocals_url, instrumental_url = await asyncio.gather(
+            upload(vocals_dry, "vocals_dry"),
+            upload(vocals, "vocals"),
+            upload(instrumental, "instrumental"),
+        )
         return vocals_dry_url, vocals_url, instrumental_url
 
     async def copy_object(self, source_s3_url: str, dest_s3_url: str) -> None:
@@ -2,8 +2,10 @@
 
 import asyncio
 import logging
+import multiprocessing
 import tempfile
 import time
+from concurrent.futures import Executor, ProcessPoolExecutor
 from dataclasses import asdict, dataclass
 from datetime import datetime, timezone
 from pathlib import Path
@@ -117,18 +119,41 @@ def _window_bounds(
     return [(float(start), float(min(start + window, duration))) for start in starts]
 
 
+@dataclass(frozen=True)
+class HarmonicFeatures:
+    """Harmonic chroma and RMS for segment-vote key detection.
+
+    These are the expensive part of key detection and do not depend on the
+    section boundaries, so they can be computed while allin1 is still running.
+    """
+
+    duration: float
+    chroma: np.ndarray
+    rms: np.ndarray
+
+
+def compute_harmonic_features(y: np.ndarray, sr: int, hop_length: int = 512) -> HarmonicFeatures:
+    duration = librosa.get_duration(y=y, sr=sr)
+    y_harmonic, _ = librosa.effects.hpss(y)
+    chroma = librosa.feature.chroma_cqt(y=y_harmonic, sr=sr, hop_length=hop_length)
+    rms = librosa.feature.rms(y=y_harmonic, frame_length=2048, hop_length=hop_length)[0]
+    return HarmonicFeatures(duration=duration, chroma=chroma, rms=rms)
+
+
 def detect_key_segment_vote(
     y: np.ndarray,
     sr: int,
     segments: Optional[list[dict]] = None,
     algorithm_version: str = "ks_segment_vote_v1",
+    features: Optional[HarmonicFeatures] = None,
 ) -> KeyDetectionResult:
     """Detect key by aggregating harmonic chroma votes across sections/windows."""
     hop_length = 512
-    duration = librosa.get_duration(y=y, sr=sr)
-    y_harmonic, _ = librosa.effects.hpss(y)
-    chroma = librosa.feature.chroma_cqt(y=y_harmonic, sr=sr, hop_length=hop_length)
-    rms = librosa.feature.rms(y=y_harmonic, frame_length=2048, hop_length=hop_length)[0]
+    if features is None:
+        features = compute_harmonic_features(y, sr, hop_length)
+    duration = features.duration
+    chroma = features.chroma
+    rms = features.rms
     rms_cutoff = float(np.percentile(rms, 10)) if rms.size else 0.0
     rms_cap = float(np.percentile(rms, 90)) if rms.size else 1.0
     aggregate: dict[tuple[str, str], float] = {}
@@ -197,14 +222,21 @@ def detect_key_segment_vote(
     )
 
 
-def detect_key(y: np.ndarray, sr: int, segments: Optional[list[dict]] = None) -> KeyDetectionResult:
+def detect_key(
+    y: np.ndarray,
+    sr: int,
+    segments: Optional[list[dict]] = None,
+    features: Optional[HarmonicFeatures] = None,
+) -> KeyDetectionResult:
     algorithm = settings.KEY_ALGORITHM_VERSION
     if algorithm == "ks_fulltrack_v1":
         return detect_key_fulltrack(y, sr)
     if algorithm == "ks_segment_vote_v1":
-        return detect_key_segment_vote(y, sr, segments, algorithm_version=algorithm)
+        return detect_key_segment_vote(
+            y, sr, segments, algorithm_version=algorithm, features=features
+        )
     if algorithm == "ks_window_vote_v1":
-        return detect_key_segment_vote(y, sr, None, algorithm_version=algorithm)
+        return detect_key_segment_vote(y, sr, None, algorithm_version=algorithm, features=features)
     raise ValueError(f"Unsupported KEY_ALGORITHM_VERSION: {algorithm}")
 
 
@@ -223,6 +255,69 @@ def compute_loudness(y: np.ndarray) -> float:
     return float(db)
 
 
+@dataclass
+class _LibrosaInputs:
+    """Everything analyze_audio needs from the single librosa decode."""
+
+    duration: float
+    loudness_db: float
+    y_key: np.ndarray
+    key_sr: int
+    features: Optional[HarmonicFeatures]
+    key_result: Optional[KeyDetectionResult]
+
+
+def _decode_for_analysis(audio_path: Path, work_dir: Path) -> _LibrosaInputs:
+    """Decode once and derive every librosa input for full analysis.
+
+    Loudness and duration come from the native-rate signal, which is then
+    resampled once to the key-detection rate and released. Key features that do
+    not need allin1's sections are computed here too.
+    """
+    load_start = time.time()
+    y, sr = librosa.load(str(audio_path), sr=None, mono=True, dtype=np.float32)
+    duration = librosa.get_duration(y=y, sr=sr)
+    logger.info(f"Audio decoded in {time.time() - load_start:.2f}s - Duration: {duration:.2f}s")
+
+    loudness_db = compute_loudness(y)
+
+    key_sr = settings.SOW_ANALYSIS_KEY_SAMPLE_RATE or sr
+    y_key = librosa.resample(y, orig_sr=sr, target_sr=key_sr) if key_sr != sr else y
+    del y
+    if settings.SOW_ANALYSIS_MMAP_AUDIO:
+        buffer_path = work_dir / "key_audio.f32"
+        y_key.astype(np.float32, copy=False).tofile(buffer_path)
+        y_key = np.memmap(buffer_path, dtype=np.float32, mode="r")
+
+    key_start = time.time()
+    features = None
+    key_result = None
+    if settings.KEY_ALGORITHM_VERSION == "ks_segment_vote_v1":
+        # Voting needs allin1's sections; the heavy HPSS/CQT does not
+        features = compute_harmonic_features(y_key, key_sr)
+    else:
+        key_result = detect_key(y_key, key_sr, None)
+    logger.info(f"Key features computed in {time.time() - key_start:.2f}s at {key_sr} Hz")
+
+    return _LibrosaInputs(
+        duration=duration,
+        loudness_db=loudness_db,
+        y_key=y_key,
+        key_sr=key_sr,
+        features=features,
+        key_result=key_result,
+    )
+
+
+def _process_peak_rss_mb() -> Optional[float]:
+    try:
+        import resource
+    except ImportError:
+        return None
+    # ru_maxrss is the peak over the whole process lifetime, in KiB on Linux
+    return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024
+
+
 async def analyze_audio(
     audio_path: Path,
     cache_manager: CacheManager,
@@ -234,12 +329,13 @@ async def analyze_audio(
 
     Steps:
     1. Check cache (if not force)
-    2. Load audio with librosa
-    3. Run allin1.analyze() for tempo/beats/sections/embeddings
-    4. Run librosa chroma analysis for key detection
-    5. Compute loudness/energy metrics
-    6. Save to cache
-    7. Return results dict
+    2. Concurrently:
+       - run allin1.analyze() for tempo/beats/sections/embeddings
+       - decode once with librosa for loudness, then resample once for key
+         features
+    3. Vote the key over allin1's sections
+    4. Save to cache
+    5. Return results dict
 
     Args:
         audio_path: Path to audio file
@@ -258,77 +354,77 @@ async def analyze_audio(
             logger.info(f"Cache hit for analysis result: {content_hash[:16]}...")
             return cached
 
-    # Load audio
-    logger.info(f"Loading audio file: {audio_path}")
-    load_start = time.time()
-    y, sr = librosa.load(str(audio_path), sr=None, mono=True)
-    duration = librosa.get_duration(y=y, sr=sr)
-    load_elapsed = time.time() - load_start
-    logger.info(f"Audio loaded in {load_elapsed:.2f}s - Duration: {duration:.2f}s")
+    start = time.time()
+    loop = asyncio.get_running_loop()
 
-    # Run allin1 analysis in thread pool (it's blocking)
     # Use isolated temp directory to prevent concurrent jobs from mixing outputs
-    logger.info("Starting allin1 analysis (tempo, beats, sections, embeddings)")
-    allin1_start = time.time()
-    loop = asyncio.get_event_loop()
-
     with tempfile.TemporaryDirectory() as temp_dir:
 
         def run_allin1():
-            return allin1.analyze(
+            allin1_start = time.time()
+            result = allin1.analyze(
                 str(audio_path),
                 out_dir=temp_dir,
                 visualize=False,
                 include_embeddings=True,
                 sonify=False,
             )
+            logger.info(f"allin1 analysis completed in {time.time() - allin1_start:.2f}s")
+            return result
+
+        # allin1 decodes the file itself; everything librosa needs shares one
+        # decode and runs alongside it
+        logger.info("Starting allin1 analysis alongside key/loudness (single librosa decode)")
+        outcomes = await asyncio.gather(
+            loop.run_in_executor(None, run_allin1),
+            loop.run_in_executor(None, _decode_for_analysis, audio_path, Path(temp_dir)),
+            return_exceptions=True,
+        )
+        for outcome in outcomes:
+            if isinstance(outcome, BaseException):
+                raise outcome
+        result, inputs = outcomes
+
+        # Extract allin1 results
+        bpm = result.bpm
+
+        beats = result.beats
+        if isinstance(beats, np.ndarray):
+            beats = beats.tolist()
+        else:
+            beats = list(beats)
+
+        downbeats = result.downbeats
+        if isinstance(downbeats, np.ndarray):
+            downbeats = downbeats.tolist()
+        else:
+            downbeats = list(downbeats)
+
+        sections = [
+            {"label": seg.label, "start": seg.start, "end": seg.end} for seg in result.segments
+        ]
 
-        result = await loop.run_in_executor(None, run_allin1)
-
-    allin1_elapsed = time.time() - allin1_start
-    logger.info(f"allin1 analysis completed in {allin1_elapsed:.2f}s")
-
-    # Extract allin1 results
-    bpm = result.bpm
-
-    beats = result.beats
-    if isinstance(beats, np.ndarray):
-        beats = beats.tolist()
-    else:
-        beats = list(beats)
-
-    downbeats = result.downbeats
-    if isinstance(downbeats, np.ndarray):
-        downbeats = downbeats.tolist()
-    else:
-        downbeats = list(downbeats)
-
-    sections = [{"label": seg.label, "start": seg.start, "end": seg.end} for seg in result.segments]
+        embeddings_shape = list(result.embeddings.shape)
 
-    embeddings_shape = list(result.embeddings.shape)
+        key_result = inputs.key_result
+        if key_result is None:
+            key_result = detect_key(inputs.y_key, inputs.key_sr, sections, inputs.features)
+        # Release the (possibly memory-mapped) buffer before the temp dir goes
+        inputs.y_key = None
 
-    # Key detection with librosa
-    logger.info("Detecting musical key...")
-    key_start = time.time()
-    key_result = detect_key(y, sr, sections)
-    key_elapsed = time.time() - key_start
+    logger.info(f"Detected key: {key_result.key} {key_result.mode}")
+    peak_rss = _process_peak_rss_mb()
     logger.info(
-        f"Key detection completed in {key_elapsed:.2f}s - "
-        f"Detected: {key_result.key} {key_result.mode}"
+        f"Total analysis time: {time.time() - start:.2f}s"
+        + (f", process peak RSS {peak_rss:.0f}MB" if peak_rss is not None else "")
     )
 
-    # Loudness
-    loudness_db = compute_loudness(y)
-
-    total_elapsed = time.time() - load_start
-    logger.info(f"Total analysis time: {total_elapsed:.2f}s")
-
     # Build result
     analysis_result = {
-        "duration_seconds": duration,
+        "duration_seconds": inputs.duration,
         "tempo_bpm": round(bpm, 1),
         **key_result.to_analysis_fields(),
-        "loudness_db": loudness_db,
+        "loudness_db": inputs.loudness_db,
         "beats": beats,
         "downbeats": downbeats,
         "sections": sections,
@@ -448,6 +544,83 @@ def _compute_tempo_v5(
         return _compute_tempo_v4(y, sr, hop_length, start_bpm)
 
 
+def _run_fast_analysis(
+    audio_path: Path,
+    sample_rate: int,
+    hop_length: int,
+    start_bpm: float,
+    lrc_content: Optional[str],
+) -> tuple[dict, dict[str, float]]:
+    """Blocking fast-tier analysis of one file.
+
+    Module-level so it can be sent to a worker process. Returns the result dict
+    and per-step timings; logging is left to the caller because worker
+    processes do not share the service's log handlers.
+    """
+    load_start = time.time()
+    y, sr = librosa.load(str(audio_path), sr=sample_rate, mono=True)
+    duration = librosa.get_duration(y=y, sr=sr)
+    tempo_start = time.time()
+
+    algorithm = settings.BPM_ALGORITHM_VERSION
+    if algorithm == "v5_cps_prior":
+        bpm = _compute_tempo_v5(y, sr, hop_length, lrc_content, start_bpm)
+    elif algorithm == "v4_octave_guard":
+        bpm = _compute_tempo_v4(y, sr, hop_length, start_bpm)
+    else:
+        raise ValueError(f"Unsupported BPM_ALGORITHM_VERSION: {algorithm}")
+
+    key_start = time.time()
+    key_result = detect_key(y, sr, None)
+    loudness_db = compute_loudness(y)
+    end = time.time()
+
+    analysis_result = {
+        "duration_seconds": duration,
+        "tempo_bpm": round(bpm, 1),
+        **key_result.to_analysis_fields(),
+        "loudness_db": loudness_db,
+    }
+    timings = {
+        "load": tempo_start - load_start,
+        "tempo": key_start - tempo_start,
+        "key": end - key_start,
+        "total": end - load_start,
+    }
+    return analysis_result, timings
+
+
+def _init_fast_analysis_worker(bpm_algorithm: str, key_algorithm: str) -> None:
+    """Process-pool initializer: mirror the parent's algorithm settings and warm librosa.
+
+    The first librosa call in a fresh process pays numba compilation and
+    filter-bank setup, so run the fast path once on a short synthetic clip.
+    """
+    settings.BPM_ALGORITHM_VERSION = bpm_algorithm
+    settings.KEY_ALGORITHM_VERSION = key_algorithm
+    try:
+        sr = 22050
+        y = np.random.default_rng(0).standard_normal(sr * 2).astype(np.float32) * 0.1
+        _compute_tempo_v4(y, sr, 512, 80.0)
+        detect_key_fulltrack(y, sr)
+    except Exception as e:  # warm-up is best effort
+        logger.debug(f"Fast analysis worker warm-up failed: {e}")
+
+
+def create_fast_analysis_executor(max_workers: int) -> ProcessPoolExecutor:
+    """Create the process pool used for fast analysis.
+
+    Workers are spawned rather than forked so they never inherit the event
+    loop or executor threads of the service process.
+    """
+    return ProcessPoolExecutor(
+        max_workers=max_workers,
+        mp_context=multiprocessing.get_context("spawn"),
+        initializer=_init_fast_analysis_worker,
+        initargs=(settings.BPM_ALGORITHM_VERSION, settings.KEY_ALGORITHM_VERSION),
+    )
+
+
 async def analyze_audio_fast(
     audio_path: Path,
     cache_manager: CacheManager,
@@ -457,6 +630,7 @@ async def analyze_audio_fast(
     start_bpm: float = 80.0,
     force: bool = False,
     lrc_content: Optional[str] = None,
+    executor: Optional[Executor] = None,
 ) -> dict:
     """Fast audio analysis using librosa only (no allin1, no stems).
 
@@ -482,6 +656,9 @@ async def analyze_audio_fast(
             When provided and BPM_ALGORITHM_VERSION=v5_cps_prior, a lognormal
             prior is derived from the CPS value. When None or empty, the v5
             path falls back to v4 behavior.
+        executor: Where to run the librosa work. Pass the pool from
+            create_fast_analysis_executor() to analyze songs in parallel
+            processes; None uses the default thread executor.
 
     Returns:
         Dictionary with the fast-tier analysis fields
@@ -495,60 +672,26 @@ async def analyze_audio_fast(
 
     loop = asyncio.get_event_loop()
 
-    # Load audio (blocking — run in executor)
-    logger.info(f"Loading audio file for fast analysis: {audio_path}")
-    load_start = time.time()
-
-    def _load_audio():
-        y, sr = librosa.load(str(audio_path), sr=sample_rate, mono=True)
-        duration = librosa.get_duration(y=y, sr=sr)
-        return y, sr, duration
-
-    y, sr, duration = await loop.run_in_executor(None, _load_audio)
-    load_elapsed = time.time() - load_start
-    logger.info(f"Audio loaded in {load_elapsed:.2f}s - Duration: {duration:.2f}s")
-
-    # Tempo via librosa.beat.tempo
-    logger.info("Estimating tempo...")
-    tempo_start = time.time()
-
-    algorithm = settings.BPM_ALGORITHM_VERSION
-    if algorithm == "v5_cps_prior":
-        bpm = await loop.run_in_executor(
-            None, _compute_tempo_v5, y, sr, hop_length, lrc_content, start_bpm
-        )
-    elif algorithm == "v4_octave_guard":
-        bpm = await loop.run_in_executor(None, _compute_tempo_v4, y, sr, hop_length, start_bpm)
-    else:
-        raise ValueError(f"Unsupported BPM_ALGORITHM_VERSION: {algorithm}")
-
-    tempo_elapsed = time.time() - tempo_start
-    logger.info(f"Tempo estimation completed in {tempo_elapsed:.2f}s - {bpm:.1f} BPM")
-
-    # Key detection with librosa (blocking — run in executor)
-    logger.info("Detecting musical key...")
-    key_start = time.time()
-    key_result = await loop.run_in_executor(None, detect_key, y, sr, None)
-    key_elapsed = time.time() - key_start
+    # Decode + tempo + key + loudness run as one blocking call, either on the
+    # default thread executor or in a fast-analysis worker process
+    logger.info(f"Running fast analysis for: {audio_path}")
+    analysis_result, timings = await loop.run_in_executor(
+        executor,
+        _run_fast_analysis,
+        audio_path,
+        sample_rate,
+        hop_length,
+        start_bpm,
+        lrc_content,
+    )
     logger.info(
-        f"Key detection completed in {key_elapsed:.2f}s - "
-        f"Detected: {key_result.key} {key_result.mode}"
+        f"Fast analysis done - duration {analysis_result['duration_seconds']:.2f}s, "
+        f"{analysis_result['tempo_bpm']:.1f} BPM, "
+        f"{analysis_result['musical_key']} {analysis_result['musical_mode']} "
+        f"(load {timings['load']:.2f}s, tempo {timings['tempo']:.2f}s, "
+        f"key {timings['key']:.2f}s, total {timings['total']:.2f}s)"
     )
 
-    # Loudness (blocking — run in executor)
-    loudness_db = await loop.run_in_executor(None, compute_loudness, y)
-
-    total_elapsed = time.time() - load_start
-    logger.info(f"Total fast analysis time: {total_elapsed:.2f}s")
-
-    # Build result (fast subset only)
-    analysis_result = {
-        "duration_seconds": duration,
-        "tempo_bpm": round(bpm, 1),
-        **key_result.to_analysis_fields(),
-        "loudness_db": loudness_db,
-    }
-
     # Save to cache (distinct from full-tier cache)
     cache_manager.save_fast_analyze_result(content_hash, analysis_result)
 
@@ -1,13 +1,16 @@
 """Embedding worker for generating text embeddings via OpenAI-compatible API."""
 
 import asyncio
+import hashlib
 import logging
-from typing import List
+from dataclasses import dataclass
+from typing import Awaitable, Callable, List, Optional
 
 from openai import OpenAI
 
 from ..config import settings
 from ..models import EmbeddingJobRequest, EmbeddingJobResult, LineEmbedding
+from ..storage.cache import CacheManager
 from .exceptions import LLMConfigError
 
 logger = logging.getLogger(__name__)
@@ -15,16 +18,179 @@ logger = logging.getLogger(__name__)
 _CJK_RANGE_START = 0x4E00
 _CJK_RANGE_END = 0x9FFF
 _MAX_INPUT_CHARS_HEURISTIC = 6000
+_EMBEDDING_DIMENSIONS = 1536
+# The API truncates each input at 8191 tokens, so no single text counts for more.
+_MAX_TOKENS_PER_INPUT = 8191
 
 
 def _count_cjk_chars(text: str) -> int:
     return sum(1 for ch in text if _CJK_RANGE_START <= ord(ch) <= _CJK_RANGE_END)
 
 
+def _estimate_tokens(text: str) -> int:
+    """Conservative token estimate: ~2 per CJK character, ~4 chars per token otherwise."""
+    cjk = _count_cjk_chars(text)
+    return min(_MAX_TOKENS_PER_INPUT, cjk * 2 + (len(text) - cjk) // 4 + 1)
+
+
+def text_embedding_key(text: str, model: str, dimensions: int = _EMBEDDING_DIMENSIONS) -> str:
+    """Content-addressed cache key for one embedded text."""
+    payload = f"{model}\x00{dimensions}\x00{text}".encode("utf-8")
+    return hashlib.sha256(payload).hexdigest()
+
+
+@dataclass
+class _PendingEmbed:
+    texts: List[str]
+    future: "asyncio.Future[List[List[float]]]"
+
+
+class EmbeddingBatcher:
+    """Coalesces embedding requests from concurrent jobs into shared API calls.
+
+    Callers await ``embed(texts)``. Texts arriving within ``window_seconds`` of
+    each other are deduplicated and packed into as few requests as the input
+    and token limits allow; each caller gets back vectors in its own order. A
+    failed request shared by several callers is retried per caller, so it only
+    fails the callers whose own texts still fail. A response with the wrong
+    number of vectors counts as a failed request.
+    """
+
+    def __init__(
+        self,
+        embed_fn: Callable[[List[str]], Awaitable[List[List[float]]]],
+        window_seconds: float = 0.05,
+        max_inputs: int = 2048,
+        max_tokens: int = 250000,
+    ) -> None:
+        self._embed_fn = embed_fn
+        self.window_seconds = window_seconds
+        self.max_inputs = max(1, max_inputs)
+        self.max_tokens = max(_MAX_TOKENS_PER_INPUT, max_tokens)
+        self._pending: List[_PendingEmbed] = []
+        self._task: Optional[asyncio.Task] = None
+        self.requests_sent = 0
+        self.texts_embedded = 0
+
+    async def embed(self, texts: List[str]) -> List[List[float]]:
+        if not texts:
+            return []
+        future = asyncio.get_running_loop().create_future()
+        self._pending.append(_PendingEmbed(list(texts), future))
+        if self._task is None:
+            self._task = asyncio.create_task(self._run())
+        return await future
+
+    async def _run(self) -> None:
+        try:
+            while self._pending:
+                await asyncio.sleep(self.window_seconds)
+                pending, self._pending = self._pending, []
+                try:
+                    await self._dispatch(pending)
+                except Exception as e:
+                    # Never leave a caller waiting on an unresolved future
+                    for item in pending:
+                        if not item.future.done():
+                            item.future.set_exception(e)
+        finally:
+            self._task = None
+
+    def _pack(self, texts: List[str]) -> List[List[str]]:
+        batches: List[List[str]] = []
+        current: List[str] = []
+        current_tokens = 0
+        for text in texts:
+            tokens = _estimate_tokens(text)
+            if current and (
+                len(current) >= self.max_inputs or current_tokens + tokens > self.max_tokens
+            ):
+                batches.append(current)
+                current, current_tokens = [], 0
+            current.append(text)
+            current_tokens += tokens
+        if current:
+            batches.append(current)
+        return batches
+
+    async def _embed_batch(self, batch: List[str]) -> List[List[float]]:
+        vectors = await self._embed_fn(batch)
+        if len(vectors) != len(batch):
+            raise ValueError(
+                f"Embedding provider returned {len(vectors)} vectors for {len(batch)} inputs"
+            )
+        self.requests_sent += 1
+        self.texts_embedded += len(batch)
+        return vectors
+
+    async def _embed_into(
+        self,
+        texts: List[str],
+        vectors: dict[str, List[float]],
+        failures: dict[str, Exception],
+    ) -> List[List[str]]:
+        """Embed ``texts`` in packed batches; return the batches that failed."""
+        failed: List[List[str]] = []
+        for batch in self._pack(texts):
+            try:
+                batch_vectors = await self._embed_batch(batch)
+            except Exception as e:
+                failures.update((text, e) for text in batch)
+                failed.append(batch)
+                continue
+            vectors.update(zip(batch, batch_vectors))
+            for text in batch:
+                failures.pop(text, None)
+        return failed
+
+    async def _dispatch(self, pending: List[_PendingEmbed]) -> None:
+        unique_texts = list(dict.fromkeys(text for item in pending for text in item.texts))
+        vectors: dict[str, List[float]] = {}
+        failures: dict[str, Exception] = {}
+        requests_before = self.requests_sent
+
+        failed_batches = await self._embed_into(unique_texts, vectors, failures)
+
+        # A failed request shared by several jobs is retried once per job, so
+        # one bad input only fails the job that sent it.
+        retry_items: List[_PendingEmbed] = []
+        for batch in failed_batches:
+            in_batch = set(batch)
+            owners = [item for item in pending if in_batch.intersection(item.texts)]
+            if len(owners) > 1:
+                retry_items.extend(item for item in owners if item not in retry_items)
+        for item in retry_items:
+            retry = [t for t in dict.fromkeys(item.texts) if t in failures]
+            if retry:
+                await self._embed_into(retry, vectors, failures)
+
+        if len(pending) > 1:
+            logger.info(
+                f"Embedded {len(unique_texts)} unique texts for {len(pending)} jobs "
+                f"in {self.requests_sent - requests_before} requests"
+            )
+
+        for item in pending:
+            if item.future.done():
+                continue
+            try:
+                error = next((failures[t] for t in item.texts if t in failures), None)
+                if error is not None:
+                    item.future.set_exception(error)
+                else:
+                    item.future.set_result([vectors[t] for t in item.texts])
+            except Exception as e:
+                item.future.set_exception(e)
+
+
 class EmbeddingWorker:
     """Generates text embeddings using OpenAI text-embedding-3-small."""
 
-    def __init__(self):
+    def __init__(
+        self,
+        cache_manager: Optional[CacheManager] = None,
+        batcher: Optional[EmbeddingBatcher] = None,
+    ):
         if not settings.SOW_EMBEDDING_API_KEY:
             raise LLMConfigError(
                 "SOW_EMBEDDING_API_KEY environment variable not set. "
@@ -42,6 +208,13 @@ class EmbeddingWorker:
             timeout=60.0,
             max_retries=2,
         )
+        self._cache = cache_manager if settings.SOW_EMBEDDING_CACHE_ENABLED else None
+        self._batcher = batcher or EmbeddingBatcher(
+            self._embed_texts,
+            window_seconds=settings.SOW_EMBEDDING_BATCH_WINDOW_MS / 1000,
+            max_inputs=settings.SOW_EMBEDDING_BATCH_MAX_INPUTS,
+            max_tokens=settings.SOW_EMBEDDING_BATCH_MAX_TOKENS,
+        )
 
     async def embed_song(self, request: EmbeddingJobRequest) -> EmbeddingJobResult:
         song_text = f"{request.title} {request.composer} {request.lyrics_raw}".strip()
@@ -53,8 +226,6 @@ class EmbeddingWorker:
                 _MAX_INPUT_CHARS_HEURISTIC,
             )
 
-        song_embedding = await self._embed_texts([song_text])
-
         eligible_lines = [
             (i, line)
             for i, line in enumerate(request.lyrics_lines)
@@ -62,9 +233,9 @@ class EmbeddingWorker:
         ]
 
         line_texts = [line for _, line in eligible_lines]
-        line_embeddings_raw = (
-            await self._embed_texts(line_texts) if line_texts else []
-        )
+        embedded = await self._embed_cached([song_text, *line_texts])
+        song_embedding = embedded[:1]
+        line_embeddings_raw = embedded[1:]
 
         line_embeddings = [
             LineEmbedding(
@@ -83,11 +254,36 @@ class EmbeddingWorker:
             content_hash=request.content_hash,
         )
 
+    async def embed_query(self, text: str) -> List[float]:
+        """Embed a search query, sharing the batcher and text cache with song jobs."""
+        return (await self._embed_cached([text.strip()]))[0]
+
+    async def _embed_cached(self, texts: List[str]) -> List[List[float]]:
+        """Embed texts, serving repeats from the disk cache and batching the rest."""
+        if self._cache is None:
+            return await self._batcher.embed(texts)
+
+        keys = [text_embedding_key(t, settings.SOW_EMBEDDING_MODEL) for t in texts]
+        cached = await asyncio.to_thread(self._cache.get_text_embeddings, list(set(keys)))
+        missing = list(dict.fromkeys(t for t, k in zip(texts, keys) if k not in cached))
+        if missing:
+            fresh = await self._batcher.embed(missing)
+            fresh_by_key = {
+                text_embedding_key(t, settings.SOW_EMBEDDING_MODEL): v
+                for t, v in zip(missing, fresh)
+            }
+            try:
+                await asyncio.to_thread(self._cache.save_text_embeddings, fresh_by_key)
+            except OSError as e:
+                logger.warning(f"Failed to cache text embeddings: {e}")
+            cached.update(fresh_by_key)
+        return [cached[k] for k in keys]
+
     async def _embed_texts(self, texts: List[str]) -> List[List[float]]:
         response = await asyncio.to_thread(
             self._client.embeddings.create,
             model=settings.SOW_EMBEDDING_MODEL,
             input=texts,
-            dimensions=1536,
+            dimensions=_EMBEDDING_DIMENSIONS,
         )
         return [d.embedding for d in sorted(response.data, key=lambda x: x.index)]
@@ -22,6 +22,7 @@ from ..services.canonical_snap import snap_qwen3_asr_to_canonical
 from ..services.qwen3_asr_client import Qwen3AsrClient, Qwen3AsrError, Qwen3AsrResult
 from ..storage.cache import CacheManager
 from .exceptions import LLMConfigError, WorkerError
+from .whisper_pool import get_whisper_model_pool
 
 logger = logging.getLogger(__name__)
 
@@ -184,28 +185,14 @@ async def _run_whisper_transcription(
     loop = asyncio.get_running_loop()
 
     def _transcribe():
-        from faster_whisper import WhisperModel
-
-        # Ensure cache directory exists
-        cache_dir = settings.SOW_WHISPER_CACHE_DIR
-        cache_dir.mkdir(parents=True, exist_ok=True)
-
         # Determine device
         device_type = device if device else "cuda"
         compute_type = "int8"  # Use int8 quantization for speed
 
-        # Load model
-        logger.info(f"Loading Whisper model: {model_name} on {device_type} with {compute_type}")
-        model_load_start = time.time()
-        model = WhisperModel(
-            model_name,
-            device=device_type,
-            compute_type=compute_type,
-            download_root=str(cache_dir),
-        )
-        model_load_elapsed = time.time() - model_load_start
-        logger.info(f"Whisper model loaded in {model_load_elapsed:.2f}s")
+        with get_whisper_model_pool().lease(model_name, device_type, compute_type) as lease:
+            return _transcribe_with_model(lease.model), lease
 
+    def _transcribe_with_model(model):
         # Transcribe with language-specific worship song context.
         logger.info(f"Running Whisper transcription: {audio_path}")
         transcribe_start = time.time()
@@ -267,10 +254,19 @@ async def _run_whisper_transcription(
         return phrases
 
     try:
-        phrases = await loop.run_in_executor(None, _transcribe)
+        phrases, lease = await loop.run_in_executor(None, _transcribe)
     except Exception as e:
         raise WhisperTranscriptionError(f"Whisper transcription failed: {e}") from e
 
+    # Logged here rather than in the executor thread so the job_id context applies
+    pool_stats = get_whisper_model_pool().get_stats()
+    load_info = "reused from pool" if lease.pool_hit else f"loaded in {lease.load_seconds:.2f}s"
+    logger.info(
+        f"Whisper model {model_name} {load_info} "
+        f"(pool hit rate {pool_stats['hit_rate']:.0%} over "
+        f"{pool_stats['hits'] + pool_stats['misses']} lookups)"
+    )
+
     if not phrases:
         raise WhisperTranscriptionError("Whisper returned no phrases")
 
@@ -5,9 +5,10 @@ import hashlib
 import logging
 import time
 import uuid
+from concurrent.futures.process import BrokenProcessPool
 from contextlib import asynccontextmanager
 from dataclasses import dataclass
-from datetime import datetime, timezone
+from datetime import datetime, timedelta, timezone
 from pathlib import Path
 from typing import Any, AsyncIterator, Dict, Optional, Union
 
@@ -87,11 +88,12 @@ from ..storage.r2 import R2Client
 
 # Optional imports for heavy dependencies
 try:
-    from .analyzer import analyze_audio, analyze_audio_fast
+    from .analyzer import analyze_audio, analyze_audio_fast, create_fast_analysis_executor
     from .separator import separate_stems
 except ImportError:
     analyze_audio = None
     analyze_audio_fast = None
+    create_fast_analysis_executor = None
     separate_stems = None
 
 # Optional LRC imports - require whisper and openai
@@ -152,6 +154,19 @@ except ImportError:
     validate_audio_duration = None
 
 
+def _resolve_fast_analyze_workers() -> int:
+    """Fast-analysis process count from settings; 0 means the pool is disabled.
+
+    Defaults to the memory-capped SOW_FAST_ANALYZE_MAX_CONCURRENT.
+    """
+    configured = settings.SOW_FAST_ANALYZE_PROCESS_WORKERS
+    if configured < 0:
+        return 0
+    if configured > 0:
+        return configured
+    return settings.SOW_FAST_ANALYZE_MAX_CONCURRENT
+
+
 class JobQueue:
     """In-memory job queue with concurrent execution control."""
 
@@ -185,20 +200,41 @@ class JobQueue:
         # Cloud operations (YouTube transcript, MVSEP, LLM alignment) don't acquire this.
         self._local_model_semaphore = asyncio.Semaphore(max_concurrent_local_model)
         self._dashscope_asr_semaphore = asyncio.Semaphore(settings.SOW_DASHSCOPE_ASR_MAX_CONCURRENT)
-        # Separate semaphore for embedding jobs (external API, no GPU needed)
-        self._embedding_semaphore = asyncio.Semaphore(5)
+        # Separate semaphore for embedding jobs (external API, no GPU needed).
+        # Jobs share one worker so their texts are batched into common requests.
+        self._embedding_semaphore = asyncio.Semaphore(settings.SOW_EMBEDDING_MAX_CONCURRENT_JOBS)
+        self._embedding_worker: Optional[Any] = None
         # Separate semaphore for fast analysis (librosa-only, CPU/memory heavy).
         # Distinct from _local_model_semaphore (allin1/demucs) so fast and full
-        # analysis do not coordinate; operator sizes both together.
-        self._fast_analyze_semaphore = asyncio.Semaphore(settings.SOW_FAST_ANALYZE_MAX_CONCURRENT)
+        # analysis do not coordinate; operator sizes both together. With the
+        # fast-analysis process pool on, at most one job per worker process,
+        # still bounded by SOW_FAST_ANALYZE_MAX_CONCURRENT for memory.
+        self.fast_analyze_workers = _resolve_fast_analyze_workers()
+        self._fast_analyze_executor: Optional[Any] = None
+        self._fast_analyze_semaphore = asyncio.Semaphore(
+            min(self.fast_analyze_workers, settings.SOW_FAST_ANALYZE_MAX_CONCURRENT)
+            if self.fast_analyze_workers
+            else settings.SOW_FAST_ANALYZE_MAX_CONCURRENT
+        )
         self._running = False
         self._logging_task: Optional[asyncio.Task] = None
         self._log_interval_seconds: float = 60.0
         self._last_quiescent_log_time: float = 0.0
+        # Serializes duplicate lookup + insert so concurrent identical submits coalesce
+        self._submit_lock = asyncio.Lock()
+        self._coalesce_stats: Dict[str, int] = {
+            "submitted": 0,
+            "coalesced_in_flight": 0,
+            "coalesced_completed": 0,
+        }
 
-        # Persistent job store
+        # Persistent job store; every insert/update is pushed to status streams
         db_path = db_path if db_path is not None else cache_dir / "jobs.db"
-        self.job_store = JobStore(db_path)
+        self.job_store = JobStore(
+            db_path, flush_interval_seconds=settings.SOW_JOB_STORE_FLUSH_INTERVAL_MS / 1000
+        )
+        self._job_watchers: set[asyncio.Queue[str]] = set()
+        self.job_store.add_update_listener(self._publish_job_change)
 
     def initialize_r2(self, bucket: str, endpoint_url: str) -> None:
         """Initialize R2 client.
@@ -336,36 +372,93 @@ class JobQueue:
             ForcedAlignmentJobRequest,
             FastAnalyzeJobRequest,
         ],
+        force: bool = False,
     ) -> Job:
         """Submit a new job to the queue.
 
+        An identical request (same type, content_hash and options) that is
+        already queued or processing, or completed recently, is returned
+        instead of enqueuing the same work again.
+
         Args:
             job_type: Type of job (analyze, lrc, or stem_separation)
             request: Job request data
+            force: Always create a new job, even if an identical one exists.
+                Implied by ``request.options.force``.
 
         Returns:
-            Created job instance
+            Created or existing job instance
         """
-        job_id = f"job_{uuid.uuid4().hex[:12]}"
+        async with self._submit_lock:
+            self._coalesce_stats["submitted"] += 1
+            options = getattr(request, "options", None)
+            if (
+                settings.SOW_JOB_COALESCING_ENABLED
+                and not force
+                and not getattr(options, "force", False)
+            ):
+                existing = await self._find_duplicate_job(job_type, request)
+                if existing:
+                    return existing
 
-        job = Job(
-            id=job_id,
-            type=job_type,
-            status=JobStatus.QUEUED,
-            request=request,
-        )
+            job_id = f"job_{uuid.uuid4().hex[:12]}"
+
+            job = Job(
+                id=job_id,
+                type=job_type,
+                status=JobStatus.QUEUED,
+                request=request,
+            )
+
+            self._jobs[job_id] = job
+            await self._queue.put(job_id)
+
+            # Persist job to database
+            try:
+                await self.job_store.insert_job(job)
+            except Exception as e:
+                logger.error(f"Failed to persist job {job_id} to database: {e}")
 
-        self._jobs[job_id] = job
-        await self._queue.put(job_id)
+            return job
 
-        # Persist job to database
+    async def _find_duplicate_job(self, job_type: JobType, request: Any) -> Optional[Job]:
+        """Return an in-flight or recently completed job identical to ``request``."""
+        max_age = settings.SOW_JOB_COALESCE_COMPLETED_MAX_AGE_SECONDS
+        completed_since = (
+            datetime.now(timezone.utc) - timedelta(seconds=max_age) if max_age > 0 else None
+        )
         try:
-            await self.job_store.insert_job(job)
+            stored = await self.job_store.find_duplicate_job(
+                job_type,
+                request.content_hash,
+                request.model_dump_json(),
+                completed_since,
+            )
         except Exception as e:
-            logger.error(f"Failed to persist job {job_id} to database: {e}")
+            logger.error(f"Failed to look up duplicate jobs in database: {e}")
+            return None
+        if stored is None:
+            return None
+
+        # Prefer the in-memory job: it carries live progress
+        job = self._jobs.get(stored.id, stored)
+        if job.status == JobStatus.COMPLETED:
+            self._coalesce_stats["coalesced_completed"] += 1
+        elif job.status in (JobStatus.QUEUED, JobStatus.WAITING, JobStatus.PROCESSING):
+            self._coalesce_stats["coalesced_in_flight"] += 1
+        else:
+            return None
 
+        logger.info(
+            f"Coalesced {job_type.value} submission for {request.content_hash[:12]} "
+            f"into {job.status.value} job {job.id}"
+        )
         return job
 
+    def get_coalesce_stats(self) -> Dict[str, int]:
+        """Return submission counts and how many were deduplicated."""
+        return dict(self._coalesce_stats)
+
     async def get_job(self, job_id: str) -> Optional[Job]:
         """Get job by ID.
 
@@ -387,6 +480,102 @@ class JobQueue:
             logger.error(f"Failed to retrieve job {job_id} from database: {e}")
             return None
 
+    def _get_embedding_worker(self) -> Any:
+        """Return the shared embedding worker, creating it on first use."""
+        if EmbeddingWorker is None:
+            raise RuntimeError("Embedding dependencies not available (openai)")
+        if self._embedding_worker is None:
+            self._embedding_worker = EmbeddingWorker(cache_manager=self.cache_manager)
+        return self._embedding_worker
+
+    async def embed_query(self, text: str) -> list[float]:
+        """Embed a search query synchronously (no job record).
+
+        Args:
+            text: Query text
+
+        Returns:
+            Query embedding vector
+
+        Raises:
+            RuntimeError: If openai is not installed
+            LLMConfigError: If the embedding provider is not configured
+        """
+        async with self._embedding_semaphore:
+            return await self._get_embedding_worker().embed_query(text)
+
+    async def get_jobs(self, job_ids: list[str]) -> Dict[str, Job]:
+        """Get many jobs by ID in one pass.
+
+        Args:
+            job_ids: Job IDs to look up
+
+        Returns:
+            Mapping of job ID to job; unknown IDs are absent
+        """
+        found = {job_id: self._jobs[job_id] for job_id in job_ids if job_id in self._jobs}
+        remaining = [job_id for job_id in dict.fromkeys(job_ids) if job_id not in found]
+        if remaining:
+            try:
+                for job in await self.job_store.get_jobs(remaining):
+                    found[job.id] = job
+            except Exception as e:
+                logger.error(f"Failed to retrieve {len(remaining)} jobs from database: {e}")
+        return found
+
+    def _publish_job_change(self, job_id: str) -> None:
+        """Job store listener: wake every watcher after a job's status or result changes."""
+        for changes in self._job_watchers:
+            changes.put_nowait(job_id)
+
+    async def watch_jobs(
+        self,
+        job_ids: list[str],
+        include_initial: bool = True,
+        heartbeat_seconds: float = 15.0,
+    ) -> AsyncIterator[Optional[Job]]:
+        """Yield watched jobs as their status or result changes until all are finished.
+
+        Args:
+            job_ids: Job IDs to watch; unknown IDs are ignored
+            include_initial: Yield the current state of every known job first
+            heartbeat_seconds: Yield None after this long without a change so
+                callers can keep the connection alive
+
+        Yields:
+            The job after each change (possibly repeated for one state), or None
+            as a heartbeat
+        """
+        finished = (JobStatus.COMPLETED, JobStatus.FAILED, JobStatus.CANCELLED)
+        changes: asyncio.Queue[str] = asyncio.Queue()
+        self._job_watchers.add(changes)
+        try:
+            # Unknown IDs never finish, so only watch jobs that exist.
+            known = await self.get_jobs(job_ids)
+            watching = set(known)
+            for job in known.values():
+                if include_initial:
+                    yield job
+                if job.status in finished:
+                    watching.discard(job.id)
+
+            while watching:
+                try:
+                    job_id = await asyncio.wait_for(changes.get(), timeout=heartbeat_seconds)
+                except asyncio.TimeoutError:
+                    yield None
+                    continue
+                if job_id not in watching:
+                    continue
+                job = await self.get_job(job_id)
+                if job is None:
+                    continue
+                yield job
+                if job.status in finished:
+                    watching.discard(job_id)
+        finally:
+            self._job_watchers.discard(changes)
+
     async def list_jobs(
         self,
         status: Optional[JobStatus] = None,
@@ -776,16 +965,29 @@ class JobQueue:
                 except Exception as e:
                     logger.error(f"Failed to update job {job.id} in database: {e}")
 
-                analysis_result = await analyze_audio_fast(
-                    audio_path,
-                    self.cache_manager,
-                    request.content_hash,
-                    sample_rate=request.options.sample_rate,
-                    hop_length=request.options.hop_length,
-                    start_bpm=request.options.start_bpm,
-                    force=request.options.force,
-                    lrc_content=request.options.lrc_content,
-                )
+                async def run_fast_analysis(executor: Optional[Any]) -> dict:
+                    return await analyze_audio_fast(
+                        audio_path,
+                        self.cache_manager,
+                        request.content_hash,
+                        sample_rate=request.options.sample_rate,
+                        hop_length=request.options.hop_length,
+                        start_bpm=request.options.start_bpm,
+                        force=request.options.force,
+                        lrc_content=request.options.lrc_content,
+                        executor=executor,
+                    )
+
+                executor = self._get_fast_analyze_executor()
+                try:
+                    analysis_result = await run_fast_analysis(executor)
+                except BrokenProcessPool:
+                    # A worker died (e.g. OOM-killed) and took the pool with
+                    # it. Replace the pool so later jobs are unaffected and
+                    # retry this one once; a second failure fails the job.
+                    logger.warning("Fast analysis process pool broke; restarting it")
+                    self._reset_fast_analyze_executor(executor)
+                    analysis_result = await run_fast_analysis(self._get_fast_analyze_executor())
 
                 # Build job result (fast subset only; full-only fields stay None)
                 job.result = JobResult(
@@ -836,6 +1038,30 @@ class JobQueue:
         finally:
             job.updated_at = datetime.now(timezone.utc)
 
+    def _get_fast_analyze_executor(self) -> Optional[Any]:
+        """Process pool for fast analysis, created on first use; None when disabled."""
+        if self.fast_analyze_workers <= 0 or create_fast_analysis_executor is None:
+            return None
+        if self._fast_analyze_executor is None:
+            logger.info(
+                f"Starting fast analysis process pool with {self.fast_analyze_workers} workers"
+            )
+            self._fast_analyze_executor = create_fast_analysis_executor(
+                self.fast_analyze_workers
+            )
+        return self._fast_analyze_executor
+
+    def _reset_fast_analyze_executor(self, broken: Optional[Any]) -> None:
+        """Drop a broken fast-analysis pool so the next use starts a new one.
+
+        Concurrent jobs may all hit the same broken pool; only the first to
+        get here replaces it.
+        """
+        if broken is None or self._fast_analyze_executor is not broken:
+            return
+        self._fast_analyze_executor = None
+        broken.shutdown(wait=False, cancel_futures=True)
+
     async def _update_stage(
         self,
         job: Job,
@@ -1998,8 +2224,7 @@ class JobQueue:
             return
 
         try:
-            worker = EmbeddingWorker()
-            result = await worker.embed_song(request)
+            result = await self._get_embedding_worker().embed_song(request)
 
             job.result = result
             job.status = JobStatus.COMPLETED
@@ -2193,6 +2418,11 @@ class JobQueue:
         await self.stop_periodic_logging()
         if self._forced_aligner_wrapper is not None:
             await self._forced_aligner_wrapper.cleanup()
+        if self._fast_analyze_executor is not None:
+            self._fast_analyze_executor.shutdown(wait=False, cancel_futures=True)
+            self._fast_analyze_executor = None
+        if self.r2_client is not None:
+            self.r2_client.close()
         await self.job_store.close()
 
     def _is_quota_wait_quiescent(self) -> bool:
@@ -2302,7 +2532,18 @@ class JobQueue:
                 wait_parts.append(f"{jt.name} processing={avg_dur:.0f}s")
 
         wait_time_str = " " + " ".join(wait_parts) if wait_parts else " none"
-        logger.info(f"Queue state: {' '.join(parts)} | Wait times:{wait_time_str}")
+        coalesce = self._coalesce_stats
+        deduplicated = coalesce["coalesced_in_flight"] + coalesce["coalesced_completed"]
+        coalesce_str = (
+            f" | Coalesced: {deduplicated}/{coalesce['submitted']} submissions "
+            f"(in_flight:{coalesce['coalesced_in_flight']},"
+            f"completed:{coalesce['coalesced_completed']})"
+            if deduplicated
+            else ""
+        )
+        logger.info(
+            f"Queue state: {' '.join(parts)} | Wait times:{wait_time_str}{coalesce_str}"
+        )
 
     async def _periodic_logging_loop(self) -> None:
         """Background task that logs queue state periodically."""
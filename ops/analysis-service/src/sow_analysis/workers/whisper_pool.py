@@ -0,0 +1,224 @@
+"""Process-wide pool of resident faster-whisper models."""
+
+from __future__ import annotations
+
+import asyncio
+import gc
+import logging
+import threading
+import time
+from collections import OrderedDict
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Callable, Iterator, Optional
+
+from ..config import settings
+
+logger = logging.getLogger(__name__)
+
+WhisperModelKey = tuple[str, str, str]  # (model_name, device, compute_type)
+
+
+def _load_faster_whisper(key: WhisperModelKey, download_root: Path) -> Any:
+    from faster_whisper import WhisperModel
+
+    model_name, device, compute_type = key
+    download_root.mkdir(parents=True, exist_ok=True)
+    return WhisperModel(
+        model_name,
+        device=device,
+        compute_type=compute_type,
+        download_root=str(download_root),
+    )
+
+
+def _available_memory_bytes() -> Optional[int]:
+    """MemAvailable from /proc/meminfo, or None where it cannot be read."""
+    try:
+        with open("/proc/meminfo", encoding="utf-8") as f:
+            for line in f:
+                if line.startswith("MemAvailable:"):
+                    return int(line.split()[1]) * 1024
+    except (OSError, ValueError, IndexError):
+        pass
+    return None
+
+
+@dataclass
+class _PooledModel:
+    model: Any
+    load_seconds: float
+    last_used: float = field(default_factory=time.monotonic)
+    in_use: int = 0
+
+
+@dataclass(frozen=True)
+class WhisperModelLease:
+    """A model checked out of the pool for one transcription."""
+
+    model: Any
+    pool_hit: bool
+    load_seconds: float
+
+
+class WhisperModelPool:
+    """Keeps loaded faster-whisper models resident between LRC jobs.
+
+    Models are keyed by (model name, device, compute type). A model stays loaded
+    until it has been idle for ``idle_seconds``, the pool grows past
+    ``max_models`` (least recently used first), or available memory drops below
+    ``min_available_bytes``. Models in use by a transcription are never unloaded.
+
+    Loading and transcription run in executor threads, so the pool is guarded by
+    a threading lock; a per-key lock keeps two jobs from loading the same model.
+    """
+
+    def __init__(
+        self,
+        max_models: int = 1,
+        idle_seconds: float = 600.0,
+        min_available_bytes: int = 0,
+        download_root: Optional[Path] = None,
+        loader: Callable[[WhisperModelKey, Path], Any] = _load_faster_whisper,
+        available_memory_fn: Callable[[], Optional[int]] = _available_memory_bytes,
+    ) -> None:
+        self.max_models = max(1, max_models)
+        self.idle_seconds = idle_seconds
+        self.min_available_bytes = min_available_bytes
+        self.download_root = download_root or settings.SOW_WHISPER_CACHE_DIR
+        self._loader = loader
+        self._available_memory_fn = available_memory_fn
+        self._models: OrderedDict[WhisperModelKey, _PooledModel] = OrderedDict()
+        self._lock = threading.Lock()
+        self._load_locks: dict[WhisperModelKey, threading.Lock] = {}
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    @contextmanager
+    def lease(
+        self, model_name: str, device: str, compute_type: str = "int8"
+    ) -> Iterator[WhisperModelLease]:
+        """Check out a model, loading it on a miss. Blocking; call from a worker thread."""
+        key = (model_name, device, compute_type)
+        with self._lock:
+            load_lock = self._load_locks.setdefault(key, threading.Lock())
+
+        with load_lock:
+            with self._lock:
+                entry = self._models.get(key)
+                if entry is not None:
+                    self._models.move_to_end(key)
+                    entry.in_use += 1
+                    self.hits += 1
+                    pool_hit = True
+            if entry is None:
+                with self._lock:
+                    self._evict_locked(reserve_slot=True)
+                logger.info(
+                    f"Loading Whisper model: {model_name} on {device} with {compute_type}"
+                )
+                load_start = time.monotonic()
+                model = self._loader(key, self.download_root)
+                entry = _PooledModel(model=model, load_seconds=time.monotonic() - load_start)
+                entry.in_use = 1
+                with self._lock:
+                    self._models[key] = entry
+                    self.misses += 1
+                pool_hit = False
+
+        try:
+            yield WhisperModelLease(
+                model=entry.model,
+                pool_hit=pool_hit,
+                load_seconds=0.0 if pool_hit else entry.load_seconds,
+            )
+        finally:
+            with self._lock:
+                entry.in_use -= 1
+                entry.last_used = time.monotonic()
+
+    def warm(self, model_name: str, device: str, compute_type: str = "int8") -> None:
+        """Load a model ahead of the first job that needs it."""
+        with self.lease(model_name, device, compute_type) as lease:
+            if not lease.pool_hit:
+                logger.info(
+                    f"Whisper model {model_name} warmed in {lease.load_seconds:.2f}s"
+                )
+
+    def evict_idle(self) -> int:
+        """Unload models idle too long, or any idle model under memory pressure."""
+        with self._lock:
+            return self._evict_locked(reserve_slot=False)
+
+    def _evict_locked(self, reserve_slot: bool) -> int:
+        now = time.monotonic()
+        available = self._available_memory_fn() if self.min_available_bytes > 0 else None
+        under_pressure = available is not None and available < self.min_available_bytes
+        limit = self.max_models - 1 if reserve_slot else self.max_models
+
+        evicted = 0
+        for key, entry in list(self._models.items()):
+            if entry.in_use:
+                continue
+            idle = now - entry.last_used >= self.idle_seconds
+            over_limit = len(self._models) > limit
+            if not (idle or over_limit or under_pressure):
+                continue
+            del self._models[key]
+            evicted += 1
+            reason = "memory pressure" if under_pressure else "idle" if idle else "pool full"
+            logger.info(f"Unloading Whisper model {key[0]} ({key[1]}/{key[2]}): {reason}")
+
+        if evicted:
+            self.evictions += evicted
+            gc.collect()
+        return evicted
+
+    async def run_maintenance(self, interval_seconds: float = 60.0) -> None:
+        """Background task that unloads idle models until cancelled."""
+        loop = asyncio.get_running_loop()
+        while True:
+            try:
+                await asyncio.sleep(interval_seconds)
+                await loop.run_in_executor(None, self.evict_idle)
+            except asyncio.CancelledError:
+                break
+            except Exception as e:
+                logger.warning(f"Whisper model pool maintenance failed: {e}")
+
+    def clear(self) -> None:
+        """Unload every model that is not in use."""
+        with self._lock:
+            for key in [k for k, entry in self._models.items() if not entry.in_use]:
+                del self._models[key]
+        gc.collect()
+
+    def get_stats(self) -> dict[str, Any]:
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "loaded": [key[0] for key in self._models],
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+                "hit_rate": self.hits / lookups if lookups else 0.0,
+            }
+
+
+_pool: Optional[WhisperModelPool] = None
+_pool_lock = threading.Lock()
+
+
+def get_whisper_model_pool() -> WhisperModelPool:
+    """Return the process-wide pool, created from settings on first use."""
+    global _pool
+    with _pool_lock:
+        if _pool is None:
+            _pool = WhisperModelPool(
+                max_models=settings.SOW_WHISPER_POOL_MAX_MODELS,
+                idle_seconds=settings.SOW_WHISPER_POOL_IDLE_SECONDS,
+                min_available_bytes=settings.SOW_WHISPER_POOL_MIN_AVAILABLE_MB * 1024 * 1024,
+            )
+        return _pool
@@ -1,5 +1,6 @@
 """Tests for FastAPI endpoints."""
 
+import json
 import os
 from datetime import datetime, timezone
 from unittest.mock import MagicMock, patch
@@ -9,6 +10,7 @@ from fastapi.testclient import TestClient
 from sow_analysis.main import app
 from sow_analysis.models import JobStatus, JobType
 from sow_analysis.routes.jobs import set_job_queue
+from sow_analysis.workers.exceptions import LLMConfigError
 from sow_analysis.workers.queue import Job, JobQueue
 
 
@@ -65,6 +67,8 @@ def mock_settings():
         "sow_analysis.routes.jobs.settings",
         SOW_ANALYSIS_API_KEY="test-api-key",
         SOW_ADMIN_API_KEY="test-admin-key",
+        SOW_FAST_ANALYZE_BATCH_MAX_SIZE=500,
+        SOW_EMBEDDING_MODEL="text-embedding-3-small",
     ):
         with patch(
             "sow_analysis.routes.health.settings",
@@ -147,6 +151,55 @@ class TestJobsEndpoints:
         assert data["job_id"] == "job_abc123"
         assert data["status"] == "queued"
 
+    def test_submit_fast_analysis_batch(self, client, mock_job_queue):
+        """Each song in a batch becomes its own fast analysis job."""
+        submitted = []
+
+        async def mock_submit(job_type, request, *args, **kwargs):
+            submitted.append((job_type, request.content_hash))
+            now = datetime.now(timezone.utc)
+            return Job(
+                id=f"job_{request.content_hash}",
+                type=job_type,
+                status=JobStatus.QUEUED,
+                request=request,
+                created_at=now,
+                updated_at=now,
+            )
+
+        mock_job_queue.submit = mock_submit
+        response = client.post(
+            "/api/v1/jobs/fast-analyze/batch",
+            json={
+                "songs": [
+                    {"audio_url": "s3://bucket/a/audio.mp3", "content_hash": "aaa"},
+                    {"audio_url": "s3://bucket/b/audio.mp3", "content_hash": "bbb"},
+                ]
+            },
+            headers={"Authorization": "Bearer test-api-key"},
+        )
+
+        assert response.status_code == 200
+        jobs = response.json()["jobs"]
+        assert [job["job_id"] for job in jobs] == ["job_aaa", "job_bbb"]
+        assert all(job["job_type"] == "fast_analyze" for job in jobs)
+        assert submitted == [(JobType.FAST_ANALYZE, "aaa"), (JobType.FAST_ANALYZE, "bbb")]
+
+    def test_submit_fast_analysis_batch_over_limit(self, client, mock_job_queue):
+        """Batches above SOW_FAST_ANALYZE_BATCH_MAX_SIZE are rejected."""
+        from sow_analysis.routes import jobs as jobs_module
+
+        songs = [{"audio_url": f"s3://bucket/{i}.mp3", "content_hash": str(i)} for i in range(3)]
+        with patch.object(jobs_module.settings, "SOW_FAST_ANALYZE_BATCH_MAX_SIZE", 2):
+            response = client.post(
+                "/api/v1/jobs/fast-analyze/batch",
+                json={"songs": songs},
+                headers={"Authorization": "Bearer test-api-key"},
+            )
+
+        assert response.status_code == 422
+        assert "exceeds the limit of 2" in response.json()["detail"]
+
     def test_submit_fast_analysis_job_no_auth(self, client):
         """Test submitting fast analysis without auth fails."""
         response = client.post(
@@ -264,6 +317,138 @@ class TestJobsEndpoints:
 
         assert response.status_code == 404
 
+    def test_bulk_job_status(self, client, mock_job_queue):
+        """POST /jobs/status returns known jobs in request order plus missing IDs."""
+        now = datetime.now(timezone.utc)
+
+        async def mock_get_jobs(job_ids):
+            return {
+                job_id: Job(
+                    id=job_id,
+                    type=JobType.FAST_ANALYZE,
+                    status=JobStatus.COMPLETED,
+                    request=MagicMock(),
+                    created_at=now,
+                    updated_at=now,
+                )
+                for job_id in job_ids
+                if job_id != "job_missing"
+            }
+
+        mock_job_queue.get_jobs = mock_get_jobs
+        response = client.post(
+            "/api/v1/jobs/status",
+            json={"job_ids": ["job_b", "job_missing", "job_a"]},
+            headers={"Authorization": "Bearer test-api-key"},
+        )
+
+        assert response.status_code == 200
+        data = response.json()
+        assert [job["job_id"] for job in data["jobs"]] == ["job_b", "job_a"]
+        assert data["missing"] == ["job_missing"]
+
+    def test_job_status_stream(self, client, mock_job_queue):
+        """POST /jobs/status/stream emits SSE job events, keep-alives and an end event."""
+        now = datetime.now(timezone.utc)
+        seen_kwargs = {}
+
+        async def mock_watch_jobs(job_ids, **kwargs):
+            seen_kwargs.update(kwargs)
+            for status in (JobStatus.PROCESSING, None, JobStatus.COMPLETED):
+                if status is None:
+                    yield None
+                    continue
+                yield Job(
+                    id=job_ids[0],
+                    type=JobType.ANALYZE,
+                    status=status,
+                    request=MagicMock(),
+                    created_at=now,
+                    updated_at=now,
+                )
+
+        mock_job_queue.watch_jobs = mock_watch_jobs
+        response = client.post(
+            "/api/v1/jobs/status/stream",
+            json={"job_ids": ["job_abc123"], "include_initial": False},
+            headers={"Authorization": "Bearer test-api-key"},
+        )
+
+        assert response.status_code == 200
+        assert response.headers["content-type"].startswith("text/event-stream")
+        blocks = [b for b in response.text.split("\n\n") if b]
+        assert blocks[1] == ": keep-alive"
+        assert blocks[-1] == "event: end\ndata: {}"
+        statuses = [
+            json.loads(b.split("data: ", 1)[1])["status"]
+            for b in blocks
+            if b.startswith("event: job")
+        ]
+        assert statuses == ["processing", "completed"]
+        assert seen_kwargs == {"include_initial": False}
+
+    def test_job_status_stream_ends_with_unknown_ids(self, client, tmp_path):
+        """Unknown job IDs are ignored, so the stream still ends once known jobs finish."""
+        now = datetime.now(timezone.utc)
+        queue = JobQueue(cache_dir=tmp_path, db_path=tmp_path / "jobs.db")
+
+        async def mock_get_jobs(job_ids):
+            job = Job(
+                id="job_done",
+                type=JobType.ANALYZE,
+                status=JobStatus.COMPLETED,
+                request=MagicMock(),
+                created_at=now,
+                updated_at=now,
+            )
+            return {job.id: job}
+
+        queue.get_jobs = mock_get_jobs
+        set_job_queue(queue)
+        response = client.post(
+            "/api/v1/jobs/status/stream",
+            json={"job_ids": ["job_done", "job_missing"]},
+            headers={"Authorization": "Bearer test-api-key"},
+        )
+
+        assert response.status_code == 200
+        blocks = [b for b in response.text.split("\n\n") if b]
+        assert blocks[-1] == "event: end\ndata: {}"
+        assert sum(b.startswith("event: job") for b in blocks) == 1
+
+    def test_embed_query(self, client, mock_job_queue):
+        """POST /embeddings/query returns the vector and model; config errors are 503."""
+        seen = []
+
+        async def mock_embed_query(text):
+            seen.append(text)
+            return [0.1, 0.2]
+
+        mock_job_queue.embed_query = mock_embed_query
+        response = client.post(
+            "/api/v1/embeddings/query",
+            json={"text": "奇異恩典"},
+            headers={"Authorization": "Bearer test-api-key"},
+        )
+
+        assert response.status_code == 200
+        assert response.json() == {
+            "embedding": [0.1, 0.2],
+            "model_version": "text-embedding-3-small",
+        }
+        assert seen == ["奇異恩典"]
+
+        async def unconfigured(text):
+            raise LLMConfigError("SOW_EMBEDDING_API_KEY environment variable not set.")
+
+        mock_job_queue.embed_query = unconfigured
+        response = client.post(
+            "/api/v1/embeddings/query",
+            json={"text": "奇異恩典"},
+            headers={"Authorization": "Bearer test-api-key"},
+        )
+        assert response.status_code == 503
+
     def test_get_job_status_no_queue_initialized(self, client):
         """Test error when queue not initialized."""
         set_job_queue(None)
@@ -272,6 +272,15 @@ class TestWriteLRC:
 class TestRunWhisperTranscription:
     """Test Whisper transcription function."""
 
+    @pytest.fixture(autouse=True)
+    def _fresh_whisper_pool(self, tmp_path):
+        """Give each test its own model pool so mocked models do not leak between tests."""
+        from sow_analysis.workers.whisper_pool import WhisperModelPool
+
+        pool = WhisperModelPool(download_root=tmp_path)
+        with patch("sow_analysis.workers.lrc.get_whisper_model_pool", return_value=pool):
+            yield
+
     @pytest.mark.asyncio
     async def test_transcription_returns_phrases(self):
         """Test that transcription returns WhisperPhrase list."""
@@ -566,3 +566,96 @@ class TestJobQueueR2:
                 mock_r2.assert_called_once_with("my-bucket", "https://r2.example.com")
 
             await queue.stop()
+
+
+class TestFastAnalyzeProcessPool:
+    """Fast analysis process pool sizing and lifecycle."""
+
+    @pytest.mark.asyncio
+    async def test_pool_sizes_semaphore_and_is_created_lazily(self, tmp_path):
+        import sow_analysis.workers.queue as queue_module
+
+        with (
+            patch.object(queue_module.settings, "SOW_FAST_ANALYZE_PROCESS_WORKERS", 3),
+            patch.object(queue_module.settings, "SOW_FAST_ANALYZE_MAX_CONCURRENT", 4),
+        ):
+            queue = JobQueue(cache_dir=tmp_path)
+        try:
+            assert queue._fast_analyze_semaphore._value == 3
+            assert queue._fast_analyze_executor is None
+
+            fake_executor = MagicMock()
+            with patch.object(
+                queue_module, "create_fast_analysis_executor", return_value=fake_executor
+            ) as create:
+                assert queue._get_fast_analyze_executor() is fake_executor
+                assert queue._get_fast_analyze_executor() is fake_executor
+            create.assert_called_once_with(3)
+        finally:
+            await queue.stop()
+        fake_executor.shutdown.assert_called_once_with(wait=False, cancel_futures=True)
+
+    @pytest.mark.asyncio
+    async def test_default_workers_follow_memory_cap(self, tmp_path):
+        import sow_analysis.workers.queue as queue_module
+
+        with (
+            patch.object(queue_module.settings, "SOW_FAST_ANALYZE_PROCESS_WORKERS", 0),
+            patch.object(queue_module.settings, "SOW_FAST_ANALYZE_MAX_CONCURRENT", 2),
+        ):
+            queue = JobQueue(cache_dir=tmp_path)
+        try:
+            assert queue.fast_analyze_workers == 2
+            assert queue._fast_analyze_semaphore._value == 2
+        finally:
+            await queue.stop()
+
+    @pytest.mark.asyncio
+    async def test_explicit_workers_still_bounded_by_cap(self, tmp_path):
+        import sow_analysis.workers.queue as queue_module
+
+        with (
+            patch.object(queue_module.settings, "SOW_FAST_ANALYZE_PROCESS_WORKERS", 8),
+            patch.object(queue_module.settings, "SOW_FAST_ANALYZE_MAX_CONCURRENT", 2),
+        ):
+            queue = JobQueue(cache_dir=tmp_path)
+        try:
+            assert queue.fast_analyze_workers == 8
+            assert queue._fast_analyze_semaphore._value == 2
+        finally:
+            await queue.stop()
+
+    @pytest.mark.asyncio
+    async def test_broken_pool_is_replaced(self, tmp_path):
+        import sow_analysis.workers.queue as queue_module
+
+        with patch.object(queue_module.settings, "SOW_FAST_ANALYZE_PROCESS_WORKERS", 2):
+            queue = JobQueue(cache_dir=tmp_path)
+        broken, fresh = MagicMock(), MagicMock()
+        try:
+            with patch.object(
+                queue_module, "create_fast_analysis_executor", side_effect=[broken, fresh]
+            ):
+                assert queue._get_fast_analyze_executor() is broken
+                queue._reset_fast_analyze_executor(broken)
+                # A second job reporting the same broken pool is a no-op
+                queue._reset_fast_analyze_executor(broken)
+                assert queue._get_fast_analyze_executor() is fresh
+            broken.shutdown.assert_called_once_with(wait=False, cancel_futures=True)
+        finally:
+            await queue.stop()
+
+    @pytest.mark.asyncio
+    async def test_negative_workers_disables_pool(self, tmp_path):
+        import sow_analysis.workers.queue as queue_module
+
+        with (
+            patch.object(queue_module.settings, "SOW_FAST_ANALYZE_PROCESS_WORKERS", -1),
+            patch.object(queue_module.settings, "SOW_FAST_ANALYZE_MAX_CONCURRENT", 2),
+        ):
+            queue = JobQueue(cache_dir=tmp_path)
+        try:
+            assert queue._fast_analyze_semaphore._value == 2
+            assert queue._get_fast_analyze_executor() is None
+        finally:
+            await queue.stop()
@@ -3,6 +3,7 @@
 import json
 import os
 import tempfile
+import threading
 from pathlib import Path
 from unittest.mock import MagicMock, patch
 
@@ -80,7 +81,7 @@ class TestR2Client:
             local_path = Path(tmp) / "audio.mp3"
 
             # Create the file that the mock would have downloaded
-            def mock_download(bucket, key, filepath):
+            def mock_download(bucket, key, filepath, Config=None):
                 Path(filepath).write_text("fake audio data")
 
             mock_boto3.download_file.side_effect = mock_download
@@ -105,6 +106,73 @@ class TestR2Client:
             assert url == "s3://my-bucket/abc123/stems/"
             assert mock_boto3.upload_file.call_count == 4
 
+    @pytest.mark.asyncio
+    async def test_upload_stems_runs_concurrently_with_transfer_config(self, mock_boto3):
+        """All stems are in flight at once and use the tuned TransferConfig."""
+        client = R2Client("my-bucket", "https://r2.example.com")
+        barrier = threading.Barrier(4, timeout=5)
+
+        def upload_file(filename, bucket, key, Config=None):
+            assert Config is client.transfer_config
+            barrier.wait()  # deadlocks (BrokenBarrierError) if uploads are sequential
+
+        mock_boto3.upload_file.side_effect = upload_file
+
+        with tempfile.TemporaryDirectory() as tmp:
+            stems_dir = Path(tmp)
+            for stem in ("bass", "drums", "other", "vocals"):
+                (stems_dir / f"{stem}.wav").write_text(f"fake {stem}")
+
+            await client.upload_stems("abc123", stems_dir)
+
+        keys = sorted(c.args[2] for c in mock_boto3.upload_file.call_args_list)
+        assert keys == [f"abc123/stems/{s}.wav" for s in ("bass", "drums", "other", "vocals")]
+        client.close()
+
+    @pytest.mark.asyncio
+    async def test_upload_stems_as_flac(self, mock_boto3):
+        """SOW_R2_STEMS_FORMAT=flac re-encodes PCM stems under stems/full/."""
+        import numpy as np
+        import soundfile
+
+        client = R2Client("my-bucket", "https://r2.example.com")
+        samples = (np.sin(np.linspace(0, 200, 4410)) * 0.5).astype(np.float32)
+
+        with tempfile.TemporaryDirectory() as tmp:
+            stems_dir = Path(tmp)
+            soundfile.write(str(stems_dir / "vocals.wav"), samples, 44100, subtype="PCM_16")
+
+            with patch("sow_analysis.storage.r2.settings.SOW_R2_STEMS_FORMAT", "flac"):
+                await client.upload_stems("abc123", stems_dir)
+
+            filename, _, key = mock_boto3.upload_file.call_args.args
+            assert key == "abc123/stems/full/vocals.flac"
+            decoded, rate = soundfile.read(filename, dtype="int16")
+            original, _ = soundfile.read(str(stems_dir / "vocals.wav"), dtype="int16")
+
+        assert rate == 44100
+        assert np.array_equal(decoded, original)
+
+    @pytest.mark.asyncio
+    async def test_upload_stems_as_flac_keeps_float_stems_wav(self, mock_boto3):
+        """Float stems can't round-trip through FLAC, so they upload as WAV."""
+        import numpy as np
+        import soundfile
+
+        client = R2Client("my-bucket", "https://r2.example.com")
+        samples = (np.sin(np.linspace(0, 200, 4410)) * 1.5).astype(np.float32)
+
+        with tempfile.TemporaryDirectory() as tmp:
+            stems_dir = Path(tmp)
+            soundfile.write(str(stems_dir / "vocals.wav"), samples, 44100, subtype="FLOAT")
+
+            with patch("sow_analysis.storage.r2.settings.SOW_R2_STEMS_FORMAT", "flac"):
+                await client.upload_stems("abc123", stems_dir)
+
+            filename, _, key = mock_boto3.upload_file.call_args.args
+            assert key == "abc123/stems/vocals.wav"
+            assert not (stems_dir / "vocals.flac").exists()
+
     @pytest.mark.asyncio
     async def test_upload_analysis_result(self, mock_boto3):
         """Test uploading analysis result."""
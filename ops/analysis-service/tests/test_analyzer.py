@@ -1,6 +1,9 @@
 """Tests for analyze_audio_fast tempo parameters and octave guard."""
 
+import sys
+import threading
 from pathlib import Path
+from types import SimpleNamespace
 from unittest.mock import MagicMock, patch
 
 import numpy as np
@@ -568,3 +571,138 @@ class TestAnalyzeAudioFastV5CpsPrior:
         tempo_call = mock_librosa.beat.tempo.call_args
         assert tempo_call.kwargs.get("start_bpm") == 80.0
         assert "prior" not in tempo_call.kwargs
+
+
+def _write_tone(path: Path, sr: int = 44100, seconds: float = 4.0) -> None:
+    import soundfile as sf
+
+    t = np.arange(int(sr * seconds)) / sr
+    # C major triad
+    y = sum(np.sin(2 * np.pi * f * t) for f in (261.63, 329.63, 392.0)) / 3
+    sf.write(str(path), y.astype(np.float32), sr)
+
+
+class _FakeAllin1:
+    """Stands in for allin1; optionally blocks until key-feature work has started."""
+
+    def __init__(self, wait_for=None):
+        self.wait_for = wait_for
+        self.saw_features_first = None
+
+    def analyze(self, path, **kwargs):
+        if self.wait_for is not None:
+            # Generous timeout: only guards against a hang if the overlap breaks.
+            self.saw_features_first = self.wait_for.wait(timeout=300)
+        return SimpleNamespace(
+            bpm=72.0,
+            beats=np.array([0.5, 1.3]),
+            downbeats=np.array([0.5]),
+            segments=[SimpleNamespace(label="verse", start=0.0, end=4.0)],
+            embeddings=np.zeros((4, 2, 24)),
+        )
+
+
+class TestAnalyzeAudioSharedDecode:
+    """analyze_audio decodes once and overlaps key/loudness with allin1."""
+
+    @pytest.fixture
+    def audio_path(self, tmp_path):
+        path = tmp_path / "audio.wav"
+        _write_tone(path)
+        return path
+
+    @pytest.fixture
+    def cache_manager(self):
+        manager = MagicMock()
+        manager.get_analysis_result.return_value = None
+        return manager
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("mmap_audio", [False, True])
+    async def test_key_features_computed_while_allin1_runs(
+        self, audio_path, cache_manager, mmap_audio, monkeypatch
+    ):
+        from sow_analysis.workers import analyzer
+
+        features_started = threading.Event()
+        real_compute = analyzer.compute_harmonic_features
+        seen_rates = []
+
+        def compute(y, sr, *args):
+            # Signal on entry so the ordering does not depend on librosa's speed.
+            seen_rates.append(sr)
+            features_started.set()
+            return real_compute(y, sr, *args)
+
+        fake = _FakeAllin1(wait_for=features_started)
+        monkeypatch.setitem(sys.modules, "allin1", fake)
+        with (
+            patch.object(analyzer, "compute_harmonic_features", side_effect=compute),
+            patch.object(analyzer.settings, "KEY_ALGORITHM_VERSION", "ks_segment_vote_v1"),
+            patch.object(analyzer.settings, "SOW_ANALYSIS_KEY_SAMPLE_RATE", 22050),
+            patch.object(analyzer.settings, "SOW_ANALYSIS_MMAP_AUDIO", mmap_audio),
+        ):
+            result = await analyzer.analyze_audio(audio_path, cache_manager, "abc123")
+
+        assert fake.saw_features_first is True
+        assert seen_rates == [22050]
+        assert (result["musical_key"], result["musical_mode"]) == ("C", "major")
+        assert result["duration_seconds"] == pytest.approx(4.0, abs=0.01)
+        assert result["tempo_bpm"] == 72.0
+        assert result["sections"] == [{"label": "verse", "start": 0.0, "end": 4.0}]
+        cache_manager.save_analysis_result.assert_called_once_with("abc123", result)
+
+    @pytest.mark.asyncio
+    async def test_decode_failure_waits_for_allin1(self, tmp_path, cache_manager, monkeypatch):
+        from sow_analysis.workers import analyzer
+
+        monkeypatch.setitem(sys.modules, "allin1", _FakeAllin1())
+        with pytest.raises(Exception):
+            await analyzer.analyze_audio(tmp_path / "missing.wav", cache_manager, "abc123")
+        cache_manager.save_analysis_result.assert_not_called()
+
+    def test_precomputed_features_match(self, audio_path):
+        from sow_analysis.workers import analyzer
+
+        y, sr = analyzer.librosa.load(str(audio_path), sr=22050)
+        sections = [{"label": "verse", "start": 0.0, "end": 4.0}]
+        features = analyzer.compute_harmonic_features(y, sr)
+
+        direct = analyzer.detect_key_segment_vote(y, sr, sections)
+        shared = analyzer.detect_key_segment_vote(y, sr, sections, features=features)
+
+        assert (shared.key, shared.mode, shared.confidence) == (
+            direct.key,
+            direct.mode,
+            direct.confidence,
+        )
+
+
+class TestAnalyzeAudioFastProcessPool:
+    """analyze_audio_fast can run its librosa work in a spawned worker process."""
+
+    @pytest.mark.asyncio
+    async def test_results_match_thread_executor_and_are_cached(self, tmp_path):
+        from sow_analysis.workers import analyzer
+
+        audio_path = tmp_path / "audio.wav"
+        _write_tone(audio_path, sr=22050, seconds=6.0)
+
+        thread_cache = MagicMock()
+        thread_cache.get_fast_analyze_result.return_value = None
+        expected = await analyzer.analyze_audio_fast(audio_path, thread_cache, "abc123")
+
+        pool_cache = MagicMock()
+        pool_cache.get_fast_analyze_result.return_value = None
+        executor = analyzer.create_fast_analysis_executor(1)
+        try:
+            result = await analyzer.analyze_audio_fast(
+                audio_path, pool_cache, "abc123", executor=executor
+            )
+        finally:
+            executor.shutdown()
+
+        assert {k: v for k, v in result.items() if k != "key_detected_at"} == {
+            k: v for k, v in expected.items() if k != "key_detected_at"
+        }
+        pool_cache.save_fast_analyze_result.assert_called_once_with("abc123", result)
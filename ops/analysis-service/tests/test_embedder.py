@@ -0,0 +1,217 @@
+"""Tests for cross-job embedding batching and the text embedding cache."""
+
+import asyncio
+from types import SimpleNamespace
+from unittest.mock import patch
+
+import pytest
+
+from sow_analysis.models import EmbeddingJobRequest
+from sow_analysis.storage.cache import CacheManager
+from sow_analysis.workers import embedder as embedder_module
+from sow_analysis.workers.embedder import EmbeddingBatcher, EmbeddingWorker
+
+
+class FakeEmbeddings:
+    """Stands in for client.embeddings; vectors encode the text length."""
+
+    def __init__(self):
+        self.calls = []
+
+    def create(self, model, input, dimensions):
+        self.calls.append(list(input))
+        data = [
+            SimpleNamespace(index=i, embedding=[float(len(text)), float(i)])
+            for i, text in enumerate(input)
+        ]
+        return SimpleNamespace(data=list(reversed(data)))
+
+
+def _settings(**overrides):
+    values = dict(
+        SOW_EMBEDDING_API_KEY="sk-test",
+        SOW_EMBEDDING_BASE_URL="https://example.invalid/v1",
+        SOW_EMBEDDING_MODEL="text-embedding-3-small",
+        SOW_EMBEDDING_CACHE_ENABLED=True,
+        SOW_EMBEDDING_BATCH_WINDOW_MS=20,
+        SOW_EMBEDDING_BATCH_MAX_INPUTS=2048,
+        SOW_EMBEDDING_BATCH_MAX_TOKENS=250000,
+    )
+    values.update(overrides)
+    return SimpleNamespace(**values)
+
+
+def _worker(cache_manager=None, **overrides):
+    with patch.object(embedder_module, "settings", _settings(**overrides)):
+        worker = EmbeddingWorker(cache_manager=cache_manager)
+    fake = FakeEmbeddings()
+    worker._client = SimpleNamespace(embeddings=fake)
+    return worker, fake
+
+
+def _request(song_id, lines):
+    return EmbeddingJobRequest(
+        song_id=song_id,
+        title=f"Song {song_id}",
+        lyrics_raw="\n".join(lines),
+        lyrics_lines=lines,
+        content_hash=f"hash-{song_id}",
+    )
+
+
+class TestEmbeddingBatcher:
+    async def test_concurrent_callers_share_one_request(self):
+        calls = []
+
+        async def embed_fn(texts):
+            calls.append(texts)
+            return [[float(len(t))] for t in texts]
+
+        batcher = EmbeddingBatcher(embed_fn, window_seconds=0.01)
+        first, second = await asyncio.gather(
+            batcher.embed(["aa", "bbb"]), batcher.embed(["bbb", "c"])
+        )
+
+        assert calls == [["aa", "bbb", "c"]]
+        assert first == [[2.0], [3.0]]
+        assert second == [[3.0], [1.0]]
+
+    async def test_splits_on_input_and_token_limits(self):
+        calls = []
+
+        async def embed_fn(texts):
+            calls.append(texts)
+            return [[0.0] for _ in texts]
+
+        batcher = EmbeddingBatcher(embed_fn, window_seconds=0, max_inputs=2)
+        await batcher.embed(["a", "b", "c"])
+        assert [len(c) for c in calls] == [2, 1]
+
+        calls.clear()
+        batcher = EmbeddingBatcher(embed_fn, window_seconds=0, max_tokens=10000)
+        await batcher.embed(["讚美" * 2500, "主" * 2500, "x"])
+        assert [len(c) for c in calls] == [1, 2]
+
+    async def test_failed_request_only_fails_its_callers(self):
+        async def embed_fn(texts):
+            if "bad" in texts:
+                raise RuntimeError("rate limited")
+            return [[1.0] for _ in texts]
+
+        batcher = EmbeddingBatcher(embed_fn, window_seconds=0.01, max_inputs=1)
+        ok, failed = await asyncio.gather(
+            batcher.embed(["good"]), batcher.embed(["bad"]), return_exceptions=True
+        )
+
+        assert ok == [[1.0]]
+        assert isinstance(failed, RuntimeError)
+
+    async def test_shared_failed_request_is_retried_per_caller(self):
+        calls = []
+
+        async def embed_fn(texts):
+            calls.append(texts)
+            if "too long" in texts:
+                raise RuntimeError("input too long")
+            return [[1.0] for _ in texts]
+
+        batcher = EmbeddingBatcher(embed_fn, window_seconds=0.01)
+        ok, failed = await asyncio.gather(
+            batcher.embed(["good"]), batcher.embed(["too long"]), return_exceptions=True
+        )
+
+        assert calls == [["good", "too long"], ["good"], ["too long"]]
+        assert ok == [[1.0]]
+        assert isinstance(failed, RuntimeError)
+
+    async def test_short_response_fails_callers_instead_of_hanging(self):
+        async def embed_fn(texts):
+            return [[1.0]]  # one vector regardless of input count
+
+        batcher = EmbeddingBatcher(embed_fn, window_seconds=0.01)
+        single, short = await asyncio.wait_for(
+            asyncio.gather(
+                batcher.embed(["a"]), batcher.embed(["b", "c"]), return_exceptions=True
+            ),
+            timeout=2.0,
+        )
+
+        assert single == [[1.0]]
+        assert isinstance(short, ValueError)
+
+
+class TestEmbeddingWorker:
+    async def test_songs_embedded_concurrently_share_api_calls(self):
+        worker, fake = _worker()
+        lines_a = ["奇異恩典何等甘甜", "hi"]
+        lines_b = ["奇異恩典何等甘甜", "我罪已得赦免"]
+
+        with patch.object(embedder_module, "settings", _settings()):
+            result_a, result_b = await asyncio.gather(
+                worker.embed_song(_request("a", lines_a)),
+                worker.embed_song(_request("b", lines_b)),
+            )
+
+        assert len(fake.calls) == 1
+        assert len(fake.calls[0]) == 4  # two song texts + two unique eligible lines
+        assert [le.line_index for le in result_a.line_embeddings] == [0]
+        assert [le.line_text for le in result_b.line_embeddings] == lines_b
+        assert result_a.line_embeddings[0].embedding == result_b.line_embeddings[0].embedding
+        assert result_a.embedding[0] == float(len(f"Song a  {lines_a[0]}\nhi"))
+
+    async def test_cached_lines_skip_the_api(self, tmp_path):
+        cache = CacheManager(tmp_path)
+        worker, fake = _worker(cache_manager=cache)
+        lines = ["奇異恩典何等甘甜", "我罪已得赦免"]
+
+        with patch.object(embedder_module, "settings", _settings()):
+            first = await worker.embed_song(_request("a", lines))
+            second = await worker.embed_song(_request("a", lines))
+            third = await worker.embed_song(_request("b", [*lines, "前我失喪今被尋回"]))
+
+        assert [len(c) for c in fake.calls] == [3, 2]
+        assert fake.calls[1] == ["Song b  " + "\n".join([*lines, "前我失喪今被尋回"]),
+                                 "前我失喪今被尋回"]
+        assert second.embedding == first.embedding
+        assert [le.embedding for le in third.line_embeddings[:2]] == [
+            le.embedding for le in first.line_embeddings
+        ]
+        assert list((tmp_path / "embeddings").rglob("*.f32"))
+
+    async def test_query_embedding_shares_the_text_cache(self, tmp_path):
+        worker, fake = _worker(cache_manager=CacheManager(tmp_path))
+
+        with patch.object(embedder_module, "settings", _settings()):
+            first = await worker.embed_query(" 奇異恩典 ")
+            second = await worker.embed_query("奇異恩典")
+
+        assert fake.calls == [["奇異恩典"]]
+        assert first == second
+
+    async def test_cache_disabled(self, tmp_path):
+        with patch.object(
+            embedder_module, "settings", _settings(SOW_EMBEDDING_CACHE_ENABLED=False)
+        ):
+            worker, fake = _worker(
+                cache_manager=CacheManager(tmp_path), SOW_EMBEDDING_CACHE_ENABLED=False
+            )
+            for _ in range(2):
+                await worker.embed_song(_request("a", ["奇異恩典何等甘甜"]))
+
+        assert len(fake.calls) == 2
+        assert not (tmp_path / "embeddings").exists()
+
+
+class TestTextEmbeddingCache:
+    def test_round_trip_and_miss(self, tmp_path):
+        cache = CacheManager(tmp_path)
+        cache.save_text_embeddings({"ab" * 32: [0.5, -1.25]})
+
+        assert cache.get_text_embeddings(["ab" * 32, "cd" * 32]) == {"ab" * 32: [0.5, -1.25]}
+
+
+@pytest.mark.parametrize("model", ["text-embedding-3-small", "text-embedding-3-large"])
+def test_cache_key_depends_on_model(model):
+    key = embedder_module.text_embedding_key("奇異恩典", model)
+    assert key != embedder_module.text_embedding_key("奇異恩典", "other-model")
+    assert len(key) == 64
@@ -681,3 +681,143 @@ async def test_get_waiting_jobs(job_store: JobStore) -> None:
     assert len(waiting) == 2
     waiting_ids = {job.id for job in waiting}
     assert waiting_ids == {"job_waiting1", "job_waiting2"}
+
+
+@pytest.mark.asyncio
+async def test_find_duplicate_job_prefers_in_flight(job_store: JobStore) -> None:
+    """In-flight duplicates win over completed ones; completed need a window."""
+    request = AnalyzeJobRequest(audio_url="s3://test/dup.mp3", content_hash="dup123")
+    request_json = request.model_dump_json()
+    since = datetime.now(timezone.utc) - timedelta(hours=1)
+
+    completed = Job(id="job_done", type=JobType.ANALYZE, status=JobStatus.COMPLETED, request=request)
+    await job_store.insert_job(completed)
+
+    found = await job_store.find_duplicate_job(JobType.ANALYZE, "dup123", request_json, since)
+    assert found is not None and found.id == "job_done"
+    assert await job_store.find_duplicate_job(JobType.ANALYZE, "dup123", request_json) is None
+
+    queued = Job(id="job_queued", type=JobType.ANALYZE, status=JobStatus.QUEUED, request=request)
+    await job_store.insert_job(queued)
+
+    found = await job_store.find_duplicate_job(JobType.ANALYZE, "dup123", request_json, since)
+    assert found.id == "job_queued"
+    assert (
+        await job_store.find_duplicate_job(JobType.FAST_ANALYZE, "dup123", request_json, since)
+        is None
+    )
+    other_options = AnalyzeJobRequest(
+        audio_url="s3://test/dup.mp3",
+        content_hash="dup123",
+        options=AnalyzeOptions(generate_stems=False),
+    )
+    assert (
+        await job_store.find_duplicate_job(
+            JobType.ANALYZE, "dup123", other_options.model_dump_json(), since
+        )
+        is None
+    )
+
+
+@pytest.mark.asyncio
+async def test_get_jobs_skips_unknown_ids(job_store: JobStore) -> None:
+    """Bulk lookup returns every known job and ignores unknown IDs."""
+    for i in range(3):
+        request = AnalyzeJobRequest(audio_url=f"s3://test/bulk{i}.mp3", content_hash=f"bulk{i}")
+        await job_store.insert_job(
+            Job(id=f"job_{i}", type=JobType.ANALYZE, status=JobStatus.QUEUED, request=request)
+        )
+
+    jobs = await job_store.get_jobs(["job_0", "job_2", "job_missing"])
+
+    assert sorted(job.id for job in jobs) == ["job_0", "job_2"]
+
+
+@pytest.mark.asyncio
+async def test_update_listeners_notified(job_store: JobStore) -> None:
+    """Listeners hear about inserts and status changes; a failing listener is ignored."""
+    seen = []
+
+    def broken(job_id: str) -> None:
+        raise RuntimeError("boom")
+
+    job_store.add_update_listener(broken)
+    job_store.add_update_listener(seen.append)
+    request = AnalyzeJobRequest(audio_url="s3://test/listen.mp3", content_hash="listen")
+    await job_store.insert_job(
+        Job(id="job_listen", type=JobType.ANALYZE, status=JobStatus.QUEUED, request=request)
+    )
+    await job_store.update_job("job_listen", progress=0.5, stage="analyzing")
+    await job_store.update_job("job_listen", status="processing")
+
+    # The progress tick alone does not notify
+    assert seen == ["job_listen", "job_listen"]
+
+
+async def _committed_row(db_path: Path, job_id: str) -> tuple:
+    """Read a job row through a separate connection (committed data only)."""
+    async with aiosqlite.connect(db_path) as db:
+        async with db.execute(
+            "SELECT status, progress, stage FROM jobs WHERE id = ?", (job_id,)
+        ) as cursor:
+            return await cursor.fetchone()
+
+
+@pytest.fixture
+async def buffered_store(temp_db_path: Path) -> JobStore:
+    """JobStore with a write-behind buffer long enough to never fire on its own."""
+    store = JobStore(temp_db_path, flush_interval_seconds=60)
+    await store.initialize()
+    request = AnalyzeJobRequest(audio_url="s3://test/buffer.mp3", content_hash="buffer")
+    await store.insert_job(
+        Job(id="job_buf", type=JobType.ANALYZE, status=JobStatus.PROCESSING, request=request)
+    )
+    yield store
+    await store.close()
+
+
+@pytest.mark.asyncio
+async def test_progress_updates_are_coalesced(
+    buffered_store: JobStore, temp_db_path: Path
+) -> None:
+    """Progress/stage ticks stay buffered but are visible to the store's own reads."""
+    await buffered_store.update_job("job_buf", progress=0.2, stage="separating")
+    await buffered_store.update_job("job_buf", progress=0.4)
+
+    assert await _committed_row(temp_db_path, "job_buf") == ("processing", 0.0, "")
+
+    job = await buffered_store.get_job("job_buf")
+    assert (job.progress, job.stage) == (0.4, "separating")
+    assert await _committed_row(temp_db_path, "job_buf") == ("processing", 0.4, "separating")
+
+
+@pytest.mark.asyncio
+async def test_status_change_commits_immediately_with_buffered_progress(
+    buffered_store: JobStore, temp_db_path: Path
+) -> None:
+    """A status transition is durable at once and carries the job's latest progress."""
+    await buffered_store.update_job("job_buf", progress=0.9, stage="uploading")
+    await buffered_store.update_job("job_buf", status="completed", progress=1.0)
+
+    assert await _committed_row(temp_db_path, "job_buf") == ("completed", 1.0, "uploading")
+    assert buffered_store._pending == {}
+
+
+@pytest.mark.asyncio
+async def test_buffer_flushes_on_interval_and_close(temp_db_path: Path) -> None:
+    """Buffered updates reach disk after the interval, and on close."""
+    store = JobStore(temp_db_path, flush_interval_seconds=0.01)
+    await store.initialize()
+    request = AnalyzeJobRequest(audio_url="s3://test/flush.mp3", content_hash="flush")
+    await store.insert_job(
+        Job(id="job_flush", type=JobType.ANALYZE, status=JobStatus.PROCESSING, request=request)
+    )
+
+    await store.update_job("job_flush", progress=0.5)
+    await asyncio.sleep(0.1)
+    assert await _committed_row(temp_db_path, "job_flush") == ("processing", 0.5, "")
+
+    store.flush_interval_seconds = 60
+    await store.update_job("job_flush", progress=0.75)
+    await store.close()
+    assert await _committed_row(temp_db_path, "job_flush") == ("processing", 0.75, "")
@@ -662,3 +662,219 @@ async def test_log_queue_state_shows_waiting(temp_dir: Path) -> None:
     assert "waiting:1" in log_text
 
     await queue.stop()
+
+
+@pytest.mark.asyncio
+async def test_duplicate_submission_coalesces_into_in_flight_job(job_queue: JobQueue) -> None:
+    """Identical submissions attach to the queued job instead of enqueuing again."""
+    request = AnalyzeJobRequest(audio_url="s3://test/dup.mp3", content_hash="dup1")
+
+    first = await job_queue.submit(JobType.ANALYZE, request)
+    second = await job_queue.submit(
+        JobType.ANALYZE,
+        AnalyzeJobRequest(audio_url="s3://test/dup.mp3", content_hash="dup1"),
+    )
+
+    assert second is first
+    assert job_queue._queue.qsize() == 1
+    assert len(await job_queue.list_jobs()) == 1
+    assert job_queue.get_coalesce_stats() == {
+        "submitted": 2,
+        "coalesced_in_flight": 1,
+        "coalesced_completed": 0,
+    }
+
+
+@pytest.mark.asyncio
+async def test_concurrent_duplicate_submissions_coalesce(job_queue: JobQueue) -> None:
+    """Duplicate submissions racing each other still produce one job."""
+    jobs = await asyncio.gather(
+        *(
+            job_queue.submit(
+                JobType.ANALYZE,
+                AnalyzeJobRequest(audio_url="s3://test/race.mp3", content_hash="race1"),
+            )
+            for _ in range(5)
+        )
+    )
+
+    assert len({job.id for job in jobs}) == 1
+    assert job_queue._queue.qsize() == 1
+
+
+@pytest.mark.asyncio
+async def test_different_options_or_type_not_coalesced(job_queue: JobQueue) -> None:
+    """Only requests with the same type and options coalesce."""
+    from sow_analysis.models import AnalyzeOptions, FastAnalyzeJobRequest
+
+    base = await job_queue.submit(
+        JobType.ANALYZE,
+        AnalyzeJobRequest(audio_url="s3://test/opt.mp3", content_hash="opt1"),
+    )
+    no_stems = await job_queue.submit(
+        JobType.ANALYZE,
+        AnalyzeJobRequest(
+            audio_url="s3://test/opt.mp3",
+            content_hash="opt1",
+            options=AnalyzeOptions(generate_stems=False),
+        ),
+    )
+    fast = await job_queue.submit(
+        JobType.FAST_ANALYZE,
+        FastAnalyzeJobRequest(audio_url="s3://test/opt.mp3", content_hash="opt1"),
+    )
+
+    assert len({base.id, no_stems.id, fast.id}) == 3
+
+
+@pytest.mark.asyncio
+async def test_force_always_creates_new_job(job_queue: JobQueue) -> None:
+    """force (argument or options.force) bypasses coalescing."""
+    from sow_analysis.models import AnalyzeOptions
+
+    request = AnalyzeJobRequest(audio_url="s3://test/force.mp3", content_hash="force1")
+    first = await job_queue.submit(JobType.ANALYZE, request)
+    forced = await job_queue.submit(JobType.ANALYZE, request, force=True)
+    forced_option = AnalyzeJobRequest(
+        audio_url="s3://test/force.mp3",
+        content_hash="force1",
+        options=AnalyzeOptions(force=True),
+    )
+    option_first = await job_queue.submit(JobType.ANALYZE, forced_option)
+    option_second = await job_queue.submit(JobType.ANALYZE, forced_option)
+
+    assert len({first.id, forced.id, option_first.id, option_second.id}) == 4
+    assert job_queue._queue.qsize() == 4
+
+
+@pytest.mark.asyncio
+async def test_completed_job_returned_from_store(job_queue: JobQueue) -> None:
+    """A recently completed identical job is returned with its result."""
+    from sow_analysis.models import JobResult
+
+    request = AnalyzeJobRequest(audio_url="s3://test/done.mp3", content_hash="done1")
+    job = await job_queue.submit(JobType.ANALYZE, request)
+    result = JobResult(tempo_bpm=72.0)
+    await job_queue.job_store.update_job(
+        job.id,
+        status="completed",
+        progress=1.0,
+        result_json=result.model_dump_json(),
+    )
+    job_queue._jobs.pop(job.id)
+
+    again = await job_queue.submit(JobType.ANALYZE, request)
+
+    assert again.id == job.id
+    assert again.status == JobStatus.COMPLETED
+    assert again.result.tempo_bpm == 72.0
+    assert job_queue.get_coalesce_stats()["coalesced_completed"] == 1
+
+
+@pytest.mark.asyncio
+async def test_failed_or_stale_completed_jobs_not_coalesced(
+    job_queue: JobQueue, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """Failed jobs, and completed jobs outside the reuse window, are re-run."""
+    from sow_analysis.workers import queue as queue_module
+
+    failed_request = AnalyzeJobRequest(audio_url="s3://test/f.mp3", content_hash="failed1")
+    failed = await job_queue.submit(JobType.ANALYZE, failed_request)
+    failed.status = JobStatus.FAILED
+    await job_queue.job_store.update_job(failed.id, status="failed")
+
+    done_request = AnalyzeJobRequest(audio_url="s3://test/d.mp3", content_hash="stale1")
+    done = await job_queue.submit(JobType.ANALYZE, done_request)
+    done.status = JobStatus.COMPLETED
+    await job_queue.job_store.update_job(done.id, status="completed")
+    monkeypatch.setattr(queue_module.settings, "SOW_JOB_COALESCE_COMPLETED_MAX_AGE_SECONDS", 0)
+
+    assert (await job_queue.submit(JobType.ANALYZE, failed_request)).id != failed.id
+    assert (await job_queue.submit(JobType.ANALYZE, done_request)).id != done.id
+
+
+@pytest.mark.asyncio
+async def test_coalescing_can_be_disabled(
+    job_queue: JobQueue, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """SOW_JOB_COALESCING_ENABLED=false restores one job per submission."""
+    from sow_analysis.workers import queue as queue_module
+
+    monkeypatch.setattr(queue_module.settings, "SOW_JOB_COALESCING_ENABLED", False)
+    request = AnalyzeJobRequest(audio_url="s3://test/off.mp3", content_hash="off1")
+
+    first = await job_queue.submit(JobType.ANALYZE, request)
+    second = await job_queue.submit(JobType.ANALYZE, request)
+
+    assert first.id != second.id
+
+
+@pytest.mark.asyncio
+async def test_get_jobs_merges_memory_and_store(job_queue: JobQueue) -> None:
+    """Bulk lookup serves live jobs from memory and evicted ones from the DB."""
+    live = await job_queue.submit(
+        JobType.ANALYZE, AnalyzeJobRequest(audio_url="s3://test/a.mp3", content_hash="bulk_a")
+    )
+    evicted = await job_queue.submit(
+        JobType.ANALYZE, AnalyzeJobRequest(audio_url="s3://test/b.mp3", content_hash="bulk_b")
+    )
+    job_queue._jobs.pop(evicted.id)
+
+    found = await job_queue.get_jobs([live.id, evicted.id, "job_missing"])
+
+    assert set(found) == {live.id, evicted.id}
+    assert found[live.id] is live
+
+
+@pytest.mark.asyncio
+async def test_watch_jobs_streams_changes_until_finished(job_queue: JobQueue) -> None:
+    """Watchers see the initial state, each persisted change, then stop."""
+    job = await job_queue.submit(
+        JobType.ANALYZE, AnalyzeJobRequest(audio_url="s3://test/w.mp3", content_hash="watch1")
+    )
+    seen = []
+
+    async def consume() -> None:
+        async for update in job_queue.watch_jobs([job.id], heartbeat_seconds=0.05):
+            seen.append(None if update is None else update.status)
+
+    consumer = asyncio.create_task(consume())
+    await asyncio.sleep(0.1)
+
+    job.status = JobStatus.PROCESSING
+    await job_queue.job_store.update_job(job.id, status="processing")
+    await asyncio.sleep(0.02)
+    job.status = JobStatus.COMPLETED
+    await job_queue.job_store.update_job(job.id, status="completed")
+    await asyncio.wait_for(consumer, timeout=2.0)
+
+    statuses = [s for s in seen if s is not None]
+    assert statuses == [JobStatus.QUEUED, JobStatus.PROCESSING, JobStatus.COMPLETED]
+    assert None in seen  # heartbeat while idle
+    assert not job_queue._job_watchers
+
+
+@pytest.mark.asyncio
+async def test_watch_jobs_ignores_unknown_ids(job_queue: JobQueue) -> None:
+    """An unknown ID never finishes, so it must not keep the watch open."""
+    job = await job_queue.submit(
+        JobType.ANALYZE, AnalyzeJobRequest(audio_url="s3://test/u.mp3", content_hash="watch2")
+    )
+    seen = []
+
+    async def consume() -> None:
+        async for update in job_queue.watch_jobs(
+            [job.id, "job_missing"], heartbeat_seconds=0.05
+        ):
+            if update is not None:
+                seen.append((update.id, update.status))
+
+    consumer = asyncio.create_task(consume())
+    await asyncio.sleep(0.1)
+
+    job.status = JobStatus.COMPLETED
+    await job_queue.job_store.update_job(job.id, status="completed")
+    await asyncio.wait_for(consumer, timeout=2.0)
+
+    assert seen == [(job.id, JobStatus.QUEUED), (job.id, JobStatus.COMPLETED)]
+    assert not job_queue._job_watchers
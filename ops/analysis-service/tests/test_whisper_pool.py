@@ -0,0 +1,151 @@
+"""Tests for the resident faster-whisper model pool."""
+
+import threading
+import time
+from pathlib import Path
+from types import SimpleNamespace
+from unittest.mock import patch
+
+import pytest
+
+from sow_analysis.workers.whisper_pool import WhisperModelPool
+
+
+class FakeLoader:
+    """Counts loads and returns a distinct object per call."""
+
+    def __init__(self, delay: float = 0.0):
+        self.loads = []
+        self.delay = delay
+
+    def __call__(self, key, download_root: Path):
+        time.sleep(self.delay)
+        self.loads.append(key)
+        return SimpleNamespace(key=key)
+
+
+def _pool(tmp_path: Path, **kwargs) -> tuple[WhisperModelPool, FakeLoader]:
+    loader = kwargs.pop("loader", FakeLoader())
+    pool = WhisperModelPool(download_root=tmp_path, loader=loader, **kwargs)
+    return pool, loader
+
+
+class TestLease:
+    def test_second_lease_is_a_hit(self, tmp_path):
+        pool, loader = _pool(tmp_path)
+
+        with pool.lease("large-v3", "cpu") as first:
+            assert not first.pool_hit
+        with pool.lease("large-v3", "cpu") as second:
+            assert second.pool_hit
+            assert second.load_seconds == 0.0
+            assert second.model is first.model
+
+        assert loader.loads == [("large-v3", "cpu", "int8")]
+        stats = pool.get_stats()
+        assert stats["hits"] == 1
+        assert stats["misses"] == 1
+        assert stats["hit_rate"] == 0.5
+
+    def test_key_includes_device_and_compute_type(self, tmp_path):
+        pool, loader = _pool(tmp_path, max_models=3)
+        for device, compute_type in [("cpu", "int8"), ("cuda", "int8"), ("cpu", "float16")]:
+            with pool.lease("large-v3", device, compute_type):
+                pass
+        assert len(loader.loads) == 3
+
+    def test_concurrent_leases_load_once(self, tmp_path):
+        pool, loader = _pool(tmp_path, loader=FakeLoader(delay=0.05))
+        leases = []
+
+        def run():
+            with pool.lease("large-v3", "cpu") as lease:
+                leases.append(lease)
+
+        threads = [threading.Thread(target=run) for _ in range(4)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert len(loader.loads) == 1
+        assert len({id(lease.model) for lease in leases}) == 1
+
+    def test_failed_load_is_not_cached(self, tmp_path):
+        def failing_loader(key, download_root):
+            raise RuntimeError("out of memory")
+
+        pool = WhisperModelPool(download_root=tmp_path, loader=failing_loader)
+        with pytest.raises(RuntimeError, match="out of memory"):
+            with pool.lease("large-v3", "cpu"):
+                pass
+        assert pool.get_stats()["loaded"] == []
+
+
+class TestEviction:
+    def test_pool_full_evicts_least_recently_used(self, tmp_path):
+        pool, loader = _pool(tmp_path, max_models=2)
+        for name in ("small", "medium", "small", "large-v3"):
+            with pool.lease(name, "cpu"):
+                pass
+
+        assert pool.get_stats()["loaded"] == ["small", "large-v3"]
+        assert pool.get_stats()["evictions"] == 1
+
+    def test_idle_models_unloaded(self, tmp_path):
+        pool, _ = _pool(tmp_path, idle_seconds=0.0)
+        with pool.lease("large-v3", "cpu"):
+            assert pool.evict_idle() == 0
+        assert pool.evict_idle() == 1
+        assert pool.get_stats()["loaded"] == []
+
+    def test_memory_pressure_unloads_idle_models(self, tmp_path):
+        available = {"bytes": 8 * 1024**3}
+        pool, _ = _pool(
+            tmp_path,
+            min_available_bytes=1024**3,
+            available_memory_fn=lambda: available["bytes"],
+        )
+        with pool.lease("large-v3", "cpu"):
+            pass
+
+        assert pool.evict_idle() == 0
+        available["bytes"] = 512 * 1024**2
+        assert pool.evict_idle() == 1
+
+    def test_in_use_model_survives_pool_full(self, tmp_path):
+        pool, loader = _pool(tmp_path, max_models=1)
+        with pool.lease("large-v3", "cpu") as busy:
+            with pool.lease("small", "cpu"):
+                pass
+            assert "large-v3" in pool.get_stats()["loaded"]
+            assert busy.model.key == ("large-v3", "cpu", "int8")
+
+
+class TestRunWhisperTranscription:
+    @pytest.mark.asyncio
+    async def test_reuses_pooled_model_across_jobs(self, tmp_path, caplog):
+        from sow_analysis.workers.lrc import _run_whisper_transcription
+
+        def loader(key, download_root):
+            model = SimpleNamespace()
+            model.transcribe = lambda *args, **kwargs: (
+                iter([SimpleNamespace(text=" 哈利路亞 ", start=0.0, end=1.5)]),
+                SimpleNamespace(language="zh", language_probability=0.99),
+            )
+            loads.append(key)
+            return model
+
+        loads = []
+        pool = WhisperModelPool(download_root=tmp_path, loader=loader)
+        caplog.set_level("INFO", logger="sow_analysis.workers.lrc")
+
+        with patch("sow_analysis.workers.lrc.get_whisper_model_pool", return_value=pool):
+            for _ in range(2):
+                phrases = await _run_whisper_transcription(
+                    tmp_path / "audio.mp3", "large-v3", "zh", "cpu"
+                )
+
+        assert [p.text for p in phrases] == ["哈利路亞"]
+        assert loads == [("large-v3", "cpu", "int8")]
+        assert "reused from pool (pool hit rate 50% over 2 lookups)" in caplog.text